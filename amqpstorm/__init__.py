@@ -8,8 +8,13 @@ logging.getLogger('amqpstorm').addHandler(logging.NullHandler())
 
 from amqpstorm.channel import Channel  # noqa
 from amqpstorm.connection import Connection  # noqa
+from amqpstorm.cluster import ClusterConnection  # noqa
 from amqpstorm.uri_connection import UriConnection  # noqa
+from amqpstorm.robust import RobustConnection  # noqa
+from amqpstorm.reactor import Reactor  # noqa
+from amqpstorm.metrics import Metrics  # noqa
 from amqpstorm.message import Message  # noqa
+from amqpstorm.message import LazyMessage  # noqa
 from amqpstorm.exception import AMQPError  # noqa
 from amqpstorm.exception import AMQPChannelError  # noqa
 from amqpstorm.exception import AMQPMessageError  # noqa
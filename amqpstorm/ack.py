@@ -0,0 +1,223 @@
+"""AMQPStorm Channel.Ack."""
+from __future__ import annotations
+
+import heapq
+import logging
+import threading
+from typing import Any
+from typing import Callable
+
+from pamqp import commands
+
+from amqpstorm.exception import AMQPError
+
+LOGGER = logging.getLogger(__name__)
+
+
+class AckCoalescer:
+    """Internal acknowledgement coalescer.
+
+        Keeps track of the delivery tags that are waiting to be
+        acknowledged, and of the messages that have been acknowledged but
+        not yet sent to the remote server. Once max_pending messages are
+        waiting, or flush_interval seconds have passed, the acknowledgements
+        are sent. All messages up to the lowest delivery tag still being
+        processed are acknowledged using a single Basic.Ack with multiple
+        set. Messages acknowledged out of order, past that point, are
+        acknowledged one at a time.
+
+        Basic.Nack and Basic.Reject frames are sent right away, after the
+        pending acknowledgements.
+
+        Only messages delivered while the coalescer is enabled are tracked,
+        so it should be enabled before consuming.
+
+    :param typing.Callable write_frame: Writes a frame to the Channel.
+    :param int max_pending: Maximum number of acknowledgements held back.
+    :param float flush_interval: Maximum number of seconds an
+                                 acknowledgement is held back.
+    :param typing.Callable timer: Timer implementation used to schedule
+                                  the flush.
+    """
+
+    def __init__(
+        self,
+        write_frame: Callable[[Any], None],
+        max_pending: int = 100,
+        flush_interval: float = 0.1,
+        timer: Callable[..., Any] = threading.Timer,
+    ) -> None:
+        self.write_frame = write_frame
+        self.timer_impl = timer
+        self._lock = threading.RLock()
+        self._max_pending = max_pending
+        self._flush_interval = flush_interval
+        self._outstanding: set[int] = set()
+        self._outstanding_tags: list[int] = []
+        self._completed: set[int] = set()
+        self._timer: Any = None
+
+    @property
+    def pending(self) -> int:
+        """Returns the number of acknowledgements not yet sent.
+
+        :rtype: int
+        """
+        return len(self._completed)
+
+    def delivered(self, delivery_tag: int) -> None:
+        """Register a delivered message that needs to be acknowledged.
+
+            Must be called in the order the messages were delivered.
+
+        :param int delivery_tag: Server-assigned delivery tag
+
+        :return:
+        """
+        with self._lock:
+            self._outstanding.add(delivery_tag)
+            heapq.heappush(self._outstanding_tags, delivery_tag)
+
+    def ack(self, delivery_tag: int, multiple: bool = False) -> None:
+        """Acknowledge a message, or all messages up to and including the
+        delivery tag.
+
+        :param int delivery_tag: Server-assigned delivery tag
+        :param bool multiple: Acknowledge multiple messages
+
+        :return:
+        """
+        if multiple and not delivery_tag:
+            self.send(commands.Basic.Ack(delivery_tag=0, multiple=True))
+            return
+        with self._lock:
+            if multiple:
+                self._completed.update(self._settle_up_to(delivery_tag))
+            self._outstanding.discard(delivery_tag)
+            self._completed.add(delivery_tag)
+            if len(self._completed) >= self._max_pending:
+                self._flush()
+            elif self._timer is None:
+                self._timer = self.timer_impl(self._flush_interval,
+                                              self._on_timer)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def send(self, frame_out: Any) -> None:
+        """Send a Basic.Ack, Basic.Nack or Basic.Reject frame right away,
+        after sending the pending acknowledgements.
+
+        :param pamqp.Frame frame_out: Basic.Ack, Basic.Nack or
+                                      Basic.Reject frame.
+
+        :return:
+        """
+        with self._lock:
+            self.flush()
+            if getattr(frame_out, 'multiple', False):
+                self._settle_up_to(frame_out.delivery_tag)
+            self._outstanding.discard(frame_out.delivery_tag)
+            self.write_frame(frame_out)
+
+    def flush(self) -> None:
+        """Send all pending acknowledgements.
+
+        :return:
+        """
+        with self._lock:
+            self._flush()
+
+    def clear(self) -> None:
+        """Forget all delivered messages, and pending acknowledgements,
+        e.g. once the Channel has been closed.
+
+        :return:
+        """
+        with self._lock:
+            self._cancel_timer()
+            self._outstanding.clear()
+            self._outstanding_tags = []
+            self._completed.clear()
+
+    def _flush(self) -> None:
+        """Send all pending acknowledgements.
+
+            Must be called while holding the lock.
+
+        :return:
+        """
+        self._cancel_timer()
+        if not self._completed:
+            return
+        lowest_outstanding = self._lowest_outstanding()
+        completed = sorted(self._completed)
+        self._completed.clear()
+        index = 0
+        while index < len(completed):
+            if lowest_outstanding is not None and completed[index] > lowest_outstanding:
+                break
+            index += 1
+        frames_out = []
+        if index:
+            frames_out.append(commands.Basic.Ack(
+                delivery_tag=completed[index - 1], multiple=index > 1
+            ))
+        for delivery_tag in completed[index:]:
+            frames_out.append(commands.Basic.Ack(delivery_tag=delivery_tag))
+        for frame_out in frames_out:
+            self.write_frame(frame_out)
+
+    def _on_timer(self) -> None:
+        """Send the pending acknowledgements once the flush interval
+        has passed.
+
+        :return:
+        """
+        with self._lock:
+            self._timer = None
+            try:
+                self._flush()
+            except AMQPError as why:
+                LOGGER.warning('Failed to send acknowledgements: %s', why)
+
+    def _cancel_timer(self) -> None:
+        """Cancel the scheduled flush, if any.
+
+        :return:
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _lowest_outstanding(self) -> int | None:
+        """Returns the lowest delivery tag still waiting to be acknowledged.
+
+        :rtype: int,None
+        """
+        while self._outstanding_tags:
+            delivery_tag = self._outstanding_tags[0]
+            if delivery_tag in self._outstanding:
+                return delivery_tag
+            heapq.heappop(self._outstanding_tags)
+        return None
+
+    def _settle_up_to(self, delivery_tag: int) -> list[int]:
+        """Remove all delivered messages up to and including the delivery
+        tag, e.g. after a Basic.Ack, or Basic.Nack, with multiple set.
+
+            A delivery tag of 0 covers all delivered messages.
+
+        :param int delivery_tag: Server-assigned delivery tag
+
+        :rtype: list
+        """
+        settled = []
+        while self._outstanding_tags:
+            tag = self._outstanding_tags[0]
+            if delivery_tag and tag > delivery_tag:
+                break
+            heapq.heappop(self._outstanding_tags)
+            if tag in self._outstanding:
+                self._outstanding.discard(tag)
+                settled.append(tag)
+        return settled
@@ -0,0 +1,2 @@
+from amqpstorm.aio.channel import AsyncChannel  # noqa
+from amqpstorm.aio.connection import AsyncConnection  # noqa
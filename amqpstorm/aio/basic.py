@@ -0,0 +1,314 @@
+"""AMQPStorm Asyncio Channel.Basic."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from concurrent.futures import Future
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+from typing import Sequence
+
+from pamqp import commands
+
+from amqpstorm import compatibility
+from amqpstorm.base import BaseMessage
+from amqpstorm.basic import Basic
+from amqpstorm.exception import AMQPChannelError
+from amqpstorm.exception import AMQPError
+from amqpstorm.exception import AMQPInvalidArgument
+from amqpstorm.message import Message
+
+if TYPE_CHECKING:
+    from amqpstorm.aio.channel import AsyncChannel
+
+LOGGER = logging.getLogger(__name__)
+
+
+class AsyncBasic(Basic):
+    """RabbitMQ Basic Operations for asyncio.
+
+        ack, nack and reject do not wait for a response from the remote
+        server, and are therefore not coroutines.
+    """
+    __slots__ = []
+    _channel: AsyncChannel  # type: ignore[assignment]
+
+    def __init__(
+        self, channel: AsyncChannel, max_frame_size: int | None = None,
+    ) -> None:
+        super().__init__(channel, max_frame_size)  # type: ignore[arg-type]
+
+    async def get(  # type: ignore[override]
+        self,
+        queue: str = '',
+        no_ack: bool = False,
+        to_dict: bool = False,
+        auto_decode: bool = True,
+        message_impl: type[BaseMessage] | None = None,
+    ) -> Message | BaseMessage | dict[str, Any] | None:
+        """Fetch a single message.
+
+        :param str queue: Queue name
+        :param bool no_ack: No acknowledgement needed
+        :param bool to_dict: Should incoming messages be converted to a
+                    dictionary before delivery.
+        :param bool auto_decode: Auto-decode strings when possible.
+        :param class message_impl: Message implementation based on BaseMessage
+        :raises AMQPInvalidArgument: Invalid Parameters
+        :raises AMQPChannelError: Raises if the channel encountered an error.
+        :raises AMQPConnectionError: Raises if the connection
+                                     encountered an error.
+
+        :returns: Returns a single message, as long as there is a message in
+                  the queue. If no message is available, returns None.
+
+        :rtype: amqpstorm.Message,dict,None
+        """
+        if not compatibility.is_string(queue):
+            raise AMQPInvalidArgument('queue should be a string')
+        elif not isinstance(no_ack, bool):
+            raise AMQPInvalidArgument('no_ack should be a boolean')
+        elif self._channel.consumer_tags:
+            raise AMQPChannelError("Cannot call 'get' when channel is "
+                                   "set to consume")
+
+        if message_impl:
+            if not issubclass(message_impl, BaseMessage):
+                raise AMQPInvalidArgument(
+                    'message_impl should be derived from BaseMessage'
+                )
+        else:
+            message_impl = Message
+
+        get_frame = commands.Basic.Get(queue=queue,
+                                       no_ack=no_ack)
+        valid_responses = get_frame.valid_responses + ['ContentHeader',
+                                                       'ContentBody']
+        async with self._channel.rpc_session(get_frame, valid_responses):
+            get_ok_frame = await self._channel.get_rpc_response()
+            if isinstance(get_ok_frame, commands.Basic.GetEmpty):
+                return None
+            content_header = await self._channel.get_rpc_response()
+            body_parts: list[bytes] = []
+            body_len = 0
+            while body_len < content_header.body_size:
+                body_piece = await self._channel.get_rpc_response()
+                if not body_piece.value:
+                    break
+                body_parts.append(body_piece.value)
+                body_len += len(body_piece.value)
+
+        message = message_impl.from_frames(
+            self._channel, b''.join(body_parts),  # type: ignore[arg-type]
+            get_ok_frame, content_header.properties, auto_decode=auto_decode
+        )
+        if to_dict:
+            return message.to_dict()
+        return message
+
+    async def consume(  # type: ignore[override]
+        self,
+        callback: Callable[..., Any] | None = None,
+        queue: str = '',
+        consumer_tag: str = '',
+        exclusive: bool = False,
+        no_ack: bool = False,
+        no_local: bool = False,
+        arguments: dict[str, Any] | None = None,
+    ) -> str:
+        """Start a queue consumer.
+
+            Messages are delivered using channel.build_inbound_messages,
+            or to the callback using channel.start_consuming.
+
+        :param typing.Callable callback: Message callback, may be a
+                                         coroutine function
+        :param str queue: Queue name
+        :param str consumer_tag: Consumer tag
+        :param bool no_local: Do not deliver own messages
+        :param bool no_ack: No acknowledgement needed
+        :param bool exclusive: Request exclusive access
+        :param dict arguments: Consume key/value arguments
+
+        :raises AMQPInvalidArgument: Invalid Parameters
+        :raises AMQPChannelError: Raises if the channel encountered an error.
+        :raises AMQPConnectionError: Raises if the connection
+                                     encountered an error.
+
+        :returns: Consumer tag
+        :rtype: str
+        """
+        self._validate_consume_parameters(arguments, consumer_tag, exclusive,
+                                          no_ack, no_local, queue)
+        consume_rpc_result = await self._consume_rpc_request(  # type: ignore[misc]
+            arguments, consumer_tag, exclusive, no_ack, no_local, queue
+        )
+        tag = self._consume_add_and_get_tag(consume_rpc_result)
+        self._channel._consumer_callbacks[tag] = callback
+        return tag
+
+    async def cancel(  # type: ignore[override]
+        self, consumer_tag: str = '',
+    ) -> dict[str, Any]:
+        """Cancel a queue consumer.
+
+        :param str consumer_tag: Consumer tag
+
+        :raises AMQPInvalidArgument: Invalid Parameters
+        :raises AMQPChannelError: Raises if the channel encountered an error.
+        :raises AMQPConnectionError: Raises if the connection
+                                     encountered an error.
+
+        :rtype: dict
+        """
+        if not compatibility.is_string(consumer_tag):
+            raise AMQPInvalidArgument('consumer_tag should be a string')
+        cancel_frame = commands.Basic.Cancel(consumer_tag=consumer_tag)
+        result = await self._channel.rpc_request(cancel_frame)
+        self._channel.remove_consumer_tag(consumer_tag)
+        return result
+
+    async def publish(  # type: ignore[override]
+        self,
+        body: bytes | str,
+        routing_key: str,
+        exchange: str = '',
+        properties: dict[str, Any] | None = None,
+        mandatory: bool = False,
+        immediate: bool = False,
+    ) -> bool | None:
+        """Publish a Message.
+
+            If the channel is set to confirm deliveries, waits for the
+            message to be confirmed and returns True if the message was
+            acknowledged by the remote server and False if not. Messages
+            published concurrently are confirmed concurrently.
+
+        :param bytes,str,unicode body: Message payload
+        :param str routing_key: Message routing key
+        :param str exchange: The exchange to publish the message to
+        :param dict properties: Message properties
+        :param bool mandatory: Requires the message is published
+        :param bool immediate: Request immediate delivery
+
+        :raises AMQPInvalidArgument: Invalid Parameters
+        :raises AMQPChannelError: Raises if the channel encountered an error.
+        :raises AMQPConnectionError: Raises if the connection
+                                     encountered an error.
+
+        :rtype: bool,None
+        """
+        frames_out = self._create_publish_frames(body, routing_key, exchange,
+                                                 properties, mandatory,
+                                                 immediate)
+        return await self._publish_frames(frames_out, mandatory)
+
+    async def publish_batch(  # type: ignore[override]
+        self, messages: Sequence[tuple[Any, ...] | dict[str, Any]],
+    ) -> list[bool] | None:
+        """Publish multiple Messages using a single write.
+
+            Each message is either a tuple of positional, or a dict of
+            keyword, basic.publish arguments.
+
+            If the channel is set to confirm deliveries, waits for all
+            messages to be confirmed and returns a list with True or False
+            for each message.
+
+        :param list messages: Messages to publish.
+
+        :raises AMQPInvalidArgument: Invalid Parameters
+        :raises AMQPChannelError: Raises if the channel encountered an error.
+        :raises AMQPConnectionError: Raises if the connection
+                                     encountered an error.
+
+        :rtype: list,None
+        """
+        frames_out, mandatory = self._create_batch_frames(messages)
+        return await self._publish_batch_frames(frames_out, len(messages),
+                                                mandatory)
+
+    async def _publish_frames(  # type: ignore[override]
+        self, frames_out: list[Any] | bytes, mandatory: bool,
+    ) -> bool | None:
+        """Write the frames of a single message, and wait for it to be
+        confirmed when the channel is set to confirm deliveries.
+
+        :param list,bytes frames_out: Frames, or pre-marshalled frames.
+        :param bool mandatory: Message published as mandatory.
+
+        :rtype: bool,None
+        """
+        await self._channel._connection.drain()
+        confirms = self._channel._confirms
+        if not confirms:
+            self._write_frames(frames_out)
+            return None
+
+        future = confirms.register()
+        try:
+            self._write_frames(frames_out)
+        except AMQPError:
+            confirms.unregister(future)
+            raise
+        results = await self._wait_for_confirms([future], mandatory)
+        return results[0]
+
+    async def _publish_batch_frames(  # type: ignore[override]
+        self, frames_out: list[Any] | bytes, count: int, mandatory: bool,
+    ) -> list[bool] | None:
+        """Write the frames of a batch of messages, and wait for them to be
+        confirmed when the channel is set to confirm deliveries.
+
+        :param list,bytes frames_out: Frames, or pre-marshalled frames.
+        :param int count: Number of messages in the batch.
+        :param bool mandatory: Any message published as mandatory.
+
+        :rtype: list,None
+        """
+        if not frames_out:
+            return [] if self._channel._confirms else None
+        await self._channel._connection.drain()
+        confirms = self._channel._confirms
+        if not confirms:
+            self._write_frames(frames_out)
+            return None
+
+        futures = [confirms.register() for _ in range(count)]
+        try:
+            self._write_frames(frames_out)
+        except AMQPError:
+            for future in reversed(futures):
+                confirms.unregister(future)
+            raise
+        return await self._wait_for_confirms(futures, mandatory)
+
+    async def _wait_for_confirms(
+        self, futures: list[Future[bool]], mandatory: bool,
+    ) -> list[bool]:
+        """Wait for published messages to be confirmed.
+
+        :param list futures: Futures returned by ConfirmTracker.register.
+        :param bool mandatory: Any message published as mandatory.
+
+        :raises AMQPChannelError: Raises if the channel encountered an error,
+                                  or if the confirms took too long.
+
+        :rtype: list
+        """
+        try:
+            results = await asyncio.wait_for(
+                asyncio.shield(asyncio.gather(*[
+                    asyncio.wrap_future(future) for future in futures
+                ])),
+                self._channel.rpc_timeout
+            )
+        except asyncio.TimeoutError:
+            self._channel.check_for_errors()
+            raise AMQPChannelError(
+                'publisher confirm took too long'
+            ) from None
+        if mandatory:
+            self._channel.check_for_exceptions()
+        return results
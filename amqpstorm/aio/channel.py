@@ -0,0 +1,636 @@
+"""AMQPStorm Asyncio Channel."""
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import inspect
+import logging
+from types import TracebackType
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import AsyncIterator
+
+from pamqp import commands
+
+from amqpstorm import compatibility
+from amqpstorm.ack import AckCoalescer
+from amqpstorm.aio.basic import AsyncBasic
+from amqpstorm.base import BaseChannel
+from amqpstorm.base import BaseMessage
+from amqpstorm.channel import CONFIRM_FRAME
+from amqpstorm.channel import CONTENT_FRAME
+from amqpstorm.compatibility import try_utf8_decode
+from amqpstorm.confirm import ConfirmTracker
+from amqpstorm.exception import AMQPChannelError
+from amqpstorm.exception import AMQPConnectionError
+from amqpstorm.exception import AMQPInvalidArgument
+from amqpstorm.exception import AMQPMessageError
+from amqpstorm.exchange import Exchange
+from amqpstorm.message import Message
+from amqpstorm.queue import Queue
+from amqpstorm.tx import Tx
+
+if TYPE_CHECKING:
+    from pamqp.base import Frame
+
+    from amqpstorm.aio.connection import AsyncConnection
+
+LOGGER = logging.getLogger(__name__)
+
+
+class AsyncChannel(BaseChannel):
+    """RabbitMQ Channel for asyncio.
+
+        The Exchange, Queue and Tx operations are shared with
+        amqpstorm.Channel, and return awaitables.
+
+    e.g.
+    ::
+
+        channel = await connection.channel()
+        await channel.queue.declare('my_queue')
+        await channel.basic.consume(queue='my_queue')
+        async for message in channel.build_inbound_messages():
+            message.ack()
+    """
+
+    def __init__(
+        self,
+        channel_id: int,
+        connection: AsyncConnection,
+        rpc_timeout: float,
+    ) -> None:
+        super().__init__(channel_id)
+        self.rpc_timeout = rpc_timeout
+        # Acknowledgements are written to the transport buffer, and are
+        # not coalesced.
+        self._acks: AckCoalescer | None = None
+        self._consumer_callbacks: dict[str, Any] = {}
+        self._confirming_deliveries = False
+        self._confirms: ConfirmTracker | None = None
+        self._connection = connection
+        self._inbound: asyncio.Queue[Any] = asyncio.Queue()
+        self._inbound_message: list[Any] = []
+        self._inbound_body_size = 0
+        self._rpc_lock = asyncio.Lock()
+        self._rpc_responses: asyncio.Queue[Any] | None = None
+        self._rpc_valid_responses: list[str] = []
+        self._basic = AsyncBasic(self, connection.max_frame_size)
+        self._exchange = Exchange(self)  # type: ignore[arg-type]
+        self._tx = Tx(self)  # type: ignore[arg-type]
+        self._queue = Queue(self)  # type: ignore[arg-type]
+        self._user_closed: bool = False
+
+    async def __aenter__(self) -> AsyncChannel:
+        return self
+
+    async def __aexit__(
+        self,
+        exception_type: type[BaseException] | None,
+        exception_value: BaseException | None,
+        _: TracebackType | None,
+    ) -> None:
+        if exception_type:
+            LOGGER.warning(
+                'Closing channel due to an unhandled exception: %s',
+                exception_value
+            )
+        if not self.is_open:
+            return
+        await self.close()
+
+    def __int__(self) -> int:
+        return self._channel_id
+
+    @property
+    def basic(self) -> AsyncBasic:
+        """RabbitMQ Basic Operations.
+
+            e.g.
+            ::
+
+                message = await channel.basic.get(queue='hello_world')
+
+        :rtype: amqpstorm.aio.basic.AsyncBasic
+        """
+        return self._basic
+
+    @property
+    def exchange(self) -> Exchange:
+        """RabbitMQ Exchange Operations.
+
+            e.g.
+            ::
+
+                await channel.exchange.declare(exchange='hello_world')
+
+        :rtype: amqpstorm.exchange.Exchange
+        """
+        return self._exchange
+
+    @property
+    def queue(self) -> Queue:
+        """RabbitMQ Queue Operations.
+
+            e.g.
+            ::
+
+                await channel.queue.declare(queue='hello_world')
+
+        :rtype: amqpstorm.queue.Queue
+        """
+        return self._queue
+
+    @property
+    def tx(self) -> Tx:
+        """RabbitMQ Tx Operations.
+
+            e.g.
+            ::
+
+                await channel.tx.commit()
+
+        :rtype: amqpstorm.tx.Tx
+        """
+        return self._tx
+
+    @property
+    def confirming_deliveries(self) -> bool:
+        """Is the channel set to confirm deliveries.
+
+        :return:
+        """
+        return self._confirming_deliveries
+
+    async def build_inbound_messages(
+        self,
+        to_tuple: bool = False,
+        auto_decode: bool = True,
+        message_impl: type[BaseMessage] | None = None,
+    ) -> AsyncIterator[Any]:
+        """Build messages delivered to the consumers of this channel.
+
+            Stops once the channel is closed, or once there are no more
+            active consumers and all delivered messages have been yielded.
+
+            e.g.
+            ::
+
+                async for message in channel.build_inbound_messages():
+                    message.ack()
+
+        :param bool to_tuple: Should incoming messages be converted to a
+                              tuple before delivery.
+        :param bool auto_decode: Auto-decode strings when possible.
+        :param class message_impl: Optional message class to use, derived from
+                                   BaseMessage, for created messages. Defaults
+                                   to Message.
+        :raises AMQPInvalidArgument: Invalid Parameters
+        :raises AMQPChannelError: Raises if the channel encountered an error.
+        :raises AMQPConnectionError: Raises if the connection
+                                     encountered an error.
+
+        :rtype: :py:class:`async_generator`
+        """
+        if message_impl:
+            if not issubclass(message_impl, BaseMessage):
+                raise AMQPInvalidArgument(
+                    'message_impl must derive from BaseMessage'
+                )
+        else:
+            message_impl = Message
+        while True:
+            if self._inbound.empty():
+                try:
+                    self.check_for_errors()
+                except (AMQPConnectionError, AMQPChannelError):
+                    if self._user_initiated_close():
+                        return
+                    raise
+                if not self.consumer_tags:
+                    return
+            delivery = await self._inbound.get()
+            if delivery is None:
+                continue
+            basic_deliver, content_header, body = delivery
+            message = message_impl.from_frames(
+                self, body, basic_deliver,  # type: ignore[arg-type]
+                content_header.properties, auto_decode=auto_decode
+            )
+            if to_tuple:
+                yield message.to_tuple()
+                continue
+            yield message
+
+    def check_for_errors(self) -> None:
+        """Check connection and channel for errors.
+
+        :raises AMQPChannelError: Raises if the channel encountered an error.
+        :raises AMQPConnectionError: Raises if the connection
+                                     encountered an error.
+        :return:
+        """
+        try:
+            self._connection.check_for_errors()
+        except AMQPConnectionError:
+            self.set_state(self.CLOSED)
+            raise
+
+        self.check_for_exceptions()
+
+        if self.is_closed:
+            raise AMQPChannelError('channel closed')
+
+    def check_for_exceptions(self) -> None:
+        """Check channel for exceptions.
+
+        :raises AMQPChannelError: Raises if the channel encountered an error.
+
+        :return:
+        """
+        if self.exceptions:
+            exception = self.exceptions[0]
+            if self.is_open:
+                self.exceptions.pop(0)
+            raise exception
+
+    async def close(self, reply_code: int = 200, reply_text: str = '') -> None:
+        """Close Channel.
+
+        :param int reply_code: Close reply code (e.g. 200)
+        :param str reply_text: Close reply text
+
+        :raises AMQPInvalidArgument: Invalid Parameters
+        :raises AMQPChannelError: Raises if the channel encountered an error.
+        :raises AMQPConnectionError: Raises if the connection
+                                     encountered an error.
+
+        :return:
+        """
+        if not compatibility.is_integer(reply_code):
+            raise AMQPInvalidArgument('reply_code should be an integer')
+        elif not compatibility.is_string(reply_text):
+            raise AMQPInvalidArgument('reply_text should be a string')
+        self._user_closed = True
+        try:
+            if self._connection.is_closed or not self.is_open:
+                LOGGER.debug('Channel #%d forcefully Closed', self.channel_id)
+                return
+            self.set_state(self.CLOSING)
+            LOGGER.debug('Channel #%d Closing', self.channel_id)
+            await self.rpc_request(commands.Channel.Close(
+                class_id=0,
+                method_id=0,
+                reply_code=reply_code,
+                reply_text=reply_text)
+            )
+        finally:
+            self._set_closed(AMQPChannelError('channel closed'))
+            self._connection._cleanup_channel(self.channel_id)
+        LOGGER.debug('Channel #%d Closed', self.channel_id)
+
+    async def confirm_deliveries(self) -> dict[str, Any]:
+        """Set the channel to confirm that each message has been
+        successfully delivered.
+
+            Once enabled basic.publish waits for the remote server to
+            confirm the message and returns True (ack) or False (nack).
+            Publish concurrently, e.g. using asyncio.gather, to have
+            multiple messages waiting to be confirmed at the same time.
+
+        :raises AMQPChannelError: Raises if the channel encountered an error.
+        :raises AMQPConnectionError: Raises if the connection
+                                     encountered an error.
+
+        :return:
+        """
+        result = await self.rpc_request(commands.Confirm.Select())
+        self._confirming_deliveries = True
+        self._confirms = ConfirmTracker()
+        return result
+
+    def on_connection_closed(self) -> None:
+        """The connection was closed, forcefully close the channel.
+
+        :return:
+        """
+        if self.is_closed:
+            return
+        self._set_closed(AMQPConnectionError('connection closed'))
+
+    def on_frame(self, frame_in: Any) -> None:
+        """Handle frame sent to this specific channel.
+
+        :param pamqp.Frame frame_in: Amqp frame.
+        :return:
+        """
+        responses = self._rpc_responses
+        if responses is not None and frame_in.name in self._rpc_valid_responses:
+            responses.put_nowait(frame_in)
+        elif frame_in.name in CONTENT_FRAME:
+            self._on_content_frame(frame_in)
+        elif frame_in.name == 'Basic.Cancel':
+            self._basic_cancel(frame_in)
+        elif frame_in.name == 'Basic.CancelOk':
+            self.remove_consumer_tag(frame_in.consumer_tag)
+        elif frame_in.name == 'Basic.ConsumeOk':
+            self.add_consumer_tag(frame_in['consumer_tag'])
+        elif frame_in.name == 'Basic.Return':
+            self._basic_return(frame_in)
+        elif self._confirms and frame_in.name in CONFIRM_FRAME:
+            self._confirms.on_frame(frame_in)
+        elif frame_in.name == 'Channel.Close':
+            self._close_channel(frame_in)
+        elif frame_in.name == 'Channel.Flow':
+            self.write_frame(commands.Channel.FlowOk(frame_in.active))
+        else:
+            LOGGER.error(
+                '[Channel%d] Unhandled Frame: %s -- %s',
+                self.channel_id, frame_in.name, dict(frame_in)
+            )
+
+    async def open(self) -> None:
+        """Open Channel.
+
+        :return:
+        """
+        self._inbound = asyncio.Queue()
+        self._inbound_message = []
+        self._inbound_body_size = 0
+        self._exceptions: list[Exception] = []
+        self._confirming_deliveries = False
+        self._confirms = None
+        self._user_closed = False
+        self.set_state(self.OPENING)
+        await self.rpc_request(commands.Channel.Open())
+        self.set_state(self.OPEN)
+
+    def remove_consumer_tag(self, tag: str | None = None) -> None:
+        """Remove a Consumer tag.
+
+            If no tag is specified, all tags will be removed.
+
+        :param str,None tag: Consumer tag.
+        :return:
+        """
+        super().remove_consumer_tag(tag)
+        self._inbound.put_nowait(None)
+
+    async def rpc_request(self, frame_out: Frame) -> Any:
+        """Perform a RPC Request.
+
+            Requests on the same channel are sent one at a time.
+
+        :param specification.Frame frame_out: Amqp frame.
+
+        :raises AMQPChannelError: Raises if the channel encountered an error,
+                                  or if the request timed out.
+        :raises AMQPConnectionError: Raises if the connection
+                                     encountered an error.
+
+        :rtype: dict
+        """
+        async with self.rpc_session(frame_out):
+            return dict(await self.get_rpc_response())
+
+    @contextlib.asynccontextmanager
+    async def rpc_session(
+        self, frame_out: Frame, valid_responses: list[str] | None = None,
+    ) -> AsyncIterator[None]:
+        """Send a RPC Request, and collect the response frames until the
+        session ends. Use get_rpc_response to fetch the responses.
+
+        :param specification.Frame frame_out: Amqp frame.
+        :param list,None valid_responses: Response frames to collect.
+                                          Defaults to the valid responses of
+                                          frame_out.
+
+        :raises AMQPChannelError: Raises if the channel encountered an error.
+        :raises AMQPConnectionError: Raises if the connection
+                                     encountered an error.
+        """
+        async with self._rpc_lock:
+            self._rpc_responses = asyncio.Queue()
+            self._rpc_valid_responses = (
+                valid_responses or frame_out.valid_responses
+            )
+            try:
+                self._connection.write_frame(self.channel_id, frame_out)
+                yield
+            finally:
+                self._rpc_responses = None
+                self._rpc_valid_responses = []
+
+    async def get_rpc_response(self) -> Any:
+        """Wait for the next response frame of the current RPC Request.
+
+        :raises AMQPChannelError: Raises if the channel encountered an error,
+                                  or if the request timed out.
+        :raises AMQPConnectionError: Raises if the connection
+                                     encountered an error.
+
+        :rtype: pamqp.Frame
+        """
+        responses = self._rpc_responses
+        if responses is None:
+            raise AMQPChannelError('no rpc request in progress')
+        try:
+            frame_in = await asyncio.wait_for(responses.get(),
+                                              self.rpc_timeout)
+        except asyncio.TimeoutError:
+            self.check_for_errors()
+            raise AMQPChannelError(
+                f'rpc requests {self._rpc_valid_responses} took too long'
+            ) from None
+        if frame_in is None:
+            self.check_for_errors()
+            raise AMQPChannelError('channel closed')
+        return frame_in
+
+    async def start_consuming(
+        self, to_tuple: bool = False, auto_decode: bool = True,
+    ) -> None:
+        """Start consuming messages, and deliver them to the consumer
+        callbacks.
+
+            Callbacks may be regular functions or coroutine functions.
+
+        :param bool to_tuple: Should incoming messages be converted to a
+                              tuple before delivery.
+        :param bool auto_decode: Auto-decode strings when possible.
+
+        :raises AMQPChannelError: Raises if the channel encountered an error.
+        :raises AMQPConnectionError: Raises if the connection
+                                     encountered an error.
+
+        :return:
+        """
+        if not self._consumer_callbacks:
+            raise AMQPChannelError('no consumer callback defined')
+        async for message in self.build_inbound_messages(
+                auto_decode=auto_decode):
+            consumer_tag = message._method.get('consumer_tag')
+            callback = self._consumer_callbacks.get(consumer_tag)
+            if callback is None:
+                continue
+            if to_tuple:
+                result = callback(*message.to_tuple())
+            else:
+                result = callback(message)
+            if inspect.isawaitable(result):
+                await result
+
+    async def stop_consuming(self) -> None:
+        """Stop consuming messages.
+
+        :raises AMQPChannelError: Raises if the channel encountered an error.
+        :raises AMQPConnectionError: Raises if the connection
+                                     encountered an error.
+
+        :return:
+        """
+        if not self.consumer_tags:
+            return
+        if not self.is_closed:
+            for tag in list(self.consumer_tags):
+                await self.basic.cancel(tag)
+        self.remove_consumer_tag()
+
+    def write_frame(self, frame_out: Frame) -> None:
+        """Write a pamqp frame from the current channel.
+
+        :param specification.Frame frame_out: A single pamqp frame.
+
+        :return:
+        """
+        self.check_for_errors()
+        self._connection.write_frame(self.channel_id, frame_out)
+
+    def write_frames(self, frames_out: list[Frame]) -> None:
+        """Write multiple pamqp frames from the current channel.
+
+        :param list frames_out: A list of pamqp frames.
+
+        :return:
+        """
+        self.check_for_errors()
+        self._connection.write_frames(self.channel_id, frames_out)
+
+    def write_marshalled_frames(self, data_out: bytes) -> None:
+        """Write already marshalled amqp frames from the current channel.
+
+        :param bytes data_out: Marshalled amqp frames.
+
+        :return:
+        """
+        self.check_for_errors()
+        self._connection.write_marshalled_frames(data_out)
+
+    def _basic_cancel(self, frame_in: Any) -> None:
+        """Handle a Basic Cancel frame.
+
+        :param specification.Basic.Cancel frame_in: Amqp frame.
+
+        :return:
+        """
+        LOGGER.warning(
+            'Received Basic.Cancel on consumer_tag: %s',
+            try_utf8_decode(frame_in.consumer_tag)
+        )
+        self.remove_consumer_tag(frame_in.consumer_tag)
+
+    def _basic_return(self, frame_in: Any) -> None:
+        """Handle a Basic Return Frame and treat it as an error.
+
+        :param specification.Basic.Return frame_in: Amqp frame.
+
+        :return:
+        """
+        reply_text = try_utf8_decode(frame_in.reply_text)
+        message = (
+            "Message not delivered: %s (%s) to queue '%s' from exchange '%s'" %
+            (
+                reply_text,
+                frame_in.reply_code,
+                frame_in.routing_key,
+                frame_in.exchange
+            )
+        )
+        exception = AMQPMessageError(message,
+                                     reply_code=frame_in.reply_code)
+        self.exceptions.append(exception)
+
+    def _close_channel(self, frame_in: Any) -> None:
+        """Close Channel.
+
+        :param specification.Channel.Close frame_in: Channel Close frame.
+        :return:
+        """
+        self.set_state(self.CLOSING)
+        if not self._connection.is_closed:
+            try:
+                self._connection.write_frame(self.channel_id,
+                                             commands.Channel.CloseOk())
+            except AMQPConnectionError:
+                pass
+        reply_text = try_utf8_decode(frame_in.reply_text)
+        exception = AMQPChannelError(
+            f'Channel {self._channel_id} was closed by remote server: '
+            f'{reply_text}',
+            reply_code=frame_in.reply_code
+        )
+        self.exceptions.append(exception)
+        self._set_closed(exception)
+        self._connection._cleanup_channel(self.channel_id)
+
+    def _on_content_frame(self, frame_in: Any) -> None:
+        """Assemble the content frames of a delivered message, and add
+        the message to the inbound queue once complete.
+
+        :param pamqp.Frame frame_in: Amqp frame.
+        :return:
+        """
+        if frame_in.name == 'Basic.Deliver':
+            self._inbound_message = [frame_in]
+            return
+        elif not self._inbound_message:
+            LOGGER.warning(
+                'Received an out-of-order frame: %s was '
+                'expecting a Basic.Deliver frame',
+                type(frame_in)
+            )
+            return
+        self._inbound_message.append(frame_in)
+        if frame_in.name == 'ContentHeader':
+            self._inbound_body_size = frame_in.body_size
+        elif not frame_in.value:
+            self._inbound_body_size = 0
+        else:
+            self._inbound_body_size -= len(frame_in.value)
+        if self._inbound_body_size > 0:
+            return
+        basic_deliver, content_header, *body_parts = self._inbound_message
+        self._inbound_message = []
+        self._inbound.put_nowait((
+            basic_deliver, content_header,
+            b''.join(body_piece.value for body_piece in body_parts)
+        ))
+
+    def _set_closed(self, exception: Exception) -> None:
+        """Mark the channel as closed, and wake up anyone waiting on it.
+
+        :param Exception exception: Exception set on pending confirms.
+        :return:
+        """
+        self.set_state(self.CLOSED)
+        super().remove_consumer_tag()
+        if self._rpc_responses is not None:
+            self._rpc_responses.put_nowait(None)
+        if self._confirms:
+            self._confirms.fail(exception)
+        while not self._inbound.empty():
+            self._inbound.get_nowait()
+        self._inbound.put_nowait(None)
+
+    def _user_initiated_close(self) -> bool:
+        return self._user_closed or self._connection._user_closed
@@ -0,0 +1,597 @@
+"""AMQPStorm Asyncio Connection."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from types import TracebackType
+from typing import Any
+from typing import Callable
+
+from pamqp import exceptions as pamqp_exception
+from pamqp import frame as pamqp_frame
+from pamqp import header as pamqp_header
+
+from amqpstorm import compatibility
+from amqpstorm.aio.channel import AsyncChannel
+from amqpstorm.base import Stateful
+from amqpstorm.channel0 import Channel0
+from amqpstorm.channel_ids import ChannelIds
+from amqpstorm.connection import DEFAULT_HEARTBEAT_TIMEOUT
+from amqpstorm.connection import DEFAULT_SOCKET_TIMEOUT
+from amqpstorm.connection import DEFAULT_VIRTUAL_HOST
+from amqpstorm.connection import Connection
+from amqpstorm.exception import AMQPConnectionError
+from amqpstorm.exception import AMQPInvalidArgument
+from amqpstorm.heartbeat import Heartbeat
+from amqpstorm.io import IO
+
+LOGGER = logging.getLogger(__name__)
+
+
+class AsyncConnection(Stateful):
+    """RabbitMQ Connection for asyncio.
+
+        Runs on an asyncio Protocol instead of a socket and inbound
+        thread, but otherwise uses the same Channel0 negotiation and
+        Heartbeat handling as amqpstorm.Connection.
+
+    e.g.
+    ::
+
+        import amqpstorm.aio
+
+        async def main():
+            async with amqpstorm.aio.AsyncConnection(
+                    'localhost', 'guest', 'guest') as connection:
+                async with await connection.channel() as channel:
+                    await channel.queue.declare('my_queue')
+                    await channel.basic.publish('Hello World!', 'my_queue')
+
+    :param str hostname: Hostname
+    :param str username: Username
+    :param str password: Password
+    :param int port: Server port
+    :param str virtual_host: Virtual host
+    :param int heartbeat: RabbitMQ Heartbeat timeout
+    :param int,float timeout: Connection timeout
+    :param bool ssl: Enable SSL
+    :param dict ssl_options: SSL kwargs
+    :param dict client_properties: None or dict of client properties
+    :param str locale: Locale used during connection negotiation. Defaults to "en_US".
+
+    :raises AMQPConnectionError: Raises if the connection
+                                 encountered an error.
+    """
+
+    def __init__(
+        self,
+        hostname: str,
+        username: str,
+        password: str,
+        port: int = 5672,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__()
+        self.parameters = {
+            'hostname': hostname,
+            'username': username,
+            'password': password,
+            'port': port,
+            'virtual_host': kwargs.get('virtual_host', DEFAULT_VIRTUAL_HOST),
+            'heartbeat': kwargs.get('heartbeat', DEFAULT_HEARTBEAT_TIMEOUT),
+            'timeout': kwargs.get('timeout', DEFAULT_SOCKET_TIMEOUT),
+            'ssl': kwargs.get('ssl', False),
+            'ssl_options': kwargs.get('ssl_options', {}),
+            'client_properties': kwargs.get('client_properties', {}),
+            'locale': kwargs.get('locale', 'en_US'),
+        }
+        self._validate_parameters()
+        self._buffer = bytearray()
+        self._channel0 = Channel0(
+            self, self.parameters['client_properties']  # type: ignore[arg-type]
+        )
+        self._channels: dict[int, AsyncChannel] = {}
+        self._channel_ids = ChannelIds()
+        self._state_changed = asyncio.Event()
+        self._writable = asyncio.Event()
+        self._writable.set()
+        self._transport: asyncio.Transport | None = None
+        self._user_closed: bool = False
+        self.heartbeat = Heartbeat(self.parameters['heartbeat'],
+                                   self._channel0.send_heartbeat,
+                                   timer=self._create_heartbeat_timer)  # type: ignore[arg-type]
+
+    async def __aenter__(self) -> AsyncConnection:
+        if not self.is_open:
+            await self.open()
+        return self
+
+    async def __aexit__(
+        self,
+        exception_type: type[BaseException] | None,
+        exception_value: BaseException | None,
+        _: TracebackType | None,
+    ) -> None:
+        if exception_type:
+            message = 'Closing connection due to an unhandled exception: %s'
+            LOGGER.warning(message, exception_value)
+        await self.close()
+
+    @property
+    def channels(self) -> dict[int, AsyncChannel]:
+        """Returns a dictionary of the Channels currently available.
+
+        :rtype: dict
+        """
+        return self._channels
+
+    @property
+    def is_blocked(self) -> bool:
+        """Is the connection currently being blocked from publishing by
+        the remote server.
+
+        :rtype: bool
+        """
+        return self._channel0.is_blocked
+
+    @property
+    def max_allowed_channels(self) -> int:
+        """Returns the maximum allowed channels for the connection.
+
+        :rtype: int
+        """
+        return self._channel0.max_allowed_channels
+
+    @property
+    def max_frame_size(self) -> int:
+        """Returns the maximum allowed frame size for the connection.
+
+        :rtype: int
+        """
+        return self._channel0.max_frame_size
+
+    @property
+    def server_properties(self) -> dict[str, Any]:
+        """Returns the RabbitMQ Server Properties.
+
+        :rtype: dict
+        """
+        return self._channel0.server_properties
+
+    def set_state(self, state: int) -> None:
+        """Set State, and wake up anyone waiting for the state to change.
+
+        :param int state:
+        :return:
+        """
+        super().set_state(state)
+        self._state_changed.set()
+
+    async def channel(self, rpc_timeout: float = 60) -> AsyncChannel:
+        """Open a Channel.
+
+        :param int rpc_timeout: Timeout before we give up waiting for an RPC
+                                response from the server.
+
+        :raises AMQPInvalidArgument: Invalid Parameters
+        :raises AMQPChannelError: Raises if the channel encountered an error.
+        :raises AMQPConnectionError: Raises if the connection
+                                     encountered an error.
+
+        :rtype: amqpstorm.aio.AsyncChannel
+        """
+        LOGGER.debug('Opening a new Channel')
+        if not compatibility.is_integer(rpc_timeout):
+            raise AMQPInvalidArgument('rpc_timeout should be an integer')
+        elif self.is_closed:
+            raise AMQPConnectionError('connection closed')
+
+        channel_id = self._get_next_available_channel_id()
+        channel = AsyncChannel(channel_id, self, rpc_timeout)
+        self._channels[channel_id] = channel
+        try:
+            await channel.open()
+        except BaseException:
+            self._cleanup_channel(channel_id)
+            raise
+        LOGGER.debug('Channel #%d Opened', channel_id)
+        return channel
+
+    def check_for_errors(self) -> None:
+        """Check Connection for errors.
+
+        :raises AMQPConnectionError: Raises if the connection
+                                     encountered an error.
+        :return:
+        """
+        if not self.exceptions:
+            if not self.is_closed:
+                return
+            self.exceptions.append(AMQPConnectionError('connection closed'))
+        if not self.is_closed:
+            self.set_state(self.CLOSED)
+            self._abort()
+        raise self.exceptions[0]
+
+    async def close(self) -> None:
+        """Close the Connection.
+
+        :raises AMQPConnectionError: Raises if the connection
+                                     encountered an error.
+        :return:
+        """
+        LOGGER.debug('Connection Closing')
+        self._user_closed = True
+        self.heartbeat.stop()
+        try:
+            if not self.is_closed and self._transport:
+                self.set_state(self.CLOSING)
+                self._channel0.send_close_connection()
+                await self._wait_for_connection_state(Stateful.CLOSED)
+        except AMQPConnectionError:
+            pass
+        finally:
+            self._close_remaining_channels()
+            if self._transport:
+                self._transport.close()
+                self._transport = None
+            self.set_state(self.CLOSED)
+        LOGGER.debug('Connection Closed')
+
+    async def open(self) -> None:
+        """Open Connection.
+
+        :raises AMQPConnectionError: Raises if the connection
+                                     encountered an error.
+        """
+        LOGGER.debug('Connection Opening')
+        self.set_state(self.OPENING)
+        self._exceptions = []
+        self._channels = {}
+        self._channel_ids.reset()
+        self._buffer = bytearray()
+        self._user_closed = False
+        loop = asyncio.get_running_loop()
+        try:
+            await asyncio.wait_for(
+                loop.create_connection(
+                    lambda: _AMQPProtocol(self),
+                    self.parameters['hostname'],
+                    self.parameters['port'],
+                    **self._ssl_kwargs()
+                ),
+                timeout=self.parameters['timeout']
+            )
+        except (OSError, asyncio.TimeoutError) as why:
+            self.set_state(self.CLOSED)
+            raise AMQPConnectionError(
+                f"Could not connect to {self.parameters['hostname']}:"
+                f"{self.parameters['port']} error: {why!r}"
+            ) from why
+        self._write(pamqp_header.ProtocolHeader().marshal())
+        try:
+            await self._wait_for_connection_state(Stateful.OPEN)
+        except AMQPConnectionError:
+            self._abort()
+            raise
+        self.heartbeat.start(self._exceptions)
+        LOGGER.debug('Connection Opened')
+
+    async def drain(self) -> None:
+        """Wait until the transport is ready to accept more data.
+
+        :raises AMQPConnectionError: Raises if the connection
+                                     encountered an error.
+        :return:
+        """
+        while not self._writable.is_set():
+            self.check_for_errors()
+            await self._writable.wait()
+
+    def write_frame(self, channel_id: int, frame_out: Any) -> None:
+        """Marshal and write an outgoing pamqp frame to the Transport.
+
+        :param int channel_id: Channel ID.
+        :param specification.Frame frame_out: Amqp frame.
+
+        :return:
+        """
+        self.heartbeat.register_write()
+        self._write(pamqp_frame.marshal(frame_out, channel_id))
+
+    def write_frames(self, channel_id: int, frames_out: list[Any]) -> None:
+        """Marshal and write multiple outgoing pamqp frames to the Transport.
+
+        :param int channel_id: Channel ID.
+        :param list frames_out: Amqp frames.
+
+        :return:
+        """
+        data_out = b''.join(
+            pamqp_frame.marshal(single_frame, channel_id)
+            for single_frame in frames_out
+        )
+        self.heartbeat.register_write()
+        self._write(data_out)
+
+    def write_marshalled_frames(self, data_out: bytes) -> None:
+        """Write already marshalled amqp frames to the Transport.
+
+        :param bytes data_out: Marshalled amqp frames.
+
+        :return:
+        """
+        self.heartbeat.register_write()
+        self._write(data_out)
+
+    def _abort(self) -> None:
+        """Abort the Transport without waiting for buffered data.
+
+        :return:
+        """
+        if self._transport:
+            self._transport.abort()
+
+    def _cleanup_channel(self, channel_id: int) -> None:
+        """Remove the channel from the list of available channels.
+
+        :param int channel_id: Channel id
+
+        :return:
+        """
+        if self._channels.pop(channel_id, None) is not None:
+            self._channel_ids.release(channel_id)
+
+    def _close_on_error(self) -> None:
+        """Tear down the connection if it encountered an error, or was
+        closed by the remote server.
+
+        :return:
+        """
+        if self._user_closed:
+            return
+        try:
+            self.check_for_errors()
+        except AMQPConnectionError:
+            self._abort()
+            self._close_remaining_channels()
+
+    def _close_remaining_channels(self) -> None:
+        """Forcefully close all open channels.
+
+        :return:
+        """
+        for channel_id in list(self._channels):
+            self._channels[channel_id].on_connection_closed()
+            self._cleanup_channel(channel_id)
+
+    def _create_heartbeat_timer(
+        self, interval: float, function: Callable[[], bool],
+    ) -> _LoopTimer:
+        """Heartbeat timer implementation running on the event loop.
+
+            The connection is aborted as soon as the heartbeat checker
+            reports that the connection is dead.
+
+        :param float interval: Seconds between each check.
+        :param typing.Callable function: Heartbeat check.
+
+        :rtype: _LoopTimer
+        """
+        def check_for_life_signs() -> None:
+            function()
+            if self.exceptions:
+                self._close_on_error()
+
+        return _LoopTimer(interval, check_for_life_signs)
+
+    def _get_next_available_channel_id(self) -> int:
+        """Returns the next available channel id.
+
+            Ids of closed channels are re-used, lowest id first.
+
+        :raises AMQPConnectionError: Raises if there is no available channel.
+        :rtype: int
+        """
+        channel_id = self._channel_ids.acquire(
+            self.max_allowed_channels,
+            lambda channel_id: channel_id not in self._channels
+        )
+        if channel_id is None:
+            raise AMQPConnectionError(
+                f'reached the maximum number of channels {self.max_allowed_channels}'
+            )
+        return channel_id
+
+    def _on_connection_lost(self, exc: Exception | None) -> None:
+        """The Transport was closed.
+
+        :param Exception,None exc: Error that caused the connection to close.
+        :return:
+        """
+        self._transport = None
+        self.heartbeat.stop()
+        if not self._user_closed and not self.exceptions:
+            why = AMQPConnectionError(
+                f'connection was closed by remote server: {exc!r}'
+                if exc else 'connection was closed by remote server'
+            )
+            self.exceptions.append(why)
+        self.set_state(self.CLOSED)
+        self._writable.set()
+        self._close_remaining_channels()
+
+    def _on_data(self, data: bytes) -> None:
+        """Process data received on the Transport, and direct the frames
+        to the appropriate channel.
+
+        :param bytes data: Data received.
+        :return:
+        """
+        data_in = self._buffer
+        data_in += data
+        offset = 0
+        while True:
+            byte_count, channel_id, frame_in = self._handle_amqp_frame(
+                data_in, offset
+            )
+            if frame_in is None:
+                break
+            offset += byte_count
+
+            self.heartbeat.register_read()
+            if channel_id == 0:
+                self._channel0.on_frame(frame_in)
+            elif channel_id in self._channels:
+                self._channels[channel_id].on_frame(frame_in)
+        if offset:
+            del data_in[:offset]
+        if self.exceptions or self.is_closed:
+            self._close_on_error()
+
+    def _handle_amqp_frame(
+        self, data_in: bytearray, offset: int,
+    ) -> tuple[int, int | None, Any]:
+        """Unmarshal a single AMQP frame starting at offset and return
+        the result.
+
+        :param bytearray data_in: Received data
+        :param int offset: Position of the frame in data_in
+
+        :return: byte_count, channel_id, frame
+        """
+        byte_count = Connection._get_frame_size(data_in, offset)
+        if not byte_count:
+            return 0, None, None
+        try:
+            return pamqp_frame.unmarshal(
+                bytes(data_in[offset:offset + byte_count])
+            )
+        except pamqp_exception.UnmarshalingException:
+            pass
+        except pamqp_exception.AMQPFrameError as why:
+            LOGGER.error('AMQPFrameError: %r', why, exc_info=True)
+        except ValueError as why:
+            LOGGER.error(why, exc_info=True)
+            self.exceptions.append(AMQPConnectionError(why))
+        return 0, None, None
+
+    def _ssl_kwargs(self) -> dict[str, Any]:
+        """Keyword arguments used to set up SSL for the Transport.
+
+        :rtype: dict
+        """
+        if not self.parameters['ssl']:
+            return {}
+        ssl_options = self.parameters['ssl_options'] or {}
+        return {
+            'ssl': IO._create_ssl_context(ssl_options),
+            'server_hostname': (
+                ssl_options.get('server_hostname') or self.parameters['hostname']
+            ),
+        }
+
+    def _validate_parameters(self) -> None:
+        """Validate Connection Parameters.
+
+        :return:
+        """
+        if not compatibility.is_string(self.parameters['hostname']):
+            raise AMQPInvalidArgument('hostname should be a string')
+        elif not compatibility.is_integer(self.parameters['port']):
+            raise AMQPInvalidArgument('port should be an integer')
+        elif not compatibility.is_string(self.parameters['username']):
+            raise AMQPInvalidArgument('username should be a string')
+        elif not compatibility.is_string(self.parameters['password']):
+            raise AMQPInvalidArgument('password should be a string')
+        elif not compatibility.is_string(self.parameters['virtual_host']):
+            raise AMQPInvalidArgument('virtual_host should be a string')
+        elif not isinstance(self.parameters['timeout'], (int, float)):
+            raise AMQPInvalidArgument('timeout should be an integer or float')
+        elif not compatibility.is_integer(self.parameters['heartbeat']):
+            raise AMQPInvalidArgument('heartbeat should be an integer')
+
+    async def _wait_for_connection_state(
+        self, state: int, rpc_timeout: float = 30,
+    ) -> None:
+        """Wait for a Connection state.
+
+        :param int state: State that we expect
+
+        :raises AMQPConnectionError: Raises if we are unable to establish
+                                     a connection to RabbitMQ.
+
+        :return:
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + rpc_timeout
+        while self.current_state != state:
+            self.check_for_errors()
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                raise AMQPConnectionError('connection timed out')
+            self._state_changed.clear()
+            try:
+                await asyncio.wait_for(self._state_changed.wait(), remaining)
+            except asyncio.TimeoutError:
+                pass
+
+    def _write(self, data: bytes) -> None:
+        """Write data to the Transport.
+
+        :param bytes data: Data to write.
+
+        :raises AMQPConnectionError: Raises if the connection
+                                     encountered an error.
+        :return:
+        """
+        if not self._transport or self._transport.is_closing():
+            self.exceptions.append(AMQPConnectionError('connection closed'))
+            self.check_for_errors()
+            return
+        self._transport.write(data)
+
+
+class _AMQPProtocol(asyncio.Protocol):
+    """Internal asyncio Protocol feeding an AsyncConnection."""
+
+    def __init__(self, connection: AsyncConnection) -> None:
+        self._connection = connection
+
+    def connection_made(self, transport: Any) -> None:
+        self._connection._transport = transport
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        self._connection._on_connection_lost(exc)
+
+    def data_received(self, data: bytes) -> None:
+        self._connection._on_data(data)
+
+    def pause_writing(self) -> None:
+        self._connection._writable.clear()
+
+    def resume_writing(self) -> None:
+        self._connection._writable.set()
+
+
+class _LoopTimer:
+    """Internal threading.Timer compatible timer running on the event loop.
+
+    :param float interval: Seconds before the function is called.
+    :param typing.Callable function: Function to call.
+    """
+
+    def __init__(self, interval: float, function: Callable[[], None]) -> None:
+        self.daemon = True
+        self._interval = interval
+        self._function = function
+        self._handle: asyncio.TimerHandle | None = None
+
+    def start(self) -> None:
+        self._handle = asyncio.get_running_loop().call_later(
+            self._interval, self._function
+        )
+
+    def cancel(self) -> None:
+        if self._handle:
+            self._handle.cancel()
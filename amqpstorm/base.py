@@ -12,6 +12,7 @@ if TYPE_CHECKING:
     from amqpstorm.channel import Channel
 
 AUTH_MECHANISM = 'PLAIN'
+ERROR_CHECK_INTERVAL = 0.1
 IDLE_WAIT = 0.01
 MAX_FRAME_SIZE = 131072
 MAX_CHANNELS = 65535
@@ -168,10 +169,44 @@ class BaseMessage:
         self._method = method
         self._properties: dict[str, Any] = properties or {}
 
+    @classmethod
+    def from_frames(
+        cls,
+        channel: Channel | None,
+        body: Any,
+        method_frame: Any,
+        properties_frame: Any,
+        auto_decode: bool | None = None,
+    ) -> BaseMessage:
+        """Create a Message from the frames received from the remote
+        server.
+
+        :param Channel channel: AMQPStorm Channel
+        :param bytes body: Message body
+        :param pamqp.Frame method_frame: Basic.Deliver or Basic.GetOk frame.
+        :param pamqp.Frame properties_frame: Basic.Properties frame.
+        :param bool auto_decode: Auto-decode strings when possible.
+
+        :rtype: BaseMessage
+        """
+        return cls(channel=channel, body=body, method=dict(method_frame),
+                   properties=dict(properties_frame),
+                   auto_decode=auto_decode)
+
     def __iter__(self) -> Iterator[tuple[str, Any]]:
         for attribute in ['_body', '_channel', '_method', '_properties']:
             yield attribute[1::], getattr(self, attribute)
 
+    @property
+    def delivery_tag(self) -> int | None:
+        """Server-assigned delivery tag.
+
+        :rtype: int,None
+        """
+        if not self._method:
+            return None
+        return self._method.get('delivery_tag')
+
     def to_dict(self) -> dict[str, Any]:
         """Message to Dictionary.
 
@@ -1,11 +1,16 @@
 """AMQPStorm Channel.Basic."""
 from __future__ import annotations
 
+import itertools
 import logging
+import time
+from concurrent.futures import Future
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import Callable
 from typing import Iterable
+from typing import Iterator
+from typing import Sequence
 
 from pamqp import body as pamqp_body
 from pamqp import header as pamqp_header
@@ -15,9 +20,12 @@ from amqpstorm import compatibility
 from amqpstorm.base import BaseMessage
 from amqpstorm.base import Handler
 from amqpstorm.base import MAX_FRAME_SIZE
+from amqpstorm.confirm import ConfirmTracker
 from amqpstorm.exception import AMQPChannelError
+from amqpstorm.exception import AMQPError
 from amqpstorm.exception import AMQPInvalidArgument
 from amqpstorm.message import Message
+from amqpstorm.publisher import PreparedPublisher
 
 if TYPE_CHECKING:
     from amqpstorm.channel import Channel
@@ -27,11 +35,12 @@ LOGGER = logging.getLogger(__name__)
 
 class Basic(Handler):
     """RabbitMQ Basic Operations."""
-    __slots__ = ['_max_frame_size']
+    __slots__ = ['_max_frame_size', '_prefetch']
 
     def __init__(self, channel: Channel, max_frame_size: int | None = None) -> None:
         super().__init__(channel)
         self._max_frame_size = max_frame_size or MAX_FRAME_SIZE
+        self._prefetch = (0, 0)
 
     def qos(
         self,
@@ -61,7 +70,9 @@ class Basic(Handler):
         qos_frame = commands.Basic.Qos(prefetch_count=prefetch_count,
                                        prefetch_size=prefetch_size,
                                        global_=global_)
-        return self._channel.rpc_request(qos_frame)
+        result = self._channel.rpc_request(qos_frame)
+        self._prefetch = (prefetch_count, prefetch_size)
+        return result
 
     def get(
         self,
@@ -111,6 +122,9 @@ class Basic(Handler):
         with self._channel.lock:
             message = self._get_message(get_frame, auto_decode=auto_decode,
                                         message_impl=message_impl)
+            delivery_tag = message.delivery_tag if message else None
+            if delivery_tag is not None and not no_ack and self._channel._acks:
+                self._channel._acks.delivered(delivery_tag)
             if message and to_dict:
                 return message.to_dict()
             return message
@@ -160,24 +174,16 @@ class Basic(Handler):
         :returns: Consumer tag
         :rtype: str
         """
-        if not compatibility.is_string(queue):
-            raise AMQPInvalidArgument('queue should be a string')
-        elif not compatibility.is_string(consumer_tag):
-            raise AMQPInvalidArgument('consumer_tag should be a string')
-        elif not isinstance(exclusive, bool):
-            raise AMQPInvalidArgument('exclusive should be a boolean')
-        elif not isinstance(no_ack, bool):
-            raise AMQPInvalidArgument('no_ack should be a boolean')
-        elif not isinstance(no_local, bool):
-            raise AMQPInvalidArgument('no_local should be a boolean')
-        elif arguments is not None and not isinstance(arguments, dict):
-            raise AMQPInvalidArgument('arguments should be a dict or None')
+        self._validate_consume_parameters(arguments, consumer_tag, exclusive,
+                                          no_ack, no_local, queue)
         with self._channel.lock:
             consume_rpc_result = self._consume_rpc_request(arguments, consumer_tag,
                                                            exclusive, no_ack,
                                                            no_local, queue)
             tag = self._consume_add_and_get_tag(consume_rpc_result)
             self._channel._consumer_callbacks[tag] = callback
+            if no_ack:
+                self._channel._no_ack_consumer_tags.add(tag)
         return tag
 
     def cancel(self, consumer_tag: str = '') -> dict[str, Any]:
@@ -208,43 +214,131 @@ class Basic(Handler):
         properties: dict[str, Any] | None = None,
         mandatory: bool = False,
         immediate: bool = False,
-    ) -> bool | None:
+        body_size: int | None = None,
+    ) -> bool | Future[bool] | None:
         """Publish a Message.
 
-        :param bytes,str,unicode body: Message payload
+            If the channel is set to confirm deliveries, returns True if the
+            message was acknowledged by the remote server and False if not.
+            With asynchronous confirms a concurrent.futures.Future is
+            returned instead, which resolves to True or False.
+
+            With body_size set, the body can also be a binary file, or an
+            iterable of bytes. The body is then read, and written, one
+            frame at a time, instead of being held in memory as a whole.
+
+            e.g.
+            ::
+
+                with open('payload.bin', 'rb') as body:
+                    channel.basic.publish(
+                        body, 'my_queue',
+                        body_size=os.fstat(body.fileno()).st_size
+                    )
+
+            The other frames of the channel wait until the body has been
+            written. If the body turns out to be shorter, or longer, than
+            body_size, the message cannot be completed, and the channel
+            is left unusable.
+
+        :param bytes,str,unicode,file,iterable body: Message payload
         :param str routing_key: Message routing key
         :param str exchange: The exchange to publish the message to
         :param dict properties: Message properties
         :param bool mandatory: Requires the message is published
         :param bool immediate: Request immediate delivery
+        :param int body_size: Size of a streamed body in bytes.
 
         :raises AMQPInvalidArgument: Invalid Parameters
         :raises AMQPChannelError: Raises if the channel encountered an error.
         :raises AMQPConnectionError: Raises if the connection
                                      encountered an error.
 
-        :rtype: bool,None
+        :rtype: bool,concurrent.futures.Future,None
         """
-        self._validate_publish_parameters(body, exchange, immediate, mandatory,
-                                          properties, routing_key)
-        properties = properties or {}
-        encoded_body = self._handle_utf8_payload(body, properties)
-        properties_frame = commands.Basic.Properties(**properties)
-        method_frame = commands.Basic.Publish(exchange=exchange,
-                                              routing_key=routing_key,
-                                              mandatory=mandatory,
-                                              immediate=immediate)
-        header_frame = pamqp_header.ContentHeader(body_size=len(encoded_body),
-                                                  properties=properties_frame)
+        if body_size is not None:
+            frames_out: Any = self._create_stream_frames(
+                body, body_size, routing_key, exchange, properties,
+                mandatory, immediate
+            )
+        else:
+            frames_out = self._create_publish_frames(body, routing_key,
+                                                     exchange, properties,
+                                                     mandatory, immediate)
+        return self._publish_frames(frames_out, mandatory)
 
-        frames_out: list[Any] = [method_frame, header_frame]
-        frames_out.extend(self._create_content_body(encoded_body))
+    def publish_batch(
+        self, messages: Sequence[tuple[Any, ...] | dict[str, Any]],
+    ) -> list[bool] | list[Future[bool]] | None:
+        """Publish multiple Messages using a single write.
 
-        if self._channel.confirming_deliveries:
-            with self._channel.rpc.lock:
-                return self._publish_confirm(frames_out, mandatory)
-        self._channel.write_frames(frames_out)
-        return None
+            Each message is either a tuple of positional, or a dict of
+            keyword, basic.publish arguments. The frames of all messages
+            are marshalled into a single buffer, and written to the socket
+            at once.
+
+            e.g.
+            ::
+
+                channel.basic.publish_batch([
+                    ('Hello World!', 'my_queue'),
+                    {'body': 'Hello World!', 'routing_key': 'my_queue',
+                     'properties': {'delivery_mode': 2}},
+                ])
+
+            If the channel is set to confirm deliveries, returns a list
+            with True or False for each message, once all of them have been
+            confirmed by the remote server. With asynchronous confirms a
+            list of concurrent.futures.Future is returned instead.
+
+        :param list messages: Messages to publish.
+
+        :raises AMQPInvalidArgument: Invalid Parameters
+        :raises AMQPChannelError: Raises if the channel encountered an error.
+        :raises AMQPConnectionError: Raises if the connection
+                                     encountered an error.
+
+        :rtype: list,None
+        """
+        frames_out, mandatory = self._create_batch_frames(messages)
+        return self._publish_batch_frames(frames_out, len(messages),
+                                          mandatory)
+
+    def prepare_publisher(
+        self,
+        routing_key: str,
+        exchange: str = '',
+        properties: dict[str, Any] | None = None,
+        mandatory: bool = False,
+        immediate: bool = False,
+    ) -> PreparedPublisher:
+        """Prepare a Publisher for Messages sharing the same exchange,
+        routing key and properties.
+
+            The Basic.Publish frame and the message properties are
+            marshalled once, instead of for every message published.
+
+            e.g.
+            ::
+
+                publisher = channel.basic.prepare_publisher('my_queue')
+                publisher.publish('Hello World!')
+
+        :param str routing_key: Message routing key
+        :param str exchange: The exchange to publish the message to
+        :param dict properties: Message properties
+        :param bool mandatory: Requires the message is published
+        :param bool immediate: Request immediate delivery
+
+        :raises AMQPInvalidArgument: Invalid Parameters
+
+        :rtype: amqpstorm.publisher.PreparedPublisher
+        """
+        self._validate_publish_parameters('', exchange, immediate, mandatory,
+                                          properties, routing_key)
+        return PreparedPublisher(self, self._channel.channel_id,
+                                 self._max_frame_size, routing_key,
+                                 exchange, properties, mandatory, immediate)
 
     def ack(self, delivery_tag: int = 0, multiple: bool = False) -> None:
         """Acknowledge Message.
@@ -263,6 +357,10 @@ class Basic(Handler):
             raise AMQPInvalidArgument('delivery_tag should be an integer')
         elif not isinstance(multiple, bool):
             raise AMQPInvalidArgument('multiple should be a boolean')
+        if self._channel._acks:
+            self._channel.check_for_errors()
+            self._channel._acks.ack(delivery_tag, multiple)
+            return
         ack_frame = commands.Basic.Ack(delivery_tag=delivery_tag,
                                        multiple=multiple)
         self._channel.write_frame(ack_frame)
@@ -295,7 +393,7 @@ class Basic(Handler):
         nack_frame = commands.Basic.Nack(delivery_tag=delivery_tag,
                                          multiple=multiple,
                                          requeue=requeue)
-        self._channel.write_frame(nack_frame)
+        self._write_settle_frame(nack_frame)
 
     def reject(self, delivery_tag: int = 0, requeue: bool = True) -> None:
         """Reject Message.
@@ -316,7 +414,21 @@ class Basic(Handler):
             raise AMQPInvalidArgument('requeue should be a boolean')
         reject_frame = commands.Basic.Reject(delivery_tag=delivery_tag,
                                              requeue=requeue)
-        self._channel.write_frame(reject_frame)
+        self._write_settle_frame(reject_frame)
+
+    def _write_settle_frame(self, frame_out: Any) -> None:
+        """Write a Basic.Nack or Basic.Reject frame, after any
+        acknowledgements held back by the Channel.
+
+        :param pamqp.Frame frame_out: Basic.Nack or Basic.Reject frame.
+
+        :return:
+        """
+        if not self._channel._acks:
+            self._channel.write_frame(frame_out)
+            return
+        self._channel.check_for_errors()
+        self._channel._acks.send(frame_out)
 
     def _consume_add_and_get_tag(self, consume_rpc_result: dict[str, Any]) -> str:
         """Add the tag to the channel and return it.
@@ -357,6 +469,41 @@ class Basic(Handler):
                                                arguments=arguments)
         return self._channel.rpc_request(consume_frame)
 
+    @staticmethod
+    def _validate_consume_parameters(
+        arguments: Any,
+        consumer_tag: Any,
+        exclusive: Any,
+        no_ack: Any,
+        no_local: Any,
+        queue: Any,
+    ) -> None:
+        """Validate Consume Parameters.
+
+        :param str queue: Queue name
+        :param str consumer_tag: Consumer tag
+        :param bool no_local: Do not deliver own messages
+        :param bool no_ack: No acknowledgement needed
+        :param bool exclusive: Request exclusive access
+        :param dict arguments: Consume key/value arguments
+
+        :raises AMQPInvalidArgument: Invalid Parameters
+
+        :return:
+        """
+        if not compatibility.is_string(queue):
+            raise AMQPInvalidArgument('queue should be a string')
+        elif not compatibility.is_string(consumer_tag):
+            raise AMQPInvalidArgument('consumer_tag should be a string')
+        elif not isinstance(exclusive, bool):
+            raise AMQPInvalidArgument('exclusive should be a boolean')
+        elif not isinstance(no_ack, bool):
+            raise AMQPInvalidArgument('no_ack should be a boolean')
+        elif not isinstance(no_local, bool):
+            raise AMQPInvalidArgument('no_local should be a boolean')
+        elif arguments is not None and not isinstance(arguments, dict):
+            raise AMQPInvalidArgument('arguments should be a dict or None')
+
     @staticmethod
     def _validate_publish_parameters(
         body: Any,
@@ -441,28 +588,395 @@ class Basic(Handler):
             finally:
                 self._channel.rpc.remove(message_uuid)
 
-        return message_impl(channel=self._channel,
-                            body=body,
-                            method=dict(get_ok_frame),
-                            properties=dict(content_header.properties),
-                            auto_decode=auto_decode)
+        return message_impl.from_frames(self._channel, body, get_ok_frame,
+                                        content_header.properties,
+                                        auto_decode=auto_decode)
+
+    def _publish_frames(
+        self, frames_out: list[Any] | bytes, mandatory: bool,
+    ) -> bool | Future[bool] | None:
+        """Write the frames of a single message, and wait for it to be
+        confirmed when the channel is set to confirm deliveries.
+
+        :param list,bytes frames_out: Frames, or pre-marshalled frames.
+        :param bool mandatory: Message published as mandatory.
+
+        :rtype: bool,concurrent.futures.Future,None
+        """
+        start_time = time.monotonic()
+        result: bool | Future[bool] | None = None
+        if self._channel.confirming_deliveries:
+            with self._channel.rpc.lock:
+                confirms = self._channel._confirms
+                if confirms:
+                    result = self._publish_confirm_async(confirms, frames_out)
+                else:
+                    result = self._publish_confirm(frames_out, mandatory)
+        else:
+            self._write_frames(frames_out)
+        if self._channel._metrics is not None:
+            self._channel._metrics.on_publish(1, time.monotonic() - start_time)
+        return result
+
+    def _publish_batch_frames(
+        self, frames_out: list[Any] | bytes, count: int, mandatory: bool,
+    ) -> list[bool] | list[Future[bool]] | None:
+        """Write the frames of a batch of messages, and wait for them to be
+        confirmed when the channel is set to confirm deliveries.
+
+        :param list,bytes frames_out: Frames, or pre-marshalled frames.
+        :param int count: Number of messages in the batch.
+        :param bool mandatory: Any message published as mandatory.
+
+        :rtype: list,None
+        """
+        start_time = time.monotonic()
+        result: list[bool] | list[Future[bool]] | None = None
+        if self._channel.confirming_deliveries:
+            with self._channel.rpc.lock:
+                confirms = self._channel._confirms
+                if confirms:
+                    result = self._publish_batch_confirm_async(
+                        confirms, frames_out, count
+                    )
+                else:
+                    result = self._publish_batch_confirm(frames_out, count,
+                                                         mandatory)
+        elif frames_out:
+            self._write_frames(frames_out)
+        if self._channel._metrics is not None and count:
+            self._channel._metrics.on_publish(count,
+                                              time.monotonic() - start_time)
+        return result
+
+    def _write_frames(self, frames_out: list[Any] | bytes | Iterator[Any]) -> None:
+        """Write frames, or pre-marshalled frames, to the channel.
+
+            Frames from an iterator are written one at a time, while
+            holding the write lock of the channel, so that no other frames
+            of the channel are written in between.
+
+        :param list,bytes,iterator frames_out: Frames, or pre-marshalled
+                                               frames.
 
-    def _publish_confirm(self, frames_out: list[Any], mandatory: bool) -> bool:
+        :return:
+        """
+        if isinstance(frames_out, bytes):
+            self._channel.write_marshalled_frames(frames_out)
+            return
+        elif isinstance(frames_out, list):
+            self._channel.write_frames(frames_out)
+            return
+        with self._channel._write_lock:
+            for frame_out in frames_out:
+                self._channel.write_frame(frame_out)
+
+    def _publish_confirm(
+        self, frames_out: list[Any] | bytes, mandatory: bool,
+    ) -> bool:
         """Confirm that message was published successfully.
 
-        :param list frames_out:
+        :param list,bytes frames_out:
 
         :rtype: bool
         """
         confirm_uuid = self._channel.rpc.register_request(['Basic.Ack',
                                                            'Basic.Nack'])
-        self._channel.write_frames(frames_out)
+        self._write_frames(frames_out)
+        start_time = time.monotonic()
+        self._channel._delivery_tag += 1
         result = self._channel.rpc.get_request(confirm_uuid, raw=True)
+        acked = isinstance(result, commands.Basic.Ack)
+        if self._channel._metrics is not None:
+            self._channel._metrics.on_confirm(acked,
+                                              time.monotonic() - start_time)
         if mandatory:
             self._channel.check_for_exceptions()
-        if isinstance(result, commands.Basic.Ack):
-            return True
-        return False
+        return acked
+
+    def _publish_confirm_async(
+        self, confirms: ConfirmTracker, frames_out: list[Any] | bytes,
+    ) -> Future[bool]:
+        """Publish a message without waiting for it to be confirmed.
+
+            Blocks while the channel has max_in_flight unconfirmed messages.
+
+        :param ConfirmTracker confirms: Publisher Confirm tracker.
+        :param list,bytes frames_out:
+
+        :rtype: concurrent.futures.Future
+        """
+        if confirms.max_in_flight:
+            confirms.wait(self._channel.check_for_errors,
+                          max_in_flight=confirms.max_in_flight - 1,
+                          timeout=self._channel.rpc.timeout)
+        future = confirms.register()
+        try:
+            self._write_frames(frames_out)
+        except AMQPError:
+            confirms.unregister(future)
+            raise
+        self._observe_confirms([future])
+        return future
+
+    def _create_batch_frames(
+        self, messages: Any,
+    ) -> tuple[list[Any], bool]:
+        """Validate the messages of a batch and create the frames needed
+        to publish all of them.
+
+        :param list messages: Messages to publish.
+
+        :raises AMQPInvalidArgument: Invalid Parameters
+
+        :return: frames, any message published as mandatory
+        """
+        if not isinstance(messages, (list, tuple)):
+            raise AMQPInvalidArgument('messages should be a list or tuple')
+        frames_out: list[Any] = []
+        mandatory = False
+        for message in messages:
+            if isinstance(message, dict):
+                frames_out.extend(self._create_publish_frames(**message))
+                mandatory = mandatory or message.get('mandatory', False)
+            elif isinstance(message, (list, tuple)):
+                frames_out.extend(self._create_publish_frames(*message))
+                mandatory = mandatory or (len(message) > 4 and message[4])
+            else:
+                raise AMQPInvalidArgument(
+                    'messages should only contain tuples or dicts'
+                )
+        return frames_out, bool(mandatory)
+
+    def _create_publish_frames(
+        self,
+        body: bytes | str,
+        routing_key: str,
+        exchange: str = '',
+        properties: dict[str, Any] | None = None,
+        mandatory: bool = False,
+        immediate: bool = False,
+    ) -> list[Any]:
+        """Validate the Publish Parameters and create the frames needed
+        to publish the message.
+
+        :param bytes,str,unicode body: Message payload
+        :param str routing_key: Message routing key
+        :param str exchange: The exchange to publish the message to
+        :param dict properties: Message properties
+        :param bool mandatory: Requires the message is published
+        :param bool immediate: Request immediate delivery
+
+        :raises AMQPInvalidArgument: Invalid Parameters
+
+        :rtype: list
+        """
+        self._validate_publish_parameters(body, exchange, immediate, mandatory,
+                                          properties, routing_key)
+        properties = properties or {}
+        encoded_body = self._handle_utf8_payload(body, properties)
+        properties_frame = commands.Basic.Properties(**properties)
+        method_frame = commands.Basic.Publish(exchange=exchange,
+                                              routing_key=routing_key,
+                                              mandatory=mandatory,
+                                              immediate=immediate)
+        header_frame = pamqp_header.ContentHeader(body_size=len(encoded_body),
+                                                  properties=properties_frame)
+
+        frames_out: list[Any] = [method_frame, header_frame]
+        frames_out.extend(self._create_content_body(encoded_body))
+        return frames_out
+
+    def _create_stream_frames(
+        self,
+        body: Any,
+        body_size: int,
+        routing_key: str,
+        exchange: str = '',
+        properties: dict[str, Any] | None = None,
+        mandatory: bool = False,
+        immediate: bool = False,
+    ) -> Iterator[Any]:
+        """Validate the Publish Parameters and create an iterator over the
+        frames needed to publish a streamed message.
+
+            The parameters are validated right away, while the body is
+            only read as the frames are written.
+
+        :param file,iterable body: Message payload
+        :param int body_size: Size of the body in bytes.
+        :param str routing_key: Message routing key
+        :param str exchange: The exchange to publish the message to
+        :param dict properties: Message properties
+        :param bool mandatory: Requires the message is published
+        :param bool immediate: Request immediate delivery
+
+        :raises AMQPInvalidArgument: Invalid Parameters
+
+        :rtype: iterator
+        """
+        if not compatibility.is_integer(body_size) or body_size < 0:
+            raise AMQPInvalidArgument(
+                'body_size should be a non-negative integer'
+            )
+        elif compatibility.is_string(body) or not (hasattr(body, 'read') or hasattr(body, '__iter__')):
+            raise AMQPInvalidArgument(
+                'body should be a file or an iterable when body_size is set'
+            )
+        self._validate_publish_parameters('', exchange, immediate, mandatory,
+                                          properties, routing_key)
+        properties = properties or {}
+        self._handle_utf8_payload(b'', properties)
+        properties_frame = commands.Basic.Properties(**properties)
+        method_frame = commands.Basic.Publish(exchange=exchange,
+                                              routing_key=routing_key,
+                                              mandatory=mandatory,
+                                              immediate=immediate)
+        header_frame = pamqp_header.ContentHeader(body_size=body_size,
+                                                  properties=properties_frame)
+        return itertools.chain(
+            (method_frame, header_frame),
+            self._create_stream_content_body(
+                body, body_size, properties['content_encoding']
+            )
+        )
+
+    def _create_stream_content_body(
+        self, body: Any, body_size: int, encoding: str,
+    ) -> Iterator[pamqp_body.ContentBody]:
+        """Read a streamed body, and split it based on the maximum frame
+        size.
+
+            At most one frame of the body is held in memory at a time.
+
+        :param file,iterable body: Message payload
+        :param int body_size: Size of the body in bytes.
+        :param str encoding: Encoding used for str chunks.
+
+        :raises AMQPChannelError: Raises if the body does not match
+                                  body_size.
+
+        :rtype: iterator
+        """
+        max_frame_size = self._max_frame_size
+        if hasattr(body, 'read'):
+            chunks = iter(lambda: body.read(max_frame_size) or None, None)
+        else:
+            chunks = iter(body)
+        pending = bytearray()
+        body_len = 0
+        for chunk in chunks:
+            if isinstance(chunk, str):
+                chunk = bytes(chunk, encoding=encoding)
+            if not chunk:
+                continue
+            body_len += len(chunk)
+            if body_len > body_size:
+                break
+            elif not pending and len(chunk) == max_frame_size and isinstance(chunk, bytes):
+                yield pamqp_body.ContentBody(chunk)
+                continue
+            pending += chunk
+            while len(pending) >= max_frame_size:
+                yield pamqp_body.ContentBody(bytes(pending[:max_frame_size]))
+                del pending[:max_frame_size]
+        if pending and body_len <= body_size:
+            yield pamqp_body.ContentBody(bytes(pending))
+        if body_len != body_size:
+            error = AMQPChannelError(
+                f'body does not match body_size, expected {body_size} bytes'
+            )
+            self._channel.exceptions.append(error)
+            raise error
+
+    def _publish_batch_confirm(
+        self, frames_out: list[Any] | bytes, count: int, mandatory: bool,
+    ) -> list[bool]:
+        """Confirm that a batch of messages was published successfully.
+
+            The messages are assigned the delivery tags following the last
+            confirmed message, and each Basic.Ack or Basic.Nack received
+            resolves the range of delivery tags it covers.
+
+        :param list,bytes frames_out:
+        :param int count: Number of messages in the batch.
+        :param bool mandatory: Any message published as mandatory.
+
+        :rtype: list
+        """
+        confirms = ConfirmTracker(delivery_tag=self._channel._delivery_tag)
+        futures = [confirms.register() for _ in range(count)]
+        if not futures:
+            return []
+        confirm_uuid = self._channel.rpc.register_request(['Basic.Ack',
+                                                           'Basic.Nack'])
+        try:
+            self._write_frames(frames_out)
+            self._observe_confirms(futures)
+            self._channel._delivery_tag = confirms.delivery_tag
+            while confirms.in_flight:
+                confirms.on_frame(self._channel.rpc.get_request(
+                    confirm_uuid, raw=True, multiple=True
+                ))
+        finally:
+            self._channel.rpc.remove(confirm_uuid)
+        if mandatory:
+            self._channel.check_for_exceptions()
+        return [future.result() for future in futures]
+
+    def _publish_batch_confirm_async(
+        self, confirms: ConfirmTracker, frames_out: list[Any] | bytes,
+        count: int,
+    ) -> list[Future[bool]]:
+        """Publish a batch of messages without waiting for them to be
+        confirmed.
+
+            Blocks until the batch fits within max_in_flight, or until
+            there are no unconfirmed messages left if the batch is larger
+            than max_in_flight.
+
+        :param ConfirmTracker confirms: Publisher Confirm tracker.
+        :param list,bytes frames_out:
+        :param int count: Number of messages in the batch.
+
+        :rtype: list
+        """
+        if not count:
+            return []
+        if confirms.max_in_flight:
+            confirms.wait(self._channel.check_for_errors,
+                          max_in_flight=max(confirms.max_in_flight - count, 0),
+                          timeout=self._channel.rpc.timeout)
+        futures = [confirms.register() for _ in range(count)]
+        try:
+            self._write_frames(frames_out)
+        except AMQPError:
+            for future in reversed(futures):
+                confirms.unregister(future)
+            raise
+        self._observe_confirms(futures)
+        return futures
+
+    def _observe_confirms(self, futures: list[Future[bool]]) -> None:
+        """Report the time until each message is confirmed to the
+        metrics of the connection, if any.
+
+        :param list futures: Futures of the written messages.
+
+        :return:
+        """
+        metrics = self._channel._metrics
+        if metrics is None:
+            return
+        start_time = time.monotonic()
+
+        def on_confirm(future: Future[bool]) -> None:
+            if future.cancelled() or future.exception() is not None:
+                return
+            metrics.on_confirm(future.result(), time.monotonic() - start_time)
+
+        for future in futures:
+            future.add_done_callback(on_confirm)
 
     def _create_content_body(self, body: bytes) -> Iterable[pamqp_body.ContentBody]:
         """Split body based on the maximum frame size.
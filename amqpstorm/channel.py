@@ -14,20 +14,26 @@ from pamqp import commands
 from pamqp.header import ContentHeader
 
 from amqpstorm import compatibility
+from amqpstorm.ack import AckCoalescer
 from amqpstorm.base import BaseChannel
 from amqpstorm.base import BaseMessage
+from amqpstorm.base import ERROR_CHECK_INTERVAL
 from amqpstorm.base import IDLE_WAIT
 from amqpstorm.basic import Basic
 from amqpstorm.compatibility import try_utf8_decode
+from amqpstorm.confirm import ConfirmTracker
+from amqpstorm.dispatcher import ConsumerDispatcher
 from amqpstorm.exception import AMQPError
 from amqpstorm.exception import AMQPChannelError
 from amqpstorm.exception import AMQPConnectionError
 from amqpstorm.exception import AMQPInvalidArgument
 from amqpstorm.exception import AMQPMessageError
 from amqpstorm.exchange import Exchange
+from amqpstorm.flow import InboundCounter
 from amqpstorm.message import Message
 from amqpstorm.queue import Queue
 from amqpstorm.rpc import Rpc
+from amqpstorm.stream import BodyStream
 from amqpstorm.tx import Tx
 
 if TYPE_CHECKING:
@@ -36,6 +42,7 @@ if TYPE_CHECKING:
     from amqpstorm.connection import Connection
 
 LOGGER = logging.getLogger(__name__)
+CONFIRM_FRAME = frozenset(('Basic.Ack', 'Basic.Nack'))
 CONTENT_FRAME = frozenset(('Basic.Deliver', 'ContentHeader', 'ContentBody'))
 
 
@@ -48,8 +55,12 @@ class Channel(BaseChannel):
         channel = connection.channel()
     """
     __slots__ = [
-        '_consumer_callbacks', 'rpc', '_basic', '_confirming_deliveries',
-        '_connection', '_exchange', '_inbound', '_queue', '_tx'
+        '_consumer_callbacks', 'rpc', '_acks', '_basic',
+        '_confirming_deliveries', '_confirms', '_connection', '_delivery_tag',
+        '_exchange', '_inbound', '_inbound_body_size', '_inbound_counter',
+        '_inbound_ready', '_inbound_stream', '_metrics',
+        '_no_ack_consumer_tags', '_queue', '_stream_body', '_transactional',
+        '_tx', '_write_lock'
     ]
 
     def __init__(
@@ -60,11 +71,24 @@ class Channel(BaseChannel):
     ) -> None:
         super().__init__(channel_id)
         self.lock = threading.Lock()
-        self.rpc = Rpc(self, timeout=rpc_timeout)
+        self._metrics = connection._metrics
+        self.rpc = Rpc(self, timeout=rpc_timeout, metrics=self._metrics,
+                       on_request=connection._wake_inbound)
+        self._acks: AckCoalescer | None = None
         self._consumer_callbacks: dict[str, Any] = {}
         self._confirming_deliveries = False
+        self._confirms: ConfirmTracker | None = None
         self._connection = connection
+        self._delivery_tag = 0
         self._inbound: collections.deque[Any] = collections.deque()
+        self._inbound_body_size = 0
+        self._inbound_counter = InboundCounter()
+        self._inbound_ready = threading.Event()
+        self._inbound_stream: BodyStream | None = None
+        self._no_ack_consumer_tags: set[str] = set()
+        self._stream_body = False
+        self._transactional = False
+        self._write_lock = threading.RLock()
         self._basic = Basic(self, connection.max_frame_size)
         self._exchange = Exchange(self)
         self._tx = Tx(self)
@@ -92,6 +116,24 @@ class Channel(BaseChannel):
     def __int__(self) -> int:
         return self._channel_id
 
+    @property
+    def inbound_bytes(self) -> int:
+        """Returns the number of message body bytes received that have not
+        been consumed yet.
+
+        :rtype: int
+        """
+        return self._inbound_counter.bytes
+
+    @property
+    def inbound_messages(self) -> int:
+        """Returns the number of messages received that have not been
+        consumed yet.
+
+        :rtype: int
+        """
+        return self._inbound_counter.messages
+
     @property
     def basic(self) -> Basic:
         """RabbitMQ Basic Operations.
@@ -151,6 +193,7 @@ class Channel(BaseChannel):
         auto_decode: bool = True,
         message_impl: type[BaseMessage] | None = None,
         empty_timeout: float | None = 1.0,
+        stream_body: bool = False,
     ) -> Iterator[Any]:
         """Build messages in the inbound queue.
 
@@ -176,6 +219,11 @@ class Channel(BaseChannel):
                                     ``break_on_empty`` exits the loop while a
                                     consumer is active. A None value exits as
                                     soon as the queue is empty, without waiting.
+        :param bool stream_body: Deliver messages as soon as their headers
+                                 have arrived, with the body as a
+                                 BodyStream that is read one frame at a
+                                 time, instead of as bytes. The body must
+                                 be read before the next message is built.
         :raises AMQPInvalidArgument: Invalid Parameters
         :raises AMQPChannelError: Raises if the channel encountered an error.
         :raises AMQPConnectionError: Raises if the connection
@@ -196,40 +244,59 @@ class Channel(BaseChannel):
                 )
         else:
             message_impl = Message
-        empty_since = None
-        while not self.is_closed:
-            try:
-                message = self._build_message(auto_decode=auto_decode,
-                                              message_impl=message_impl)
-            except (AMQPConnectionError, AMQPChannelError):
-                if self._user_initiated_close():
-                    return
-                raise
-
-            if not message:
+        if not isinstance(stream_body, bool):
+            raise AMQPInvalidArgument('stream_body should be a boolean')
+        self._stream_body = stream_body
+        try:
+            empty_since = None
+            while not self.is_closed:
+                self._inbound_ready.clear()
                 try:
-                    self.check_for_errors()
+                    message = self._build_message(auto_decode=auto_decode,
+                                                  message_impl=message_impl,
+                                                  stream_body=stream_body)
                 except (AMQPConnectionError, AMQPChannelError):
                     if self._user_initiated_close():
                         return
                     raise
-                time.sleep(IDLE_WAIT)
-                if break_on_empty and not self._inbound:
-                    if not self.consumer_tags:
-                        break
-                    if empty_timeout:
-                        if empty_since is None:
-                            empty_since = time.monotonic()
-                        elif time.monotonic() - empty_since >= empty_timeout:
+
+                if not message:
+                    try:
+                        self.check_for_errors()
+                    except (AMQPConnectionError, AMQPChannelError):
+                        if self._user_initiated_close():
+                            return
+                        raise
+                    timeout = ERROR_CHECK_INTERVAL
+                    if break_on_empty:
+                        if not self.consumer_tags or not empty_timeout:
+                            timeout = IDLE_WAIT
+                        else:
+                            now = time.monotonic()
+                            if empty_since is None:
+                                empty_since = now
+                            timeout = min(timeout,
+                                          max(empty_since + empty_timeout - now,
+                                              0))
+                    self._wait_for_inbound(timeout)
+                    if break_on_empty and not self._inbound:
+                        if not self.consumer_tags:
                             break
-                    else:
-                        break
-                continue
-            empty_since = None
-            if to_tuple:
-                yield message.to_tuple()
-                continue
-            yield message
+                        if empty_timeout:
+                            if empty_since is None:
+                                empty_since = time.monotonic()
+                            elif time.monotonic() - empty_since >= empty_timeout:
+                                break
+                        else:
+                            break
+                    continue
+                empty_since = None
+                if to_tuple:
+                    yield message.to_tuple()
+                    continue
+                yield message
+        finally:
+            self._stream_body = False
 
     def _user_initiated_close(self) -> bool:
         return self._user_closed or self._connection._user_closed
@@ -257,6 +324,8 @@ class Channel(BaseChannel):
                 self.stop_consuming()
                 LOGGER.debug('Channel #%d forcefully Closed', self.channel_id)
                 return
+            if self._acks:
+                self._acks.flush()
             self.set_state(self.CLOSING)
             LOGGER.debug('Channel #%d Closing', self.channel_id)
             try:
@@ -271,11 +340,25 @@ class Channel(BaseChannel):
                 connection_adapter=self._connection
             )
         finally:
-            if self._inbound:
-                self._inbound.clear()
+            self._clear_inbound()
+            if self._acks:
+                self._acks.clear()
+            if self._confirms:
+                self._confirms.fail(AMQPChannelError('channel closed'))
             self.set_state(self.CLOSED)
+            self._inbound_ready.set()
         LOGGER.debug('Channel #%d Closed', self.channel_id)
 
+    def set_state(self, state: int) -> None:
+        """Set State, and release the channel id once the channel is closed.
+
+        :param int state:
+        :return:
+        """
+        super().set_state(state)
+        if state == self.CLOSED:
+            self._connection._channel_ids.release(self._channel_id)
+
     def check_for_errors(self) -> None:
         """Check connection and channel for errors.
 
@@ -308,17 +391,143 @@ class Channel(BaseChannel):
                 self.exceptions.pop(0)
             raise exception
 
-    def confirm_deliveries(self) -> dict[str, Any]:
+    def set_inbound_limits(
+        self, max_bytes: int | None = None, max_messages: int | None = None,
+    ) -> None:
+        """Limit the number of messages, and message body bytes, waiting
+        to be consumed on this Channel.
+
+            Once a limit is exceeded the Connection stops reading from the
+            socket, for all of its Channels, until the Channel has consumed
+            enough messages to be back below half of the limit. This also
+            limits the memory used by consumers with no_ack set, that are
+            not limited by the prefetch count.
+
+            Reading carries on while a Channel waits for a RPC response, or
+            for publisher confirms, so that e.g. a consumer callback can
+            still declare a queue or publish.
+
+        :param int,None max_bytes: Maximum number of buffered body bytes.
+        :param int,None max_messages: Maximum number of buffered messages.
+
+        :raises AMQPInvalidArgument: Invalid Parameters
+
+        :return:
+        """
+        for name, value in (('max_bytes', max_bytes),
+                            ('max_messages', max_messages)):
+            if value is not None and (not compatibility.is_integer(value) or value < 1):
+                raise AMQPInvalidArgument(
+                    f'{name} should be a positive integer or None'
+                )
+        self._inbound_counter.max_bytes = max_bytes
+        self._inbound_counter.max_messages = max_messages
+
+    def coalesce_acks(
+        self, max_pending: int = 100, flush_interval: float = 0.1,
+    ) -> None:
+        """Hold back acknowledgements, and send them in batches.
+
+            Acknowledgements sent using Message.ack or basic.ack are held
+            back until max_pending of them are waiting, or flush_interval
+            seconds have passed. All messages up to the oldest message not
+            yet acknowledged are then acknowledged using a single
+            Basic.Ack with multiple set. Messages acknowledged out of
+            order, past that point, are acknowledged one at a time.
+
+            Nacks and rejects are sent right away, after any acknowledgements
+            held back. Should be enabled before consuming.
+
+            e.g.
+            ::
+
+                channel.coalesce_acks(max_pending=100, flush_interval=0.1)
+                channel.basic.consume(on_message, 'my_queue')
+                channel.start_consuming()
+
+        :param int max_pending: Maximum number of acknowledgements held back.
+        :param int,float flush_interval: Maximum number of seconds an
+                                         acknowledgement is held back.
+
+        :raises AMQPInvalidArgument: Invalid Parameters
+
+        :return:
+        """
+        if not compatibility.is_integer(max_pending) or max_pending < 1:
+            raise AMQPInvalidArgument(
+                'max_pending should be a positive integer'
+            )
+        elif not isinstance(flush_interval, (int, float)) or flush_interval <= 0:
+            raise AMQPInvalidArgument(
+                'flush_interval should be a positive integer or float'
+            )
+        if self._acks:
+            self._acks.flush()
+        self._acks = AckCoalescer(self.write_frame, max_pending,
+                                  flush_interval,
+                                  timer=self._connection.heartbeat.timer_impl)
+
+    def flush_acks(self) -> None:
+        """Send all acknowledgements held back by coalesce_acks.
+
+        :raises AMQPChannelError: Raises if the channel encountered an error.
+        :raises AMQPConnectionError: Raises if the connection
+                                     encountered an error.
+
+        :return:
+        """
+        if not self._acks:
+            return
+        self._acks.flush()
+
+    def confirm_deliveries(
+        self,
+        asynchronous: bool = False,
+        max_in_flight: int | None = None,
+    ) -> dict[str, Any]:
         """Set the channel to confirm that each message has been
         successfully delivered.
 
+            By default basic.publish blocks until the message has been
+            confirmed and returns True or False. With asynchronous enabled
+            basic.publish instead returns a concurrent.futures.Future right
+            away, which resolves to True (ack) or False (nack) once the
+            remote server confirms the message.
+
+            e.g.
+            ::
+
+                channel.confirm_deliveries(asynchronous=True,
+                                           max_in_flight=1000)
+                future = channel.basic.publish('Hello World!', 'my_queue')
+                channel.wait_for_confirms()
+                assert future.result()
+
+        :param bool asynchronous: Do not wait for each message to be confirmed.
+        :param int,None max_in_flight: Maximum number of unconfirmed messages
+                                       before basic.publish blocks. Only used
+                                       with asynchronous confirms.
+
+        :raises AMQPInvalidArgument: Invalid Parameters
         :raises AMQPChannelError: Raises if the channel encountered an error.
         :raises AMQPConnectionError: Raises if the connection
                                      encountered an error.
 
         :return:
         """
+        if not isinstance(asynchronous, bool):
+            raise AMQPInvalidArgument('asynchronous should be a boolean')
+        elif max_in_flight is not None and not (
+                compatibility.is_integer(max_in_flight) and max_in_flight > 0):
+            raise AMQPInvalidArgument(
+                'max_in_flight should be a positive integer or None'
+            )
         self._confirming_deliveries = True
+        self._delivery_tag = 0
+        if asynchronous:
+            self._confirms = ConfirmTracker(
+                max_in_flight, on_wait=self._connection._wake_inbound
+            )
         confirm_frame = commands.Confirm.Select()
         return self.rpc_request(confirm_frame)
 
@@ -330,6 +539,26 @@ class Channel(BaseChannel):
         """
         return self._confirming_deliveries
 
+    def wait_for_confirms(self, timeout: float | None = None) -> None:
+        """Wait until all asynchronously published messages have been
+        confirmed by the remote server.
+
+        :param int,float,None timeout: Give up waiting after this many
+                                       seconds. Defaults to the RPC timeout.
+
+        :raises AMQPChannelError: Raises if the channel encountered an error,
+                                  or if the confirms took too long.
+        :raises AMQPConnectionError: Raises if the connection
+                                     encountered an error.
+
+        :return:
+        """
+        if not self._confirms:
+            return
+        if timeout is None:
+            timeout = self.rpc.timeout
+        self._confirms.wait(self.check_for_errors, timeout=timeout)
+
     def on_frame(self, frame_in: Any) -> None:
         """Handle frame sent to this specific channel.
 
@@ -340,7 +569,7 @@ class Channel(BaseChannel):
             return
 
         if frame_in.name in CONTENT_FRAME:
-            self._inbound.append(frame_in)
+            self._on_content_frame(frame_in)
         elif frame_in.name == 'Basic.Cancel':
             self._basic_cancel(frame_in)
         elif frame_in.name == 'Basic.CancelOk':
@@ -349,6 +578,8 @@ class Channel(BaseChannel):
             self.add_consumer_tag(frame_in['consumer_tag'])
         elif frame_in.name == 'Basic.Return':
             self._basic_return(frame_in)
+        elif self._confirms and frame_in.name in CONFIRM_FRAME:
+            self._confirms.on_frame(frame_in)
         elif frame_in.name == 'Channel.Close':
             self._close_channel(frame_in)
         elif frame_in.name == 'Channel.Flow':
@@ -364,9 +595,19 @@ class Channel(BaseChannel):
 
         :return:
         """
+        self._clear_inbound()
         self._inbound = collections.deque()
+        self._inbound_body_size = 0
+        self._inbound_ready.clear()
         self._exceptions: list[Exception] = []
         self._confirming_deliveries = False
+        self._confirms = None
+        self._delivery_tag = 0
+        self._transactional = False
+        if self._acks:
+            self._acks.clear()
+        self._acks = None
+        self._no_ack_consumer_tags = set()
         self._user_closed = False
         self.set_state(self.OPENING)
         self.rpc_request(commands.Channel.Open())
@@ -374,12 +615,15 @@ class Channel(BaseChannel):
 
     def process_data_events(
         self, to_tuple: bool = False, auto_decode: bool = True,
+        stream_body: bool = False,
     ) -> None:
         """Consume inbound messages.
 
         :param bool to_tuple: Should incoming messages be converted to a
                               tuple before delivery.
         :param bool auto_decode: Auto-decode strings when possible.
+        :param bool stream_body: Pass the body to the consumer callback as
+                                 a BodyStream, read one frame at a time.
 
         :raises AMQPChannelError: Raises if the channel encountered an error.
         :raises AMQPConnectionError: Raises if the connection
@@ -389,16 +633,19 @@ class Channel(BaseChannel):
         """
         if not self._consumer_callbacks:
             raise AMQPChannelError('no consumer callback defined')
-        for message in self.build_inbound_messages(break_on_empty=True,
-                                                   auto_decode=auto_decode,
-                                                   empty_timeout=None):
-            consumer_tag = message._method.get('consumer_tag')
-            if to_tuple:
-                # noinspection PyCallingNonCallable
-                self._consumer_callbacks[consumer_tag](*message.to_tuple())
-                continue
-            # noinspection PyCallingNonCallable
-            self._consumer_callbacks[consumer_tag](message)
+        self._process_data_events(to_tuple, auto_decode,
+                                  stream_body=stream_body)
+
+    def remove_consumer_tag(self, tag: str | None = None) -> None:
+        """Remove a Consumer tag.
+
+            If no tag is specified, all tags will be removed.
+
+        :param str,None tag: Consumer tag.
+        :return:
+        """
+        super().remove_consumer_tag(tag)
+        self._inbound_ready.set()
 
     def rpc_request(
         self,
@@ -412,33 +659,79 @@ class Channel(BaseChannel):
         """
         with self.rpc.lock:
             uuid = self.rpc.register_request(frame_out.valid_responses)
-            self._connection.write_frame(self.channel_id, frame_out)
+            with self._write_lock:
+                self._connection.write_frame(self.channel_id, frame_out)
             return self.rpc.get_request(
                 uuid, connection_adapter=connection_adapter
             )
 
     def start_consuming(
-        self, to_tuple: bool = False, auto_decode: bool = True,
+        self,
+        to_tuple: bool = False,
+        auto_decode: bool = True,
+        workers: int | None = None,
+        ordered: bool = False,
+        stream_body: bool = False,
     ) -> None:
         """Start consuming messages.
 
+            By default the consumer callbacks are called on the current
+            thread. With workers set, messages are built on the current
+            thread, and the callbacks are called on a pool of worker
+            threads, so that one slow callback does not hold up the other
+            messages. At most workers messages are handed out at a time,
+            and the rest stay in the inbound queue.
+
+            Messages can be acknowledged from the callbacks as usual.
+
         :param bool to_tuple: Should incoming messages be converted to a
                               tuple before delivery.
         :param bool auto_decode: Auto-decode strings when possible.
+        :param int workers: Number of worker threads used to call the
+                            consumer callbacks.
+        :param bool ordered: Process the messages of each consumer tag
+                             one at a time, in the order they were
+                             received. Only used together with workers.
+        :param bool stream_body: Pass the body to the consumer callback as
+                                 a BodyStream, read one frame at a time.
+                                 The body must be read before the callback
+                                 returns, so it cannot be used together
+                                 with workers.
 
+        :raises AMQPInvalidArgument: Invalid Parameters
         :raises AMQPChannelError: Raises if the channel encountered an error.
         :raises AMQPConnectionError: Raises if the connection
                                      encountered an error.
 
         :return:
         """
-        if not self._consumer_callbacks:
-            raise AMQPChannelError('no consumer callback defined')
-        while not self.is_closed and self.consumer_tags:
-            self.process_data_events(
-                to_tuple=to_tuple,
-                auto_decode=auto_decode
+        if workers is not None and (not compatibility.is_integer(workers) or workers < 1):
+            raise AMQPInvalidArgument(
+                'workers should be a positive integer or None'
+            )
+        elif not isinstance(ordered, bool):
+            raise AMQPInvalidArgument('ordered should be a boolean')
+        elif stream_body and workers:
+            raise AMQPInvalidArgument(
+                'stream_body cannot be used together with workers'
             )
+        elif not self._consumer_callbacks:
+            raise AMQPChannelError('no consumer callback defined')
+        dispatcher = None
+        if workers:
+            dispatcher = ConsumerDispatcher(workers, ordered=ordered)
+        try:
+            while not self.is_closed and self.consumer_tags:
+                self._process_data_events(to_tuple, auto_decode, dispatcher,
+                                          stream_body=stream_body)
+                if dispatcher and dispatcher.exceptions:
+                    break
+                self._wait_for_inbound(ERROR_CHECK_INTERVAL)
+        finally:
+            if dispatcher:
+                dispatcher.close()
+        if dispatcher and dispatcher.exceptions:
+            raise dispatcher.exceptions[0]
 
     def stop_consuming(self) -> None:
         """Stop consuming messages.
@@ -464,7 +757,8 @@ class Channel(BaseChannel):
         :return:
         """
         self.check_for_errors()
-        self._connection.write_frame(self.channel_id, frame_out)
+        with self._write_lock:
+            self._connection.write_frame(self.channel_id, frame_out)
 
     def write_frames(self, frames_out: list[Frame]) -> None:
         """Write multiple pamqp frames from the current channel.
@@ -474,7 +768,51 @@ class Channel(BaseChannel):
         :return:
         """
         self.check_for_errors()
-        self._connection.write_frames(self.channel_id, frames_out)
+        with self._write_lock:
+            self._connection.write_frames(self.channel_id, frames_out)
+
+    def write_marshalled_frames(self, data_out: bytes) -> None:
+        """Write already marshalled amqp frames from the current channel.
+
+        :param bytes data_out: Marshalled amqp frames.
+
+        :return:
+        """
+        self.check_for_errors()
+        with self._write_lock:
+            self._connection.write_marshalled_frames(data_out)
+
+    def _process_data_events(
+        self,
+        to_tuple: bool,
+        auto_decode: bool,
+        dispatcher: ConsumerDispatcher | None = None,
+        stream_body: bool = False,
+    ) -> None:
+        """Call the consumer callback of each inbound message, either
+        directly, or using the dispatcher.
+
+        :param bool to_tuple: Should incoming messages be converted to a
+                              tuple before delivery.
+        :param bool auto_decode: Auto-decode strings when possible.
+        :param ConsumerDispatcher dispatcher: Worker threads used to call
+                                              the consumer callbacks.
+        :param bool stream_body: Build the body as a BodyStream.
+
+        :return:
+        """
+        for message in self.build_inbound_messages(break_on_empty=True,
+                                                   auto_decode=auto_decode,
+                                                   empty_timeout=None,
+                                                   stream_body=stream_body):
+            consumer_tag = message._method.get('consumer_tag')
+            callback = self._consumer_callbacks[consumer_tag]
+            args = message.to_tuple() if to_tuple else (message,)
+            if dispatcher is None:
+                # noinspection PyCallingNonCallable
+                callback(*args)
+            elif not dispatcher.dispatch(consumer_tag, callback, args):
+                return
 
     def _basic_cancel(self, frame_in: Any) -> None:
         """Handle a Basic Cancel frame.
@@ -512,27 +850,40 @@ class Channel(BaseChannel):
 
     def _build_message(
         self, auto_decode: bool, message_impl: type[BaseMessage],
+        stream_body: bool = False,
     ) -> BaseMessage | None:
         """Fetch and build a complete Message from the inbound queue.
 
+            The part of the previous streamed body not yet read is
+            discarded first.
+
         :param bool auto_decode: Auto-decode strings when possible.
         :param class message_impl: Message implementation from BaseMessage
+        :param bool stream_body: Build the body as a BodyStream.
 
         :rtype: Message
         """
+        if self._inbound_stream is not None:
+            self._inbound_stream.close()
+            self._inbound_stream = None
         if len(self._inbound) < 2:
             return None
         headers = self._build_message_headers()
         if not headers:
             return None
         basic_deliver, content_header = headers
-        body = self._build_message_body(content_header.body_size)
+        if stream_body:
+            body: Any = BodyStream(self._next_body_chunk,
+                                   content_header.body_size)
+            self._inbound_stream = body
+        else:
+            body = self._build_message_body(content_header.body_size)
+        if self._acks and basic_deliver.consumer_tag not in self._no_ack_consumer_tags:
+            self._acks.delivered(basic_deliver.delivery_tag)
 
-        message = message_impl(channel=self,
-                               body=body,
-                               method=dict(basic_deliver),
-                               properties=dict(content_header.properties),
-                               auto_decode=auto_decode)
+        message = message_impl.from_frames(self, body, basic_deliver,
+                                           content_header.properties,
+                                           auto_decode=auto_decode)
         return message
 
     def _build_message_headers(self) -> tuple[Any, Any] | None:
@@ -540,7 +891,7 @@ class Channel(BaseChannel):
 
         :rtype: tuple,None
         """
-        basic_deliver = self._inbound.popleft()
+        basic_deliver = self._pop_inbound()
         if not isinstance(basic_deliver, commands.Basic.Deliver):
             LOGGER.warning(
                 'Received an out-of-order frame: %s was '
@@ -548,7 +899,7 @@ class Channel(BaseChannel):
                 type(basic_deliver)
             )
             return None
-        content_header = self._inbound.popleft()
+        content_header = self._pop_inbound()
         if not isinstance(content_header, ContentHeader):
             LOGGER.warning(
                 'Received an out-of-order frame: %s was '
@@ -567,17 +918,107 @@ class Channel(BaseChannel):
         body_parts: list[bytes] = []
         body_len = 0
         while body_len < body_size:
-            if not self._inbound:
-                self.check_for_errors()
-                time.sleep(IDLE_WAIT)
-                continue
-            body_piece: Any = self._inbound.popleft()
-            if not body_piece.value:
+            body_piece = self._next_body_chunk()
+            if not body_piece:
                 break
-            body_parts.append(body_piece.value)
-            body_len += len(body_piece.value)
+            body_parts.append(body_piece)
+            body_len += len(body_piece)
         return b''.join(body_parts)
 
+    def _next_body_chunk(self) -> bytes | None:
+        """Wait for the next ContentBody frame, and return its value.
+
+        :raises AMQPChannelError: Raises if the channel encountered an error.
+        :raises AMQPConnectionError: Raises if the connection
+                                     encountered an error.
+
+        :rtype: bytes,None
+        """
+        while not self._inbound:
+            self.check_for_errors()
+            self._inbound_ready.clear()
+            if not self._inbound:
+                self._wait_for_inbound(ERROR_CHECK_INTERVAL)
+        body_piece: Any = self._pop_inbound()
+        return body_piece.value
+
+    def _on_content_frame(self, frame_in: Any) -> None:
+        """Add a content frame to the inbound queue, and wake up the
+        consumer once the message is complete, or for every frame while
+        the body is streamed.
+
+        :param pamqp.Frame frame_in: Amqp frame.
+        :return:
+        """
+        self._inbound.append(frame_in)
+        if frame_in.name == 'ContentHeader':
+            self._inbound_body_size = frame_in.body_size
+        elif frame_in.name == 'ContentBody':
+            if not frame_in.value:
+                self._inbound_body_size = 0
+            else:
+                self._count_inbound(len(frame_in.value), 0)
+                self._inbound_body_size -= len(frame_in.value)
+        else:
+            self._count_inbound(0, 1)
+            if self._metrics is not None:
+                self._metrics.on_message_received()
+            return
+        if self._inbound_body_size <= 0 or self._stream_body:
+            self._inbound_ready.set()
+
+    def _count_inbound(self, size: int, messages: int) -> None:
+        """Count a content frame added to the inbound queue, and let the
+        Connection know once the inbound limits are exceeded.
+
+        :param int size: Number of body bytes.
+        :param int messages: Number of messages.
+
+        :return:
+        """
+        self._inbound_counter.receive(size, messages)
+        self._connection._inbound_counter.receive(size, messages)
+        if self._inbound_counter.is_full:
+            self._connection._full_channels.add(self)
+
+    def _pop_inbound(self) -> Any:
+        """Remove the oldest frame from the inbound queue.
+
+        :rtype: pamqp.Frame
+        """
+        frame_in = self._inbound.popleft()
+        if frame_in.name == 'ContentBody' and frame_in.value:
+            size, messages = len(frame_in.value), 0
+        elif frame_in.name == 'Basic.Deliver':
+            size, messages = 0, 1
+        else:
+            return frame_in
+        self._inbound_counter.consume(size, messages)
+        self._connection._inbound_counter.consume(size, messages)
+        return frame_in
+
+    def _clear_inbound(self) -> None:
+        """Drop all frames in the inbound queue.
+
+        :return:
+        """
+        if self._inbound:
+            self._inbound.clear()
+        self._inbound_body_size = 0
+        self._inbound_stream = None
+        size = self._inbound_counter.bytes
+        messages = self._inbound_counter.messages
+        self._inbound_counter.consume(size, messages)
+        self._connection._inbound_counter.consume(size, messages)
+
+    def _wait_for_inbound(self, timeout: float) -> bool:
+        """Wait for a complete message to arrive in the inbound queue.
+
+        :param float timeout: Maximum time to wait, in seconds.
+        :rtype: bool
+        """
+        return self._inbound_ready.wait(timeout)
+
     def _close_channel(self, frame_in: Any) -> None:
         """Close Channel.
 
@@ -592,7 +1033,7 @@ class Channel(BaseChannel):
                 pass
         self.remove_consumer_tag()
         if self._inbound:
-            self._inbound.clear()
+            self._clear_inbound()
             # Releases the buffer; channel is being torn down so no further
             # reads are expected.
             self._inbound = None  # type: ignore[assignment]
@@ -602,4 +1043,10 @@ class Channel(BaseChannel):
             f'{reply_text}',
             reply_code=frame_in.reply_code
         ))
+        if self._acks:
+            self._acks.clear()
+        if self._confirms:
+            self._confirms.fail(self.exceptions[-1])
         self.set_state(self.CLOSED)
+        self._inbound_ready.set()
+        self.rpc.notify_all()
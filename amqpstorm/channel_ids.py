@@ -0,0 +1,113 @@
+"""AMQPStorm Channel Id allocation."""
+from __future__ import annotations
+
+import heapq
+import threading
+from typing import Callable
+
+
+class ChannelIds:
+    """Internal Channel id allocator.
+
+        Ids released by closed Channels are kept in a min-heap, and are
+        handed out again lowest id first, before ids that were never used.
+        Allocating an id does not need to scan all Channels, unless every
+        id has been handed out and none were released.
+    """
+    __slots__ = ['_lock', '_next_channel_id', '_released', '_released_ids']
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._next_channel_id = 1
+        self._released: list[int] = []
+        self._released_ids: set[int] = set()
+
+    def reset(self) -> None:
+        """Forget all allocated, and released, ids.
+
+        :return:
+        """
+        with self._lock:
+            self._next_channel_id = 1
+            self._released = []
+            self._released_ids = set()
+
+    def release(self, channel_id: int) -> None:
+        """Release a Channel id, so that it can be re-used.
+
+            Safe to call from any thread, and more than once for the
+            same id.
+
+        :param int channel_id: Channel id
+
+        :return:
+        """
+        if channel_id < 1:
+            return
+        with self._lock:
+            if channel_id in self._released_ids:
+                return
+            self._released_ids.add(channel_id)
+            heapq.heappush(self._released, channel_id)
+
+    def acquire(
+        self, max_channels: int, is_available: Callable[[int], bool],
+    ) -> int | None:
+        """Get the next available Channel id.
+
+        :param int max_channels: Highest Channel id allowed.
+        :param typing.Callable is_available: Checks that an id is not used
+                                             by an open Channel.
+
+        :rtype: int|None
+        """
+        with self._lock:
+            channel_id = self._get_released_id(max_channels, is_available)
+            if channel_id is None:
+                channel_id = self._get_unused_id(max_channels, is_available)
+            if channel_id is None:
+                self._reclaim(max_channels, is_available)
+                channel_id = self._get_released_id(max_channels, is_available)
+            return channel_id
+
+    def _get_released_id(
+        self, max_channels: int, is_available: Callable[[int], bool],
+    ) -> int | None:
+        """Get the lowest released id that is still available.
+
+        :rtype: int|None
+        """
+        while self._released:
+            channel_id = heapq.heappop(self._released)
+            self._released_ids.discard(channel_id)
+            if channel_id <= max_channels and is_available(channel_id):
+                return channel_id
+        return None
+
+    def _get_unused_id(
+        self, max_channels: int, is_available: Callable[[int], bool],
+    ) -> int | None:
+        """Get the next id that has never been handed out.
+
+        :rtype: int|None
+        """
+        while self._next_channel_id <= max_channels:
+            channel_id = self._next_channel_id
+            self._next_channel_id += 1
+            if is_available(channel_id):
+                return channel_id
+        return None
+
+    def _reclaim(
+        self, max_channels: int, is_available: Callable[[int], bool],
+    ) -> None:
+        """Release all available ids, including ids that were freed
+        without being released.
+
+        :return:
+        """
+        self._released = [
+            channel_id for channel_id in range(1, max_channels + 1)
+            if is_available(channel_id)
+        ]
+        self._released_ids = set(self._released)
@@ -0,0 +1,280 @@
+"""AMQPStorm Cluster Connection."""
+from __future__ import annotations
+
+import concurrent.futures
+import itertools
+import logging
+import math
+import random
+import socket
+import threading
+import time
+from typing import Any
+from typing import Iterable
+
+from amqpstorm import compatibility
+from amqpstorm.connection import Connection
+from amqpstorm.exception import AMQPConnectionError
+from amqpstorm.exception import AMQPInvalidArgument
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_NODE_COOLDOWN = 30
+STRATEGIES = ('shuffle', 'round_robin', 'latency')
+
+Node = tuple[str, int]
+
+
+def parse_nodes(nodes: Any, port: int = 5672) -> list[Node]:
+    """Parse a list of cluster nodes.
+
+        Each node is either a (hostname, port) tuple, or a string of the
+        form hostname, hostname:port or [ipv6]:port. A string of comma
+        separated nodes is also accepted.
+
+    :param list,str nodes: Cluster nodes.
+    :param int port: Port of the nodes that do not specify one.
+
+    :raises AMQPInvalidArgument: Invalid Parameters
+
+    :rtype: list
+    """
+    if compatibility.is_string(nodes):
+        nodes = nodes.split(',')
+    if not isinstance(nodes, (list, tuple)):
+        raise AMQPInvalidArgument('nodes should be a list or a string')
+    parsed = []
+    for node in nodes:
+        if isinstance(node, (list, tuple)) and len(node) == 2:
+            hostname, node_port = node
+        elif compatibility.is_string(node) and node.strip():
+            hostname, node_port = _split_host_port(node.strip(), port)
+        else:
+            raise AMQPInvalidArgument(f'invalid cluster node: {node!r}')
+        if not compatibility.is_integer(node_port):
+            raise AMQPInvalidArgument(f'invalid cluster node: {node!r}')
+        parsed.append((hostname, node_port))
+    if not parsed:
+        raise AMQPInvalidArgument('nodes should contain at least one node')
+    return parsed
+
+
+def _split_host_port(node: str, port: int) -> Node:
+    """Split a hostname:port string.
+
+    :param str node: Node string.
+    :param int port: Port used if the node does not specify one.
+
+    :raises AMQPInvalidArgument: Invalid Parameters
+
+    :rtype: tuple
+    """
+    hostname = node
+    if node.startswith('['):
+        hostname, _, remainder = node[1:].partition(']')
+        node_port = remainder[1:] if remainder.startswith(':') else ''
+    elif node.count(':') == 1:
+        hostname, _, node_port = node.partition(':')
+    else:
+        node_port = ''
+    if not node_port:
+        return hostname, port
+    if not node_port.isdigit():
+        raise AMQPInvalidArgument(f'invalid cluster node: {node!r}')
+    return hostname, int(node_port)
+
+
+class ClusterConnection(Connection):
+    """RabbitMQ Connection to one of the nodes of a cluster.
+
+        Every time the connection is opened a node is picked using the
+        strategy, and if connecting to it fails the next node is tried
+        right away.
+
+        e.g.
+        ::
+
+            import amqpstorm
+            connection = amqpstorm.ClusterConnection(
+                ['rmq1.eandersson.net', 'rmq2.eandersson.net:5673'],
+                'guest', 'guest', strategy='round_robin'
+            )
+
+        Strategies:
+
+        * shuffle: Try the nodes in a random order.
+        * round_robin: Start with the node after the node picked by the
+          previous connection, in this process.
+        * latency: Connect to all nodes at once, and try them in the
+          order they accepted the connection. The probe costs one extra
+          TCP connection per node.
+
+        Nodes that could not be connected to are tried last for
+        node_cooldown seconds.
+
+        A node that blocks the connection, due to a resource alarm, is
+        not failed over, as Connection.Blocked only arrives after the
+        connection was opened, once it publishes. Check is_blocked, and
+        close the connection to move to another node.
+
+        Combine with RobustConnection to fail over to another node when
+        the connection is recovered.
+        ::
+
+            class RobustClusterConnection(amqpstorm.RobustConnection,
+                                          amqpstorm.ClusterConnection):
+                pass
+
+    :param list,str nodes: Cluster nodes, either as (hostname, port)
+                           tuples, or hostname:port strings.
+    :param str username: Username
+    :param str password: Password
+    :param int port: Port of the nodes that do not specify one.
+    :param str strategy: Either "shuffle", "round_robin" or "latency".
+    :param int,float node_cooldown: Seconds a node that could not be
+                                    connected to is tried last.
+    :param kwargs: Connection kwargs (e.g. virtual_host, heartbeat or ssl)
+
+    :raises AMQPInvalidArgument: Invalid Parameters
+    :raises AMQPConnectionError: Raises if no node could be connected to.
+    """
+    __slots__ = ['_node_cooldown', '_nodes', '_nodes_lock', '_strategy',
+                 '_unavailable']
+    _round_robin = itertools.count()
+
+    def __init__(
+        self,
+        nodes: Any,
+        username: str,
+        password: str,
+        port: int = 5672,
+        strategy: str = 'shuffle',
+        node_cooldown: float = DEFAULT_NODE_COOLDOWN,
+        **kwargs: Any,
+    ) -> None:
+        if strategy not in STRATEGIES:
+            raise AMQPInvalidArgument(
+                f"strategy should be one of: {', '.join(STRATEGIES)}"
+            )
+        elif not isinstance(node_cooldown, (int, float)) or node_cooldown < 0:
+            raise AMQPInvalidArgument(
+                'node_cooldown should be a non-negative integer or float'
+            )
+        self._nodes = parse_nodes(nodes, port)
+        self._node_cooldown = node_cooldown
+        self._nodes_lock = threading.Lock()
+        self._strategy = strategy
+        self._unavailable: dict[Node, float] = {}
+        hostname, port = self._nodes[0]
+        super().__init__(hostname, username, password, port, **kwargs)
+
+    @property
+    def node(self) -> Node:
+        """Returns the node the connection was last opened to.
+
+        :rtype: tuple
+        """
+        return self.parameters['hostname'], self.parameters['port']
+
+    @property
+    def nodes(self) -> list[Node]:
+        """Returns the cluster nodes.
+
+        :rtype: list
+        """
+        return list(self._nodes)
+
+    def open(self) -> None:
+        """Open the Connection to the first available node.
+
+        :raises AMQPConnectionError: Raises if no node could be connected to.
+        """
+        if len(self._nodes) == 1:
+            super().open()
+            return
+        errors = []
+        candidates = self._candidates()
+        for node in candidates:
+            self.parameters['hostname'], self.parameters['port'] = node
+            try:
+                super().open()
+            except AMQPConnectionError as why:
+                LOGGER.warning('Cluster node %s:%d unavailable: %s',
+                               node[0], node[1], why)
+                errors.append(f'{node[0]}:{node[1]}: {why}')
+                self._set_unavailable(node)
+                self._io.close()
+                self.set_state(self.CLOSED)
+                continue
+            LOGGER.debug('Connected to cluster node %s:%d', node[0], node[1])
+            return
+        raise AMQPConnectionError(
+            f"no cluster node available: {'; '.join(errors)}"
+        )
+
+    def _candidates(self) -> list[Node]:
+        """Returns the nodes in the order they should be tried.
+
+        :rtype: list
+        """
+        nodes = list(self._nodes)
+        if self._strategy == 'shuffle':
+            random.shuffle(nodes)
+        elif self._strategy == 'round_robin':
+            start = next(self._round_robin) % len(nodes)
+            nodes = nodes[start:] + nodes[:start]
+        else:
+            latency = self._measure_latency(nodes)
+            nodes.sort(key=latency.__getitem__)
+            for node in nodes:
+                if math.isinf(latency[node]):
+                    self._set_unavailable(node)
+        now = time.monotonic()
+        with self._nodes_lock:
+            for node, until in list(self._unavailable.items()):
+                if until <= now:
+                    del self._unavailable[node]
+            return sorted(nodes, key=lambda node: node in self._unavailable)
+
+    def _measure_latency(self, nodes: Iterable[Node]) -> dict[Node, float]:
+        """Measure how long each node takes to accept a TCP connection.
+
+            The nodes are probed in parallel, and nodes that could not be
+            connected to get an infinite latency.
+
+        :param list nodes: Cluster nodes.
+
+        :rtype: dict
+        """
+        nodes = list(nodes)
+        with concurrent.futures.ThreadPoolExecutor(len(nodes)) as executor:
+            return dict(zip(nodes, executor.map(self._connect_time, nodes)))
+
+    def _connect_time(self, node: Node) -> float:
+        """Returns the seconds taken to open a TCP connection to a node.
+
+        :param tuple node: Cluster node.
+
+        :rtype: float
+        """
+        start_time = time.monotonic()
+        try:
+            sock = socket.create_connection(
+                node, timeout=self.parameters['timeout'] or None
+            )
+        except OSError as why:
+            LOGGER.debug('Cluster node %s:%d unreachable: %s',
+                         node[0], node[1], why)
+            return math.inf
+        sock.close()
+        return time.monotonic() - start_time
+
+    def _set_unavailable(self, node: Node) -> None:
+        """Try a node last for the next node_cooldown seconds.
+
+        :param tuple node: Cluster node.
+
+        :return:
+        """
+        with self._nodes_lock:
+            self._unavailable[node] = time.monotonic() + self._node_cooldown
@@ -59,8 +59,10 @@ if SSL_SUPPORTED:
         'cert_required': ssl.CERT_REQUIRED
     }
     SSLWantReadError: type[BaseException] = ssl.SSLWantReadError
+    SSLWantWriteError: type[BaseException] = ssl.SSLWantWriteError
 else:
     SSLWantReadError = DummyException
+    SSLWantWriteError = DummyException
 
 
 def is_string(obj: Any) -> bool:
@@ -0,0 +1,197 @@
+"""AMQPStorm Channel.Confirm."""
+from __future__ import annotations
+
+import collections
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any
+from typing import Callable
+
+from amqpstorm.base import ERROR_CHECK_INTERVAL
+from amqpstorm.exception import AMQPChannelError
+
+
+class ConfirmTracker:
+    """Internal asynchronous Publisher Confirm tracker.
+
+        Every published message is assigned the next delivery tag and a
+        Future. Incoming Basic.Ack and Basic.Nack frames, including those
+        confirming multiple messages at once, resolve the Futures of the
+        delivery tags they cover with True (ack) or False (nack).
+
+    :param int,None max_in_flight: Maximum number of unconfirmed messages
+                                   before publishing blocks.
+    :param int delivery_tag: Delivery tag of the last message published
+                             before the tracker was created.
+    :param typing.Callable on_wait: Called once a thread starts waiting for
+                                    confirms.
+    """
+
+    def __init__(
+        self, max_in_flight: int | None = None, delivery_tag: int = 0,
+        on_wait: Callable[[], None] | None = None,
+    ) -> None:
+        self._condition = threading.Condition(threading.Lock())
+        self._max_in_flight = max_in_flight
+        self._delivery_tag = delivery_tag
+        self._on_wait = on_wait
+        self._waiting = 0
+        self._pending: collections.OrderedDict[int, Future[bool]] = (
+            collections.OrderedDict()
+        )
+
+    @property
+    def delivery_tag(self) -> int:
+        """Returns the delivery tag of the last published message.
+
+        :rtype: int
+        """
+        return self._delivery_tag
+
+    @property
+    def in_flight(self) -> int:
+        """Returns the number of messages waiting to be confirmed.
+
+        :rtype: int
+        """
+        return len(self._pending)
+
+    @property
+    def is_waiting(self) -> bool:
+        """Returns True while a thread is waiting for confirms.
+
+        :rtype: bool
+        """
+        return self._waiting > 0
+
+    @property
+    def max_in_flight(self) -> int | None:
+        """Returns the maximum number of unconfirmed messages allowed.
+
+        :rtype: int,None
+        """
+        return self._max_in_flight
+
+    def register(self) -> Future[bool]:
+        """Register a new message and assign it the next delivery tag.
+
+            Must be called in the same order as the messages are written
+            to the socket.
+
+        :rtype: concurrent.futures.Future
+        """
+        future: Future[bool] = Future()
+        with self._condition:
+            self._delivery_tag += 1
+            self._pending[self._delivery_tag] = future
+        return future
+
+    def unregister(self, future: Future[bool]) -> None:
+        """Roll back the last registered message, e.g. if the message
+        never made it to the socket.
+
+        :param concurrent.futures.Future future: Future returned by register.
+        :return:
+        """
+        with self._condition:
+            if self._pending.get(self._delivery_tag) is not future:
+                return
+            del self._pending[self._delivery_tag]
+            self._delivery_tag -= 1
+            self._condition.notify_all()
+
+    def on_frame(self, frame_in: Any) -> None:
+        """Handle a Basic.Ack or Basic.Nack frame.
+
+            Futures are resolved outside of the internal lock, as any
+            callbacks added to them are run on the thread processing
+            inbound frames.
+
+        :param pamqp.Frame frame_in: Amqp frame.
+        :return:
+        """
+        confirmed = frame_in.name == 'Basic.Ack'
+        delivery_tag = frame_in.delivery_tag
+        resolved = []
+        with self._condition:
+            if frame_in.multiple:
+                while self._pending:
+                    tag = next(iter(self._pending))
+                    if delivery_tag and tag > delivery_tag:
+                        break
+                    resolved.append(self._pending.pop(tag))
+            elif delivery_tag in self._pending:
+                resolved.append(self._pending.pop(delivery_tag))
+            self._condition.notify_all()
+        for future in resolved:
+            future.set_result(confirmed)
+
+    def fail(self, exception: Exception) -> None:
+        """Fail all messages still waiting to be confirmed.
+
+        :param Exception exception: Exception set on the pending Futures.
+        :return:
+        """
+        with self._condition:
+            resolved = list(self._pending.values())
+            self._pending.clear()
+            self._condition.notify_all()
+        for future in resolved:
+            future.set_exception(exception)
+
+    def wait(
+        self,
+        check_for_errors: Callable[[], None],
+        max_in_flight: int = 0,
+        timeout: float | None = None,
+    ) -> None:
+        """Wait until no more than max_in_flight messages are unconfirmed.
+
+        :param typing.Callable check_for_errors: Raises if the channel
+                                                 encountered an error.
+        :param int max_in_flight: Number of unconfirmed messages to wait for.
+        :param int,float,None timeout: Give up waiting after this many
+                                       seconds.
+
+        :raises AMQPChannelError: Raises if the confirms took too long.
+        :return:
+        """
+        if len(self._pending) <= max_in_flight:
+            return
+        with self._condition:
+            self._waiting += 1
+        try:
+            if self._on_wait:
+                self._on_wait()
+            self._wait(check_for_errors, max_in_flight, timeout)
+        finally:
+            with self._condition:
+                self._waiting -= 1
+
+    def _wait(
+        self,
+        check_for_errors: Callable[[], None],
+        max_in_flight: int,
+        timeout: float | None,
+    ) -> None:
+        """Wait for the confirms, once registered as waiting.
+
+        :return:
+        """
+        start_time = time.monotonic()
+        while len(self._pending) > max_in_flight:
+            check_for_errors()
+            wait_time = ERROR_CHECK_INTERVAL
+            if timeout is not None:
+                remaining = timeout - (time.monotonic() - start_time)
+                if remaining < 0:
+                    raise AMQPChannelError(
+                        f'publisher confirms took too long '
+                        f'({len(self._pending)} in flight)'
+                    )
+                wait_time = min(remaining, wait_time)
+            with self._condition:
+                if len(self._pending) <= max_in_flight:
+                    break
+                self._condition.wait(wait_time)
@@ -2,12 +2,14 @@
 from __future__ import annotations
 
 import logging
+import struct
 import threading
 import time
 from types import TracebackType
 from typing import TYPE_CHECKING
 from typing import Any
 
+from pamqp import constants as pamqp_constants
 from pamqp import exceptions as pamqp_exception
 from pamqp import frame as pamqp_frame
 from pamqp import header as pamqp_header
@@ -17,10 +19,15 @@ from amqpstorm.base import IDLE_WAIT
 from amqpstorm.base import Stateful
 from amqpstorm.channel import Channel
 from amqpstorm.channel0 import Channel0
+from amqpstorm.channel_ids import ChannelIds
 from amqpstorm.exception import AMQPConnectionError
 from amqpstorm.exception import AMQPInvalidArgument
+from amqpstorm.flow import InboundCounter
 from amqpstorm.heartbeat import Heartbeat
 from amqpstorm.io import IO
+from amqpstorm.io import POLL_TIMEOUT
+from amqpstorm.metrics import Metrics
+from amqpstorm.reactor import Reactor
 
 if TYPE_CHECKING:
     import socket as _socket
@@ -32,6 +39,7 @@ LOGGER = logging.getLogger(__name__)
 DEFAULT_HEARTBEAT_TIMEOUT = 60
 DEFAULT_SOCKET_TIMEOUT = 10
 DEFAULT_VIRTUAL_HOST = '/'
+FRAME_HEADER = struct.Struct('>BHI')
 
 
 class Connection(Stateful):
@@ -69,15 +77,28 @@ class Connection(Stateful):
     :param bool ssl: Enable SSL
     :param dict ssl_options: SSL kwargs
     :param dict client_properties: None or dict of client properties
-    :param str poller: Either "select" or "poll". If you encounter file descriptor errors, consider switching to "poll".
+    :param str poller: Either "select", "poll" or "epoll". If you encounter file descriptor errors,
+                       consider switching to "poll" or "epoll".
+    :param int,float poll_timeout: Seconds the inbound thread waits for data, before checking if
+                                   the connection was closed.
     :param str locale: Locale used during connection negotiation. Defaults to "en_US".
+    :param Reactor reactor: Shared Reactor used to read the socket, and
+                            run the heartbeat, instead of dedicated threads.
+    :param int max_inbound_bytes: Pause reading from the socket once more than this many message
+                                  body bytes are buffered, waiting to be consumed.
+    :param int max_inbound_messages: Pause reading from the socket once more than this many
+                                     messages are buffered, waiting to be consumed.
+    :param Metrics metrics: Receives measurements of the frames, publishes, confirms, RPC
+                            responses and heartbeats of the connection.
     :param bool lazy: Lazy initialize the connection
 
     :raises AMQPConnectionError: Raises if the connection
                                  encountered an error.
     """
     __slots__ = [
-        'heartbeat', 'parameters', '_channel0', '_channels', '_io'
+        'heartbeat', 'parameters', '_channel0', '_channel_ids', '_channels',
+        '_full_channels', '_inbound_counter', '_inbound_paused', '_io',
+        '_metrics'
     ]
 
     def __init__(
@@ -102,17 +123,36 @@ class Connection(Stateful):
             'ssl_options': kwargs.get('ssl_options', {}),
             'client_properties': kwargs.get('client_properties', {}),
             'poller': kwargs.get('poller', 'select'),
+            'poll_timeout': kwargs.get('poll_timeout', POLL_TIMEOUT),
             'locale': kwargs.get('locale', 'en_US'),
+            'reactor': kwargs.get('reactor'),
+            'max_inbound_bytes': kwargs.get('max_inbound_bytes'),
+            'max_inbound_messages': kwargs.get('max_inbound_messages'),
+            'metrics': kwargs.get('metrics'),
         }
         self._validate_parameters()
+        self._metrics: Metrics | None = self.parameters['metrics']
+        if self._metrics is not None:
+            self._metrics.register_connection(self)
         self._io = IO(self.parameters, exceptions=self._exceptions,
-                      on_read_impl=self._read_buffer)
+                      on_read_impl=self._read_buffer,
+                      is_paused_impl=self._is_inbound_paused,
+                      on_error_impl=self._on_io_error)
         self._channel0 = Channel0(self, self.parameters['client_properties'])
         self._channels: dict[int, Channel] = {}
-        self._last_channel_id: int | None = None
+        self._channel_ids = ChannelIds()
+        self._inbound_counter = InboundCounter(
+            self.parameters['max_inbound_bytes'],
+            self.parameters['max_inbound_messages'],
+            drained=self._io.inbound_drained
+        )
+        self._full_channels: set[Channel] = set()
+        self._inbound_paused = False
         self._user_closed: bool = False
         self.heartbeat = Heartbeat(self.parameters['heartbeat'],
-                                   self._channel0.send_heartbeat)
+                                   self._channel0.send_heartbeat,
+                                   metrics=self._metrics,
+                                   **self._heartbeat_timer())
         if not kwargs.get('lazy', False):
             self.open()
 
@@ -148,6 +188,24 @@ class Connection(Stateful):
             return None
         return self._io.socket.fileno()
 
+    @property
+    def inbound_bytes(self) -> int:
+        """Returns the number of message body bytes received, on all
+        Channels, that have not been consumed yet.
+
+        :rtype: int
+        """
+        return self._inbound_counter.bytes
+
+    @property
+    def inbound_messages(self) -> int:
+        """Returns the number of messages received, on all Channels, that
+        have not been consumed yet.
+
+        :rtype: int
+        """
+        return self._inbound_counter.messages
+
     @property
     def is_blocked(self) -> bool:
         """Is the connection currently being blocked from publishing by
@@ -210,7 +268,7 @@ class Connection(Stateful):
 
         with self.lock:
             channel_id = self._get_next_available_channel_id()
-            channel = Channel(channel_id, self, rpc_timeout)
+            channel = self._create_channel(channel_id, rpc_timeout)
             self._channels[channel_id] = channel
             if not lazy:
                 channel.open()
@@ -265,9 +323,16 @@ class Connection(Stateful):
         """
         LOGGER.debug('Connection Opening')
         self.set_state(self.OPENING)
-        self._exceptions = []
+        self._exceptions.clear()
         self._channels = {}
-        self._last_channel_id = None
+        self._channel_ids.reset()
+        self._inbound_counter = InboundCounter(
+            self.parameters['max_inbound_bytes'],
+            self.parameters['max_inbound_messages'],
+            drained=self._io.inbound_drained
+        )
+        self._full_channels = set()
+        self._inbound_paused = False
         self._user_closed = False
         self._io.open()
         self._send_handshake()
@@ -287,6 +352,8 @@ class Connection(Stateful):
         frame_data = pamqp_frame.marshal(frame_out, channel_id)
         self.heartbeat.register_write()
         self._io.write_to_socket(frame_data)
+        if self._metrics is not None:
+            self._metrics.on_frames_sent(1, len(frame_data))
 
     def write_frames(self, channel_id: int, frames_out: list[Frame]) -> None:
         """Marshal and write multiple outgoing pamqp frames to the Socket.
@@ -302,6 +369,31 @@ class Connection(Stateful):
         )
         self.heartbeat.register_write()
         self._io.write_to_socket(data_out)
+        if self._metrics is not None:
+            self._metrics.on_frames_sent(len(frames_out), len(data_out))
+
+    def write_marshalled_frames(self, data_out: bytes) -> None:
+        """Write already marshalled amqp frames to the Socket.
+
+        :param bytes data_out: Marshalled amqp frames.
+
+        :return:
+        """
+        self.heartbeat.register_write()
+        self._io.write_to_socket(data_out)
+        if self._metrics is not None:
+            self._metrics.on_frames_sent(self._count_frames(data_out),
+                                         len(data_out))
+
+    def _create_channel(self, channel_id: int, rpc_timeout: float) -> Channel:
+        """Create the Channel returned by channel.
+
+        :param int channel_id: Channel id
+        :param int rpc_timeout: Rpc timeout of the Channel.
+
+        :rtype: amqpstorm.Channel
+        """
+        return Channel(channel_id, self, rpc_timeout)
 
     def _close_remaining_channels(self) -> None:
         """Forcefully close all open channels.
@@ -316,41 +408,147 @@ class Connection(Stateful):
     def _get_next_available_channel_id(self) -> int:
         """Returns the next available channel id.
 
+            Ids of closed channels are re-used, lowest id first.
+
         :raises AMQPConnectionError: Raises if there is no available channel.
         :rtype: int
         """
-        for channel_id in range(self._last_channel_id or 1,
-                                self.max_allowed_channels + 1):
-            if channel_id in self._channels:
-                channel = self._channels[channel_id]
-                if channel.current_state != Channel.CLOSED:
-                    continue
-                del self._channels[channel_id]
-            self._last_channel_id = channel_id
-            return channel_id
-
-        if self._last_channel_id:
-            self._last_channel_id = None
-            return self._get_next_available_channel_id()
-
-        raise AMQPConnectionError(
-            f'reached the maximum number of channels {self.max_allowed_channels}'
-        )
+        channel_id = self._channel_ids.acquire(self.max_allowed_channels,
+                                               self._is_channel_id_available)
+        if channel_id is None:
+            raise AMQPConnectionError(
+                f'reached the maximum number of channels {self.max_allowed_channels}'
+            )
+        self._channels.pop(channel_id, None)
+        return channel_id
+
+    def _is_inbound_paused(self) -> bool:
+        """Check if reading from the socket should be paused, as too many
+        messages are waiting to be consumed.
+
+            Called from the thread reading from the socket. Reading is
+            paused once a limit of the Connection, or of a Channel, is
+            exceeded, and resumed once the buffered messages are back below
+            half of the limit. The remote server then stops sending once
+            the TCP window is full.
+
+            Reading is not paused while a Channel is receiving a message
+            that is only delivered once it is complete, as the message
+            could otherwise never be consumed, nor while a Channel is
+            waiting for a RPC response or a publisher confirm, e.g. sent
+            from a consumer callback.
+
+            The heartbeat is not checked while reading is paused.
+
+        :rtype: bool
+        """
+        if not self._inbound_paused:
+            if not self._full_channels and not self._inbound_counter.is_full:
+                return False
+            elif self._must_keep_reading():
+                return False
+            LOGGER.debug('Inbound buffer full, pausing reading')
+            self._inbound_paused = True
+        self.heartbeat.register_read()
+        self._full_channels = {
+            channel for channel in self._full_channels
+            if not channel.is_closed and not channel._inbound_counter.is_drained
+        }
+        if self._full_channels or not self._inbound_counter.is_drained:
+            return not self._must_keep_reading()
+        LOGGER.debug('Inbound buffer drained, resuming reading')
+        self._inbound_paused = False
+        return False
+
+    def _must_keep_reading(self) -> bool:
+        """Check if the socket needs to be read even though the inbound
+        buffers are full.
+
+        :rtype: bool
+        """
+        return self._is_receiving_message() or self._is_waiting_for_reply()
+
+    def _wake_inbound(self) -> None:
+        """Wake up the paused inbound thread, as a Channel is now waiting
+        for a reply from the remote server.
+
+        :return:
+        """
+        self._io.inbound_drained.set()
+
+    def _on_io_error(self, why: AMQPConnectionError) -> None:
+        """Fail the messages waiting to be confirmed once the socket
+        encountered an error.
+
+            Called from the thread that detected the error, so that
+            anyone waiting on a publisher confirm Future is not left
+            waiting until the connection is closed.
+
+        :param AMQPConnectionError why: Connection error.
+        :return:
+        """
+        for channel in list(self._channels.values()):
+            if channel._confirms:
+                channel._confirms.fail(why)
+
+    def _is_receiving_message(self) -> bool:
+        """Check if a Channel is part way through receiving a message that
+        is not streamed.
+
+        :rtype: bool
+        """
+        for channel in list(self._channels.values()):
+            if channel._inbound_body_size > 0 and not channel._stream_body:
+                return True
+        return False
+
+    def _is_waiting_for_reply(self) -> bool:
+        """Check if a Channel is waiting for a RPC response, or for
+        publisher confirms.
+
+        :rtype: bool
+        """
+        for channel in list(self._channels.values()):
+            if channel.rpc.is_waiting:
+                return True
+            elif channel._confirms and channel._confirms.is_waiting:
+                return True
+        return False
+
+    def _is_channel_id_available(self, channel_id: int) -> bool:
+        """Check that the channel id is not used by an open channel.
+
+        :param int channel_id: Channel id
+
+        :rtype: bool
+        """
+        channel = self._channels.get(channel_id)
+        return channel is None or channel.current_state == Channel.CLOSED
 
     def _handle_amqp_frame(
-        self, data_in: bytes,
-    ) -> tuple[bytes, int | None, Any]:
-        """Unmarshal a single AMQP frame and return the result.
+        self, data_in: bytes | bytearray, offset: int = 0,
+    ) -> tuple[int, int | None, Any]:
+        """Unmarshal a single AMQP frame starting at offset and return
+        the result.
+
+            Only the bytes belonging to the frame are copied out of the
+            buffer, so that the rest of the buffer is left untouched.
 
         :param data_in: socket data
+        :param int offset: Position of the frame in data_in
 
-        :return: data_in, channel_id, frame
+        :return: byte_count, channel_id, frame
         """
-        if not data_in:
-            return data_in, None, None
+        byte_count = self._get_frame_size(data_in, offset)
+        if not byte_count:
+            return 0, None, None
         try:
-            byte_count, channel_id, frame_in = pamqp_frame.unmarshal(data_in)
-            return data_in[byte_count:], channel_id, frame_in
+            with memoryview(data_in) as data_view:
+                frame_data = bytes(data_view[offset:offset + byte_count])
+            byte_count, channel_id, frame_in = pamqp_frame.unmarshal(
+                frame_data
+            )
+            return byte_count, channel_id, frame_in
         except pamqp_exception.UnmarshalingException:
             pass
         except pamqp_exception.AMQPFrameError as why:
@@ -358,19 +556,66 @@ class Connection(Stateful):
         except ValueError as why:
             LOGGER.error(why, exc_info=True)
             self.exceptions.append(AMQPConnectionError(why))
-        return data_in, None, None
+        return 0, None, None
+
+    @staticmethod
+    def _count_frames(data_out: bytes) -> int:
+        """Count the frames in a buffer of marshalled frames.
+
+        :param bytes data_out: Marshalled amqp frames.
+
+        :rtype: int
+        """
+        frames = offset = 0
+        while offset < len(data_out):
+            _, _, frame_size = FRAME_HEADER.unpack_from(data_out, offset)
+            offset += pamqp_constants.FRAME_HEADER_SIZE + frame_size + 1
+            frames += 1
+        return frames
+
+    @staticmethod
+    def _get_frame_size(data_in: bytes | bytearray, offset: int) -> int:
+        """Get the size of the frame starting at offset, including the
+        frame header and end byte.
 
-    def _read_buffer(self, data_in: bytes) -> bytes:
+        :param data_in: socket data
+        :param int offset: Position of the frame in data_in
+
+        :return: Frame size, or 0 if the frame is not fully received yet.
+        """
+        if len(data_in) - offset < pamqp_constants.FRAME_HEADER_SIZE:
+            return 0
+        if data_in[offset:offset + 4] == pamqp_constants.AMQP:
+            byte_count = 8
+        else:
+            _, _, frame_size = FRAME_HEADER.unpack_from(data_in, offset)
+            byte_count = pamqp_constants.FRAME_HEADER_SIZE + frame_size + 1
+        if offset + byte_count > len(data_in):
+            return 0
+        return byte_count
+
+    def _read_buffer(self, data_in: bytearray) -> bytearray:
         """Process the socket buffer, and direct the data to the appropriate
         channel.
 
-        :rtype: bytes
+            Frames are read using an offset, and the processed data is
+            removed from the front of the buffer in a single operation
+            once all complete frames have been handled.
+
+        :rtype: bytearray
         """
-        while data_in:
-            data_in, channel_id, frame_in = self._handle_amqp_frame(data_in)
+        if not data_in:
+            return data_in
+        offset = frames = 0
+        while True:
+            byte_count, channel_id, frame_in = self._handle_amqp_frame(
+                data_in, offset
+            )
 
             if frame_in is None:
                 break
+            offset += byte_count
+            frames += 1
 
             self.heartbeat.register_read()
             if channel_id == 0:
@@ -378,6 +623,13 @@ class Connection(Stateful):
             elif channel_id in self._channels:
                 self._channels[channel_id].on_frame(frame_in)
 
+        if offset:
+            if self._metrics is not None:
+                self._metrics.on_frames_received(frames, offset)
+            if isinstance(data_in, bytearray):
+                del data_in[:offset]
+            else:
+                data_in = data_in[offset:]
         return data_in
 
     def _cleanup_channel(self, channel_id: int) -> None:
@@ -391,6 +643,7 @@ class Connection(Stateful):
             if channel_id not in self._channels:
                 return
             del self._channels[channel_id]
+            self._channel_ids.release(channel_id)
 
     def _send_handshake(self) -> None:
         """Send a RabbitMQ Handshake.
@@ -399,6 +652,15 @@ class Connection(Stateful):
         """
         self._io.write_to_socket(pamqp_header.ProtocolHeader().marshal())
 
+    def _heartbeat_timer(self) -> dict[str, Any]:
+        """Heartbeat timer implementation, when using a Reactor.
+
+        :rtype: dict
+        """
+        if not self.parameters['reactor']:
+            return {}
+        return {'timer': self.parameters['reactor'].timer}
+
     def _validate_parameters(self) -> None:
         """Validate Connection Parameters.
 
@@ -416,8 +678,22 @@ class Connection(Stateful):
             raise AMQPInvalidArgument('virtual_host should be a string')
         elif not isinstance(self.parameters['timeout'], (int, float)):
             raise AMQPInvalidArgument('timeout should be an integer or float')
+        elif not isinstance(self.parameters['poll_timeout'], (int, float)):
+            raise AMQPInvalidArgument(
+                'poll_timeout should be an integer or float'
+            )
         elif not compatibility.is_integer(self.parameters['heartbeat']):
             raise AMQPInvalidArgument('heartbeat should be an integer')
+        elif not isinstance(self.parameters['reactor'], (Reactor, type(None))):
+            raise AMQPInvalidArgument('reactor should be a Reactor or None')
+        elif not isinstance(self.parameters['metrics'], (Metrics, type(None))):
+            raise AMQPInvalidArgument('metrics should be a Metrics or None')
+        for name in ('max_inbound_bytes', 'max_inbound_messages'):
+            value = self.parameters[name]
+            if value is not None and (not compatibility.is_integer(value) or value < 1):
+                raise AMQPInvalidArgument(
+                    f'{name} should be a positive integer or None'
+                )
 
     def _wait_for_connection_state(
         self, state: int = Stateful.OPEN, rpc_timeout: float = 30,
@@ -0,0 +1,138 @@
+"""AMQPStorm Consumer Dispatcher."""
+from __future__ import annotations
+
+import collections
+import concurrent.futures
+import threading
+from typing import Any
+from typing import Callable
+
+from amqpstorm.base import ERROR_CHECK_INTERVAL
+
+
+class ConsumerDispatcher:
+    """Internal dispatcher that runs consumer callbacks on a pool of
+    worker threads.
+
+        At most max_pending messages are handed out at any time. Once the
+        pool is full, dispatch blocks the consuming thread, and further
+        messages stay in the inbound queue of the Channel.
+
+        When ordered is set, messages for the same consumer tag are
+        processed one at a time, in the order they were received. Messages
+        for different consumer tags are still processed concurrently.
+
+    :param int workers: Number of worker threads.
+    :param bool ordered: Preserve the message order of each consumer tag.
+    :param int max_pending: Maximum number of messages handed out, that
+                            have not been processed yet.
+    """
+
+    def __init__(
+        self, workers: int, ordered: bool = False,
+        max_pending: int | None = None,
+    ) -> None:
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix='amqpstorm-consumer'
+        )
+        self._ordered = ordered
+        self._slots = threading.Semaphore(max_pending or workers)
+        self._lock = threading.Lock()
+        self._pending: dict[Any, collections.deque[Any]] = {}
+        self._exceptions: list[BaseException] = []
+
+    @property
+    def exceptions(self) -> list[BaseException]:
+        """Exceptions raised by consumer callbacks.
+
+        :rtype: list
+        """
+        return self._exceptions
+
+    def dispatch(
+        self,
+        consumer_tag: Any,
+        callback: Callable[..., Any],
+        args: tuple[Any, ...],
+    ) -> bool:
+        """Hand a message to the worker threads.
+
+            Blocks while max_pending messages are already being processed,
+            and returns False, without handing out the message, once a
+            callback raised an exception.
+
+        :param consumer_tag: Consumer tag the message was delivered to.
+        :param typing.Callable callback: Consumer callback.
+        :param tuple args: Arguments passed to the callback.
+
+        :rtype: bool
+        """
+        while not self._slots.acquire(timeout=ERROR_CHECK_INTERVAL):
+            if self._exceptions:
+                return False
+        if self._exceptions:
+            self._slots.release()
+            return False
+        if self._ordered:
+            with self._lock:
+                if consumer_tag in self._pending:
+                    self._pending[consumer_tag].append((callback, args))
+                    return True
+                self._pending[consumer_tag] = collections.deque()
+            self._executor.submit(self._run_ordered, consumer_tag,
+                                  callback, args)
+            return True
+        self._executor.submit(self._run, callback, args)
+        return True
+
+    def close(self) -> None:
+        """Wait for all messages handed out to be processed, and stop the
+        worker threads.
+
+            Messages still waiting for a worker are dropped once a
+            callback raised an exception.
+
+        :return:
+        """
+        self._executor.shutdown(wait=True,
+                                cancel_futures=bool(self._exceptions))
+
+    def _run(self, callback: Callable[..., Any], args: tuple[Any, ...]) -> None:
+        """Run a consumer callback, and free up its slot.
+
+        :param typing.Callable callback: Consumer callback.
+        :param tuple args: Arguments passed to the callback.
+
+        :return:
+        """
+        try:
+            if not self._exceptions:
+                callback(*args)
+        except BaseException as why:
+            self._exceptions.append(why)
+        finally:
+            self._slots.release()
+
+    def _run_ordered(
+        self,
+        consumer_tag: Any,
+        callback: Callable[..., Any],
+        args: tuple[Any, ...],
+    ) -> None:
+        """Run the consumer callbacks of a consumer tag, one message at
+        a time, until no messages are left.
+
+        :param consumer_tag: Consumer tag.
+        :param typing.Callable callback: Consumer callback.
+        :param tuple args: Arguments passed to the callback.
+
+        :return:
+        """
+        while True:
+            self._run(callback, args)
+            with self._lock:
+                pending = self._pending[consumer_tag]
+                if not pending:
+                    del self._pending[consumer_tag]
+                    return
+                callback, args = pending.popleft()
@@ -0,0 +1,101 @@
+"""AMQPStorm Inbound Flow Control."""
+from __future__ import annotations
+
+import threading
+
+
+class InboundCounter:
+    """Internal counter of the messages, and body bytes, received but not
+    yet consumed.
+
+        Frames are only received on the thread reading from the socket,
+        while messages may be consumed from any thread, so only consuming
+        takes the lock.
+
+        The counter is full once either limit is exceeded, and drained
+        again once both are back below half of their limit.
+
+    :param int,None max_bytes: Maximum number of buffered body bytes.
+    :param int,None max_messages: Maximum number of buffered messages.
+    :param threading.Event,None drained: Set each time consuming leaves
+                                         the counter drained.
+    """
+    __slots__ = ['drained', 'max_bytes', 'max_messages', '_consumed_bytes',
+                 '_consumed_messages', '_lock', '_received_bytes',
+                 '_received_messages']
+
+    def __init__(
+        self, max_bytes: int | None = None, max_messages: int | None = None,
+        drained: threading.Event | None = None,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.max_messages = max_messages
+        self.drained = drained
+        self._lock = threading.Lock()
+        self._received_bytes = 0
+        self._received_messages = 0
+        self._consumed_bytes = 0
+        self._consumed_messages = 0
+
+    @property
+    def bytes(self) -> int:
+        """Returns the number of buffered body bytes.
+
+        :rtype: int
+        """
+        return self._received_bytes - self._consumed_bytes
+
+    @property
+    def messages(self) -> int:
+        """Returns the number of buffered messages.
+
+        :rtype: int
+        """
+        return self._received_messages - self._consumed_messages
+
+    @property
+    def is_full(self) -> bool:
+        """Is either limit exceeded.
+
+        :rtype: bool
+        """
+        if self.max_bytes is not None and self.bytes > self.max_bytes:
+            return True
+        return self.max_messages is not None and self.messages > self.max_messages
+
+    @property
+    def is_drained(self) -> bool:
+        """Are both counters back below half of their limit.
+
+        :rtype: bool
+        """
+        if self.max_bytes is not None and self.bytes > self.max_bytes // 2:
+            return False
+        return self.max_messages is None or self.messages <= self.max_messages // 2
+
+    def receive(self, size: int, messages: int = 0) -> None:
+        """Count received body bytes, and messages.
+
+            Must only be called from the thread reading from the socket.
+
+        :param int size: Number of body bytes.
+        :param int messages: Number of messages.
+
+        :return:
+        """
+        self._received_bytes += size
+        self._received_messages += messages
+
+    def consume(self, size: int, messages: int = 0) -> None:
+        """Count consumed body bytes, and messages.
+
+        :param int size: Number of body bytes.
+        :param int messages: Number of messages.
+
+        :return:
+        """
+        with self._lock:
+            self._consumed_bytes += size
+            self._consumed_messages += messages
+        if self.drained is not None and self.is_drained:
+            self.drained.set()
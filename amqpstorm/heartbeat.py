@@ -3,10 +3,14 @@ from __future__ import annotations
 
 import logging
 import threading
+from typing import TYPE_CHECKING
 from typing import Callable
 
 from amqpstorm.exception import AMQPConnectionError
 
+if TYPE_CHECKING:
+    from amqpstorm.metrics import Metrics
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -18,9 +22,11 @@ class Heartbeat:
         timeout: float | None,
         send_heartbeat_impl: Callable[[], None],
         timer: Callable[..., threading.Timer] = threading.Timer,
+        metrics: Metrics | None = None,
     ) -> None:
         self.send_heartbeat_impl = send_heartbeat_impl
         self.timer_impl = timer
+        self._metrics = metrics
         self._lock = threading.Lock()
         self._running = threading.Event()
         self._timer: threading.Timer | None = None
@@ -90,6 +96,8 @@ class Heartbeat:
             return False
         if self._writes_since_check == 0:
             self.send_heartbeat_impl()
+        if self._reads_since_check == 0 and self._metrics is not None:
+            self._metrics.on_heartbeat_missed()
         with self._lock:
             try:
                 if self._reads_since_check == 0:
@@ -2,20 +2,26 @@
 from __future__ import annotations
 
 import logging
+import os
 import select
 import socket
 import threading
 from errno import EAGAIN
 from errno import EINTR
 from errno import EWOULDBLOCK
+from typing import TYPE_CHECKING
 from typing import Any
 from typing import Callable
 
 from amqpstorm import compatibility
+from amqpstorm.base import IDLE_WAIT
 from amqpstorm.base import MAX_FRAME_SIZE
 from amqpstorm.compatibility import ssl
 from amqpstorm.exception import AMQPConnectionError
 
+if TYPE_CHECKING:
+    from amqpstorm.reactor import Reactor
+
 EMPTY_BUFFER = b''
 LOGGER = logging.getLogger(__name__)
 POLL_TIMEOUT = 1.0
@@ -23,9 +29,17 @@ POLL_TIMEOUT_MS = int(POLL_TIMEOUT * 1000)
 
 
 class BasePoller:
-    def __init__(self, fileno: int, exceptions: list[Exception]) -> None:
+    edge_triggered = False
+
+    def __init__(
+        self,
+        fileno: int,
+        exceptions: list[Exception],
+        timeout: float = POLL_TIMEOUT,
+    ) -> None:
         self._fileno = fileno
         self._exceptions = exceptions
+        self._timeout = timeout
 
     @property
     def fileno(self) -> int:
@@ -53,7 +67,7 @@ class SelectPoller(BasePoller):
         :rtype: bool
         """
         try:
-            ready, _, _ = select.select([self.fileno], [], [], POLL_TIMEOUT)
+            ready, _, _ = select.select([self.fileno], [], [], self._timeout)
             return bool(ready)
         except OSError as why:
             if why.errno != EINTR:
@@ -64,8 +78,13 @@ class SelectPoller(BasePoller):
 class Poller(BasePoller):
     """Socket Read Poller using select.poll."""
 
-    def __init__(self, fileno: int, exceptions: list[Exception]) -> None:
-        super().__init__(fileno, exceptions)
+    def __init__(
+        self,
+        fileno: int,
+        exceptions: list[Exception],
+        timeout: float = POLL_TIMEOUT,
+    ) -> None:
+        super().__init__(fileno, exceptions, timeout)
         self.poller = select.poll()  # type: ignore[attr-defined]
         self.poller.register(
             self._fileno,
@@ -79,7 +98,7 @@ class Poller(BasePoller):
         :rtype: bool
         """
         try:
-            events = self.poller.poll(POLL_TIMEOUT_MS)
+            events = self.poller.poll(int(self._timeout * 1000))
             for fd, event in events:
                 if fd == self.fileno:
                     return True
@@ -96,6 +115,54 @@ class Poller(BasePoller):
             pass
 
 
+class EpollPoller(BasePoller):
+    """Socket Read Poller using select.epoll.
+
+        The epoll set is created once for the socket. When edge-triggered,
+        the socket is only reported as ready when new data arrives, and
+        needs to be read until it would block before polling again.
+    """
+
+    def __init__(
+        self,
+        fileno: int,
+        exceptions: list[Exception],
+        timeout: float = POLL_TIMEOUT,
+        edge_triggered: bool = True,
+    ) -> None:
+        super().__init__(fileno, exceptions, timeout)
+        self.edge_triggered = edge_triggered
+        event_mask = select.EPOLLIN | select.EPOLLPRI  # type: ignore[attr-defined]
+        if edge_triggered:
+            event_mask |= select.EPOLLET  # type: ignore[attr-defined]
+        self.poller = select.epoll()  # type: ignore[attr-defined]
+        self.poller.register(self._fileno, event_mask)
+
+    @property
+    def is_ready(self) -> bool:
+        """Check if the socket is ready for reading.
+
+        :rtype: bool
+        """
+        try:
+            events = self.poller.poll(self._timeout)
+            for fd, event in events:
+                if fd == self.fileno:
+                    return True
+        except OSError as why:
+            if why.errno != EINTR:
+                self._exceptions.append(AMQPConnectionError(why))
+        return False
+
+    def close(self) -> None:
+        """Unregister the file descriptor, and close the epoll set."""
+        try:
+            self.poller.unregister(self.fileno)
+        except OSError:
+            pass
+        self.poller.close()
+
+
 class IO:
     """Internal Input/Output handler."""
 
@@ -103,7 +170,9 @@ class IO:
         self,
         parameters: dict[str, Any],
         exceptions: list[Exception] | None = None,
-        on_read_impl: Callable[[bytes], bytes] | None = None,
+        on_read_impl: Callable[[bytearray], bytearray] | None = None,
+        is_paused_impl: Callable[[], bool] | None = None,
+        on_error_impl: Callable[[AMQPConnectionError], None] | None = None,
     ) -> None:
         self._exceptions: list[Exception] = (
             exceptions if exceptions is not None else []
@@ -112,13 +181,20 @@ class IO:
         self._rd_lock = threading.Lock()
         self._inbound_thread: threading.Thread | None = None
         self._on_read_impl = on_read_impl
+        self._is_paused_impl = is_paused_impl
+        self._on_error_impl = on_error_impl
         self._running = threading.Event()
+        self.inbound_drained = threading.Event()
         self._parameters = parameters
-        self.data_in: bytes = EMPTY_BUFFER
+        self._recv_buffer = bytearray(MAX_FRAME_SIZE)
+        self._recv_view = memoryview(self._recv_buffer)
+        self.data_in: bytearray = bytearray()
         self.poller: BasePoller | None = None
         self.socket: socket.socket | None = None
+        self._drain_pending = False
         self.use_ssl: bool = self._parameters['ssl']
         self.poller_type: str = self._parameters['poller']
+        self.reactor: Reactor | None = self._parameters.get('reactor')
 
     def close(self) -> None:
         """Close Socket.
@@ -127,6 +203,9 @@ class IO:
         """
         with self._wr_lock, self._rd_lock:
             self._running.clear()
+            self.inbound_drained.set()
+            if self.reactor:
+                self.reactor.unregister(self.socket)
             self._close_socket()
 
         if self._inbound_thread:
@@ -144,20 +223,52 @@ class IO:
         :return:
         """
         with self._wr_lock, self._rd_lock:
-            self.data_in = EMPTY_BUFFER
+            self.data_in = bytearray()
+            self._drain_pending = False
             self._running.set()
             sock_addresses = self._get_socket_addresses()
             self.socket = self._find_address_and_connect(sock_addresses)
-            if self.poller_type == 'poll':
-                self.poller = Poller(self.socket.fileno(), self._exceptions)
-            else:
-                self.poller = SelectPoller(self.socket.fileno(), self._exceptions)
+            if self.reactor and self.use_ssl:
+                # An SSL read waits for the rest of a TLS record, which
+                # would stall every connection on the Reactor thread.
+                self.socket.setblocking(False)
+            self.poller = self._create_poller(self.socket.fileno())
+
+    def _create_poller(self, fileno: int) -> BasePoller | None:
+        """Create the Poller used by the inbound thread.
+
+            epoll is only used edge-triggered for plain sockets with a
+            timeout, as SSL sockets may buffer decrypted data the poller
+            does not see, and blocking sockets cannot be read until they
+            would block. Falls back to select when epoll is not available.
+
+        :param int fileno: Socket Fileno.
+
+        :rtype: BasePoller
+        """
+        if self.reactor:
+            return None
+        timeout = self._parameters.get('poll_timeout', POLL_TIMEOUT)
+        if self.poller_type == 'epoll' and hasattr(select, 'epoll'):
+            if self.use_ssl or not self.socket or not self.socket.gettimeout():
+                return EpollPoller(fileno, self._exceptions, timeout,
+                                   edge_triggered=False)
+            return EpollPoller(fileno, self._exceptions, timeout)
+        elif self.poller_type == 'poll':
+            return Poller(fileno, self._exceptions, timeout)
+        return SelectPoller(fileno, self._exceptions, timeout)
 
     def start_inbound(self) -> None:
         """Start the inbound thread that reads incoming socket data.
 
+            When using a Reactor, the socket is registered with the
+            Reactor instead of starting a dedicated thread.
+
         :return:
         """
+        if self.reactor and self.socket:
+            self.reactor.register(self.socket, self._on_socket_readable)
+            return
         self._inbound_thread = self._create_inbound_thread()
 
     def write_to_socket(self, frame_data: bytes) -> None:
@@ -182,12 +293,39 @@ class IO:
                     total_bytes_written += bytes_written
                 except TimeoutError:
                     pass
+                except compatibility.SSLWantWriteError:
+                    self._wait_until_writable()
                 except OSError as why:
                     if why.errno in (EWOULDBLOCK, EAGAIN):
                         continue
-                    self._exceptions.append(AMQPConnectionError(why))
+                    self._on_error(AMQPConnectionError(why))
                     return
 
+    def _wait_until_writable(self) -> None:
+        """Wait for a non-blocking socket to be writable again, for at
+        most the socket timeout.
+
+        :return:
+        """
+        sock = self.socket
+        if not sock:
+            return
+        try:
+            select.select([], [sock], [], self._parameters['timeout'])
+        except (OSError, ValueError):
+            pass
+
+    def _on_error(self, why: AMQPConnectionError) -> None:
+        """Record a connection error, and let the connection know about
+        it right away.
+
+        :param AMQPConnectionError why: Connection error.
+        :return:
+        """
+        self._exceptions.append(why)
+        if self._on_error_impl:
+            self._on_error_impl(why)
+
     def _close_socket(self) -> None:
         """Shutdown and close the Socket.
 
@@ -271,16 +409,24 @@ class IO:
         :rtype: SSLSocket
         """
         ssl_options = self._parameters.get('ssl_options', {})
-
-        context = ssl_options.get('context')
         server_hostname = (
             ssl_options.get('server_hostname') or self._parameters['hostname']
         )
+        context = self._create_ssl_context(ssl_options)
+        return context.wrap_socket(sock, do_handshake_on_connect=True,
+                                   server_hostname=server_hostname)
+
+    @staticmethod
+    def _create_ssl_context(ssl_options: dict[str, Any]) -> Any:
+        """Create the SSLContext described by the ssl_options.
+
+        :param dict ssl_options: SSL kwargs
+
+        :rtype: ssl.SSLContext
+        """
+        context = ssl_options.get('context')
         if context is not None:
-            return context.wrap_socket(
-                sock, do_handshake_on_connect=True,
-                server_hostname=server_hostname
-            )
+            return context
 
         context = ssl.create_default_context()
 
@@ -313,13 +459,11 @@ class IO:
         ca_certs = ssl_options.get('ca_certs', ssl_options.get('cafile'))
         if ca_certs:
             context.load_verify_locations(cafile=ca_certs)
-        certfile = ssl_options.get('certfile')
+        certfile: Any = ssl_options.get('certfile')
         keyfile = ssl_options.get('keyfile')
         if certfile or keyfile:
             context.load_cert_chain(certfile=certfile, keyfile=keyfile)
-
-        return context.wrap_socket(sock, do_handshake_on_connect=True,
-                                   server_hostname=server_hostname)
+        return context
 
     def _create_inbound_thread(self) -> threading.Thread:
         """Internal Thread that handles all incoming traffic.
@@ -335,15 +479,38 @@ class IO:
     def _process_incoming_data(self) -> None:
         """Retrieve and process any incoming data.
 
+            Incoming data is appended to the data_in buffer in-place, and
+            the read handler removes the frames it consumed from the front
+            of the buffer, so the remaining data is never re-copied per
+            frame.
+
+            While reading is paused, waits for the buffered messages to be
+            consumed, instead of polling the socket.
+
         :return:
         """
+        poller = self.poller
+        if not poller:
+            return
+        poll_timeout = self._parameters.get('poll_timeout', POLL_TIMEOUT)
         try:
             while self._running.is_set():
-                if self.poller.is_ready:
+                self.inbound_drained.clear()
+                if self._is_paused_impl and self._is_paused_impl():
+                    self.inbound_drained.wait(poll_timeout)
+                    continue
+                if self._drain_pending:
+                    self._receive_until_would_block()
+                elif poller.is_ready:
                     self.data_in += self._receive()
+                    if poller.edge_triggered:
+                        self._receive_until_would_block()
+                else:
+                    continue
+                if self._on_read_impl:
                     self.data_in = self._on_read_impl(self.data_in)
         except Exception as why:
-            self._exceptions.append(AMQPConnectionError(why))
+            self._on_error(AMQPConnectionError(why))
             if self._running.is_set():
                 LOGGER.warning(
                     'Stopping inbound thread due to %s', why,
@@ -351,15 +518,78 @@ class IO:
                 )
             self._running.clear()
 
-    def _receive(self) -> bytes:
+    def _on_socket_readable(self) -> None:
+        """Retrieve and process incoming data once the Reactor reports
+        the socket as readable.
+
+            Unregisters the socket from the Reactor if the connection
+            encountered an error, or while reading is paused.
+
+        :return:
+        """
+        reactor = self.reactor
+        if not self._running.is_set() or not reactor:
+            return
+        try:
+            self.data_in += self._receive()
+            while self._running.is_set() and self._has_pending_data():
+                self.data_in += self._receive()
+            if self._on_read_impl:
+                self.data_in = self._on_read_impl(self.data_in)
+        except Exception as why:
+            self._on_error(AMQPConnectionError(why))
+            if self._running.is_set():
+                LOGGER.warning(
+                    'Stopping inbound processing due to %s', why,
+                    exc_info=True,
+                )
+            self._running.clear()
+        if not self._running.is_set():
+            reactor.unregister(self.socket)
+        elif self._is_paused_impl and self._is_paused_impl():
+            reactor.unregister(self.socket)
+            reactor.timer(IDLE_WAIT, self._resume_when_drained).start()
+
+    def _resume_when_drained(self) -> None:
+        """Register the socket with the Reactor again, once reading is no
+        longer paused.
+
+        :return:
+        """
+        reactor = self.reactor
+        if not self._running.is_set() or not reactor:
+            return
+        elif self._is_paused_impl and self._is_paused_impl():
+            reactor.timer(IDLE_WAIT, self._resume_when_drained).start()
+            return
+        with self._rd_lock:
+            if self._running.is_set() and self.socket:
+                reactor.register(self.socket, self._on_socket_readable)
+
+    def _has_pending_data(self) -> bool:
+        """Check if the SSL layer holds decrypted data not yet read.
+
+            The Reactor only wakes up for data still on the socket, so
+            buffered SSL records need to be read right away.
+
+        :rtype: bool
+        """
+        if not self.use_ssl or not self.socket:
+            return False
+        return self.socket.pending() > 0  # type: ignore[attr-defined]
+
+    def _receive(self) -> bytes | memoryview:
         """Receive any incoming socket data.
 
             If an error is thrown, handle it and return an empty string.
 
+            The data returned is a view of the internal read buffer, and
+            is only valid until the next read.
+
         :return: data_in
-        :rtype: bytes
+        :rtype: bytes,memoryview
         """
-        data_in = EMPTY_BUFFER
+        data_in: bytes | memoryview = EMPTY_BUFFER
         try:
             data_in = self._read_from_socket()
             if not data_in:
@@ -372,7 +602,7 @@ class IO:
             pass
         except OSError as why:
             if why.errno not in (EWOULDBLOCK, EAGAIN):
-                self._exceptions.append(AMQPConnectionError(why))
+                self._on_error(AMQPConnectionError(why))
                 if self._running.is_set():
                     LOGGER.warning(
                         'Stopping inbound thread due to %s', why,
@@ -381,17 +611,96 @@ class IO:
                 self._running.clear()
         return data_in
 
-    def _read_from_socket(self) -> bytes:
-        """Read data from the socket.
+    def _receive_until_would_block(self) -> None:
+        """Receive incoming socket data until the socket would block.
+
+            Required by edge-triggered pollers, which only report the
+            socket as ready again once new data arrives.
+
+            Stops early if reading is paused, and picks up where it left
+            off once reading is resumed.
+
+        :return:
+        """
+        with self._rd_lock:
+            sock = self.socket
+            if not sock:
+                return
+            self._drain_pending = self._drain_socket(sock)
+
+    def _drain_socket(self, sock: socket.socket) -> bool:
+        """Read from the socket until it would block.
+
+        :param socket.socket sock: Socket
+
+        :return: True if reading stopped before the socket would block.
+        :rtype: bool
+        """
+        while self._running.is_set():
+            if self._is_paused_impl and self._is_paused_impl():
+                return True
+            try:
+                bytes_read = self._recv_nowait(sock)
+                if not bytes_read:
+                    raise OSError('connection closed by server')
+            except OSError as why:
+                if why.errno in (EWOULDBLOCK, EAGAIN):
+                    return False
+                self._on_error(AMQPConnectionError(why))
+                if self._running.is_set():
+                    LOGGER.warning(
+                        'Stopping inbound thread due to %s', why,
+                        exc_info=True,
+                    )
+                self._running.clear()
+                return False
+            self.data_in += self._recv_view[:bytes_read]
+        return False
+
+    def _recv_nowait(self, sock: socket.socket) -> int:
+        """Read from the socket into the internal read buffer, without
+        waiting for data, or changing the timeout of the socket that the
+        writers share.
+
+            A socket with a timeout is non-blocking at the OS level, but
+            recv_into waits for the timeout before giving up, so its file
+            descriptor is read directly instead. SSL sockets only return
+            the data already decrypted.
 
-        :rtype: bytes
+        :param socket.socket sock: Socket
+
+        :raises OSError: EAGAIN if there is no data to read.
+
+        :return: Number of bytes read.
+        :rtype: int
+        """
+        if self.use_ssl:
+            if not sock.pending():  # type: ignore[attr-defined]
+                raise BlockingIOError(EAGAIN, 'no decrypted data pending')
+            return sock.read(  # type: ignore[attr-defined]
+                MAX_FRAME_SIZE, self._recv_buffer
+            )
+        elif sock.gettimeout() is None:
+            return sock.recv_into(self._recv_buffer, MAX_FRAME_SIZE,
+                                  socket.MSG_DONTWAIT)
+        return os.readv(sock.fileno(), [self._recv_view])
+
+    def _read_from_socket(self) -> memoryview:
+        """Read data from the socket into the internal read buffer.
+
+        :rtype: memoryview
         """
         if not self.use_ssl:
             if not self.socket:
                 raise OSError('connection/socket error')
-            return self.socket.recv(MAX_FRAME_SIZE)
+            bytes_read = self.socket.recv_into(self._recv_buffer,
+                                               MAX_FRAME_SIZE)
+            return self._recv_view[:bytes_read]
 
         with self._rd_lock:
             if not self.socket:
                 raise OSError('connection/socket error')
-            return self.socket.read(MAX_FRAME_SIZE)  # type: ignore[attr-defined]
+            bytes_read = self.socket.read(  # type: ignore[attr-defined]
+                MAX_FRAME_SIZE, self._recv_buffer
+            )
+            return self._recv_view[:bytes_read]
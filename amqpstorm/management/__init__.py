@@ -1,3 +1,5 @@
+from amqpstorm.management.aio import AsyncManagementApi  # noqa
 from amqpstorm.management.api import ManagementApi  # noqa
+from amqpstorm.management.cache import ResponseCache  # noqa
 from amqpstorm.management.exception import ApiConnectionError  # noqa
 from amqpstorm.management.exception import ApiError  # noqa
@@ -0,0 +1 @@
+from amqpstorm.management.aio.api import AsyncManagementApi  # noqa
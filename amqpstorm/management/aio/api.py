@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from amqpstorm.management.aio.basic import AsyncBasic
+from amqpstorm.management.aio.http_client import DEFAULT_MAX_CONNECTIONS
+from amqpstorm.management.aio.http_client import AsyncHTTPClient
+from amqpstorm.management.api import API_TOP
+from amqpstorm.management.api import ManagementApi
+from amqpstorm.management.channel import Channel
+from amqpstorm.management.connection import Connection
+from amqpstorm.management.exchange import Exchange
+from amqpstorm.management.healthchecks import HealthChecks
+from amqpstorm.management.queue import Queue
+from amqpstorm.management.user import User
+from amqpstorm.management.virtual_host import VirtualHost
+
+
+class AsyncManagementApi(ManagementApi):
+    """RabbitMQ Management Api for asyncio.
+
+        Has the same operations as ManagementApi, but they are
+        coroutines, and list operations with stream=True return an
+        asynchronous iterator.
+
+    e.g.
+    ::
+
+        from amqpstorm.management.aio import AsyncManagementApi
+
+        async def main():
+            async with AsyncManagementApi('https://localhost:15671', 'guest',
+                                          'guest', verify=True) as client:
+                queues = await asyncio.gather(*(
+                    client.queue.list(virtual_host=virtual_host)
+                    for virtual_host in ('/', 'travis', 'ci')
+                ))
+                async for queue in client.queue.list(show_all=True,
+                                                     stream=True):
+                    print(queue['name'], queue['messages'])
+
+    :param str api_url: RabbitMQ Management url (e.g. https://rmq.eandersson.net:15671)
+    :param str username: Username (e.g. guest)
+    :param str password: Password (e.g. guest)
+    :param int,float timeout: Request timeout
+    :param None,str,bool verify: Verify the server certificate (e.g. True, False or path to CA bundle)
+    :param None,str,tuple cert: Client certificate, or a (cert, key) tuple
+    :param int max_connections: Maximum number of concurrent requests, and
+                                of pooled keep-alive connections.
+    """
+
+    def __init__(
+        self,
+        api_url: str,
+        username: str,
+        password: str,
+        timeout: float = 10,
+        verify: bool | str | None = None,
+        cert: str | tuple[str, str] | None = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    ) -> None:
+        self.http_client = AsyncHTTPClient(  # type: ignore[assignment]
+            api_url, username, password,
+            timeout=timeout, verify=verify, cert=cert,
+            max_connections=max_connections
+        )
+        self._basic = AsyncBasic(self.http_client)
+        self._channel = Channel(self.http_client)
+        self._connection = Connection(self.http_client)
+        self._exchange = Exchange(self.http_client)
+        self._healthchecks = HealthChecks(self.http_client)
+        self._queue = Queue(self.http_client)
+        self._user = User(self.http_client)
+        self._virtual_host = VirtualHost(self.http_client)
+
+    async def __aenter__(self) -> AsyncManagementApi:
+        return self
+
+    async def __aexit__(self, *_: Any) -> None:
+        await self.close()
+
+    def __del__(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        """Close the pooled connections.
+
+        :return:
+        """
+        await self.http_client.close()  # type: ignore[attr-defined]
+
+    async def top(self) -> list[dict[str, Any]]:  # type: ignore[override]
+        """Top Processes.
+
+        :raises ApiError: Raises if the remote server encountered an error.
+        :raises ApiConnectionError: Raises if there was a connectivity issue.
+
+        :rtype: list
+        """
+        nodes = await self.nodes()  # type: ignore[misc]
+        return await asyncio.gather(*(
+            self.http_client.get(API_TOP % node['name']) for node in nodes
+        ))
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from typing import Any
+
+from amqpstorm.management.basic import Basic
+from amqpstorm.message import Message
+
+
+class AsyncBasic(Basic):
+    """RabbitMQ Basic Operations for asyncio."""
+
+    async def get(  # type: ignore[override]
+        self,
+        queue: str,
+        virtual_host: str = '/',
+        requeue: bool = False,
+        to_dict: bool = False,
+        count: int = 1,
+        truncate: int = 50000,
+        encoding: str = 'auto',
+    ) -> list[Message] | list[dict[str, Any]]:
+        """Get Messages.
+
+        :param str queue: Queue name
+        :param str virtual_host: Virtual host name
+        :param bool requeue: Re-queue message
+        :param bool to_dict: Should incoming messages be converted to a
+                             dictionary before delivery.
+        :param int count: How many messages should we try to fetch.
+        :param int truncate: The maximum length in bytes, beyond that the
+                             server will truncate the message.
+        :param str encoding: Message encoding.
+
+        :raises ApiError: Raises if the remote server encountered an error.
+        :raises ApiConnectionError: Raises if there was a connectivity issue.
+
+        :rtype: list
+        """
+        path, payload = self._get_request(queue, virtual_host, requeue,
+                                          count, truncate, encoding)
+        response = await self.http_client.post(path, payload=payload)
+        if to_dict:
+            return response
+        return self._to_messages(response)
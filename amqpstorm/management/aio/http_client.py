@@ -0,0 +1,511 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+import collections
+import json
+import ssl
+from typing import Any
+from typing import AsyncIterator
+from typing import Awaitable
+from typing import Callable
+from typing import Hashable
+from typing import List
+from typing import Mapping
+
+from amqpstorm.compatibility import urlparse
+from amqpstorm.management.exception import ApiConnectionError
+from amqpstorm.management.exception import ApiError
+from amqpstorm.management.http_client import HTTPClient
+
+DEFAULT_MAX_CONNECTIONS = 10
+
+
+class _StaleConnection(ConnectionError):
+    """The server closed a pooled connection before responding."""
+
+
+class _Connection:
+    """Keep-alive HTTP connection."""
+
+    def __init__(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+    ) -> None:
+        self.reader = reader
+        self.writer = writer
+
+    @property
+    def is_usable(self) -> bool:
+        return not self.reader.at_eof() and not self.writer.is_closing()
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+class AsyncHTTPClient:
+    """HTTP/1.1 client for asyncio, with a pool of keep-alive connections.
+
+    :param str api_url: RabbitMQ Management url
+    :param str username: Username
+    :param str password: Password
+    :param None,str,bool verify: Verify the server certificate (e.g. True,
+                                 False or path to CA bundle)
+    :param None,str,tuple cert: Client certificate, or a (cert, key) tuple
+    :param int,float timeout: Request timeout
+    :param int max_connections: Maximum number of concurrent requests, and
+                                of pooled connections.
+    """
+
+    def __init__(
+        self,
+        api_url: str,
+        username: str,
+        password: str,
+        verify: bool | str | None,
+        cert: str | tuple[str, str] | None,
+        timeout: float,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    ) -> None:
+        url = urlparse.urlsplit(api_url)
+        self._base_url = api_url
+        self._hostname = url.hostname or 'localhost'
+        self._port = url.port or (443 if url.scheme == 'https' else 80)
+        self._host_header = url.netloc.rpartition('@')[2]
+        self._ssl = (
+            self._ssl_context(verify, cert) if url.scheme == 'https' else None
+        )
+        credentials = f'{username}:{password}'.encode('utf-8')
+        self._authorization = (
+            f"Basic {base64.b64encode(credentials).decode('ascii')}"
+        )
+        self._timeout = timeout
+        self._max_connections = max_connections
+        self._semaphore = asyncio.Semaphore(max_connections)
+        self._idle: collections.deque[_Connection] = collections.deque()
+
+    async def get(
+        self,
+        path: str,
+        payload: str | None = None,
+        headers: dict[str, str] | None = None,
+        columns: List[str] | str | None = None,
+    ) -> Any:
+        """HTTP GET operation.
+
+        :param path: URI Path
+        :param payload: HTTP Body
+        :param headers: HTTP Headers
+        :param columns: Only return these fields (e.g. ['name', 'messages'])
+
+        :raises ApiError: Raises if the remote server encountered an error.
+        :raises ApiConnectionError: Raises if there was a connectivity issue.
+
+        :return: Response
+        """
+        return await self._request(
+            'get', path, payload, headers,
+            params=HTTPClient._list_params(columns=columns)
+        )
+
+    async def list(
+        self,
+        path: str,
+        name: str | None = None,
+        page_size: int | None = None,
+        use_regex: bool | str = False,
+        columns: List[str] | str | None = None,
+    ) -> Any:
+        """List operation (e.g. queue list).
+
+            Pages are fetched concurrently, up to max_connections at a
+            time.
+
+        :param path: URI Path
+        :param name: Filter by name
+        :param use_regex: Enables regular expression for the param name
+        :param page_size: Number of elements per page
+        :param columns: Only return these fields (e.g. ['name', 'messages'])
+
+        :raises ApiError: Raises if the remote server encountered an error.
+        :raises ApiConnectionError: Raises if there was a connectivity issue.
+
+        :return: Response
+        """
+        params = HTTPClient._list_params(name, use_regex, columns)
+        if page_size is None:
+            return await self._request('get', path, params=params)
+        return [item async for item in
+                self._iter_pages(path, params, page_size)]
+
+    async def iter_list(
+        self,
+        path: str,
+        name: str | None = None,
+        page_size: int | None = None,
+        use_regex: bool | str = False,
+        columns: List[str] | str | None = None,
+    ) -> AsyncIterator[Any]:
+        """List operation that yields the elements as the pages arrive.
+
+        :param path: URI Path
+        :param name: Filter by name
+        :param use_regex: Enables regular expression for the param name
+        :param page_size: Number of elements per page
+        :param columns: Only return these fields (e.g. ['name', 'messages'])
+
+        :raises ApiError: Raises if the remote server encountered an error.
+        :raises ApiConnectionError: Raises if there was a connectivity issue.
+
+        :return: Asynchronous iterator of elements
+        """
+        params = HTTPClient._list_params(name, use_regex, columns)
+        if page_size is None:
+            for item in await self._request('get', path, params=params):
+                yield item
+            return
+        async for item in self._iter_pages(path, params, page_size):
+            yield item
+
+    async def post(
+        self,
+        path: str,
+        payload: str | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> Any:
+        """HTTP POST operation.
+
+        :param path: URI Path
+        :param payload: HTTP Body
+        :param headers: HTTP Headers
+
+        :raises ApiError: Raises if the remote server encountered an error.
+        :raises ApiConnectionError: Raises if there was a connectivity issue.
+
+        :return: Response
+        """
+        return await self._request('post', path, payload, headers)
+
+    async def delete(
+        self,
+        path: str,
+        payload: str | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> Any:
+        """HTTP DELETE operation.
+
+        :param path: URI Path
+        :param payload: HTTP Body
+        :param headers: HTTP Headers
+
+        :raises ApiError: Raises if the remote server encountered an error.
+        :raises ApiConnectionError: Raises if there was a connectivity issue.
+
+        :return: Response
+        """
+        return await self._request('delete', path, payload, headers)
+
+    async def put(
+        self,
+        path: str,
+        payload: str | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> Any:
+        """HTTP PUT operation.
+
+        :param path: URI Path
+        :param payload: HTTP Body
+        :param headers: HTTP Headers
+
+        :raises ApiError: Raises if the remote server encountered an error.
+        :raises ApiConnectionError: Raises if there was a connectivity issue.
+
+        :return: Response
+        """
+        return await self._request('put', path, payload, headers)
+
+    async def run_many(
+        self, operations: Mapping[Hashable, Callable[[], Awaitable[Any]]],
+    ) -> dict[Hashable, ApiError | ApiConnectionError]:
+        """Run operations concurrently, up to max_connections at a time,
+        and collect their errors.
+
+        :param dict operations: Operations by key.
+
+        :return: Errors by key, of the operations that failed.
+        :rtype: dict
+        """
+        keys = list(operations)
+        results = await asyncio.gather(
+            *(operations[key]() for key in keys), return_exceptions=True
+        )
+        errors: dict[Hashable, ApiError | ApiConnectionError] = {}
+        for key, result in zip(keys, results):
+            if isinstance(result, (ApiError, ApiConnectionError)):
+                errors[key] = result
+            elif isinstance(result, BaseException):
+                raise result
+        return errors
+
+    async def close(self) -> None:
+        """Close the pooled connections.
+
+        :return:
+        """
+        while self._idle:
+            connection = self._idle.popleft()
+            connection.close()
+            try:
+                await connection.writer.wait_closed()
+            except OSError:
+                pass
+
+    async def _iter_pages(
+        self, path: str, params: dict[str, Any], page_size: int,
+    ) -> AsyncIterator[Any]:
+        """Fetch the pages of a paginated list, and yield their elements
+        in order.
+
+        :param path: URI Path
+        :param params: HTTP Parameters
+        :param page_size: Number of elements per page
+
+        :raises ApiError: Raises if the remote server encountered an error.
+        :raises ApiConnectionError: Raises if there was a connectivity issue.
+
+        :return: Asynchronous iterator of elements
+        """
+        params['page'] = 1
+        params['page_size'] = page_size
+        params['pagination'] = True
+        first_result = await self._request('get', path, params=params)
+        num_pages = first_result['page_count']
+        next_page = first_result.get('page', 1) + 1
+        items = first_result['items']
+        pending: collections.deque[asyncio.Task[Any]] = collections.deque()
+        try:
+            while True:
+                window = min(num_pages + 1,
+                             next_page + self._max_connections - len(pending))
+                for page in range(next_page, window):
+                    pending.append(asyncio.ensure_future(self._request(
+                        'get', path, params=dict(params, page=page)
+                    )))
+                next_page = max(next_page, window)
+                for item in items:
+                    yield item
+                if not pending:
+                    return
+                next_result = await pending.popleft()
+                num_pages = next_result['page_count']
+                items = next_result.get('items', [])
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        payload: str | None = None,
+        headers: dict[str, str] | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> Any:
+        """HTTP operation.
+
+            A pooled connection closed by the server while idle is
+            replaced by a new connection, and the request retried once.
+
+        :param method: Operation type (e.g. post)
+        :param path: URI Path
+        :param payload: HTTP Body
+        :param headers: HTTP Headers
+        :param params: HTTP Parameters
+
+        :raises ApiError: Raises if the remote server encountered an error.
+        :raises ApiConnectionError: Raises if there was a connectivity issue.
+
+        :return: Response
+        """
+        url = urlparse.urljoin(self._base_url, f'api/{path}')
+        if params:
+            url = f'{url}?{urlparse.urlencode(params)}'
+        request = self._build_request(method, url, payload, headers)
+        async with self._semaphore:
+            for attempt in range(2):
+                try:
+                    async with asyncio.timeout(self._timeout):
+                        connection, reused = await self._acquire()
+                        try:
+                            status, reason, body, keep_alive = (
+                                await self._exchange(connection, request,
+                                                     method)
+                            )
+                        except BaseException:
+                            connection.close()
+                            raise
+                except TimeoutError:
+                    raise ApiConnectionError(
+                        f'request timed out after {self._timeout}s: {url}'
+                    )
+                except (_StaleConnection, ConnectionResetError,
+                        BrokenPipeError) as why:
+                    if reused and attempt == 0:
+                        continue
+                    raise ApiConnectionError(str(why) or 'connection closed')
+                except (OSError, asyncio.IncompleteReadError,
+                        ValueError) as why:
+                    raise ApiConnectionError(str(why))
+                break
+            if keep_alive:
+                self._idle.append(connection)
+            else:
+                connection.close()
+
+        try:
+            json_response = json.loads(body) if body else None
+        except ValueError:
+            json_response = None
+        if status >= 400:
+            kind = 'Client' if status < 500 else 'Server'
+            raise ApiError(f'{status} {kind} Error: {reason} for url: {url}',
+                           reply_code=status)
+        if isinstance(json_response, dict) and 'error' in json_response:
+            raise ApiError(json_response['error'], reply_code=status)
+        return json_response
+
+    def _build_request(
+        self,
+        method: str,
+        url: str,
+        payload: str | None,
+        headers: dict[str, str] | None,
+    ) -> bytes:
+        """Build an HTTP request.
+
+        :param method: Operation type (e.g. post)
+        :param url: URL
+        :param payload: HTTP Body
+        :param headers: HTTP Headers
+
+        :rtype: bytes
+        """
+        body = payload.encode('utf-8') if payload is not None else b''
+        split_url = urlparse.urlsplit(url)
+        target = split_url.path or '/'
+        if split_url.query:
+            target = f'{target}?{split_url.query}'
+        request_headers = {
+            'Host': self._host_header,
+            'Authorization': self._authorization,
+            'Accept': 'application/json',
+        }
+        request_headers.update(headers or {})
+        request_headers['Content-Type'] = 'application/json'
+        if body or method != 'get':
+            request_headers['Content-Length'] = str(len(body))
+        lines = [f'{method.upper()} {target} HTTP/1.1']
+        lines.extend(f'{name}: {value}'
+                     for name, value in request_headers.items())
+        return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + body
+
+    async def _acquire(self) -> tuple[_Connection, bool]:
+        """Returns an idle pooled connection, or a new connection.
+
+        :return: The connection, and if it was pooled.
+        :rtype: tuple
+        """
+        while self._idle:
+            connection = self._idle.pop()
+            if connection.is_usable:
+                return connection, True
+            connection.close()
+        reader, writer = await asyncio.open_connection(
+            self._hostname, self._port, ssl=self._ssl,
+            server_hostname=self._hostname if self._ssl else None,
+        )
+        return _Connection(reader, writer), False
+
+    @staticmethod
+    async def _exchange(
+        connection: _Connection, request: bytes, method: str,
+    ) -> tuple[int, str, bytes, bool]:
+        """Send a request, and read the response.
+
+        :param connection: HTTP connection
+        :param request: HTTP request
+        :param method: Operation type (e.g. post)
+
+        :raises _StaleConnection: The connection was closed by the server.
+        :raises ValueError: The response is not valid HTTP.
+
+        :return: Status code, reason, body, and if the connection can be
+                 kept alive.
+        :rtype: tuple
+        """
+        reader = connection.reader
+        connection.writer.write(request)
+        await connection.writer.drain()
+
+        status_line = await reader.readline()
+        if not status_line:
+            raise _StaleConnection('connection closed by the server')
+        version, status, reason = (
+            status_line.decode('latin-1').rstrip('\r\n').split(' ', 2) + ['']
+        )[:3]
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip().lower()
+
+        status_code = int(status)
+        if version == 'HTTP/1.1':
+            keep_alive = headers.get('connection') != 'close'
+        else:
+            keep_alive = headers.get('connection') == 'keep-alive'
+        if method == 'head' or status_code in (204, 304) or status_code < 200:
+            body = b''
+        elif 'chunked' in headers.get('transfer-encoding', ''):
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b';')[0], 16)
+                if not size:
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+            while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                pass
+            body = b''.join(chunks)
+        elif 'content-length' in headers:
+            body = await reader.readexactly(int(headers['content-length']))
+        else:
+            body = await reader.read()
+            keep_alive = False
+        return status_code, reason, body, keep_alive
+
+    @staticmethod
+    def _ssl_context(
+        verify: bool | str | None, cert: str | tuple[str, str] | None,
+    ) -> ssl.SSLContext:
+        """Create the SSL context of an https api_url.
+
+        :param verify: Verify the server certificate (e.g. True, False or
+                       path to CA bundle)
+        :param cert: Client certificate, or a (cert, key) tuple
+
+        :rtype: ssl.SSLContext
+        """
+        if isinstance(verify, str):
+            context = ssl.create_default_context(cafile=verify)
+        else:
+            context = ssl.create_default_context()
+            if verify is False:
+                context.check_hostname = False
+                context.verify_mode = ssl.CERT_NONE
+        if isinstance(cert, str):
+            context.load_cert_chain(cert)
+        elif cert:
+            context.load_cert_chain(*cert)
+        return context
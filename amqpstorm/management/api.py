@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+import json
 from typing import Any
+from typing import Iterator
 
 from amqpstorm.compatibility import quote
+from amqpstorm.management.base import API_DEFINITIONS
+from amqpstorm.management.base import API_DEFINITIONS_VIRTUAL_HOST
 from amqpstorm.management.basic import Basic
+from amqpstorm.management.cache import ResponseCache
 from amqpstorm.management.channel import Channel
 from amqpstorm.management.connection import Connection
 from amqpstorm.management.exchange import Exchange
 from amqpstorm.management.healthchecks import HealthChecks
+from amqpstorm.management.http_client import DEFAULT_MAX_WORKERS
 from amqpstorm.management.http_client import HTTPClient
 from amqpstorm.management.queue import Queue
 from amqpstorm.management.user import User
@@ -45,6 +51,11 @@ class ManagementApi:
     :param int,float timeout: TCP Timeout
     :param None,str,bool verify: Requests session verify (e.g. True, False or path to CA bundle)
     :param None,str,tuple cert: Requests session cert
+    :param int max_workers: Maximum number of pages of a list fetched
+                            concurrently (e.g. queue.list)
+    :param ResponseCache cache: Cache the responses of GET operations
+                                (e.g. overview, nodes or queue.get).
+                                Streamed lists are never cached.
     """
 
     def __init__(
@@ -55,10 +66,13 @@ class ManagementApi:
         timeout: float = 10,
         verify: bool | str | None = None,
         cert: str | tuple[str, str] | None = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        cache: ResponseCache | None = None,
     ) -> None:
         self.http_client = HTTPClient(
             api_url, username, password,
-            timeout=timeout, verify=verify, cert=cert
+            timeout=timeout, verify=verify, cert=cert,
+            max_workers=max_workers, cache=cache
         )
         self._basic = Basic(self.http_client)
         self._channel = Channel(self.http_client)
@@ -212,6 +226,40 @@ class ManagementApi:
         """
         return self.http_client.get(API_CLUSTER_NAME)
 
+    def import_definitions(
+        self,
+        definitions: dict[str, Any],
+        virtual_host: str | None = None,
+    ) -> None:
+        """Import definitions (e.g. queues, exchanges and bindings) in a
+        single request.
+
+        e.g.
+        ::
+
+            client.import_definitions({
+                'queues': [{'name': 'my_queue', 'durable': True}],
+                'exchanges': [{'name': 'my_exchange', 'type': 'topic'}],
+                'bindings': [{'source': 'my_exchange',
+                              'destination': 'my_queue',
+                              'destination_type': 'queue',
+                              'routing_key': '#'}],
+            }, virtual_host='/')
+
+        :param dict definitions: Definitions
+        :param str virtual_host: Import into this virtual host, instead of
+                                 the virtual hosts of the definitions.
+
+        :raises ApiError: Raises if the remote server encountered an error.
+        :raises ApiConnectionError: Raises if there was a connectivity issue.
+
+        :rtype: None
+        """
+        path = API_DEFINITIONS
+        if virtual_host is not None:
+            path = API_DEFINITIONS_VIRTUAL_HOST % quote(virtual_host, '')
+        return self.http_client.post(path, payload=json.dumps(definitions))
+
     def node(self, name: str) -> dict[str, Any]:
         """Get Nodes.
 
@@ -222,25 +270,41 @@ class ManagementApi:
         """
         return self.http_client.get(API_NODE % name)
 
-    def nodes(self) -> list[dict[str, Any]]:
+    def nodes(
+        self,
+        columns: list[str] | str | None = None,
+        stream: bool = False,
+    ) -> list[dict[str, Any]] | Iterator[dict[str, Any]]:
         """Get Nodes.
 
+        :param columns: Only return these fields (e.g. ['name', 'mem_used'])
+        :param bool stream: Return an iterator that yields the nodes while
+                            the response is parsed, instead of a list.
+
         :raises ApiError: Raises if the remote server encountered an error.
         :raises ApiConnectionError: Raises if there was a connectivity issue.
 
-        :rtype: dict
+        :rtype: list,iterator
         """
-        return self.http_client.get(API_NODES)
+        if stream:
+            return self.http_client.iter_list(API_NODES, columns=columns)
+        return self.http_client.get(API_NODES, columns=columns)
 
-    def overview(self) -> dict[str, Any]:
+    def overview(
+        self,
+        columns: list[str] | str | None = None,
+    ) -> dict[str, Any]:
         """Get Overview.
 
+        :param columns: Only return these fields
+                        (e.g. ['rabbitmq_version', 'object_totals'])
+
         :raises ApiError: Raises if the remote server encountered an error.
         :raises ApiConnectionError: Raises if there was a connectivity issue.
 
         :rtype: dict
         """
-        return self.http_client.get(API_OVERVIEW)
+        return self.http_client.get(API_OVERVIEW, columns=columns)
 
     def top(self) -> list[dict[str, Any]]:
         """Top Processes.
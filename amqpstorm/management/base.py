@@ -1,13 +1,148 @@
 from __future__ import annotations
 
+import functools
+import inspect
+import json
 from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+from typing import Hashable
+from typing import Iterable
+
+from amqpstorm.compatibility import quote
+from amqpstorm.exception import AMQPInvalidArgument
 
 if TYPE_CHECKING:
     from amqpstorm.management.http_client import HTTPClient
 
+API_DEFINITIONS = 'definitions'
+API_DEFINITIONS_VIRTUAL_HOST = 'definitions/%s'
+
 
 class ManagementHandler:
     """Management Api Operations Handler (e.g. Queue, Exchange)"""
 
     def __init__(self, http_client: HTTPClient) -> None:
         self.http_client = http_client
+
+    def _run_many(
+        self,
+        operation: Callable[..., Any],
+        items: Iterable[Any],
+        fields: tuple[str, ...],
+        defaults: dict[str, Any],
+    ) -> Any:
+        """Run an operation for many items concurrently, and collect the
+        errors.
+
+            An item is either a dict of operation kwargs, a tuple of the
+            values of fields, or the value of the first field.
+
+        :param operation: Operation (e.g. self.declare)
+        :param items: Items
+        :param tuple fields: Fields identifying an item.
+        :param dict defaults: Default operation kwargs.
+
+        :raises AMQPInvalidArgument: Raises if an item is given more than once.
+
+        :return: Errors by item, of the items that failed.
+        :rtype: dict
+        """
+        operations: dict[Hashable, Callable[[], Any]] = {}
+        for kwargs in self._bulk_kwargs(items, fields, defaults):
+            key = self._bulk_key(kwargs, fields)
+            if key in operations:
+                raise AMQPInvalidArgument(f'duplicate item: {key!r}')
+            operations[key] = functools.partial(operation, **kwargs)
+        return self.http_client.run_many(operations)
+
+    def _import_many(
+        self,
+        keys: list[Hashable],
+        definitions: dict[str, Any],
+        virtual_host: str,
+    ) -> Any:
+        """Import definitions in a single request.
+
+        :param list keys: Items the definitions were built from.
+        :param dict definitions: Definitions (e.g. {'queues': [...]})
+        :param str virtual_host: Virtual host name
+
+        :raises AMQPInvalidArgument: Raises if an item is given more than once.
+
+        :return: The import error by item, if the import failed.
+        :rtype: dict
+        """
+        unique_keys = set()
+        for key in keys:
+            if key in unique_keys:
+                raise AMQPInvalidArgument(f'duplicate item: {key!r}')
+            unique_keys.add(key)
+        payload = json.dumps(definitions)
+        errors = self.http_client.run_many({
+            API_DEFINITIONS: functools.partial(
+                self.http_client.post,
+                API_DEFINITIONS_VIRTUAL_HOST % quote(virtual_host, ''),
+                payload=payload
+            )
+        })
+        return _then(errors, lambda errors: {
+            key: errors[API_DEFINITIONS] for key in keys
+        } if errors else {})
+
+    @staticmethod
+    def _bulk_kwargs(
+        items: Iterable[Any],
+        fields: tuple[str, ...],
+        defaults: dict[str, Any],
+    ) -> list[dict[str, Any]]:
+        """Convert bulk items to operation kwargs.
+
+        :param items: Items
+        :param tuple fields: Fields identifying an item.
+        :param dict defaults: Default operation kwargs.
+
+        :rtype: list
+        """
+        bulk_kwargs = []
+        for item in items:
+            kwargs = dict(defaults)
+            if isinstance(item, dict):
+                kwargs.update(item)
+            elif isinstance(item, (list, tuple)):
+                kwargs.update(zip(fields, item))
+            else:
+                kwargs[fields[0]] = item
+            bulk_kwargs.append(kwargs)
+        return bulk_kwargs
+
+    @staticmethod
+    def _bulk_key(kwargs: dict[str, Any], fields: tuple[str, ...]) -> Hashable:
+        """Returns the key identifying a bulk item.
+
+        :param dict kwargs: Operation kwargs
+        :param tuple fields: Fields identifying an item.
+
+        :rtype: str,tuple
+        """
+        if len(fields) == 1:
+            return kwargs[fields[0]]
+        return tuple(kwargs.get(field, '') for field in fields)
+
+
+def _then(result: Any, callback: Callable[[Any], Any]) -> Any:
+    """Apply a callback to the result of an http client operation, which
+    is awaitable when using the asyncio http client.
+
+    :param result: Result, or awaitable result
+    :param callback: Callback
+
+    :return: Result of the callback, or an awaitable of it.
+    """
+    if not inspect.isawaitable(result):
+        return callback(result)
+
+    async def wait_for_result() -> Any:
+        return callback(await result)
+
+    return wait_for_result()
@@ -80,6 +80,34 @@ class Basic(ManagementHandler):
 
         :rtype: list
         """
+        path, payload = self._get_request(queue, virtual_host, requeue,
+                                          count, truncate, encoding)
+        response = self.http_client.post(path, payload=payload)
+        if to_dict:
+            return response
+        return self._to_messages(response)
+
+    @staticmethod
+    def _get_request(
+        queue: str,
+        virtual_host: str,
+        requeue: bool,
+        count: int,
+        truncate: int,
+        encoding: str,
+    ) -> tuple[str, str]:
+        """Build the path and payload of a get request.
+
+        :param str queue: Queue name
+        :param str virtual_host: Virtual host name
+        :param bool requeue: Re-queue message
+        :param int count: How many messages should we try to fetch.
+        :param int truncate: The maximum length in bytes, beyond that the
+                             server will truncate the message.
+        :param str encoding: Message encoding.
+
+        :rtype: tuple
+        """
         ackmode = 'ack_requeue_false'
         if requeue:
             ackmode = 'ack_requeue_true'
@@ -95,14 +123,16 @@ class Basic(ManagementHandler):
             }
         )
         virtual_host = quote(virtual_host, '')
-        response = self.http_client.post(API_BASIC_GET_MESSAGE %
-                                         (
-                                             virtual_host,
-                                             queue
-                                         ),
-                                         payload=get_messages)
-        if to_dict:
-            return response
+        return API_BASIC_GET_MESSAGE % (virtual_host, queue), get_messages
+
+    @staticmethod
+    def _to_messages(response: list[dict[str, Any]]) -> list[Message]:
+        """Convert the messages of a get response to Message objects.
+
+        :param list response: Get response
+
+        :rtype: list
+        """
         messages = []
         for message in response:
             body = message.get('body')
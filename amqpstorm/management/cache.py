@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import collections
+import concurrent.futures
+import copy
+import threading
+import time
+from typing import Any
+from typing import Callable
+
+from amqpstorm.exception import AMQPInvalidArgument
+
+DEFAULT_TTL = 5
+DEFAULT_MAX_SIZE = 1024
+
+CacheKey = tuple[str, tuple[Any, ...]]
+
+
+class ResponseCache:
+    """Read-through cache of Management Api GET responses.
+
+        Responses are cached per path and parameters for the TTL of
+        their endpoint, which is the first segment of the path
+        (e.g. overview, nodes or queues). Concurrent identical requests
+        are coalesced into a single HTTP request, and the least recently
+        used responses are evicted once max_size is reached.
+
+        A PUT, POST or DELETE on a path invalidates the cached responses
+        of that path, of its parents and of its children, e.g. deleting
+        queues/%2F/my_queue invalidates queues, queues/%2F and
+        queues/%2F/my_queue/bindings.
+
+        e.g.
+        ::
+
+            from amqpstorm.management import ManagementApi
+            from amqpstorm.management import ResponseCache
+            cache = ResponseCache(ttl=5, endpoint_ttls={'overview': 1})
+            client = ManagementApi('https://localhost:15671', 'guest',
+                                   'guest', cache=cache)
+
+    :param int,float ttl: Seconds a response is cached.
+    :param dict endpoint_ttls: Seconds a response is cached, by endpoint.
+                               A TTL of 0 disables caching of the endpoint.
+    :param int max_size: Maximum number of cached responses.
+
+    :raises AMQPInvalidArgument: Invalid Parameters
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_TTL,
+        endpoint_ttls: dict[str, float] | None = None,
+        max_size: int = DEFAULT_MAX_SIZE,
+    ) -> None:
+        endpoint_ttls = dict(endpoint_ttls or {})
+        for value in [ttl, *endpoint_ttls.values()]:
+            if not isinstance(value, (int, float)) or value < 0:
+                raise AMQPInvalidArgument(
+                    'ttl should be a non-negative integer or float'
+                )
+        if not isinstance(max_size, int) or max_size < 1:
+            raise AMQPInvalidArgument('max_size should be a positive integer')
+        self._ttl = ttl
+        self._endpoint_ttls = endpoint_ttls
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        self._entries: collections.OrderedDict[
+            CacheKey, tuple[float, Any]
+        ] = collections.OrderedDict()
+        self._inflight: dict[CacheKey, concurrent.futures.Future[Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def ttl(self, path: str) -> float:
+        """Returns the seconds a response of a path is cached.
+
+        :param str path: URI Path
+
+        :rtype: float
+        """
+        return self._endpoint_ttls.get(path.split('/', 1)[0], self._ttl)
+
+    def get(
+        self,
+        path: str,
+        params: dict[str, Any] | None,
+        fetch: Callable[[], Any],
+    ) -> Any:
+        """Returns the cached response, or fetch it.
+
+            If the same request is already being fetched by another
+            thread, wait for its response instead.
+
+        :param str path: URI Path
+        :param dict params: HTTP Parameters
+        :param fetch: Function fetching the response.
+
+        :return: Response
+        """
+        ttl = self.ttl(path)
+        if not ttl:
+            return fetch()
+        key: CacheKey = (path, tuple(sorted((params or {}).items())))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                return copy.deepcopy(entry[1])
+            self._entries.pop(key, None)
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                future: concurrent.futures.Future[Any] = (
+                    concurrent.futures.Future()
+                )
+                self._inflight[key] = future
+        if inflight is not None:
+            return copy.deepcopy(inflight.result())
+
+        try:
+            response = fetch()
+        except BaseException as why:
+            with self._lock:
+                self._remove_inflight(key, future)
+            future.set_exception(why)
+            raise
+        with self._lock:
+            # Do not cache a response invalidated while in flight.
+            if self._remove_inflight(key, future):
+                self._entries[key] = (time.monotonic() + ttl,
+                                      copy.deepcopy(response))
+                while len(self._entries) > self._max_size:
+                    self._entries.popitem(last=False)
+        future.set_result(response)
+        return copy.deepcopy(response)
+
+    def invalidate(self, path: str) -> None:
+        """Invalidate the cached responses of a path, of its parents and
+        of its children.
+
+        :param str path: URI Path
+
+        :return:
+        """
+        segments = path.strip('/').split('/')
+        with self._lock:
+            for entries in (self._entries, self._inflight):
+                for key in list(entries):
+                    cached = key[0].strip('/').split('/')
+                    length = min(len(cached), len(segments))
+                    if cached[:length] == segments[:length]:
+                        del entries[key]
+
+    def clear(self) -> None:
+        """Invalidate all cached responses.
+
+        :return:
+        """
+        with self._lock:
+            self._entries.clear()
+            self._inflight.clear()
+
+    def _remove_inflight(
+        self, key: CacheKey, future: concurrent.futures.Future[Any],
+    ) -> bool:
+        """Stop coalescing requests into a fetch. Must hold the lock.
+
+        :param key: Cache key
+        :param future: Future of the fetch
+
+        :return: False if the fetch was invalidated while in flight.
+        :rtype: bool
+        """
+        if self._inflight.get(key) is not future:
+            return False
+        del self._inflight[key]
+        return True
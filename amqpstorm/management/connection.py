@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 from typing import Any
+from typing import Iterator
 from typing import List
 
 from amqpstorm.compatibility import quote
@@ -31,21 +32,32 @@ class Connection(ManagementHandler):
         name: str | None = None,
         page_size: int = 100,
         use_regex: bool = False,
-    ) -> List[dict[str, Any]]:
+        stream: bool = False,
+        columns: list[str] | str | None = None,
+    ) -> List[dict[str, Any]] | Iterator[dict[str, Any]]:
         """Get Connections.
 
         :param name: Filter by name
         :param use_regex: Enables regular expression for the param name
         :param page_size: Number of elements per page
+        :param bool stream: Return an iterator that yields the elements as
+                            the pages arrive, instead of a list.
+                            Without a page_size, the response is parsed
+                            incrementally as it is received.
+        :param columns: Only return these fields (e.g. ['name', 'messages'])
 
         :raises ApiError: Raises if the remote server encountered an error.
         :raises ApiConnectionError: Raises if there was a connectivity issue.
 
-        :rtype: list
+        :rtype: list,iterator
         """
-        return self.http_client.list(
+        list_method = (
+            self.http_client.iter_list if stream else self.http_client.list
+        )
+        return list_method(
             API_CONNECTIONS,
             name=name, use_regex=use_regex, page_size=page_size,
+            columns=columns,
         )
 
     def close(
@@ -2,10 +2,14 @@ from __future__ import annotations
 
 import json
 from typing import Any
+from typing import Iterable
+from typing import Iterator
 from typing import List
 
 from amqpstorm.compatibility import quote
 from amqpstorm.management.base import ManagementHandler
+from amqpstorm.management.exception import ApiConnectionError
+from amqpstorm.management.exception import ApiError
 
 API_EXCHANGE = 'exchanges/%s/%s'
 API_EXCHANGE_BIND = 'bindings/%s/e/%s/e/%s'
@@ -42,7 +46,9 @@ class Exchange(ManagementHandler):
         name: str | None = None,
         page_size: int = 100,
         use_regex: bool = False,
-    ) -> List[dict[str, Any]]:
+        stream: bool = False,
+        columns: list[str] | str | None = None,
+    ) -> List[dict[str, Any]] | Iterator[dict[str, Any]]:
         """List Exchanges.
 
         :param str virtual_host: Virtual host name
@@ -50,23 +56,33 @@ class Exchange(ManagementHandler):
         :param name: Filter by name
         :param use_regex: Enables regular expression for the param name
         :param page_size: Number of elements per page
+        :param bool stream: Return an iterator that yields the elements as
+                            the pages arrive, instead of a list.
+                            Without a page_size, the response is parsed
+                            incrementally as it is received.
+        :param columns: Only return these fields (e.g. ['name', 'messages'])
 
         :raises ApiError: Raises if the remote server encountered an error.
                           We also raise an exception if the exchange cannot
                           be found.
         :raises ApiConnectionError: Raises if there was a connectivity issue.
 
-        :rtype: list
+        :rtype: list,iterator
         """
+        list_method = (
+            self.http_client.iter_list if stream else self.http_client.list
+        )
         if show_all:
-            return self.http_client.list(
+            return list_method(
                 API_EXCHANGES,
                 name=name, use_regex=use_regex, page_size=page_size,
+                columns=columns,
             )
         virtual_host = quote(virtual_host, '')
-        return self.http_client.list(
+        return list_method(
             API_EXCHANGES_VIRTUAL_HOST % virtual_host,
             name=name, use_regex=use_regex, page_size=page_size,
+            columns=columns,
         )
 
     def declare(
@@ -115,6 +131,75 @@ class Exchange(ManagementHandler):
                                     ),
                                     payload=exchange_payload)
 
+    def declare_many(
+        self,
+        exchanges: Iterable[str | dict[str, Any]],
+        exchange_type: str = 'direct',
+        virtual_host: str = '/',
+        durable: bool = False,
+        auto_delete: bool = False,
+        internal: bool = False,
+        arguments: dict[str, Any] | None = None,
+        use_definitions: bool = False,
+    ) -> dict[str, ApiError | ApiConnectionError]:
+        """Declare many Exchanges.
+
+            The exchanges are declared concurrently, up to max_workers at
+            a time, and an exchange that could not be declared does not
+            stop the others.
+
+            With use_definitions, the exchanges are instead declared in a
+            single request to the definitions import endpoint, which
+            either declares all of them, or none.
+
+            e.g.
+            ::
+
+                errors = client.exchange.declare_many(
+                    ['my_exchange', {'exchange': 'my_topic',
+                                     'exchange_type': 'topic'}],
+                    durable=True
+                )
+
+        :param list exchanges: Exchange names, or dicts of declare kwargs.
+        :param str exchange_type: Exchange type
+        :param str virtual_host: Virtual host name
+        :param bool durable: Durable exchanges
+        :param bool auto_delete: Automatically delete when not in use
+        :param bool internal: Are the exchanges for use by the broker only.
+        :param dict,None arguments: Exchange key/value arguments
+        :param bool use_definitions: Use the definitions import endpoint.
+
+        :raises AMQPInvalidArgument: Raises if an item is given more than
+                                     once.
+
+        :return: Errors by exchange name, of the exchanges that failed.
+        :rtype: dict
+        """
+        defaults = {
+            'exchange_type': exchange_type, 'virtual_host': virtual_host,
+            'durable': durable, 'auto_delete': auto_delete,
+            'internal': internal, 'arguments': arguments,
+        }
+        if not use_definitions:
+            return self._run_many(self.declare, exchanges, ('exchange',),
+                                  defaults)
+        declarations = self._bulk_kwargs(exchanges, ('exchange',), defaults)
+        return self._import_many(
+            [kwargs['exchange'] for kwargs in declarations],
+            {'exchanges': [
+                {
+                    'name': kwargs['exchange'],
+                    'type': kwargs['exchange_type'],
+                    'durable': kwargs['durable'],
+                    'auto_delete': kwargs['auto_delete'],
+                    'internal': kwargs['internal'],
+                    'arguments': kwargs['arguments'] or {},
+                } for kwargs in declarations
+            ]},
+            virtual_host
+        )
+
     def delete(self, exchange: str, virtual_host: str = '/') -> dict[str, Any]:
         """Delete an Exchange.
 
@@ -133,6 +218,27 @@ class Exchange(ManagementHandler):
                                            exchange
                                        ))
 
+    def delete_many(
+        self, exchanges: Iterable[str], virtual_host: str = '/',
+    ) -> dict[str, ApiError | ApiConnectionError]:
+        """Delete many Exchanges.
+
+            The exchanges are deleted concurrently, up to max_workers at a
+            time, and an exchange that could not be deleted does not stop
+            the others.
+
+        :param list exchanges: Exchange names
+        :param str virtual_host: Virtual host name
+
+        :raises AMQPInvalidArgument: Raises if an item is given more than
+                                     once.
+
+        :return: Errors by exchange name, of the exchanges that failed.
+        :rtype: dict
+        """
+        return self._run_many(self.delete, exchanges, ('exchange',),
+                              {'virtual_host': virtual_host})
+
     def bindings(
         self, exchange: str, virtual_host: str = '/',
     ) -> List[dict[str, Any]]:
@@ -191,6 +297,53 @@ class Exchange(ManagementHandler):
                                      ),
                                      payload=bind_payload)
 
+    def bind_many(
+        self,
+        bindings: Iterable[tuple[str, ...] | dict[str, Any]],
+        virtual_host: str = '/',
+        use_definitions: bool = False,
+    ) -> dict[tuple[str, str, str], ApiError | ApiConnectionError]:
+        """Bind many Exchanges.
+
+            The bindings are created concurrently, up to max_workers at a
+            time, and a binding that could not be created does not stop
+            the others.
+
+            With use_definitions, the bindings are instead created in a
+            single request to the definitions import endpoint, which
+            either creates all of them, or none.
+
+        :param list bindings: (destination, source, routing_key) tuples, or
+                              dicts of bind kwargs.
+        :param str virtual_host: Virtual host name
+        :param bool use_definitions: Use the definitions import endpoint.
+
+        :raises AMQPInvalidArgument: Raises if an item is given more than
+                                     once.
+
+        :return: Errors by (destination, source, routing_key), of the
+                 bindings that failed.
+        :rtype: dict
+        """
+        fields = ('destination', 'source', 'routing_key')
+        defaults = {'virtual_host': virtual_host}
+        if not use_definitions:
+            return self._run_many(self.bind, bindings, fields, defaults)
+        declarations = self._bulk_kwargs(bindings, fields, defaults)
+        return self._import_many(
+            [self._bulk_key(kwargs, fields) for kwargs in declarations],
+            {'bindings': [
+                {
+                    'source': kwargs.get('source', ''),
+                    'destination': kwargs['destination'],
+                    'destination_type': 'exchange',
+                    'routing_key': kwargs.get('routing_key', ''),
+                    'arguments': kwargs.get('arguments') or {},
+                } for kwargs in declarations
+            ]},
+            virtual_host
+        )
+
     def unbind(
         self,
         destination: str = '',
@@ -1,14 +1,28 @@
 from __future__ import annotations
 
+import collections
+import concurrent.futures
 from typing import Any
+from typing import Callable
+from typing import Hashable
+from typing import Iterator
+from typing import List
+from typing import Mapping
 
 import requests
 import requests.api
+from requests.adapters import DEFAULT_POOLSIZE
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
 
 from amqpstorm.compatibility import urlparse
+from amqpstorm.management.cache import ResponseCache
 from amqpstorm.management.exception import ApiConnectionError
 from amqpstorm.management.exception import ApiError
+from amqpstorm.management.json_stream import iter_array
+
+DEFAULT_MAX_WORKERS = 4
+STREAM_CHUNK_SIZE = 65536
 
 
 class HTTPClient:
@@ -20,12 +34,20 @@ class HTTPClient:
         verify: bool | str | None,
         cert: str | tuple[str, str] | None,
         timeout: float,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        cache: ResponseCache | None = None,
     ) -> None:
         self.session = requests.Session()
         self.session.verify = verify
         self.session.cert = cert
+        if max_workers > DEFAULT_POOLSIZE:
+            adapter = HTTPAdapter(pool_maxsize=max_workers)
+            self.session.mount('http://', adapter)
+            self.session.mount('https://', adapter)
         self._auth = HTTPBasicAuth(username, password)
         self._base_url = api_url
+        self._cache = cache
+        self._max_workers = max_workers
         self._timeout = timeout
 
     def get(
@@ -33,19 +55,22 @@ class HTTPClient:
         path: str,
         payload: str | None = None,
         headers: dict[str, str] | None = None,
+        columns: List[str] | str | None = None,
     ) -> Any:
         """HTTP GET operation.
 
         :param path: URI Path
         :param payload: HTTP Body
         :param headers: HTTP Headers
+        :param columns: Only return these fields (e.g. ['name', 'messages'])
 
         :raises ApiError: Raises if the remote server encountered an error.
         :raises ApiConnectionError: Raises if there was a connectivity issue.
 
         :return: Response
         """
-        return self._request('get', path, payload, headers)
+        return self._request('get', path, payload, headers,
+                             params=self._list_params(columns=columns))
 
     def list(
         self,
@@ -53,47 +78,64 @@ class HTTPClient:
         name: str | None = None,
         page_size: int | None = None,
         use_regex: bool | str = False,
+        columns: List[str] | str | None = None,
     ) -> Any:
         """List operation (e.g. queue list).
 
+            With a page_size, the first page is fetched to learn the number
+            of pages, and the remaining pages are fetched concurrently, by
+            up to max_workers threads sharing the session.
+
         :param path: URI Path
         :param name: Filter by name, for example queue name, exchange name etc
         :param use_regex: Enables regular expression for the param name
         :param page_size: Number of elements per page
+        :param columns: Only return these fields (e.g. ['name', 'messages'])
 
         :raises ApiError: Raises if the remote server encountered an error.
         :raises ApiConnectionError: Raises if there was a connectivity issue.
 
         :return: Response
         """
-        params: dict[str, Any] = {}
-        if name is not None:
-            params['name'] = name
-        if use_regex:
-            if isinstance(use_regex, bool):
-                use_regex = str(use_regex)
-            params['use_regex'] = use_regex.lower()
-
+        params = self._list_params(name, use_regex, columns)
         if page_size is None:
             return self._request('get', path, params=params)
+        return list(self._iter_pages(path, params, page_size))
 
-        results: list[Any] = []
-        params['page'] = 1
-        params['page_size'] = page_size
-        params['pagination'] = True
-        first_result = self._request('get', path, params=params)
-        num_pages = first_result['page_count']
-        current_page = first_result.get('page', 1)
-        results.extend(first_result['items'])
+    def iter_list(
+        self,
+        path: str,
+        name: str | None = None,
+        page_size: int | None = None,
+        use_regex: bool | str = False,
+        columns: List[str] | str | None = None,
+    ) -> Iterator[Any]:
+        """List operation that yields the elements as the pages arrive.
+
+            Pages are fetched concurrently like list, but at most
+            max_workers pages are held at a time, and the elements are
+            yielded in order.
 
-        while current_page < num_pages:
-            params['page'] = current_page + 1
-            next_result = self._request('get', path, params=params)
-            current_page = next_result['page']
-            num_pages = next_result['page_count']
-            results.extend(next_result.get('items', []))
+            Without a page_size, the response is parsed incrementally while
+            it is being received, so that only one element is held in
+            memory at a time.
 
-        return results
+        :param path: URI Path
+        :param name: Filter by name, for example queue name, exchange name etc
+        :param use_regex: Enables regular expression for the param name
+        :param page_size: Number of elements per page
+        :param columns: Only return these fields (e.g. ['name', 'messages'])
+
+        :raises ApiError: Raises if the remote server encountered an error.
+        :raises ApiConnectionError: Raises if there was a connectivity issue.
+
+        :return: Iterator of elements
+        """
+        params = self._list_params(name, use_regex, columns)
+        if page_size is None:
+            yield from self._stream_request('get', path, params=params)
+            return
+        yield from self._iter_pages(path, params, page_size)
 
     def post(
         self,
@@ -152,6 +194,112 @@ class HTTPClient:
         """
         return self._request('put', path, payload, headers)
 
+    def run_many(
+        self, operations: Mapping[Hashable, Callable[[], Any]],
+    ) -> dict[Hashable, ApiError | ApiConnectionError]:
+        """Run operations concurrently, up to max_workers at a time, and
+        collect their errors.
+
+        :param dict operations: Operations by key.
+
+        :return: Errors by key, of the operations that failed.
+        :rtype: dict
+        """
+        errors: dict[Hashable, ApiError | ApiConnectionError] = {}
+        if not operations:
+            return errors
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(self._max_workers, len(operations))
+        ) as executor:
+            futures = {
+                executor.submit(operation): key
+                for key, operation in operations.items()
+            }
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    future.result()
+                except (ApiError, ApiConnectionError) as why:
+                    errors[futures[future]] = why
+        return errors
+
+    def _iter_pages(
+        self, path: str, params: dict[str, Any], page_size: int,
+    ) -> Iterator[Any]:
+        """Fetch the pages of a paginated list, and yield their elements
+        in order.
+
+            Up to max_workers pages are requested ahead of the page
+            currently being yielded.
+
+        :param path: URI Path
+        :param params: HTTP Parameters
+        :param page_size: Number of elements per page
+
+        :raises ApiError: Raises if the remote server encountered an error.
+        :raises ApiConnectionError: Raises if there was a connectivity issue.
+
+        :return: Iterator of elements
+        """
+        params['page'] = 1
+        params['page_size'] = page_size
+        params['pagination'] = True
+        first_result = self._request('get', path, params=params)
+        num_pages = first_result['page_count']
+        next_page = first_result.get('page', 1) + 1
+        if next_page > num_pages:
+            yield from first_result['items']
+            return
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(self._max_workers, num_pages - next_page + 1)
+        )
+        pending: collections.deque[concurrent.futures.Future[Any]] = (
+            collections.deque()
+        )
+        items = first_result['items']
+        try:
+            while True:
+                while next_page <= num_pages and len(pending) < self._max_workers:
+                    pending.append(executor.submit(
+                        self._request, 'get', path,
+                        params=dict(params, page=next_page)
+                    ))
+                    next_page += 1
+                yield from items
+                if not pending:
+                    return
+                next_result = pending.popleft().result()
+                num_pages = next_result['page_count']
+                items = next_result.get('items', [])
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _list_params(
+        name: str | None = None,
+        use_regex: bool | str = False,
+        columns: List[str] | str | None = None,
+    ) -> dict[str, Any]:
+        """Build the HTTP parameters of a list operation.
+
+        :param name: Filter by name
+        :param use_regex: Enables regular expression for the param name
+        :param columns: Only return these fields
+
+        :rtype: dict
+        """
+        params: dict[str, Any] = {}
+        if name is not None:
+            params['name'] = name
+        if use_regex:
+            if isinstance(use_regex, bool):
+                use_regex = str(use_regex)
+            params['use_regex'] = use_regex.lower()
+        if columns:
+            if not isinstance(columns, str):
+                columns = ','.join(columns)
+            params['columns'] = columns
+        return params
+
     def _request(
         self,
         method: str,
@@ -160,7 +308,42 @@ class HTTPClient:
         headers: dict[str, str] | None = None,
         params: dict[str, Any] | None = None,
     ) -> Any:
-        """HTTP operation.
+        """HTTP operation, using the cache if there is one.
+
+        :param method: Operation type (e.g. post)
+        :param path: URI Path
+        :param payload: HTTP Body
+        :param headers: HTTP Headers
+        :param params: HTTP Parameters
+
+        :raises ApiError: Raises if the remote server encountered an error.
+        :raises ApiConnectionError: Raises if there was a connectivity issue.
+
+        :return: Response
+        """
+        if self._cache is None:
+            return self._send(method, path, payload, headers, params)
+        elif method != 'get':
+            try:
+                return self._send(method, path, payload, headers, params)
+            finally:
+                self._cache.invalidate(path)
+        elif payload is not None or headers:
+            return self._send(method, path, payload, headers, params)
+        return self._cache.get(
+            path, params,
+            lambda: self._send(method, path, payload, headers, params)
+        )
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        payload: str | None = None,
+        headers: dict[str, str] | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> Any:
+        """Send an HTTP request.
 
         :param method: Operation type (e.g. post)
         :param path: URI Path
@@ -192,6 +375,49 @@ class HTTPClient:
         self._check_for_errors(response, json_response)
         return json_response
 
+    def _stream_request(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None = None,
+    ) -> Iterator[Any]:
+        """HTTP operation, yielding the elements of the JSON array response
+        while it is being received.
+
+        :param method: Operation type (e.g. get)
+        :param path: URI Path
+        :param params: HTTP Parameters
+
+        :raises ApiError: Raises if the remote server encountered an error,
+                          or the response is not a JSON array.
+        :raises ApiConnectionError: Raises if there was a connectivity issue.
+
+        :return: Iterator of elements
+        """
+        url = urlparse.urljoin(self._base_url, f'api/{path}')
+        try:
+            response = self.session.request(
+                method, url,
+                auth=self._auth,
+                headers={'content-type': 'application/json'},
+                timeout=self._timeout,
+                params=params,
+                stream=True,
+            )
+        except requests.RequestException as why:
+            raise ApiConnectionError(str(why))
+
+        try:
+            self._check_for_errors(response, None)
+            yield from iter_array(response.iter_content(STREAM_CHUNK_SIZE))
+        except requests.RequestException as why:
+            raise ApiConnectionError(str(why))
+        except ValueError as why:
+            raise ApiError(f'invalid JSON response: {why}',
+                           reply_code=response.status_code)
+        finally:
+            response.close()
+
     @staticmethod
     def _get_json_output(response: requests.Response) -> Any:
         """Get JSON output from the HTTP response.
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import codecs
+import json
+from typing import Any
+from typing import Iterable
+from typing import Iterator
+
+DECODER = json.JSONDecoder()
+NUMBER = frozenset('0123456789+-.eE')
+WHITESPACE = ' \t\n\r'
+
+BEFORE_ARRAY = 0
+VALUE_OR_END = 1
+VALUE = 2
+SEPARATOR_OR_END = 3
+AFTER_ARRAY = 4
+
+
+def iter_array(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """Incrementally parse a JSON array, and yield its elements.
+
+        Only the element being parsed, and the chunk it is parsed from,
+        are held in memory, instead of the whole document.
+
+    :param chunks: UTF-8 encoded JSON document, in chunks of any size.
+
+    :raises ValueError: Raises if the document is not a valid JSON array.
+
+    :return: Iterator of elements
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    chunks = iter(chunks)
+    buffer = ''
+    position = 0
+    exhausted = False
+    state = BEFORE_ARRAY
+    while True:
+        while position < len(buffer) and buffer[position] in WHITESPACE:
+            position += 1
+        if position < len(buffer):
+            char = buffer[position]
+            if state == BEFORE_ARRAY:
+                if char != '[':
+                    raise ValueError('expected a JSON array')
+                state = VALUE_OR_END
+                position += 1
+                continue
+            elif state == AFTER_ARRAY:
+                raise ValueError('unexpected data after the JSON array')
+            elif char == ']' and state in (VALUE_OR_END, SEPARATOR_OR_END):
+                state = AFTER_ARRAY
+                position += 1
+                continue
+            elif state == SEPARATOR_OR_END:
+                if char != ',':
+                    raise ValueError(f'expected "," or "]" at {char!r}')
+                state = VALUE
+                position += 1
+                continue
+            try:
+                value, end = DECODER.raw_decode(buffer, position)
+            except ValueError:
+                if exhausted:
+                    raise
+            else:
+                # A number at the end of the buffer may continue in the
+                # next chunk.
+                if exhausted or not _may_continue(value, buffer, end):
+                    state = SEPARATOR_OR_END
+                    position = end
+                    yield value
+                    continue
+        elif exhausted:
+            if state != AFTER_ARRAY:
+                raise ValueError('unexpected end of the JSON array')
+            return
+        chunk = next(chunks, None)
+        if chunk is None:
+            exhausted = True
+            chunk = b''
+        buffer = buffer[position:] + decoder.decode(chunk, final=exhausted)
+        position = 0
+
+
+def _may_continue(value: Any, buffer: str, end: int) -> bool:
+    """Check if a decoded number may continue past the end of the buffer,
+    or past the next character.
+
+    :param value: Decoded value.
+    :param str buffer: Buffer the value was decoded from.
+    :param int end: Position after the decoded value.
+
+    :rtype: bool
+    """
+    if not isinstance(value, (int, float)) or isinstance(value, bool):
+        return False
+    return end >= len(buffer) or buffer[end] in NUMBER
@@ -2,10 +2,14 @@ from __future__ import annotations
 
 import json
 from typing import Any
+from typing import Iterable
+from typing import Iterator
 from typing import List
 
 from amqpstorm.compatibility import quote
 from amqpstorm.management.base import ManagementHandler
+from amqpstorm.management.exception import ApiConnectionError
+from amqpstorm.management.exception import ApiError
 
 API_QUEUE = 'queues/%s/%s'
 API_QUEUE_BIND = 'bindings/%s/e/%s/q/%s'
@@ -45,7 +49,9 @@ class Queue(ManagementHandler):
         name: str | None = None,
         page_size: int = 100,
         use_regex: bool = False,
-    ) -> List[dict[str, Any]]:
+        stream: bool = False,
+        columns: list[str] | str | None = None,
+    ) -> List[dict[str, Any]] | Iterator[dict[str, Any]]:
         """List Queues.
 
         :param str virtual_host: Virtual host name
@@ -53,21 +59,31 @@ class Queue(ManagementHandler):
         :param name: Filter by name
         :param use_regex: Enables regular expression for the param name
         :param page_size: Number of elements per page
+        :param bool stream: Return an iterator that yields the elements as
+                            the pages arrive, instead of a list.
+                            Without a page_size, the response is parsed
+                            incrementally as it is received.
+        :param columns: Only return these fields (e.g. ['name', 'messages'])
 
         :raises ApiError: Raises if the remote server encountered an error.
         :raises ApiConnectionError: Raises if there was a connectivity issue.
 
-        :rtype: list
+        :rtype: list,iterator
         """
+        list_method = (
+            self.http_client.iter_list if stream else self.http_client.list
+        )
         if show_all:
-            return self.http_client.list(
+            return list_method(
                 API_QUEUES,
                 name=name, use_regex=use_regex, page_size=page_size,
+                columns=columns,
             )
         virtual_host = quote(virtual_host, '')
-        return self.http_client.list(
+        return list_method(
             API_QUEUES_VIRTUAL_HOST % virtual_host,
             name=name, use_regex=use_regex, page_size=page_size,
+            columns=columns,
         )
 
     def declare(
@@ -111,6 +127,68 @@ class Queue(ManagementHandler):
             ),
             payload=queue_payload)
 
+    def declare_many(
+        self,
+        queues: Iterable[str | dict[str, Any]],
+        virtual_host: str = '/',
+        durable: bool = False,
+        auto_delete: bool = False,
+        arguments: dict[str, Any] | None = None,
+        use_definitions: bool = False,
+    ) -> dict[str, ApiError | ApiConnectionError]:
+        """Declare many Queues.
+
+            The queues are declared concurrently, up to max_workers at a
+            time, and a queue that could not be declared does not stop
+            the others.
+
+            With use_definitions, the queues are instead declared in a
+            single request to the definitions import endpoint, which
+            either declares all of them, or none.
+
+            e.g.
+            ::
+
+                errors = client.queue.declare_many(
+                    ['my_queue', {'queue': 'my_dlq', 'durable': True}],
+                    durable=False
+                )
+                for queue, error in errors.items():
+                    print(queue, error)
+
+        :param list queues: Queue names, or dicts of declare kwargs.
+        :param str virtual_host: Virtual host name
+        :param bool durable: Durable queues
+        :param bool auto_delete: Automatically delete when not in use
+        :param dict,None arguments: Queue key/value arguments
+        :param bool use_definitions: Use the definitions import endpoint.
+
+        :raises AMQPInvalidArgument: Raises if an item is given more than
+                                     once.
+
+        :return: Errors by queue name, of the queues that failed.
+        :rtype: dict
+        """
+        defaults = {
+            'virtual_host': virtual_host, 'durable': durable,
+            'auto_delete': auto_delete, 'arguments': arguments,
+        }
+        if not use_definitions:
+            return self._run_many(self.declare, queues, ('queue',), defaults)
+        declarations = self._bulk_kwargs(queues, ('queue',), defaults)
+        return self._import_many(
+            [kwargs['queue'] for kwargs in declarations],
+            {'queues': [
+                {
+                    'name': kwargs['queue'],
+                    'durable': kwargs['durable'],
+                    'auto_delete': kwargs['auto_delete'],
+                    'arguments': kwargs['arguments'] or {},
+                } for kwargs in declarations
+            ]},
+            virtual_host
+        )
+
     def delete(self, queue: str, virtual_host: str = '/') -> dict[str, Any]:
         """Delete a Queue.
 
@@ -129,6 +207,27 @@ class Queue(ManagementHandler):
                                            queue
                                        ))
 
+    def delete_many(
+        self, queues: Iterable[str], virtual_host: str = '/',
+    ) -> dict[str, ApiError | ApiConnectionError]:
+        """Delete many Queues.
+
+            The queues are deleted concurrently, up to max_workers at a
+            time, and a queue that could not be deleted does not stop
+            the others.
+
+        :param list queues: Queue names
+        :param str virtual_host: Virtual host name
+
+        :raises AMQPInvalidArgument: Raises if an item is given more than
+                                     once.
+
+        :return: Errors by queue name, of the queues that failed.
+        :rtype: dict
+        """
+        return self._run_many(self.delete, queues, ('queue',),
+                              {'virtual_host': virtual_host})
+
     def purge(self, queue: str, virtual_host: str = '/') -> None:
         """Purge a Queue.
 
@@ -205,6 +304,61 @@ class Queue(ManagementHandler):
                                      ),
                                      payload=bind_payload)
 
+    def bind_many(
+        self,
+        bindings: Iterable[tuple[str, ...] | dict[str, Any]],
+        virtual_host: str = '/',
+        use_definitions: bool = False,
+    ) -> dict[tuple[str, str, str], ApiError | ApiConnectionError]:
+        """Bind many Queues.
+
+            The bindings are created concurrently, up to max_workers at a
+            time, and a binding that could not be created does not stop
+            the others.
+
+            With use_definitions, the bindings are instead created in a
+            single request to the definitions import endpoint, which
+            either creates all of them, or none.
+
+            e.g.
+            ::
+
+                errors = client.queue.bind_many([
+                    ('my_queue', 'my_exchange', 'my_routing_key'),
+                    {'queue': 'my_dlq', 'exchange': 'my_dlx'},
+                ])
+
+        :param list bindings: (queue, exchange, routing_key) tuples, or
+                              dicts of bind kwargs.
+        :param str virtual_host: Virtual host name
+        :param bool use_definitions: Use the definitions import endpoint.
+
+        :raises AMQPInvalidArgument: Raises if an item is given more than
+                                     once.
+
+        :return: Errors by (queue, exchange, routing_key), of the bindings
+                 that failed.
+        :rtype: dict
+        """
+        fields = ('queue', 'exchange', 'routing_key')
+        defaults = {'virtual_host': virtual_host}
+        if not use_definitions:
+            return self._run_many(self.bind, bindings, fields, defaults)
+        declarations = self._bulk_kwargs(bindings, fields, defaults)
+        return self._import_many(
+            [self._bulk_key(kwargs, fields) for kwargs in declarations],
+            {'bindings': [
+                {
+                    'source': kwargs.get('exchange', ''),
+                    'destination': kwargs['queue'],
+                    'destination_type': 'queue',
+                    'routing_key': kwargs.get('routing_key', ''),
+                    'arguments': kwargs.get('arguments') or {},
+                } for kwargs in declarations
+            ]},
+            virtual_host
+        )
+
     def unbind(
         self,
         queue: str = '',
@@ -12,6 +12,8 @@ from amqpstorm.compatibility import try_utf8_decode
 from amqpstorm.exception import AMQPMessageError
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
+
     from amqpstorm.channel import Channel
 
 
@@ -184,9 +186,12 @@ class Message(BaseMessage):
         exchange: str = '',
         mandatory: bool = False,
         immediate: bool = False,
-    ) -> bool | None:
+    ) -> bool | Future[bool] | None:
         """Publish Message.
 
+            With asynchronous publisher confirms, returns a
+            concurrent.futures.Future that resolves to True or False.
+
         :param str routing_key: Message routing key
         :param str exchange: The exchange to publish the message to
         :param bool mandatory: Requires the message is published
@@ -197,7 +202,7 @@ class Message(BaseMessage):
         :raises AMQPConnectionError: Raises if the connection
                                      encountered an error.
 
-        :rtype: bool,None
+        :rtype: bool,concurrent.futures.Future,None
         """
         return self._channel.basic.publish(body=self._body,
                                            routing_key=routing_key,
@@ -409,16 +414,6 @@ class Message(BaseMessage):
             return None
         return self._method.get('redelivered')
 
-    @property
-    def delivery_tag(self) -> int | None:
-        """Server-assigned delivery tag.
-
-        :rtype: int,None
-        """
-        if not self._method:
-            return None
-        return self._method.get('delivery_tag')
-
     def json(self) -> Any:
         """Deserialize the message body, if it is JSON.
 
@@ -494,3 +489,157 @@ class Message(BaseMessage):
         :return:
         """
         return tuple(Message._try_decode_list(content))
+
+
+def _lazy_property(name: str) -> property:
+    """Create a Message property that is read straight from the properties
+    frame, until the properties have been decoded.
+
+    :param str name: Property name (e.g. content_type)
+
+    :rtype: property
+    """
+    message_property = getattr(Message, name)
+
+    def fget(self: LazyMessage) -> Any:
+        return self._get_property(name)
+
+    return property(fget, message_property.fset, doc=message_property.__doc__)
+
+
+class LazyMessage(Message):
+    """RabbitMQ Message that is only decoded when needed.
+
+        Keeps the frames received from the remote server, and reads the
+        delivery_tag, redelivered and message properties (e.g.
+        content_type) straight from them. The method and properties
+        dictionaries are only created once they are needed, e.g. by
+        method, properties, to_dict or to_tuple.
+
+    e.g.
+    ::
+
+        for message in channel.build_inbound_messages(
+                message_impl=LazyMessage):
+            print(message.delivery_tag, message.body)
+            message.ack()
+
+    :param Channel channel: AMQPStorm Channel
+    :param bytes,str,unicode body: Message payload
+    :param dict method: Message method
+    :param dict properties: Message properties
+    :param bool auto_decode: Auto-decode strings when possible. Does not
+                             apply to to_dict, or to_tuple.
+    """
+    __slots__ = [
+        '_method_frame', '_properties_frame'
+    ]
+
+    def __init__(
+        self,
+        channel: Channel | None,
+        body: bytes | str | None = None,
+        method: dict[str, Any] | None = None,
+        properties: dict[str, Any] | None = None,
+        auto_decode: bool = True,
+    ) -> None:
+        super().__init__(
+            channel, body, method, properties, auto_decode
+        )
+        self._method_frame: Any = None
+        self._properties_frame: Any = None
+
+    @classmethod
+    def from_frames(
+        cls,
+        channel: Channel | None,
+        body: Any,
+        method_frame: Any,
+        properties_frame: Any,
+        auto_decode: bool | None = None,
+    ) -> LazyMessage:
+        """Create a Message that keeps the frames received from the remote
+        server.
+
+            The method, properties and decode cache are left unset, and
+            are only created by __getattr__ once accessed.
+
+        :param Channel channel: AMQPStorm Channel
+        :param bytes body: Message body
+        :param pamqp.Frame method_frame: Basic.Deliver or Basic.GetOk frame.
+        :param pamqp.Frame properties_frame: Basic.Properties frame.
+        :param bool auto_decode: Auto-decode strings when possible.
+
+        :rtype: LazyMessage
+        """
+        message = cls.__new__(cls)
+        message._channel = channel
+        message._body = body
+        message._auto_decode = auto_decode
+        message._method_frame = method_frame
+        message._properties_frame = properties_frame
+        return message
+
+    def __getattr__(self, name: str) -> Any:
+        if name == '_method':
+            self._method = dict(self._method_frame)
+            return self._method
+        elif name == '_properties':
+            self._properties = dict(self._properties_frame)
+            self._properties_frame = None
+            return self._properties
+        elif name == '_decode_cache':
+            self._decode_cache = {}
+            return self._decode_cache
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'"
+        )
+
+    @property
+    def redelivered(self) -> bool | None:
+        """Indicates if this message may have been delivered before (but not
+        acknowledged).
+
+        :rtype: bool,None
+        """
+        if self._method_frame is None:
+            return super().redelivered
+        return self._method_frame.redelivered
+
+    @property
+    def delivery_tag(self) -> int | None:
+        """Server-assigned delivery tag.
+
+        :rtype: int,None
+        """
+        if self._method_frame is None:
+            return super().delivery_tag
+        return self._method_frame.delivery_tag
+
+    app_id = _lazy_property('app_id')
+    message_id = _lazy_property('message_id')
+    content_encoding = _lazy_property('content_encoding')
+    content_type = _lazy_property('content_type')
+    correlation_id = _lazy_property('correlation_id')
+    delivery_mode = _lazy_property('delivery_mode')
+    timestamp = _lazy_property('timestamp')
+    priority = _lazy_property('priority')
+    reply_to = _lazy_property('reply_to')
+    message_type = _lazy_property('message_type')
+    expiration = _lazy_property('expiration')
+    user_id = _lazy_property('user_id')
+
+    def _get_property(self, name: str) -> Any:
+        """Get a Message property, from the properties frame if the
+        properties have not been decoded yet.
+
+        :param str name: Property name (e.g. content_type)
+
+        :return:
+        """
+        if self._properties_frame is None:
+            return self.properties.get(name)
+        value = getattr(self._properties_frame, name)
+        if self._auto_decode:
+            return try_utf8_decode(value)
+        return value
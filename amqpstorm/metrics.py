@@ -0,0 +1,399 @@
+"""AMQPStorm Connection Metrics."""
+from __future__ import annotations
+
+import bisect
+import threading
+import weakref
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Iterable
+
+if TYPE_CHECKING:
+    from amqpstorm.connection import Connection
+
+DEFAULT_BUCKETS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+    0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+
+class Metrics:
+    """Receives measurements from the hot paths of a Connection.
+
+        Pass an instance to the Connection, and override the methods of
+        interest. Every method does nothing by default, and none of them
+        are called when the Connection has no metrics, so the
+        measurements cost nothing unless enabled.
+
+        e.g.
+        ::
+
+            class PublishMetrics(amqpstorm.Metrics):
+                def on_publish(self, messages, duration):
+                    statsd.timing('amqp.publish', duration * 1000)
+
+            connection = amqpstorm.Connection(
+                'localhost', 'guest', 'guest', metrics=PublishMetrics()
+            )
+
+        The methods are called from the thread doing the work, including
+        the thread reading from the socket, so they must be thread-safe,
+        and return quickly.
+
+        One instance can be shared by multiple Connections.
+    """
+
+    def __init__(self) -> None:
+        self._connections: weakref.WeakSet[Connection] = weakref.WeakSet()
+
+    @property
+    def inbound_bytes(self) -> int:
+        """Returns the number of message body bytes received, on all
+        Connections, that have not been consumed yet.
+
+        :rtype: int
+        """
+        return sum(connection.inbound_bytes
+                   for connection in list(self._connections))
+
+    @property
+    def inbound_messages(self) -> int:
+        """Returns the number of messages received, on all Connections,
+        that have not been consumed yet.
+
+        :rtype: int
+        """
+        return sum(connection.inbound_messages
+                   for connection in list(self._connections))
+
+    def register_connection(self, connection: Connection) -> None:
+        """Register a Connection using these metrics.
+
+        :param Connection connection: Connection.
+
+        :return:
+        """
+        self._connections.add(connection)
+
+    def on_frames_sent(self, frames: int, size: int) -> None:
+        """Frames were written to the socket.
+
+        :param int frames: Number of frames.
+        :param int size: Number of bytes.
+
+        :return:
+        """
+
+    def on_frames_received(self, frames: int, size: int) -> None:
+        """Frames were read from the socket.
+
+        :param int frames: Number of frames.
+        :param int size: Number of bytes.
+
+        :return:
+        """
+
+    def on_message_received(self) -> None:
+        """A message was delivered to a consumer.
+
+        :return:
+        """
+
+    def on_publish(self, messages: int, duration: float) -> None:
+        """Messages were published.
+
+            The duration includes waiting for the messages to be confirmed,
+            unless the confirms are asynchronous.
+
+        :param int messages: Number of messages.
+        :param float duration: Seconds taken to publish.
+
+        :return:
+        """
+
+    def on_confirm(self, acked: bool, duration: float) -> None:
+        """A published message was confirmed by the remote server.
+
+        :param bool acked: True if acknowledged, False if not.
+        :param float duration: Seconds from publishing until confirmed.
+
+        :return:
+        """
+
+    def on_rpc(self, method: str, duration: float) -> None:
+        """A response frame from the remote server arrived.
+
+        :param str method: Name of the response frame, e.g. Queue.DeclareOk.
+        :param float duration: Seconds spent waiting for the frame.
+
+        :return:
+        """
+
+    def on_heartbeat_missed(self) -> None:
+        """No data was received from the remote server for a whole
+        heartbeat interval.
+
+        :return:
+        """
+
+
+class _Histogram:
+    """Internal cumulative histogram, in the Prometheus format.
+
+    :param tuple buckets: Upper bounds of the buckets, in ascending order.
+    """
+    __slots__ = ['buckets', 'counts', 'count', 'sum']
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        if index < len(self.counts):
+            self.counts[index] += 1
+        self.count += 1
+        self.sum += value
+
+    def lines(self, name: str, labels: str) -> Iterable[str]:
+        prefix = labels + ',' if labels else ''
+        cumulative = 0
+        for bucket, count in zip(self.buckets, self.counts):
+            cumulative += count
+            yield f'{name}_bucket{{{prefix}le="{bucket}"}} {cumulative}'
+        yield f'{name}_bucket{{{prefix}le="+Inf"}} {self.count}'
+        labels = f'{{{labels}}}' if labels else ''
+        yield f'{name}_sum{labels} {self.sum}'
+        yield f'{name}_count{labels} {self.count}'
+
+
+class PrometheusMetrics(Metrics):
+    """Metrics exposed in the Prometheus text format.
+
+        e.g.
+        ::
+
+            metrics = PrometheusMetrics()
+            connection = amqpstorm.Connection(
+                'localhost', 'guest', 'guest', metrics=metrics
+            )
+            ...
+            body = metrics.expose()
+
+    :param str prefix: Prefix of the metric names.
+    :param tuple buckets: Upper bounds, in seconds, of the histogram buckets.
+    """
+    COUNTERS = (
+        ('frames_sent', 'Frames written to the socket.'),
+        ('bytes_sent', 'Bytes written to the socket.'),
+        ('frames_received', 'Frames read from the socket.'),
+        ('bytes_received', 'Bytes read from the socket.'),
+        ('messages_received', 'Messages delivered to consumers.'),
+        ('messages_published', 'Messages published.'),
+        ('heartbeats_missed',
+         'Heartbeat intervals without any data received.'),
+    )
+    HISTOGRAMS = (
+        ('publish_duration_seconds',
+         'Time taken to publish a message, or batch.', ''),
+        ('confirm_duration_seconds',
+         'Time from publishing a message until confirmed.', 'result'),
+        ('rpc_duration_seconds',
+         'Time spent waiting for a response frame.', 'method'),
+    )
+
+    def __init__(
+        self, prefix: str = 'amqpstorm',
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__()
+        self._prefix = prefix
+        self._buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._counters = dict.fromkeys(
+            (name for name, _ in self.COUNTERS), 0
+        )
+        self._histograms: dict[str, dict[str, _Histogram]] = {
+            name: {} for name, _, _ in self.HISTOGRAMS
+        }
+
+    def on_frames_sent(self, frames: int, size: int) -> None:
+        with self._lock:
+            self._counters['frames_sent'] += frames
+            self._counters['bytes_sent'] += size
+
+    def on_frames_received(self, frames: int, size: int) -> None:
+        with self._lock:
+            self._counters['frames_received'] += frames
+            self._counters['bytes_received'] += size
+
+    def on_message_received(self) -> None:
+        with self._lock:
+            self._counters['messages_received'] += 1
+
+    def on_publish(self, messages: int, duration: float) -> None:
+        with self._lock:
+            self._counters['messages_published'] += messages
+            self._observe('publish_duration_seconds', '', duration)
+
+    def on_confirm(self, acked: bool, duration: float) -> None:
+        with self._lock:
+            self._observe('confirm_duration_seconds',
+                          'ack' if acked else 'nack', duration)
+
+    def on_rpc(self, method: str, duration: float) -> None:
+        with self._lock:
+            self._observe('rpc_duration_seconds', method, duration)
+
+    def on_heartbeat_missed(self) -> None:
+        with self._lock:
+            self._counters['heartbeats_missed'] += 1
+
+    def expose(self) -> str:
+        """Returns the metrics in the Prometheus text format.
+
+        :rtype: str
+        """
+        lines = []
+        with self._lock:
+            for name, description in self.COUNTERS:
+                metric = f'{self._prefix}_{name}_total'
+                lines.append(f'# HELP {metric} {description}')
+                lines.append(f'# TYPE {metric} counter')
+                lines.append(f'{metric} {self._counters[name]}')
+            for name, description, label in self.HISTOGRAMS:
+                metric = f'{self._prefix}_{name}'
+                lines.append(f'# HELP {metric} {description}')
+                lines.append(f'# TYPE {metric} histogram')
+                for value, histogram in sorted(self._histograms[name].items()):
+                    labels = f'{label}="{value}"' if label else ''
+                    lines.extend(histogram.lines(metric, labels))
+        for gauge, description, count in (
+            ('inbound_messages', 'Messages waiting to be consumed.',
+             self.inbound_messages),
+            ('inbound_bytes', 'Message body bytes waiting to be consumed.',
+             self.inbound_bytes),
+        ):
+            metric = f'{self._prefix}_{gauge}'
+            lines.append(f'# HELP {metric} {description}')
+            lines.append(f'# TYPE {metric} gauge')
+            lines.append(f'{metric} {count}')
+        return '\n'.join(lines) + '\n'
+
+    def _observe(self, name: str, label: str, value: float) -> None:
+        """Add a value to a histogram. Must be called while holding the lock.
+
+        :param str name: Histogram name.
+        :param str label: Label value.
+        :param float value: Observed value.
+
+        :return:
+        """
+        histogram = self._histograms[name].get(label)
+        if histogram is None:
+            histogram = _Histogram(self._buckets)
+            self._histograms[name][label] = histogram
+        histogram.observe(value)
+
+
+class OpenTelemetryMetrics(Metrics):
+    """Metrics recorded using OpenTelemetry instruments.
+
+        Requires the opentelemetry-api package.
+
+        e.g.
+        ::
+
+            from opentelemetry import metrics
+
+            connection = amqpstorm.Connection(
+                'localhost', 'guest', 'guest',
+                metrics=OpenTelemetryMetrics(metrics.get_meter('amqpstorm'))
+            )
+
+    :param opentelemetry.metrics.Meter meter: Meter used to create the
+                                              instruments.
+    """
+
+    def __init__(self, meter: Any) -> None:
+        from opentelemetry.metrics import Observation
+
+        super().__init__()
+        self._frames_sent = meter.create_counter(
+            'amqpstorm.frames.sent', unit='{frame}',
+            description='Frames written to the socket.'
+        )
+        self._bytes_sent = meter.create_counter(
+            'amqpstorm.bytes.sent', unit='By',
+            description='Bytes written to the socket.'
+        )
+        self._frames_received = meter.create_counter(
+            'amqpstorm.frames.received', unit='{frame}',
+            description='Frames read from the socket.'
+        )
+        self._bytes_received = meter.create_counter(
+            'amqpstorm.bytes.received', unit='By',
+            description='Bytes read from the socket.'
+        )
+        self._messages_received = meter.create_counter(
+            'amqpstorm.messages.received', unit='{message}',
+            description='Messages delivered to consumers.'
+        )
+        self._messages_published = meter.create_counter(
+            'amqpstorm.messages.published', unit='{message}',
+            description='Messages published.'
+        )
+        self._heartbeats_missed = meter.create_counter(
+            'amqpstorm.heartbeats.missed', unit='{interval}',
+            description='Heartbeat intervals without any data received.'
+        )
+        self._publish_duration = meter.create_histogram(
+            'amqpstorm.publish.duration', unit='s',
+            description='Time taken to publish a message, or batch.'
+        )
+        self._confirm_duration = meter.create_histogram(
+            'amqpstorm.confirm.duration', unit='s',
+            description='Time from publishing a message until confirmed.'
+        )
+        self._rpc_duration = meter.create_histogram(
+            'amqpstorm.rpc.duration', unit='s',
+            description='Time spent waiting for a response frame.'
+        )
+        meter.create_observable_gauge(
+            'amqpstorm.inbound.messages', unit='{message}',
+            description='Messages waiting to be consumed.',
+            callbacks=[lambda _: [Observation(self.inbound_messages)]]
+        )
+        meter.create_observable_gauge(
+            'amqpstorm.inbound.bytes', unit='By',
+            description='Message body bytes waiting to be consumed.',
+            callbacks=[lambda _: [Observation(self.inbound_bytes)]]
+        )
+
+    def on_frames_sent(self, frames: int, size: int) -> None:
+        self._frames_sent.add(frames)
+        self._bytes_sent.add(size)
+
+    def on_frames_received(self, frames: int, size: int) -> None:
+        self._frames_received.add(frames)
+        self._bytes_received.add(size)
+
+    def on_message_received(self) -> None:
+        self._messages_received.add(1)
+
+    def on_publish(self, messages: int, duration: float) -> None:
+        self._messages_published.add(messages)
+        self._publish_duration.record(duration)
+
+    def on_confirm(self, acked: bool, duration: float) -> None:
+        self._confirm_duration.record(
+            duration, {'result': 'ack' if acked else 'nack'}
+        )
+
+    def on_rpc(self, method: str, duration: float) -> None:
+        self._rpc_duration.record(duration, {'method': method})
+
+    def on_heartbeat_missed(self) -> None:
+        self._heartbeats_missed.add(1)
@@ -0,0 +1,518 @@
+"""AMQPStorm Connection Pool."""
+from __future__ import annotations
+
+import collections
+import contextlib
+import logging
+import threading
+import time
+from typing import Any
+from typing import Iterator
+
+from amqpstorm import compatibility
+from amqpstorm.channel import Channel
+from amqpstorm.connection import Connection
+from amqpstorm.exception import AMQPChannelError
+from amqpstorm.exception import AMQPConnectionError
+from amqpstorm.exception import AMQPError
+from amqpstorm.exception import AMQPInvalidArgument
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_CHECKOUT_TIMEOUT = 60
+
+
+class ConnectionPool:
+    """Pool of Connections, with open Channels that are checked out for
+        the duration of a request.
+
+        Channels are opened on demand, up to channels_per_connection on
+        each of the max_connections Connections, and re-used once they
+        are returned to the pool. Checking out an idle Channel does not
+        need a Channel.Open round trip, or the Connection lock.
+
+        Channels that encountered an error, or that were set to confirm
+        deliveries, use transactions, coalesce acknowledgements or use a
+        QoS prefetch, are closed instead of being returned to the pool. Inbound limits set
+        on a Channel are reset once it is returned. A Connection that
+        encountered an error is replaced by a new Connection on the next
+        checkout.
+
+    e.g.
+    ::
+
+        import amqpstorm
+        from amqpstorm.pool import ConnectionPool
+
+        pool = ConnectionPool('localhost', 'guest', 'guest',
+                              max_connections=2, channels_per_connection=8)
+        with pool.channel() as channel:
+            channel.basic.publish('Hello World!', 'my_queue')
+
+    :param str hostname: Hostname
+    :param str username: Username
+    :param str password: Password
+    :param int port: Server port
+    :param int max_connections: Maximum number of Connections.
+    :param int channels_per_connection: Maximum number of Channels opened
+                                        on each Connection.
+    :param int,float max_idle: Close Channels that have been idle for
+                               longer than max_idle seconds. None keeps
+                               idle Channels open.
+    :param int,float rpc_timeout: Timeout used by the pooled Channels.
+    :param kwargs: Connection kwargs (e.g. virtual_host, heartbeat or ssl)
+
+    :raises AMQPInvalidArgument: Invalid Parameters
+    """
+
+    def __init__(
+        self,
+        hostname: str,
+        username: str,
+        password: str,
+        port: int = 5672,
+        max_connections: int = 1,
+        channels_per_connection: int = 10,
+        max_idle: float | None = None,
+        rpc_timeout: float = 60,
+        **kwargs: Any,
+    ) -> None:
+        if not compatibility.is_integer(max_connections) or max_connections < 1:
+            raise AMQPInvalidArgument(
+                'max_connections should be a positive integer'
+            )
+        elif not compatibility.is_integer(channels_per_connection) or channels_per_connection < 1:
+            raise AMQPInvalidArgument(
+                'channels_per_connection should be a positive integer'
+            )
+        elif max_idle is not None and not isinstance(max_idle, (int, float)):
+            raise AMQPInvalidArgument(
+                'max_idle should be an integer, float or None'
+            )
+        kwargs.pop('lazy', None)
+        self._hostname = hostname
+        self._username = username
+        self._password = password
+        self._port = port
+        self._kwargs = kwargs
+        self._max_connections = max_connections
+        self._channels_per_connection = channels_per_connection
+        self._max_idle = max_idle
+        self._rpc_timeout = rpc_timeout
+        self._condition = threading.Condition()
+        self._connections: dict[Connection, int] = {}
+        self._opening: set[Connection] = set()
+        self._idle: collections.deque[tuple[Channel, float]] = (
+            collections.deque()
+        )
+        self._channel_count = 0
+        self._closed = False
+
+    def __enter__(self) -> ConnectionPool:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    @property
+    def connections(self) -> int:
+        """Number of Connections in the pool.
+
+        :rtype: int
+        """
+        return len(self._connections)
+
+    @property
+    def idle(self) -> int:
+        """Number of open Channels waiting to be checked out.
+
+        :rtype: int
+        """
+        return len(self._idle)
+
+    @property
+    def in_use(self) -> int:
+        """Number of Channels currently checked out.
+
+        :rtype: int
+        """
+        return self._channel_count - len(self._idle)
+
+    @contextlib.contextmanager
+    def channel(
+        self, timeout: float = DEFAULT_CHECKOUT_TIMEOUT,
+    ) -> Iterator[Channel]:
+        """Check out a Channel, and return it to the pool once done.
+
+        :param int,float timeout: Seconds to wait for a Channel when all
+                                  Channels are checked out.
+
+        :raises AMQPChannelError: Raises if no Channel became available.
+        :raises AMQPConnectionError: Raises if the connection
+                                     encountered an error.
+
+        :rtype: amqpstorm.Channel
+        """
+        channel = self._checkout(timeout)
+        try:
+            yield channel
+        except AMQPConnectionError:
+            self._discard_connection(channel._connection)
+            raise
+        except AMQPError:
+            self._release([channel])
+            raise
+        except BaseException:
+            self._checkin(channel)
+            raise
+        self._checkin(channel)
+
+    def close(self) -> None:
+        """Close all Channels and Connections in the pool.
+
+            Channels that are checked out are closed once returned.
+
+        :return:
+        """
+        with self._condition:
+            self._closed = True
+            channels = [channel for channel, _ in self._idle]
+            connections = list(self._connections)
+            self._idle.clear()
+            self._connections.clear()
+            self._channel_count = 0
+            self._condition.notify_all()
+        self._close_channels(channels)
+        for connection in connections:
+            self._close_connection(connection)
+
+    def _checkout(self, timeout: float) -> Channel:
+        """Get an idle Channel, or open a new Channel if the pool is not
+        yet full.
+
+        :param int,float timeout: Seconds to wait for a Channel.
+
+        :rtype: amqpstorm.Channel
+        """
+        deadline = time.monotonic() + timeout
+        channel = self._reserve(deadline)
+        if channel is not None:
+            return channel
+        return self._open_channel(deadline)
+
+    def _checkin(self, channel: Channel) -> None:
+        """Return a Channel to the pool.
+
+            Channels that are closed, still consuming, or that changed
+            settings the next borrower would inherit, are closed instead of
+            being re-used.
+
+        :param amqpstorm.Channel channel:
+
+        :return:
+        """
+        reusable = self._is_reusable(channel)
+        with self._condition:
+            if not self._closed and reusable:
+                channel.set_inbound_limits()
+                self._idle.append((channel, time.monotonic()))
+                self._condition.notify()
+                return
+        self._release([channel])
+
+    def _reserve(self, deadline: float) -> Channel | None:
+        """Get an idle Channel, or reserve a slot for a new Channel if the
+        pool is not yet full.
+
+        :param float deadline: Give up waiting at this time.
+
+        :raises AMQPChannelError: Raises if no Channel became available.
+        :raises AMQPConnectionError: Raises if the pool was closed.
+
+        :return: An idle Channel, or None once a slot is reserved.
+        :rtype: amqpstorm.Channel,None
+        """
+        unhealthy: list[Channel] = []
+        connections: list[Connection] = []
+        try:
+            with self._condition:
+                while True:
+                    if self._closed:
+                        raise AMQPConnectionError('connection pool closed')
+                    removed = self._evict_idle_channels()
+                    while self._idle:
+                        channel, _ = self._idle.pop()
+                        if self._is_healthy(channel):
+                            return channel
+                        removed.append(channel)
+                    connections.extend(self._remove_channels(removed))
+                    unhealthy.extend(removed)
+                    if self._channel_count < self._max_channels:
+                        self._channel_count += 1
+                        return None
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise AMQPChannelError(
+                            'timed out waiting for an available channel'
+                        )
+                    self._condition.wait(remaining)
+        finally:
+            self._close_channels(unhealthy)
+            for connection in connections:
+                self._close_connection(connection)
+
+    def _open_channel(self, deadline: float) -> Channel:
+        """Open a new Channel using a slot reserved by _reserve.
+
+            Connections that encountered an error are replaced by a new
+            Connection.
+
+        :param float deadline: Give up waiting for a slot at this time.
+
+        :rtype: amqpstorm.Channel
+        """
+        connection = self._get_connection()
+        try:
+            return connection.channel(rpc_timeout=self._rpc_timeout)
+        except AMQPConnectionError:
+            LOGGER.warning('Replacing pooled connection: connection closed')
+            self._discard_connection(connection)
+        except BaseException:
+            self._cancel_reservation(connection)
+            raise
+
+        channel = self._reserve(deadline)
+        if channel is not None:
+            return channel
+        connection = self._get_connection()
+        try:
+            return connection.channel(rpc_timeout=self._rpc_timeout)
+        except BaseException:
+            self._cancel_reservation(connection)
+            raise
+
+    def _cancel_reservation(self, connection: Connection | None) -> None:
+        """Cancel a Channel reserved by _reserve, and _get_connection.
+
+            Reservations on a Connection that was already discarded were
+            cancelled along with it.
+
+        :param amqpstorm.Connection connection: Connection the Channel was
+                                                reserved on, if any.
+
+        :return:
+        """
+        with self._condition:
+            if connection is None:
+                self._channel_count -= 1
+            elif connection in self._connections:
+                self._channel_count -= 1
+                self._connections[connection] -= 1
+            self._condition.notify()
+
+    def _get_connection(self) -> Connection:
+        """Get a Connection with room for another Channel, and move the
+        slot reserved by _reserve onto it.
+
+            New Connections are added to the pool before they are opened,
+            and opened without holding the pool lock. Channels reserved on
+            a Connection that is still opening wait for it to open.
+
+            The reserved slot is released if the Connection could not be
+            opened.
+
+        :raises AMQPConnectionError: Raises if the connection
+                                     encountered an error.
+
+        :rtype: amqpstorm.Connection
+        """
+        with self._condition:
+            for connection, channels in self._connections.items():
+                if channels >= self._channels_per_connection:
+                    continue
+                elif connection.is_open or connection in self._opening:
+                    self._connections[connection] += 1
+                    while connection in self._opening:
+                        self._condition.wait()
+                    if self._closed:
+                        raise AMQPConnectionError('connection pool closed')
+                    return connection
+            try:
+                connection = Connection(self._hostname, self._username,
+                                        self._password, self._port,
+                                        lazy=True, **self._kwargs)
+            except BaseException:
+                self._cancel_reservation(None)
+                raise
+            self._connections[connection] = 1
+            self._opening.add(connection)
+        try:
+            connection.open()
+        except BaseException:
+            self._discard_connection(connection)
+            raise
+        finally:
+            with self._condition:
+                self._opening.discard(connection)
+                self._condition.notify_all()
+        if self._closed:
+            self._close_connection(connection)
+            raise AMQPConnectionError('connection pool closed')
+        return connection
+
+    def _discard_connection(self, connection: Connection) -> None:
+        """Close a Connection that encountered an error, including all of
+        its idle Channels.
+
+            Channels on the Connection that are checked out are discarded
+            once returned.
+
+        :param amqpstorm.Connection connection:
+
+        :return:
+        """
+        with self._condition:
+            self._idle = collections.deque(
+                idle for idle in self._idle
+                if idle[0]._connection is not connection
+            )
+            channels_open = self._connections.pop(connection, 0)
+            self._channel_count -= channels_open
+            self._condition.notify_all()
+        self._close_connection(connection)
+
+    def _release(self, channels: list[Channel]) -> None:
+        """Close Channels that should no longer be used, and Connections
+        left without any Channels.
+
+            Must be called without holding the pool lock.
+
+            Connections left without Channels are only kept open when
+            idle eviction is disabled.
+
+        :param list channels: Channels removed from the pool.
+
+        :return:
+        """
+        if not channels:
+            return
+        with self._condition:
+            connections = self._remove_channels(channels)
+        self._close_channels(channels)
+        for connection in connections:
+            self._close_connection(connection)
+
+    def _remove_channels(self, channels: list[Channel]) -> list[Connection]:
+        """Free the slots of Channels removed from the pool.
+
+            Must be called while holding the pool lock.
+
+        :param list channels: Channels removed from the pool.
+
+        :return: Connections left without any Channels, that should be
+                 closed.
+        :rtype: list
+        """
+        connections = []
+        for channel in channels:
+            connection = channel._connection
+            if connection not in self._connections:
+                continue
+            self._channel_count -= 1
+            self._connections[connection] -= 1
+            if self._connections[connection]:
+                continue
+            if self._closed or self._max_idle is not None or not connection.is_open:
+                del self._connections[connection]
+                connections.append(connection)
+        if channels:
+            self._condition.notify_all()
+        return connections
+
+    def _evict_idle_channels(self) -> list[Channel]:
+        """Remove Channels idle for longer than max_idle.
+
+            Must be called while holding the pool lock.
+
+        :rtype: list
+        """
+        if self._max_idle is None:
+            return []
+        evicted = []
+        oldest_allowed = time.monotonic() - self._max_idle
+        while self._idle and self._idle[0][1] < oldest_allowed:
+            evicted.append(self._idle.popleft()[0])
+        return evicted
+
+    @property
+    def _max_channels(self) -> int:
+        """Maximum number of Channels in the pool.
+
+        :rtype: int
+        """
+        return self._max_connections * self._channels_per_connection
+
+    @classmethod
+    def _is_reusable(cls, channel: Channel) -> bool:
+        """Check that the Channel can be handed to the next borrower.
+
+            Channels still consuming, or set to confirm deliveries, use
+            transactions, coalesce acknowledgements or use a QoS prefetch,
+            are not re-used, as the next borrower would inherit those
+            settings. A transactional Channel can not leave transaction
+            mode, and the next borrower's messages would never be committed.
+
+        :param amqpstorm.Channel channel:
+
+        :rtype: bool
+        """
+        if channel.consumer_tags or channel._confirming_deliveries:
+            return False
+        elif channel._transactional:
+            return False
+        elif channel._acks is not None or channel.basic._prefetch != (0, 0):
+            return False
+        return cls._is_healthy(channel)
+
+    @staticmethod
+    def _is_healthy(channel: Channel) -> bool:
+        """Check that the Channel, and its Connection, can still be used.
+
+            Only checks the state, so that it can be called while holding
+            the pool lock.
+
+        :param amqpstorm.Channel channel:
+
+        :rtype: bool
+        """
+        connection = channel._connection
+        if channel.exceptions or connection.exceptions:
+            return False
+        return channel.is_open and connection.is_open
+
+    @staticmethod
+    def _close_channels(channels: list[Channel]) -> None:
+        """Close Channels, ignoring any errors.
+
+        :param list channels:
+
+        :return:
+        """
+        for channel in channels:
+            try:
+                channel.close()
+            except AMQPError as why:
+                LOGGER.debug('Failed to close pooled channel: %s', why)
+
+    @staticmethod
+    def _close_connection(connection: Connection) -> None:
+        """Close a Connection, ignoring any errors.
+
+        :param amqpstorm.Connection connection:
+
+        :return:
+        """
+        try:
+            connection.close()
+        except AMQPError as why:
+            LOGGER.debug('Failed to close pooled connection: %s', why)
@@ -0,0 +1,194 @@
+"""AMQPStorm Prepared Publisher."""
+from __future__ import annotations
+
+import struct
+from typing import TYPE_CHECKING
+from typing import Any
+
+from pamqp import commands
+from pamqp import constants as pamqp_constants
+from pamqp import frame as pamqp_frame
+
+from amqpstorm import compatibility
+from amqpstorm.exception import AMQPInvalidArgument
+
+if TYPE_CHECKING:
+    from amqpstorm.basic import Basic
+
+# Frame header (type, channel, size) followed by the ContentHeader payload
+# (class id, weight, body size).
+CONTENT_HEADER = struct.Struct('>BHIHxxQ')
+CONTENT_HEADER_SIZE = 12
+CONTENT_BODY = struct.Struct('>BHI')
+
+
+class PreparedPublisher:
+    """Publish Messages to the same exchange and routing key using
+        pre-marshalled frames.
+
+        The Basic.Publish method frame and the ContentHeader properties
+        are marshalled once, and only the body size and the body frames
+        are encoded for each message.
+
+        e.g.
+        ::
+
+            publisher = channel.basic.prepare_publisher(
+                'my_queue', properties={'delivery_mode': 2}
+            )
+            for body in bodies:
+                publisher.publish(body)
+
+    :param Basic basic: Channel.Basic used to write, and confirm, messages.
+    :param int channel_id: Channel ID.
+    :param int max_frame_size: Maximum size of a body frame.
+    :param str routing_key: Message routing key
+    :param str exchange: The exchange to publish the message to
+    :param dict properties: Message properties
+    :param bool mandatory: Requires the message is published
+    :param bool immediate: Request immediate delivery
+    """
+    __slots__ = [
+        '_basic', '_channel_id', '_encoding', '_mandatory',
+        '_max_frame_size', '_method_data', '_properties', '_properties_data'
+    ]
+
+    def __init__(
+        self,
+        basic: Basic,
+        channel_id: int,
+        max_frame_size: int,
+        routing_key: str,
+        exchange: str = '',
+        properties: dict[str, Any] | None = None,
+        mandatory: bool = False,
+        immediate: bool = False,
+    ) -> None:
+        self._basic = basic
+        self._channel_id = channel_id
+        self._max_frame_size = max_frame_size
+        self._mandatory = mandatory
+        self._properties = dict(properties or {})
+        self._properties.setdefault('content_encoding', 'utf-8')
+        self._encoding = self._properties['content_encoding']
+        self._properties_data = self._marshal_properties(self._properties)
+        self._method_data = pamqp_frame.marshal(
+            commands.Basic.Publish(exchange=exchange,
+                                   routing_key=routing_key,
+                                   mandatory=mandatory,
+                                   immediate=immediate),
+            channel_id
+        )
+
+    def publish(
+        self, body: bytes | str, properties: dict[str, Any] | None = None,
+    ) -> Any:
+        """Publish a Message.
+
+            Properties passed here are merged with the prepared properties,
+            and marshalled for this message only.
+
+            Returns the same as basic.publish; with amqpstorm.aio this is
+            an awaitable.
+
+        :param bytes,str,unicode body: Message payload
+        :param dict properties: Message properties
+
+        :raises AMQPInvalidArgument: Invalid Parameters
+        :raises AMQPChannelError: Raises if the channel encountered an error.
+        :raises AMQPConnectionError: Raises if the connection
+                                     encountered an error.
+
+        :rtype: bool,concurrent.futures.Future,None
+        """
+        data_out = self._marshal_message(body, properties)
+        return self._basic._publish_frames(data_out, self._mandatory)
+
+    def publish_batch(self, bodies: list[bytes | str]) -> Any:
+        """Publish multiple Messages using a single write.
+
+            Returns the same as basic.publish_batch; with amqpstorm.aio
+            this is an awaitable.
+
+        :param list bodies: Message payloads
+
+        :raises AMQPInvalidArgument: Invalid Parameters
+        :raises AMQPChannelError: Raises if the channel encountered an error.
+        :raises AMQPConnectionError: Raises if the connection
+                                     encountered an error.
+
+        :rtype: list,None
+        """
+        if not isinstance(bodies, (list, tuple)):
+            raise AMQPInvalidArgument('bodies should be a list or tuple')
+        data_out = b''.join([self._marshal_message(body) for body in bodies])
+        return self._basic._publish_batch_frames(data_out, len(bodies),
+                                                 self._mandatory)
+
+    def _marshal_message(
+        self, body: bytes | str, properties: dict[str, Any] | None = None,
+    ) -> bytes:
+        """Marshal all the frames needed to publish a message.
+
+        :param bytes,str,unicode body: Message payload
+        :param dict properties: Message properties
+
+        :raises AMQPInvalidArgument: Invalid Parameters
+
+        :rtype: bytes
+        """
+        if not compatibility.is_string(body):
+            raise AMQPInvalidArgument('body should be a string')
+        if properties is None:
+            properties_data = self._properties_data
+            encoding = self._encoding
+        elif isinstance(properties, dict):
+            merged = dict(self._properties)
+            merged.update(properties)
+            properties_data = self._marshal_properties(merged)
+            encoding = merged['content_encoding']
+        else:
+            raise AMQPInvalidArgument('properties should be a dict or None')
+
+        if isinstance(body, str):
+            body = body.encode(encoding)
+        body_size = len(body)
+        data_out = [
+            self._method_data,
+            CONTENT_HEADER.pack(pamqp_constants.FRAME_HEADER,
+                                self._channel_id,
+                                CONTENT_HEADER_SIZE + len(properties_data),
+                                commands.Basic.frame_id, body_size),
+            properties_data,
+            pamqp_constants.FRAME_END_CHAR,
+        ]
+        view = memoryview(body)
+        for index in range(0, body_size, self._max_frame_size):
+            data_out.extend(self._marshal_body(
+                view[index:index + self._max_frame_size]
+            ))
+        return b''.join(data_out)
+
+    def _marshal_body(self, chunk: bytes | memoryview) -> list[Any]:
+        """Marshal a single ContentBody frame.
+
+        :param bytes chunk: Part of the message payload
+
+        :rtype: list
+        """
+        return [
+            CONTENT_BODY.pack(pamqp_constants.FRAME_BODY, self._channel_id,
+                              len(chunk)),
+            chunk,
+            pamqp_constants.FRAME_END_CHAR,
+        ]
+
+    @staticmethod
+    def _marshal_properties(properties: dict[str, Any]) -> bytes:
+        """Marshal the ContentHeader properties.
+
+        :param dict properties: Message properties
+
+        :rtype: bytes
+        """
+        return commands.Basic.Properties(**properties).marshal()
@@ -0,0 +1,338 @@
+"""AMQPStorm Reactor."""
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import selectors
+import socket
+import threading
+import time
+from typing import Any
+from typing import Callable
+
+LOGGER = logging.getLogger(__name__)
+MAX_POLL_TIMEOUT = 1.0
+
+
+class ReactorTimer:
+    """Timer scheduled on a Reactor.
+
+        Implements the parts of threading.Timer used by the Heartbeat,
+        so that it can be passed as the Heartbeat timer implementation.
+
+    :param Reactor reactor: Reactor running the timer.
+    :param float interval: Seconds before the function is called.
+    :param typing.Callable function: Function to call.
+    """
+    __slots__ = ['daemon', 'deadline', 'function', 'interval', '_cancelled',
+                 '_reactor']
+
+    def __init__(
+        self, reactor: Reactor, interval: float, function: Callable[[], Any],
+    ) -> None:
+        self.daemon = True
+        self.deadline = 0.0
+        self.function = function
+        self.interval = interval
+        self._cancelled = False
+        self._reactor = reactor
+
+    @property
+    def is_cancelled(self) -> bool:
+        """Is the Timer cancelled.
+
+        :rtype: bool
+        """
+        return self._cancelled
+
+    def start(self) -> None:
+        """Schedule the Timer.
+
+        :return:
+        """
+        self.deadline = time.monotonic() + self.interval
+        self._reactor.schedule(self)
+
+    def cancel(self) -> None:
+        """Cancel the Timer.
+
+        :return:
+        """
+        self._cancelled = True
+
+
+class Reactor:
+    """Shared I/O loop servicing the sockets of many Connections.
+
+        A single thread waits on all registered sockets using
+        selectors.DefaultSelector (epoll on Linux), reads the sockets that
+        are ready, and runs the heartbeat timers of the connections.
+        Create more than one Reactor to spread connections over a few
+        threads.
+
+    e.g.
+    ::
+
+        import amqpstorm
+        reactor = amqpstorm.Reactor()
+        connections = [
+            amqpstorm.Connection('localhost', 'guest', 'guest',
+                                 reactor=reactor)
+            for _ in range(100)
+        ]
+
+    :param str name: Name of the Reactor thread.
+    """
+
+    def __init__(self, name: str = __name__) -> None:
+        self._name = name
+        self._lock = threading.Lock()
+        self._callbacks: dict[Any, Callable[[], None]] = {}
+        self._timers: list[tuple[float, int, ReactorTimer]] = []
+        self._sequence = itertools.count()
+        self._selector: selectors.BaseSelector | None = None
+        self._thread: threading.Thread | None = None
+        self._running = threading.Event()
+        self._wakeup_rd: socket.socket | None = None
+        self._wakeup_wr: socket.socket | None = None
+
+    @property
+    def is_running(self) -> bool:
+        """Is the Reactor thread running.
+
+        :rtype: bool
+        """
+        return self._running.is_set()
+
+    @property
+    def sockets(self) -> int:
+        """Number of sockets registered with the Reactor.
+
+        :rtype: int
+        """
+        return len(self._callbacks)
+
+    def register(
+        self, sock: socket.socket, on_readable: Callable[[], None],
+    ) -> None:
+        """Register a socket, and call on_readable each time it is ready
+        to be read.
+
+            Starts the Reactor thread if it is not already running.
+
+        :param socket.socket sock: Socket to read from.
+        :param typing.Callable on_readable: Called from the Reactor thread.
+
+        :return:
+        """
+        with self._lock:
+            selector = self._start()
+            self._callbacks[sock] = on_readable
+            selector.register(sock, selectors.EVENT_READ)
+        self._wakeup()
+
+    def unregister(self, sock: socket.socket | None) -> None:
+        """Stop reading from a socket.
+
+        :param socket.socket sock: Socket previously registered.
+
+        :return:
+        """
+        with self._lock:
+            if sock is None or sock not in self._callbacks:
+                return
+            del self._callbacks[sock]
+            try:
+                if self._selector:
+                    self._selector.unregister(sock)
+            except (KeyError, ValueError):
+                pass
+        self._wakeup()
+
+    def timer(
+        self, interval: float, function: Callable[[], Any],
+    ) -> ReactorTimer:
+        """Create a Timer that runs the function on the Reactor thread.
+
+            Has the same signature as threading.Timer, and can be used as
+            the Heartbeat timer implementation.
+
+        :param float interval: Seconds before the function is called.
+        :param typing.Callable function: Function to call.
+
+        :rtype: ReactorTimer
+        """
+        return ReactorTimer(self, interval, function)
+
+    def schedule(self, timer: ReactorTimer) -> None:
+        """Add a started Timer to the timer heap.
+
+        :param ReactorTimer timer: Timer to schedule.
+
+        :return:
+        """
+        with self._lock:
+            self._start()
+            heapq.heappush(self._timers,
+                           (timer.deadline, next(self._sequence), timer))
+        self._wakeup()
+
+    def stop(self) -> None:
+        """Stop the Reactor thread.
+
+            Sockets, and timers, still registered are dropped.
+
+        :return:
+        """
+        with self._lock:
+            if not self._running.is_set():
+                return
+            self._running.clear()
+            thread, wakeup_wr = self._thread, self._wakeup_wr
+        try:
+            if wakeup_wr:
+                wakeup_wr.send(b'\0')
+        except OSError:
+            pass
+        if thread and thread is not threading.current_thread():
+            thread.join()
+
+    def _start(self) -> selectors.BaseSelector:
+        """Start the Reactor thread, if it is not already running.
+
+            Must be called with the lock held.
+
+        :return: Selector used by the Reactor thread.
+        :rtype: selectors.BaseSelector
+        """
+        if self._running.is_set() and self._selector:
+            return self._selector
+        selector = self._selector = selectors.DefaultSelector()
+        wakeup_rd, wakeup_wr = socket.socketpair()
+        wakeup_rd.setblocking(False)
+        wakeup_wr.setblocking(False)
+        selector.register(wakeup_rd, selectors.EVENT_READ)
+        self._wakeup_rd, self._wakeup_wr = wakeup_rd, wakeup_wr
+        self._running.set()
+        self._thread = threading.Thread(target=self._process_events,
+                                        name=self._name)
+        self._thread.daemon = True
+        self._thread.start()
+        return selector
+
+    def _wakeup(self) -> None:
+        """Interrupt the Reactor thread, so that it picks up new sockets
+        and timers.
+
+        :return:
+        """
+        try:
+            if self._wakeup_wr:
+                self._wakeup_wr.send(b'\0')
+        except OSError:
+            pass
+
+    def _process_events(self) -> None:
+        """Wait for sockets to be ready, and run the timers that are due.
+
+        :return:
+        """
+        selector = self._selector
+        wakeup_rd, wakeup_wr = self._wakeup_rd, self._wakeup_wr
+        if selector is None or wakeup_rd is None or wakeup_wr is None:
+            return
+        try:
+            while self._running.is_set() and self._selector is selector:
+                try:
+                    events = selector.select(self._get_poll_timeout())
+                except OSError as why:
+                    LOGGER.warning('Reactor select failed: %s', why)
+                    self._remove_closed_sockets()
+                    continue
+                for key, _ in events:
+                    if key.fileobj is wakeup_rd:
+                        self._drain_wakeup(wakeup_rd)
+                        continue
+                    self._run(self._callbacks.get(key.fileobj))
+                self._run_timers()
+        finally:
+            with self._lock:
+                if self._selector is selector and not self._running.is_set():
+                    self._callbacks.clear()
+                    self._timers = []
+                    self._selector = None
+                    self._wakeup_rd = self._wakeup_wr = None
+            selector.close()
+            wakeup_rd.close()
+            wakeup_wr.close()
+
+    def _get_poll_timeout(self) -> float:
+        """Seconds until the next timer is due.
+
+        :rtype: float
+        """
+        with self._lock:
+            if not self._timers:
+                return MAX_POLL_TIMEOUT
+            timeout = self._timers[0][0] - time.monotonic()
+        return min(max(timeout, 0), MAX_POLL_TIMEOUT)
+
+    def _run_timers(self) -> None:
+        """Run all timers that are due.
+
+        :return:
+        """
+        now = time.monotonic()
+        due = []
+        with self._lock:
+            while self._timers and self._timers[0][0] <= now:
+                due.append(heapq.heappop(self._timers)[2])
+        for timer in due:
+            if not timer.is_cancelled:
+                self._run(timer.function)
+
+    @staticmethod
+    def _drain_wakeup(wakeup_rd: socket.socket) -> None:
+        """Read all pending wake-up bytes.
+
+        :param socket.socket wakeup_rd: Wake-up socket.
+
+        :return:
+        """
+        try:
+            while wakeup_rd.recv(4096):
+                pass
+        except OSError:
+            pass
+
+    def _remove_closed_sockets(self) -> None:
+        """Unregister sockets closed without being unregistered.
+
+        :return:
+        """
+        with self._lock:
+            for sock in list(self._callbacks):
+                if sock.fileno() == -1:
+                    del self._callbacks[sock]
+                    try:
+                        if self._selector:
+                            self._selector.unregister(sock)
+                    except (KeyError, ValueError):
+                        pass
+
+    @staticmethod
+    def _run(function: Callable[[], Any] | None) -> None:
+        """Run a socket callback, or timer function, without letting an
+        exception stop the Reactor thread.
+
+        :param typing.Callable function:
+
+        :return:
+        """
+        if function is None:
+            return
+        try:
+            function()
+        except Exception as why:
+            LOGGER.error('Reactor callback failed: %s', why, exc_info=True)
@@ -0,0 +1,616 @@
+"""AMQPStorm Robust Connection."""
+from __future__ import annotations
+
+import collections
+import copy
+import logging
+import random
+import threading
+from typing import Any
+
+from amqpstorm.channel import Channel
+from amqpstorm.connection import Connection
+from amqpstorm.exception import AMQPChannelError
+from amqpstorm.exception import AMQPConnectionError
+from amqpstorm.exception import AMQPError
+from amqpstorm.exception import AMQPInvalidArgument
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_RETRY_DELAY = 1
+DEFAULT_MAX_RETRY_DELAY = 30
+DELIVERY_FRAME = frozenset(('Basic.Deliver', 'Basic.GetOk'))
+SETTLE_FRAME = frozenset(('Basic.Ack', 'Basic.Nack', 'Basic.Reject'))
+
+
+class Topology:
+    """Internal record of the exchanges, queues and bindings declared on
+    a RobustConnection.
+
+        Declarations are recorded once the remote server confirmed them,
+        and forgotten again once deleted, or unbound.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.exchanges: dict[str, Any] = {}
+        self.queues: dict[str, Any] = {}
+        self.bindings: dict[tuple[str, ...], Any] = {}
+
+    def record(self, frame_out: Any, result: Any) -> None:
+        """Record a confirmed declaration, deletion or binding.
+
+        :param pamqp.Frame frame_out: Frame sent to the remote server.
+        :param dict result: Response of the remote server.
+
+        :return:
+        """
+        name = frame_out.name
+        with self._lock:
+            if name == 'Exchange.Declare' and not frame_out.passive:
+                self.exchanges[frame_out.exchange] = frame_out
+            elif name == 'Exchange.Delete':
+                self.exchanges.pop(frame_out.exchange, None)
+                self._remove_bindings(frame_out.exchange)
+            elif name == 'Queue.Declare' and not frame_out.passive:
+                self.queues[result['queue'] if result else frame_out.queue] = frame_out
+            elif name == 'Queue.Delete':
+                self.queues.pop(frame_out.queue, None)
+                self._remove_bindings(frame_out.queue)
+            elif name in ('Exchange.Bind', 'Queue.Bind'):
+                self.bindings[self._binding_key(frame_out)] = frame_out
+            elif name in ('Exchange.Unbind', 'Queue.Unbind'):
+                self.bindings.pop(self._binding_key(frame_out), None)
+
+    def restore(self, channel: Channel) -> dict[str, str]:
+        """Declare the recorded topology on a Channel.
+
+            Queues named by the remote server are declared one at a time,
+            to learn their new names. Everything else is written at once,
+            with nowait set, and followed by a single round trip.
+
+        :param Channel channel: Channel used to declare the topology.
+
+        :raises AMQPChannelError: Raises if a declaration failed.
+        :raises AMQPConnectionError: Raises if the connection
+                                     encountered an error.
+
+        :return: New names of the queues named by the remote server.
+        """
+        with self._lock:
+            queues = list(self.queues.items())
+        renamed = {}
+        for name, frame_out in queues:
+            if frame_out.queue:
+                continue
+            result = channel.rpc_request(copy.copy(frame_out))
+            renamed[name] = result['queue']
+        if renamed:
+            self.rename_queues(renamed)
+        with self._lock:
+            named_queues = [
+                frame_out for frame_out in self.queues.values()
+                if frame_out.queue
+            ]
+            frames_out = [copy.copy(frame_out) for frame_out in (
+                list(self.exchanges.values()) + named_queues + list(self.bindings.values())
+            )]
+        if not frames_out:
+            return renamed
+        for frame_out in frames_out[:-1]:
+            frame_out.nowait = True
+        if len(frames_out) > 1:
+            channel.write_frames(frames_out[:-1])
+        channel.rpc_request(frames_out[-1])
+        return renamed
+
+    def rename_queues(self, renamed: dict[str, str]) -> None:
+        """Rename queues, and their bindings, named by the remote server.
+
+        :param dict renamed: New queue names, by their old name.
+
+        :return:
+        """
+        with self._lock:
+            self.queues = {
+                renamed.get(name, name): frame_out
+                for name, frame_out in self.queues.items()
+            }
+            bindings = {}
+            for frame_out in self.bindings.values():
+                if frame_out.name == 'Queue.Bind' and frame_out.queue in renamed:
+                    frame_out = copy.copy(frame_out)
+                    frame_out.queue = renamed[frame_out.queue]
+                bindings[self._binding_key(frame_out)] = frame_out
+            self.bindings = bindings
+
+    def _remove_bindings(self, name: str) -> None:
+        """Forget the bindings of a deleted exchange, or queue.
+
+            Must be called while holding the lock.
+
+        :param str name: Exchange, or queue, name.
+
+        :return:
+        """
+        for key in list(self.bindings):
+            if name in key[1:3]:
+                del self.bindings[key]
+
+    @staticmethod
+    def _binding_key(frame_out: Any) -> tuple[str, ...]:
+        """Returns the key identifying a binding.
+
+        :param pamqp.Frame frame_out: Bind, or Unbind, frame.
+
+        :rtype: tuple
+        """
+        if frame_out.name.startswith('Queue.'):
+            return ('queue', frame_out.queue, frame_out.exchange,
+                    frame_out.routing_key)
+        return ('exchange', frame_out.destination, frame_out.source,
+                frame_out.routing_key)
+
+
+class RobustChannel(Channel):
+    """Channel of a RobustConnection.
+
+        The QoS, publisher confirms and consumers of the Channel are
+        restored once the RobustConnection has been recovered, and
+        start_consuming resumes consuming.
+
+        Messages received before the connection was lost are redelivered
+        by the remote server. Acknowledging, or rejecting, such a message
+        after the recovery does nothing.
+    """
+    __slots__ = ['_confirm_parameters', '_consumers',
+                 '_delivery_tag_offset', '_last_delivery_tag', '_qos']
+    _connection: RobustConnection
+
+    def __init__(
+        self, channel_id: int, connection: RobustConnection,
+        rpc_timeout: float,
+    ) -> None:
+        super().__init__(channel_id, connection, rpc_timeout)
+        self._confirm_parameters: dict[str, Any] | None = None
+        self._consumers: collections.OrderedDict[str, Any] = (
+            collections.OrderedDict()
+        )
+        self._delivery_tag_offset = 0
+        self._last_delivery_tag = 0
+        self._qos: Any = None
+
+    def check_for_errors(self) -> None:
+        """Check connection and channel for errors.
+
+            Unlike a Channel, the Channel is not marked as closed when the
+            connection was lost, as it is re-opened once the connection
+            has been recovered.
+
+        :raises AMQPChannelError: Raises if the channel encountered an error.
+        :raises AMQPConnectionError: Raises if the connection
+                                     encountered an error.
+        :return:
+        """
+        self._connection.check_for_errors()
+        self.check_for_exceptions()
+        if self.is_closed:
+            raise AMQPChannelError('channel closed')
+
+    def confirm_deliveries(
+        self,
+        asynchronous: bool = False,
+        max_in_flight: int | None = None,
+    ) -> dict[str, Any]:
+        result = super().confirm_deliveries(asynchronous, max_in_flight)
+        self._confirm_parameters = {
+            'asynchronous': asynchronous, 'max_in_flight': max_in_flight,
+        }
+        return result
+
+    def on_frame(self, frame_in: Any) -> None:
+        if frame_in.name in DELIVERY_FRAME:
+            frame_in.delivery_tag += self._delivery_tag_offset
+            self._last_delivery_tag = frame_in.delivery_tag
+        super().on_frame(frame_in)
+
+    def remove_consumer_tag(self, tag: str | None = None) -> None:
+        super().remove_consumer_tag(tag)
+        if tag is None:
+            self._consumers.clear()
+        else:
+            self._consumers.pop(tag, None)
+
+    def rpc_request(self, frame_out: Any, connection_adapter: Any = None) -> Any:
+        result = super().rpc_request(frame_out, connection_adapter)
+        if frame_out.name == 'Basic.Qos':
+            self._qos = frame_out
+        elif frame_out.name == 'Basic.Consume':
+            frame_out.consumer_tag = result['consumer_tag']
+            self._consumers[frame_out.consumer_tag] = frame_out
+        else:
+            self._connection._topology.record(frame_out, result)
+        return result
+
+    def start_consuming(self, *args: Any, **kwargs: Any) -> None:
+        """Start consuming messages, and resume consuming once the
+        connection has been recovered.
+
+            Takes the same parameters as Channel.start_consuming.
+
+        :raises AMQPInvalidArgument: Invalid Parameters
+        :raises AMQPChannelError: Raises if the channel encountered an error.
+        :raises AMQPConnectionError: Raises if the connection could not
+                                     be recovered.
+
+        :return:
+        """
+        while True:
+            try:
+                super().start_consuming(*args, **kwargs)
+                if not self.consumer_tags:
+                    return
+                self._connection._wait_for_recovery()
+                self.check_for_errors()
+            except AMQPConnectionError:
+                if not self._connection._wait_for_recovery():
+                    raise
+
+    def write_frame(self, frame_out: Any) -> None:
+        if self._delivery_tag_offset and frame_out.name in SETTLE_FRAME:
+            frame_out = self._translate_delivery_tag(frame_out)
+            if frame_out is None:
+                return
+        super().write_frame(frame_out)
+
+    def write_frames(self, frames_out: list[Any]) -> None:
+        if self._delivery_tag_offset:
+            frames_out = [
+                frame_out for frame_out in (
+                    self._translate_delivery_tag(frame_out)
+                    if frame_out.name in SETTLE_FRAME else frame_out
+                    for frame_out in frames_out
+                ) if frame_out is not None
+            ]
+            if not frames_out:
+                return
+        super().write_frames(frames_out)
+
+    def _on_connection_lost(self, why: AMQPError) -> None:
+        """Forget the state tied to the lost connection.
+
+            Messages waiting to be consumed, or acknowledged, are
+            redelivered by the remote server, and messages waiting to be
+            confirmed are failed.
+
+        :param AMQPError why: Reason the connection was lost.
+
+        :return:
+        """
+        self.set_state(self.CLOSED)
+        self._clear_inbound()
+        if self._acks:
+            self._acks.clear()
+        if self._confirms:
+            self._confirms.fail(why)
+        self._delivery_tag_offset = self._last_delivery_tag
+        self.rpc.notify_all()
+        self._inbound_ready.set()
+
+    def _restore(self) -> None:
+        """Restore the publisher confirms, QoS and consumers of the Channel.
+
+        :raises AMQPChannelError: Raises if the channel encountered an error.
+        :raises AMQPConnectionError: Raises if the connection
+                                     encountered an error.
+
+        :return:
+        """
+        if self._confirm_parameters is not None:
+            self.confirm_deliveries(**self._confirm_parameters)
+        if self._qos is not None:
+            self.rpc_request(self._qos)
+        for consumer_tag, frame_out in list(self._consumers.items()):
+            self.rpc_request(frame_out)
+            self.add_consumer_tag(consumer_tag)
+            if frame_out.no_ack:
+                self._no_ack_consumer_tags.add(consumer_tag)
+
+    def _rename_queues(self, renamed: dict[str, str]) -> None:
+        """Consume from the new names of the queues named by the remote
+        server.
+
+        :param dict renamed: New queue names, by their old name.
+
+        :return:
+        """
+        for frame_out in self._consumers.values():
+            frame_out.queue = renamed.get(frame_out.queue, frame_out.queue)
+
+    def _translate_delivery_tag(self, frame_out: Any) -> Any:
+        """Translate the delivery tag of an outgoing Basic.Ack, Basic.Nack
+        or Basic.Reject to the delivery tags of the current connection.
+
+        :param pamqp.Frame frame_out: Basic.Ack, Basic.Nack or Basic.Reject.
+
+        :return: The frame, or None if it settles messages received before
+                 the connection was lost.
+        """
+        if not frame_out.delivery_tag:
+            return frame_out
+        elif frame_out.delivery_tag <= self._delivery_tag_offset:
+            LOGGER.debug('[Channel%d] Dropping %s of a message received '
+                         'before the connection was recovered',
+                         self.channel_id, frame_out.name)
+            return None
+        frame_out.delivery_tag -= self._delivery_tag_offset
+        return frame_out
+
+
+class RobustConnection(Connection):
+    """RabbitMQ Connection that recovers from connection failures.
+
+        The exchanges, queues and bindings declared on the connection, and
+        the QoS, publisher confirms and consumers of its Channels, are
+        recorded. Once the connection is lost, it is re-established in the
+        background, the recorded topology is declared again, and the
+        Channels are re-opened and restored.
+
+        e.g.
+        ::
+
+            connection = amqpstorm.RobustConnection('localhost', 'guest',
+                                                    'guest')
+            channel = connection.channel()
+            channel.queue.declare('my_queue')
+            channel.basic.consume(on_message, 'my_queue')
+            channel.start_consuming()
+
+        Recovery starts once the failure has been noticed, by a consumer
+        or any other operation on the connection. Operations in progress
+        at that time raise AMQPConnectionError, as do operations attempted
+        while the connection is being recovered. start_consuming waits for
+        the recovery, and resumes consuming.
+
+        Each attempt to reconnect waits a random delay of up to
+        retry_delay seconds, doubled after every failed attempt, up to
+        max_retry_delay seconds. The random delay spreads out clients
+        reconnecting at the same time, e.g. after a failover.
+
+        Queues named by the remote server are declared again with a new
+        name.
+
+    :param str hostname: Hostname
+    :param str username: Username
+    :param str password: Password
+    :param int port: Server port
+    :param int,float retry_delay: Maximum delay, in seconds, before the
+                                  first attempt to reconnect.
+    :param int,float max_retry_delay: Maximum delay, in seconds, between
+                                      attempts to reconnect.
+    :param int,None max_retries: Give up after this many failed attempts.
+                                 None retries forever.
+    :param kwargs: Connection kwargs (e.g. virtual_host, heartbeat or ssl)
+
+    :raises AMQPInvalidArgument: Invalid Parameters
+    :raises AMQPConnectionError: Raises if the connection
+                                 encountered an error.
+    """
+
+    def __init__(
+        self,
+        hostname: str,
+        username: str,
+        password: str,
+        port: int = 5672,
+        retry_delay: float = DEFAULT_RETRY_DELAY,
+        max_retry_delay: float = DEFAULT_MAX_RETRY_DELAY,
+        max_retries: int | None = None,
+        **kwargs: Any,
+    ) -> None:
+        for name, value in (('retry_delay', retry_delay),
+                            ('max_retry_delay', max_retry_delay)):
+            if not isinstance(value, (int, float)) or value < 0:
+                raise AMQPInvalidArgument(
+                    f'{name} should be a non-negative integer or float'
+                )
+        if max_retries is not None and (not isinstance(max_retries, int) or max_retries < 1):
+            raise AMQPInvalidArgument(
+                'max_retries should be a positive integer or None'
+            )
+        self._retry_delay = retry_delay
+        self._max_retry_delay = max_retry_delay
+        self._max_retries = max_retries
+        self._topology = Topology()
+        self._recoverable = False
+        self._recovery_error: AMQPError | None = None
+        self._recovery_lock = threading.Lock()
+        self._recovery_thread: threading.Thread | None = None
+        self._stop_recovery = threading.Event()
+        super().__init__(hostname, username, password, port, **kwargs)
+
+    @property
+    def is_recovering(self) -> bool:
+        """Is the connection currently being recovered.
+
+        :rtype: bool
+        """
+        return self._recovery_thread is not None
+
+    def check_for_errors(self) -> None:
+        """Check Connection for errors, and start recovering the connection
+        if it was lost.
+
+        :raises AMQPConnectionError: Raises if the connection
+                                     encountered an error.
+        :return:
+        """
+        if self._recovery_thread is threading.current_thread():
+            super().check_for_errors()
+            return
+        with self._recovery_lock:
+            if self._recovery_thread is None and self._recoverable:
+                if not self.exceptions and not self.is_closed:
+                    return
+                self._start_recovery()
+            recovery_error = self._recovery_error
+        if recovery_error is not None:
+            raise recovery_error
+        super().check_for_errors()
+
+    def close(self) -> None:
+        """Close the Connection, and stop recovering it.
+
+        :raises AMQPConnectionError: Raises if the connection
+                                     encountered an error.
+        :return:
+        """
+        if self._recovery_thread is threading.current_thread():
+            self._channels = {}
+            super().close()
+            return
+        with self._recovery_lock:
+            self._recoverable = False
+            self._stop_recovery.set()
+            thread = self._recovery_thread
+        if thread:
+            thread.join()
+        super().close()
+
+    def open(self) -> None:
+        """Open Connection.
+
+        :raises AMQPConnectionError: Raises if the connection
+                                     encountered an error.
+        """
+        super().open()
+        self._recoverable = True
+        self._stop_recovery.clear()
+
+    def _create_channel(self, channel_id: int, rpc_timeout: float) -> Channel:
+        return RobustChannel(channel_id, self, rpc_timeout)
+
+    def _start_recovery(self) -> None:
+        """Start recovering the connection in the background.
+
+            Must be called while holding the recovery lock.
+
+        :return:
+        """
+        why: AMQPError = AMQPConnectionError('connection closed')
+        if self.exceptions:
+            error = self.exceptions[0]
+            why = error if isinstance(error, AMQPError) else AMQPConnectionError(error)
+        LOGGER.warning('Connection lost, recovering: %s', why)
+        self._recovery_error = why
+        channels = [
+            channel for channel in self._channels.values()
+            if isinstance(channel, RobustChannel) and channel.is_open
+        ]
+        self._recovery_thread = threading.Thread(
+            target=self._recover, args=(channels, why),
+            name='amqpstorm-recovery'
+        )
+        self._recovery_thread.daemon = True
+        self._recovery_thread.start()
+
+    def _recover(self, channels: list[RobustChannel], why: AMQPError) -> None:
+        """Reconnect, and restore the topology and Channels.
+
+        :param list channels: Channels to restore.
+        :param AMQPError why: Reason the connection was lost.
+
+        :return:
+        """
+        try:
+            self._tear_down(channels, why)
+            attempts = 0
+            while True:
+                delay = min(self._max_retry_delay,
+                            self._retry_delay * 2 ** attempts)
+                if self._stop_recovery.wait(random.uniform(0, delay)):
+                    return
+                attempts += 1
+                try:
+                    self.open()
+                    self._restore(channels)
+                    LOGGER.info('Connection recovered after %d attempt(s)',
+                                attempts)
+                    return
+                except AMQPConnectionError as error:
+                    LOGGER.warning('Connection recovery attempt %d failed: %s',
+                                   attempts, error)
+                    self._tear_down([], error)
+                if self._max_retries is not None and attempts >= self._max_retries:
+                    self._recoverable = False
+                    self._exceptions.insert(0, AMQPConnectionError(
+                        f'connection could not be recovered after {attempts} attempts'
+                    ))
+                    return
+        finally:
+            with self._recovery_lock:
+                self._recovery_thread = None
+                self._recovery_error = None
+
+    def _restore(self, channels: list[RobustChannel]) -> None:
+        """Re-open the Channels, and restore the topology, QoS, publisher
+        confirms and consumers.
+
+            A declaration that is refused by the remote server is logged,
+            as declaring it again would be refused too.
+
+        :param list channels: Channels to restore.
+
+        :raises AMQPConnectionError: Raises if the connection
+                                     encountered an error.
+
+        :return:
+        """
+        channels = [channel for channel in channels if not channel._user_closed]
+        for channel in channels:
+            self._channels[channel.channel_id] = channel
+            channel.open()
+        renamed = {}
+        recovery_channel = Channel(self._get_next_available_channel_id(),
+                                   self, rpc_timeout=60)
+        self._channels[recovery_channel.channel_id] = recovery_channel
+        try:
+            recovery_channel.open()
+            renamed = self._topology.restore(recovery_channel)
+            recovery_channel.close()
+        except AMQPChannelError as error:
+            LOGGER.error('Topology recovery failed: %s', error)
+        finally:
+            self._cleanup_channel(recovery_channel.channel_id)
+        for channel in channels:
+            try:
+                channel._rename_queues(renamed)
+                channel._restore()
+            except AMQPChannelError as error:
+                LOGGER.error('[Channel%d] Recovery failed: %s',
+                             channel.channel_id, error)
+
+    def _tear_down(self, channels: list[RobustChannel], why: AMQPError) -> None:
+        """Close the lost connection, without forgetting its Channels.
+
+        :param list channels: Channels to restore.
+        :param AMQPError why: Reason the connection was lost.
+
+        :return:
+        """
+        self.heartbeat.stop()
+        self._io.close()
+        self.set_state(self.CLOSED)
+        for channel in channels:
+            channel._on_connection_lost(why)
+
+    def _wait_for_recovery(self) -> bool:
+        """Wait for the connection to be recovered, if it is being
+        recovered.
+
+        :return: True if the connection is open.
+        """
+        thread = self._recovery_thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        return self.is_open
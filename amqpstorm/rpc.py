@@ -6,24 +6,36 @@ import threading
 import time
 from typing import TYPE_CHECKING
 from typing import Any
+from typing import Callable
 from uuid import uuid4
 
-from amqpstorm.base import IDLE_WAIT
+from amqpstorm.base import ERROR_CHECK_INTERVAL
 from amqpstorm.exception import AMQPChannelError
 
 if TYPE_CHECKING:
     from pamqp.base import Frame
 
+    from amqpstorm.metrics import Metrics
+
 
 class Rpc:
     """Internal RPC handler.
 
     :param object default_adapter: Connection or Channel.
     :param int,float timeout: Rpc timeout.
+    :param Metrics metrics: Receives the time spent waiting for responses.
+    :param typing.Callable on_request: Called once a request is registered.
     """
 
-    def __init__(self, default_adapter: Any, timeout: float = 360) -> None:
+    def __init__(
+        self, default_adapter: Any, timeout: float = 360,
+        metrics: Metrics | None = None,
+        on_request: Callable[[], None] | None = None,
+    ) -> None:
         self._lock = threading.Lock()
+        self._metrics = metrics
+        self._on_request = on_request
+        self._condition = threading.Condition(threading.Lock())
         self._default_connection_adapter = default_adapter
         self._timeout = timeout
         self._response: dict[str, collections.deque[Frame]] = {}
@@ -33,6 +45,18 @@ class Rpc:
     def lock(self) -> threading.Lock:
         return self._lock
 
+    @property
+    def timeout(self) -> float:
+        return self._timeout
+
+    @property
+    def is_waiting(self) -> bool:
+        """Returns True while a request is waiting for its response.
+
+        :rtype: bool
+        """
+        return bool(self._request)
+
     def on_frame(self, frame_in: Frame) -> bool:
         """On RPC Frame.
 
@@ -45,9 +69,22 @@ class Rpc:
         response = self._response.get(uuid)
         if response is None:
             return False
-        response.append(frame_in)
+        with self._condition:
+            response.append(frame_in)
+            self._condition.notify_all()
         return True
 
+    def notify_all(self) -> None:
+        """Wake up all threads waiting for a RPC response.
+
+            Used to make waiting requests re-check for errors right away,
+            e.g. when the channel was closed by the remote server.
+
+        :return:
+        """
+        with self._condition:
+            self._condition.notify_all()
+
     def register_request(self, valid_responses: list[str]) -> str:
         """Register a RPC request.
 
@@ -59,6 +96,8 @@ class Rpc:
         self._response[uuid] = collections.deque()
         for action in valid_responses:
             self._request[action] = uuid
+        if self._on_request:
+            self._on_request()
         return uuid
 
     def remove(self, uuid: str) -> None:
@@ -107,10 +146,13 @@ class Rpc:
         """
         if uuid not in self._response:
             return None
+        start_time = time.monotonic()
         self._wait_for_request(
             uuid, connection_adapter or self._default_connection_adapter
         )
         frame = self._get_response_frame(uuid)
+        if self._metrics is not None and frame is not None:
+            self._metrics.on_rpc(frame.name, time.monotonic() - start_time)
         if not multiple:
             self.remove(uuid)
         result: Frame | dict[str, Any] | None = None
@@ -144,9 +186,13 @@ class Rpc:
         start_time = time.monotonic()
         while not self._response[uuid]:
             connection_adapter.check_for_errors()
-            if time.monotonic() - start_time > self._timeout:
+            remaining = self._timeout - (time.monotonic() - start_time)
+            if remaining < 0:
                 self._raise_rpc_timeout_error(uuid)
-            time.sleep(IDLE_WAIT)
+            with self._condition:
+                if self._response[uuid]:
+                    break
+                self._condition.wait(min(remaining, ERROR_CHECK_INTERVAL))
 
     def _raise_rpc_timeout_error(self, uuid: str) -> None:
         """Gather information and raise an Rpc exception.
@@ -0,0 +1,128 @@
+"""AMQPStorm Message Body Stream."""
+from __future__ import annotations
+
+import io
+from typing import Any
+from typing import Callable
+from typing import Iterator
+
+from amqpstorm.exception import AMQPError
+
+
+class BodyStream(io.RawIOBase):
+    """Message body read from the Channel one frame at a time.
+
+        The body frames are read as they arrive, so a message never has
+        to be held in memory as a whole. The body can be read like any
+        other binary file, or one frame at a time using chunks.
+
+        e.g.
+        ::
+
+            for message in channel.build_inbound_messages(stream_body=True):
+                with open('payload.bin', 'wb') as file_out:
+                    for chunk in message.body.chunks():
+                        file_out.write(chunk)
+                message.ack()
+
+        The body must be read before the next message can be built, so
+        any part not read is discarded once the next message is built, or
+        the stream is closed.
+
+    :param typing.Callable read_chunk: Returns the next body frame, or
+                                       None if the body ended.
+    :param int size: Size of the body in bytes.
+    """
+
+    def __init__(self, read_chunk: Callable[[], bytes | None], size: int) -> None:
+        super().__init__()
+        self.size = size
+        self._read_chunk = read_chunk
+        self._remaining = size
+        self._buffer: memoryview | None = None
+
+    @property
+    def remaining(self) -> int:
+        """Returns the number of body bytes not yet received.
+
+        :rtype: int
+        """
+        return self._remaining
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        """Read body bytes into a pre-allocated buffer.
+
+        :param bytearray buffer: Buffer to read into.
+
+        :raises AMQPChannelError: Raises if the channel encountered an error.
+        :raises AMQPConnectionError: Raises if the connection
+                                     encountered an error.
+
+        :rtype: int
+        """
+        if self.closed:
+            raise ValueError('I/O operation on closed file.')
+        if not self._buffer:
+            chunk = self._next_chunk()
+            if chunk is None:
+                return 0
+            self._buffer = memoryview(chunk)
+        size = min(len(buffer), len(self._buffer))
+        buffer[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+    def chunks(self) -> Iterator[bytes]:
+        """Iterate over the remaining body, one frame at a time.
+
+        :raises AMQPChannelError: Raises if the channel encountered an error.
+        :raises AMQPConnectionError: Raises if the connection
+                                     encountered an error.
+
+        :rtype: :py:class:`generator`
+        """
+        if self.closed:
+            raise ValueError('I/O operation on closed file.')
+        if self._buffer:
+            buffered, self._buffer = bytes(self._buffer), None
+            yield buffered
+        while True:
+            chunk = self._next_chunk()
+            if chunk is None:
+                return
+            yield chunk
+
+    def close(self) -> None:
+        """Discard the part of the body not yet read, and close the stream.
+
+            Errors of the Channel are not raised here, and are left to the
+            next Channel operation.
+
+        :return:
+        """
+        if self.closed:
+            return
+        self._buffer = None
+        try:
+            while self._next_chunk() is not None:
+                pass
+        except AMQPError:
+            self._remaining = 0
+        super().close()
+
+    def _next_chunk(self) -> bytes | None:
+        """Returns the next body frame, or None once the body ended.
+
+        :rtype: bytes,None
+        """
+        if self._remaining <= 0:
+            return None
+        chunk = self._read_chunk()
+        if not chunk:
+            self._remaining = 0
+            return None
+        self._remaining -= len(chunk)
+        return chunk
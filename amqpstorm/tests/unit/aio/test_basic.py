@@ -0,0 +1,223 @@
+import asyncio
+import unittest
+
+from pamqp import body as pamqp_body
+from pamqp import commands
+from pamqp import frame as pamqp_frame
+from pamqp import header as pamqp_header
+
+from amqpstorm import Message
+from amqpstorm.aio import AsyncChannel
+from amqpstorm.aio import AsyncConnection
+from amqpstorm.exception import AMQPChannelError
+from amqpstorm.exception import AMQPInvalidArgument
+from amqpstorm.tests.utility import FakeTransport
+from amqpstorm.tests.utility import TestFramework
+
+
+class AsyncBasicTests(TestFramework, unittest.IsolatedAsyncioTestCase):
+
+    def create_channel(self, rpc_timeout=360):
+        connection = AsyncConnection('localhost', 'guest', 'guest',
+                                     heartbeat=0)
+        connection._transport = FakeTransport()
+        connection.set_state(connection.OPEN)
+        channel = AsyncChannel(1, connection, rpc_timeout)
+        channel.set_state(channel.OPEN)
+        connection._channels[1] = channel
+        return channel
+
+    async def confirm_deliveries(self, channel):
+        task = asyncio.ensure_future(channel.confirm_deliveries())
+        await asyncio.sleep(0)
+        channel._connection._on_data(
+            pamqp_frame.marshal(commands.Confirm.SelectOk(), 1)
+        )
+        await task
+        channel._connection._transport.get_frames()
+
+    async def test_basic_publish(self):
+        channel = self.create_channel()
+        channel.basic._max_frame_size = 5
+
+        self.assertIsNone(
+            await channel.basic.publish('hello world', 'travis-ci')
+        )
+
+        frames = [frame for _, frame in
+                  channel._connection._transport.get_frames()]
+        self.assertIsInstance(frames[0], commands.Basic.Publish)
+        self.assertEqual(frames[0].routing_key, 'travis-ci')
+        self.assertIsInstance(frames[1], pamqp_header.ContentHeader)
+        self.assertEqual(frames[1].body_size, 11)
+        self.assertEqual(b''.join(frame.value for frame in frames[2:]),
+                         b'hello world')
+        self.assertEqual(len(frames), 5)
+
+    async def test_basic_publish_invalid_parameter(self):
+        channel = self.create_channel()
+
+        with self.assertRaisesRegex(AMQPInvalidArgument,
+                                    'routing_key should be a string'):
+            await channel.basic.publish('hello world', None)
+
+    async def test_basic_publish_confirm(self):
+        channel = self.create_channel()
+        await self.confirm_deliveries(channel)
+        self.assertTrue(channel.confirming_deliveries)
+
+        first = asyncio.ensure_future(
+            channel.basic.publish('hello world', 'travis-ci')
+        )
+        second = asyncio.ensure_future(
+            channel.basic.publish('hello world', 'travis-ci')
+        )
+        third = asyncio.ensure_future(
+            channel.basic.publish('hello world', 'travis-ci')
+        )
+        await asyncio.sleep(0)
+        self.assertEqual(channel._confirms.in_flight, 3)
+
+        channel._connection._on_data(b''.join([
+            pamqp_frame.marshal(commands.Basic.Ack(delivery_tag=2,
+                                                   multiple=True), 1),
+            pamqp_frame.marshal(commands.Basic.Nack(delivery_tag=3), 1),
+        ]))
+
+        self.assertEqual(await asyncio.gather(first, second, third),
+                         [True, True, False])
+
+    async def test_basic_publish_batch(self):
+        channel = self.create_channel()
+
+        self.assertIsNone(await channel.basic.publish_batch([
+            ('hello world', 'travis-ci'),
+            {'body': 'hello world', 'routing_key': 'travis-ci-2'},
+        ]))
+
+        frames = [frame for _, frame in
+                  channel._connection._transport.get_frames()]
+        self.assertEqual(len(frames), 6)
+        self.assertEqual(frames[0].routing_key, 'travis-ci')
+        self.assertEqual(frames[3].routing_key, 'travis-ci-2')
+
+    async def test_basic_publish_batch_confirm(self):
+        channel = self.create_channel()
+        await self.confirm_deliveries(channel)
+
+        task = asyncio.ensure_future(channel.basic.publish_batch(
+            [('hello world', 'travis-ci')] * 3
+        ))
+        await asyncio.sleep(0)
+        self.assertEqual(channel._confirms.in_flight, 3)
+        channel._connection._on_data(b''.join([
+            pamqp_frame.marshal(commands.Basic.Nack(delivery_tag=1), 1),
+            pamqp_frame.marshal(commands.Basic.Ack(delivery_tag=3,
+                                                   multiple=True), 1),
+        ]))
+
+        self.assertEqual(await task, [False, True, True])
+
+    async def test_basic_publish_confirm_channel_closed(self):
+        self.disable_logging_validation()
+        channel = self.create_channel()
+        await self.confirm_deliveries(channel)
+
+        task = asyncio.ensure_future(
+            channel.basic.publish('hello world', 'travis-ci')
+        )
+        await asyncio.sleep(0)
+        channel._connection._on_data(pamqp_frame.marshal(
+            commands.Channel.Close(reply_code=404, reply_text='travis-ci',
+                                   class_id=0, method_id=0), 1
+        ))
+
+        with self.assertRaisesRegex(AMQPChannelError, 'travis-ci'):
+            await task
+
+    async def test_basic_publish_confirm_timeout(self):
+        channel = self.create_channel(rpc_timeout=0.01)
+        await self.confirm_deliveries(channel)
+
+        with self.assertRaisesRegex(AMQPChannelError,
+                                    'publisher confirm took too long'):
+            await channel.basic.publish('hello world', 'travis-ci')
+
+    async def test_basic_prepare_publisher(self):
+        channel = self.create_channel()
+        await self.confirm_deliveries(channel)
+        publisher = channel.basic.prepare_publisher('travis-ci')
+
+        task = asyncio.ensure_future(publisher.publish('hello world'))
+        await asyncio.sleep(0)
+        frames = [frame for _, frame in
+                  channel._connection._transport.get_frames()]
+        self.assertEqual(frames[0].routing_key, 'travis-ci')
+        self.assertEqual(frames[2].value, b'hello world')
+        channel._connection._on_data(pamqp_frame.marshal(
+            commands.Basic.Ack(delivery_tag=1), 1
+        ))
+
+        self.assertTrue(await task)
+
+    async def test_basic_get(self):
+        channel = self.create_channel()
+
+        task = asyncio.ensure_future(channel.basic.get('travis-ci'))
+        await asyncio.sleep(0)
+        self.assertIsInstance(
+            channel._connection._transport.get_frames()[0][1],
+            commands.Basic.Get
+        )
+        channel._connection._on_data(b''.join(
+            pamqp_frame.marshal(frame_in, 1) for frame_in in [
+                commands.Basic.GetOk(delivery_tag=1, routing_key='travis-ci',
+                                     message_count=0),
+                pamqp_header.ContentHeader(body_size=11),
+                pamqp_body.ContentBody(b'hello '),
+                pamqp_body.ContentBody(b'world'),
+            ]
+        ))
+
+        message = await task
+        self.assertIsInstance(message, Message)
+        self.assertEqual(message.body, 'hello world')
+        self.assertEqual(message.delivery_tag, 1)
+
+        message.ack()
+        ack_frame = channel._connection._transport.get_frames()[0][1]
+        self.assertIsInstance(ack_frame, commands.Basic.Ack)
+        self.assertEqual(ack_frame.delivery_tag, 1)
+
+    async def test_basic_get_empty(self):
+        channel = self.create_channel()
+
+        task = asyncio.ensure_future(channel.basic.get('travis-ci'))
+        await asyncio.sleep(0)
+        channel._connection._on_data(
+            pamqp_frame.marshal(commands.Basic.GetEmpty(), 1)
+        )
+
+        self.assertIsNone(await task)
+
+    async def test_basic_get_when_consuming(self):
+        channel = self.create_channel()
+        channel.add_consumer_tag('travis-ci')
+
+        with self.assertRaisesRegex(AMQPChannelError,
+                                    "Cannot call 'get' when channel is "
+                                    "set to consume"):
+            await channel.basic.get('travis-ci')
+
+    async def test_basic_qos(self):
+        channel = self.create_channel()
+
+        task = asyncio.ensure_future(channel.basic.qos(prefetch_count=10))
+        await asyncio.sleep(0)
+        frame_out = channel._connection._transport.get_frames()[0][1]
+        self.assertEqual(frame_out.prefetch_count, 10)
+        channel._connection._on_data(
+            pamqp_frame.marshal(commands.Basic.QosOk(), 1)
+        )
+
+        self.assertEqual(await task, {})
@@ -0,0 +1,251 @@
+import asyncio
+import unittest
+
+from pamqp import body as pamqp_body
+from pamqp import commands
+from pamqp import frame as pamqp_frame
+from pamqp import header as pamqp_header
+
+from amqpstorm import Message
+from amqpstorm.aio import AsyncChannel
+from amqpstorm.aio import AsyncConnection
+from amqpstorm.exception import AMQPChannelError
+from amqpstorm.tests.utility import FakeTransport
+from amqpstorm.tests.utility import TestFramework
+
+
+class AsyncChannelTests(TestFramework, unittest.IsolatedAsyncioTestCase):
+
+    def create_channel(self, rpc_timeout=360):
+        connection = AsyncConnection('localhost', 'guest', 'guest',
+                                     heartbeat=0)
+        connection._transport = FakeTransport()
+        connection.set_state(connection.OPEN)
+        channel = AsyncChannel(1, connection, rpc_timeout)
+        channel.set_state(channel.OPEN)
+        connection._channels[1] = channel
+        return channel
+
+    @staticmethod
+    def deliver(channel, body, consumer_tag='travis-ci', delivery_tag=1):
+        frames_in = [
+            commands.Basic.Deliver(consumer_tag=consumer_tag,
+                                   delivery_tag=delivery_tag,
+                                   routing_key='travis-ci'),
+            pamqp_header.ContentHeader(body_size=len(body)),
+        ]
+        frames_in.extend(pamqp_body.ContentBody(body[index:index + 2])
+                         for index in range(0, len(body), 2))
+        channel._connection._on_data(b''.join(
+            pamqp_frame.marshal(frame_in, 1) for frame_in in frames_in
+        ))
+
+    async def consume(self, channel, callback=None):
+        task = asyncio.ensure_future(
+            channel.basic.consume(callback, queue='travis-ci',
+                                  consumer_tag='travis-ci')
+        )
+        await asyncio.sleep(0)
+        channel._connection._on_data(pamqp_frame.marshal(
+            commands.Basic.ConsumeOk(consumer_tag='travis-ci'), 1
+        ))
+        consumer_tag = await task
+        channel._connection._transport.get_frames()
+        return consumer_tag
+
+    async def test_channel_queue_declare(self):
+        channel = self.create_channel()
+        transport = channel._connection._transport
+
+        task = asyncio.ensure_future(channel.queue.declare('travis-ci'))
+        await asyncio.sleep(0)
+        channel_id, frame_out = transport.get_frames()[0]
+        self.assertEqual(channel_id, 1)
+        self.assertIsInstance(frame_out, commands.Queue.Declare)
+        self.assertEqual(frame_out.queue, 'travis-ci')
+
+        channel._connection._on_data(pamqp_frame.marshal(
+            commands.Queue.DeclareOk(queue='travis-ci', message_count=5,
+                                     consumer_count=0), 1
+        ))
+
+        self.assertEqual(await task, {
+            'queue': 'travis-ci', 'message_count': 5, 'consumer_count': 0
+        })
+
+    async def test_channel_rpc_requests_are_serialized(self):
+        channel = self.create_channel()
+        transport = channel._connection._transport
+
+        first = asyncio.ensure_future(channel.queue.declare('first'))
+        second = asyncio.ensure_future(channel.queue.declare('second'))
+        await asyncio.sleep(0)
+        self.assertEqual(len(transport.get_frames()), 1)
+
+        channel._connection._on_data(pamqp_frame.marshal(
+            commands.Queue.DeclareOk(queue='first', message_count=0,
+                                     consumer_count=0), 1
+        ))
+        self.assertEqual((await first)['queue'], 'first')
+
+        await asyncio.sleep(0)
+        self.assertEqual(transport.get_frames()[0][1].queue, 'second')
+        channel._connection._on_data(pamqp_frame.marshal(
+            commands.Queue.DeclareOk(queue='second', message_count=0,
+                                     consumer_count=0), 1
+        ))
+        self.assertEqual((await second)['queue'], 'second')
+
+    async def test_channel_rpc_request_timeout(self):
+        channel = self.create_channel(rpc_timeout=0.01)
+
+        with self.assertRaisesRegex(AMQPChannelError, 'took too long'):
+            await channel.queue.declare('travis-ci')
+
+    async def test_channel_remote_close_during_rpc_request(self):
+        self.disable_logging_validation()
+        channel = self.create_channel()
+        transport = channel._connection._transport
+
+        task = asyncio.ensure_future(channel.queue.declare('travis-ci'))
+        await asyncio.sleep(0)
+        transport.get_frames()
+        channel._connection._on_data(pamqp_frame.marshal(
+            commands.Channel.Close(reply_code=404, reply_text='travis-ci',
+                                   class_id=0, method_id=0), 1
+        ))
+
+        with self.assertRaisesRegex(AMQPChannelError, 'travis-ci'):
+            await task
+        self.assertTrue(channel.is_closed)
+        self.assertFalse(channel._connection.channels)
+        self.assertIsInstance(transport.get_frames()[0][1],
+                              commands.Channel.CloseOk)
+
+    async def test_channel_close(self):
+        channel = self.create_channel()
+        transport = channel._connection._transport
+
+        task = asyncio.ensure_future(channel.close())
+        await asyncio.sleep(0)
+        self.assertIsInstance(transport.get_frames()[0][1],
+                              commands.Channel.Close)
+        channel._connection._on_data(
+            pamqp_frame.marshal(commands.Channel.CloseOk(), 1)
+        )
+        await task
+
+        self.assertTrue(channel.is_closed)
+        self.assertFalse(channel._connection.channels)
+
+    async def test_channel_consume_async_iterator(self):
+        channel = self.create_channel()
+        self.assertEqual(await self.consume(channel), 'travis-ci')
+        self.assertEqual(channel.consumer_tags, ['travis-ci'])
+
+        self.deliver(channel, b'hello world', delivery_tag=1)
+        self.deliver(channel, b'', delivery_tag=2)
+
+        messages = []
+        async for message in channel.build_inbound_messages():
+            messages.append(message)
+            if len(messages) == 2:
+                break
+
+        self.assertIsInstance(messages[0], Message)
+        self.assertEqual(messages[0].body, 'hello world')
+        self.assertEqual(messages[0].delivery_tag, 1)
+        self.assertFalse(messages[1].body)
+        self.assertEqual(messages[1].delivery_tag, 2)
+
+    async def test_channel_consume_waits_for_messages(self):
+        channel = self.create_channel()
+        await self.consume(channel)
+
+        async def get_first_message():
+            async for message in channel.build_inbound_messages(
+                    to_tuple=True):
+                return message
+
+        task = asyncio.ensure_future(get_first_message())
+        await asyncio.sleep(0)
+        self.assertFalse(task.done())
+
+        self.deliver(channel, b'hello world')
+        body, _, method, _ = await task
+        self.assertEqual(body, b'hello world')
+        self.assertEqual(method['consumer_tag'], 'travis-ci')
+
+    async def test_channel_consume_ends_when_cancelled(self):
+        self.disable_logging_validation()
+        channel = self.create_channel()
+        await self.consume(channel)
+
+        async def get_messages():
+            return [
+                message async for message in channel.build_inbound_messages()
+            ]
+
+        task = asyncio.ensure_future(get_messages())
+        self.deliver(channel, b'hello world')
+        await asyncio.sleep(0)
+        channel._connection._on_data(pamqp_frame.marshal(
+            commands.Basic.Cancel(consumer_tag='travis-ci'), 1
+        ))
+
+        messages = await asyncio.wait_for(task, 1)
+        self.assertEqual(len(messages), 1)
+        self.assertFalse(channel.consumer_tags)
+
+    async def test_channel_consume_ends_when_closed(self):
+        channel = self.create_channel()
+        await self.consume(channel)
+
+        async def get_messages():
+            return [
+                message async for message in channel.build_inbound_messages()
+            ]
+
+        task = asyncio.ensure_future(get_messages())
+        await asyncio.sleep(0)
+        close = asyncio.ensure_future(channel.close())
+        await asyncio.sleep(0)
+        channel._connection._on_data(
+            pamqp_frame.marshal(commands.Channel.CloseOk(), 1)
+        )
+        await close
+
+        self.assertEqual(await asyncio.wait_for(task, 1), [])
+
+    async def test_channel_start_consuming(self):
+        channel = self.create_channel()
+        received = []
+
+        async def on_message(message):
+            received.append(message.body)
+            message.ack()
+            await channel.basic.cancel('travis-ci')
+
+        await self.consume(channel, on_message)
+        self.deliver(channel, b'hello world')
+
+        task = asyncio.ensure_future(channel.start_consuming())
+        for _ in range(10):
+            await asyncio.sleep(0)
+            frames = channel._connection._transport.get_frames()
+            if frames and isinstance(frames[-1][1], commands.Basic.Cancel):
+                break
+        channel._connection._on_data(pamqp_frame.marshal(
+            commands.Basic.CancelOk(consumer_tag='travis-ci'), 1
+        ))
+        await asyncio.wait_for(task, 1)
+
+        self.assertEqual(received, ['hello world'])
+        self.assertIsInstance(frames[0][1], commands.Basic.Ack)
+
+    async def test_channel_start_consuming_no_callback(self):
+        channel = self.create_channel()
+
+        with self.assertRaisesRegex(AMQPChannelError,
+                                    'no consumer callback defined'):
+            await channel.start_consuming()
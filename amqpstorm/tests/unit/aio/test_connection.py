@@ -0,0 +1,278 @@
+import asyncio
+import ssl
+import unittest
+
+from pamqp import commands
+from pamqp import frame as pamqp_frame
+from pamqp import heartbeat as pamqp_heartbeat
+
+from amqpstorm.aio import AsyncChannel
+from amqpstorm.aio import AsyncConnection
+from amqpstorm.aio.connection import _LoopTimer
+from amqpstorm.exception import AMQPConnectionError
+from amqpstorm.exception import AMQPInvalidArgument
+from amqpstorm.tests.utility import FakeTransport
+from amqpstorm.tests.utility import TestFramework
+
+
+class FakeBroker(asyncio.Protocol):
+    """Minimal broker that negotiates, and closes connections."""
+
+    def __init__(self):
+        self.transport = None
+        self.buffer = b''
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def data_received(self, data):
+        self.buffer += data
+        if self.buffer.startswith(b'AMQP'):
+            self.buffer = self.buffer[8:]
+            self.write(commands.Connection.Start(mechanisms='PLAIN'))
+        while self.buffer:
+            try:
+                byte_count, _, frame_in = pamqp_frame.unmarshal(self.buffer)
+            except Exception:
+                return
+            self.buffer = self.buffer[byte_count:]
+            if frame_in.name == 'Connection.StartOk':
+                self.write(commands.Connection.Tune(
+                    channel_max=16, frame_max=4096, heartbeat=0
+                ))
+            elif frame_in.name == 'Connection.Open':
+                self.write(commands.Connection.OpenOk())
+            elif frame_in.name == 'Connection.Close':
+                self.write(commands.Connection.CloseOk())
+
+    def write(self, frame_out):
+        self.transport.write(pamqp_frame.marshal(frame_out, 0))
+
+
+class AsyncConnectionTests(TestFramework, unittest.IsolatedAsyncioTestCase):
+
+    def create_connection(self):
+        connection = AsyncConnection('localhost', 'guest', 'guest',
+                                     heartbeat=0)
+        connection._transport = FakeTransport()
+        connection.set_state(connection.OPEN)
+        return connection
+
+    async def test_connection_open_and_close(self):
+        loop = asyncio.get_running_loop()
+        server = await loop.create_server(FakeBroker, '127.0.0.1', 0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            async with AsyncConnection('127.0.0.1', 'guest', 'guest',
+                                       port=port, heartbeat=0) as connection:
+                self.assertTrue(connection.is_open)
+                self.assertEqual(connection.max_allowed_channels, 16)
+                self.assertEqual(connection.max_frame_size, 4096)
+            self.assertTrue(connection.is_closed)
+            self.assertFalse(connection.exceptions)
+        finally:
+            server.close()
+            await server.wait_closed()
+
+    async def test_connection_open_refused(self):
+        loop = asyncio.get_running_loop()
+        server = await loop.create_server(asyncio.Protocol, '127.0.0.1', 0)
+        port = server.sockets[0].getsockname()[1]
+        server.close()
+        await server.wait_closed()
+
+        connection = AsyncConnection('127.0.0.1', 'guest', 'guest',
+                                     port=port)
+        with self.assertRaisesRegex(AMQPConnectionError,
+                                    'Could not connect'):
+            await connection.open()
+        self.assertTrue(connection.is_closed)
+
+    async def test_connection_invalid_parameters(self):
+        self.assertRaisesRegex(
+            AMQPInvalidArgument, 'port should be an integer',
+            AsyncConnection, 'localhost', 'guest', 'guest', port='5672'
+        )
+        self.assertRaisesRegex(
+            AMQPInvalidArgument, 'heartbeat should be an integer',
+            AsyncConnection, 'localhost', 'guest', 'guest', heartbeat='60'
+        )
+
+    async def test_connection_ssl_options(self):
+        connection = AsyncConnection(
+            'localhost', 'guest', 'guest', ssl=True,
+            ssl_options={'verify_mode': 'none', 'server_hostname': 'travis'}
+        )
+
+        kwargs = connection._ssl_kwargs()
+
+        self.assertEqual(kwargs['server_hostname'], 'travis')
+        self.assertEqual(kwargs['ssl'].verify_mode, ssl.CERT_NONE)
+        self.assertFalse(kwargs['ssl'].check_hostname)
+
+    async def test_connection_ssl_defaults_are_secure(self):
+        connection = AsyncConnection('localhost', 'guest', 'guest', ssl=True)
+
+        kwargs = connection._ssl_kwargs()
+
+        self.assertEqual(kwargs['server_hostname'], 'localhost')
+        self.assertEqual(kwargs['ssl'].verify_mode, ssl.CERT_REQUIRED)
+        self.assertTrue(kwargs['ssl'].check_hostname)
+
+    async def test_connection_ssl_loads_ca_certs(self):
+        connection = AsyncConnection(
+            'localhost', 'guest', 'guest', ssl=True,
+            ssl_options={'ca_certs': '/dev/null/travis-ci.pem'}
+        )
+
+        self.assertRaises(OSError, connection._ssl_kwargs)
+
+    async def test_connection_channel_when_closed(self):
+        connection = AsyncConnection('localhost', 'guest', 'guest')
+
+        with self.assertRaisesRegex(AMQPConnectionError,
+                                    'connection closed'):
+            await connection.channel()
+
+    async def test_connection_channel(self):
+        connection = self.create_connection()
+
+        task = asyncio.ensure_future(connection.channel())
+        await asyncio.sleep(0)
+        channel_id, frame_out = connection._transport.get_frames()[0]
+        self.assertEqual(channel_id, 1)
+        self.assertIsInstance(frame_out, commands.Channel.Open)
+
+        connection._on_data(pamqp_frame.marshal(commands.Channel.OpenOk(), 1))
+        channel = await task
+
+        self.assertIsInstance(channel, AsyncChannel)
+        self.assertTrue(channel.is_open)
+        self.assertIs(connection.channels[1], channel)
+
+    async def test_connection_buffers_partial_frames(self):
+        connection = self.create_connection()
+        data_in = b''.join([
+            pamqp_frame.marshal(commands.Connection.Blocked('travis-ci'), 0),
+            pamqp_frame.marshal(commands.Connection.Unblocked(), 0),
+        ])
+
+        connection._on_data(data_in[:5])
+        self.assertFalse(connection.is_blocked)
+        self.assertEqual(len(connection._buffer), 5)
+
+        connection._on_data(data_in[5:-3])
+        self.assertTrue(connection.is_blocked)
+        self.assertEqual(self.get_last_log(),
+                         'Connection is blocked by remote server: travis-ci')
+
+        connection._on_data(data_in[-3:])
+        self.assertFalse(connection.is_blocked)
+        self.assertFalse(connection._buffer)
+
+    async def test_connection_remote_close(self):
+        self.disable_logging_validation()
+        connection = self.create_connection()
+        channel = AsyncChannel(1, connection, 360)
+        channel.set_state(channel.OPEN)
+        connection._channels[1] = channel
+
+        connection._on_data(pamqp_frame.marshal(
+            commands.Connection.Close(reply_code=320,
+                                      reply_text='travis-ci',
+                                      class_id=0, method_id=0), 0
+        ))
+
+        self.assertTrue(connection.is_closed)
+        self.assertTrue(channel.is_closed)
+        self.assertFalse(connection.channels)
+        self.assertTrue(connection._transport.closed)
+        self.assertRaisesRegex(
+            AMQPConnectionError,
+            'Connection was closed by remote server: travis-ci',
+            connection.check_for_errors
+        )
+
+    async def test_connection_lost_wakes_up_rpc_requests(self):
+        connection = self.create_connection()
+        channel = AsyncChannel(1, connection, 360)
+        channel.set_state(channel.OPEN)
+        connection._channels[1] = channel
+
+        task = asyncio.ensure_future(channel.queue.declare('travis-ci'))
+        await asyncio.sleep(0)
+        connection._on_connection_lost(ConnectionResetError())
+
+        with self.assertRaisesRegex(AMQPConnectionError,
+                                    'connection was closed by remote server'):
+            await task
+        self.assertTrue(channel.is_closed)
+
+    async def test_connection_close(self):
+        connection = self.create_connection()
+        transport = connection._transport
+
+        task = asyncio.ensure_future(connection.close())
+        await asyncio.sleep(0)
+        self.assertIsInstance(transport.get_frames()[0][1],
+                              commands.Connection.Close)
+        connection._on_data(
+            pamqp_frame.marshal(commands.Connection.CloseOk(), 0)
+        )
+        await task
+
+        self.assertTrue(connection.is_closed)
+        self.assertTrue(transport.closed)
+        self.assertIsNone(connection._transport)
+
+    async def test_connection_drain(self):
+        connection = self.create_connection()
+        connection._writable.clear()
+
+        task = asyncio.ensure_future(connection.drain())
+        await asyncio.sleep(0)
+        self.assertFalse(task.done())
+
+        connection._writable.set()
+        await task
+
+    async def test_connection_write_when_closed(self):
+        connection = self.create_connection()
+        connection._transport.closed = True
+
+        self.assertRaisesRegex(
+            AMQPConnectionError, 'connection closed',
+            connection.write_frame, 0, pamqp_heartbeat.Heartbeat()
+        )
+        self.assertTrue(connection.is_closed)
+
+    async def test_connection_heartbeat_dead_closes_connection(self):
+        connection = self.create_connection()
+        channel = AsyncChannel(1, connection, 360)
+        channel.set_state(channel.OPEN)
+        connection._channels[1] = channel
+        connection.heartbeat._interval = 0.01
+        connection.heartbeat.start(connection.exceptions)
+
+        for _ in range(100):
+            if connection.is_closed:
+                break
+            await asyncio.sleep(0.01)
+
+        self.assertTrue(connection.is_closed)
+        self.assertTrue(channel.is_closed)
+        self.assertRaisesRegex(AMQPConnectionError, 'Connection dead',
+                               channel.check_for_errors)
+
+    async def test_connection_loop_timer(self):
+        called = asyncio.Event()
+        timer = _LoopTimer(0.01, called.set)
+        timer.start()
+        await asyncio.wait_for(called.wait(), 1)
+
+        called.clear()
+        timer = _LoopTimer(0.01, called.set)
+        timer.start()
+        timer.cancel()
+        await asyncio.sleep(0.05)
+        self.assertFalse(called.is_set())
@@ -8,9 +8,11 @@ from pamqp.body import ContentBody
 from pamqp.header import ContentHeader
 
 from amqpstorm import Message
+from amqpstorm.base import BaseMessage
 from amqpstorm.channel import Basic
 from amqpstorm.channel import Channel
 from amqpstorm.compatibility import RANGE
+from amqpstorm.confirm import ConfirmTracker
 from amqpstorm.exception import AMQPChannelError
 from amqpstorm.tests.utility import FakeConnection
 from amqpstorm.tests.utility import TestFramework
@@ -48,6 +50,23 @@ class BasicTests(TestFramework):
         self.assertFalse(channel.rpc._response)
         self.assertEqual(result.body, message.decode('utf-8'))
 
+    def test_basic_get_custom_message_impl_coalesced_acks(self):
+        def on_get_frame(*_):
+            channel.rpc.on_frame(commands.Basic.GetOk(delivery_tag=7))
+            channel.rpc.on_frame(ContentHeader(body_size=2))
+            channel.rpc.on_frame(ContentBody(value=b'hi'))
+
+        connection = FakeConnection(on_write=on_get_frame)
+        channel = Channel(9, connection, 1)
+        channel.set_state(Channel.OPEN)
+        channel.coalesce_acks(flush_interval=60)
+
+        result = channel.basic.get(queue='travis-ci', message_impl=BaseMessage)
+
+        self.assertEqual(result.delivery_tag, 7)
+        self.assertEqual(channel._acks._lowest_outstanding(), 7)
+        channel._acks.clear()
+
     def test_basic_get_to_dict(self):
         message = self.message.encode('utf-8')
         message_len = len(message)
@@ -224,6 +243,117 @@ class BasicTests(TestFramework):
         self.assertFalse(basic.publish(body=self.message,
                                        routing_key='travis-ci'))
 
+    def test_basic_publish_confirms_async(self):
+        connection = FakeConnection()
+        channel = Channel(9, connection, 1)
+        channel._confirming_deliveries = True
+        channel._confirms = ConfirmTracker()
+        channel.set_state(Channel.OPEN)
+        basic = Basic(channel)
+
+        future_1 = basic.publish(body=self.message, routing_key='travis-ci')
+        future_2 = basic.publish(body=self.message, routing_key='travis-ci')
+        self.assertEqual(len(connection.frames_out), 2)
+        self.assertFalse(future_1.done())
+
+        channel.on_frame(commands.Basic.Ack(delivery_tag=1))
+        channel.on_frame(commands.Basic.Nack(delivery_tag=2))
+
+        self.assertTrue(future_1.result())
+        self.assertFalse(future_2.result())
+
+    def test_basic_publish_batch(self):
+        connection = FakeConnection()
+        channel = Channel(9, connection, 1)
+        channel.set_state(Channel.OPEN)
+        basic = Basic(channel)
+
+        self.assertIsNone(basic.publish_batch([
+            (self.message, 'travis-ci'),
+            {'body': self.message, 'routing_key': 'travis-ci-2',
+             'properties': {'delivery_mode': 2}},
+        ]))
+
+        self.assertEqual(len(connection.frames_out), 1)
+        channel_id, frames_out = connection.frames_out[0]
+        self.assertEqual(channel_id, 9)
+        self.assertEqual(len(frames_out), 6)
+        self.assertIsInstance(frames_out[0], commands.Basic.Publish)
+        self.assertEqual(frames_out[0].routing_key, 'travis-ci')
+        self.assertIsInstance(frames_out[3], commands.Basic.Publish)
+        self.assertEqual(frames_out[3].routing_key, 'travis-ci-2')
+        self.assertEqual(frames_out[4].properties.delivery_mode, 2)
+
+    def test_basic_publish_batch_empty(self):
+        connection = FakeConnection()
+        channel = Channel(9, connection, 1)
+        channel.set_state(Channel.OPEN)
+        basic = Basic(channel)
+
+        self.assertIsNone(basic.publish_batch([]))
+        self.assertFalse(connection.frames_out)
+
+    def test_basic_publish_batch_confirms(self):
+        def on_publish_batch(*_):
+            channel.rpc.on_frame(commands.Basic.Ack(delivery_tag=1))
+            channel.rpc.on_frame(commands.Basic.Nack(delivery_tag=2))
+            channel.rpc.on_frame(commands.Basic.Ack(delivery_tag=4,
+                                                    multiple=True))
+
+        connection = FakeConnection(on_write=on_publish_batch)
+        channel = Channel(9, connection, 1)
+        channel._confirming_deliveries = True
+        channel.set_state(Channel.OPEN)
+        basic = Basic(channel)
+
+        self.assertEqual(
+            basic.publish_batch([(self.message, 'travis-ci')] * 4),
+            [True, False, True, True]
+        )
+        self.assertEqual(len(connection.frames_out), 1)
+        self.assertEqual(channel._delivery_tag, 4)
+
+    def test_basic_publish_batch_confirms_after_publish(self):
+        def on_publish(_, frames_out):
+            if len(frames_out) == 3:
+                channel.rpc.on_frame(commands.Basic.Ack(delivery_tag=1))
+                return
+            channel.rpc.on_frame(commands.Basic.Nack(delivery_tag=2))
+            channel.rpc.on_frame(commands.Basic.Ack(delivery_tag=3))
+
+        connection = FakeConnection(on_write=on_publish)
+        channel = Channel(9, connection, 1)
+        channel._confirming_deliveries = True
+        channel.set_state(Channel.OPEN)
+        basic = Basic(channel)
+
+        self.assertTrue(basic.publish(self.message, 'travis-ci'))
+        self.assertEqual(
+            basic.publish_batch([(self.message, 'travis-ci')] * 2),
+            [False, True]
+        )
+        self.assertEqual(channel._delivery_tag, 3)
+
+    def test_basic_publish_batch_confirms_async(self):
+        connection = FakeConnection()
+        channel = Channel(9, connection, 1)
+        channel._confirming_deliveries = True
+        channel._confirms = ConfirmTracker()
+        channel.set_state(Channel.OPEN)
+        basic = Basic(channel)
+
+        basic.publish(body=self.message, routing_key='travis-ci')
+        futures = basic.publish_batch([(self.message, 'travis-ci')] * 3)
+        self.assertEqual(len(connection.frames_out), 2)
+        self.assertEqual(len(futures), 3)
+        self.assertEqual(channel._confirms.in_flight, 4)
+
+        channel.on_frame(commands.Basic.Ack(delivery_tag=3, multiple=True))
+        channel.on_frame(commands.Basic.Nack(delivery_tag=4))
+
+        self.assertEqual([future.result() for future in futures],
+                         [True, True, False])
+
     def test_basic_create_content_body(self):
         basic = Basic(None)
 
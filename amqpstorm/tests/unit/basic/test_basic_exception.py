@@ -4,6 +4,7 @@ from pamqp.body import ContentBody
 from amqpstorm import Channel
 from amqpstorm import exception
 from amqpstorm.basic import Basic
+from amqpstorm.confirm import ConfirmTracker
 from amqpstorm.tests.utility import FakeConnection
 from amqpstorm.tests.utility import TestFramework
 
@@ -275,6 +276,60 @@ class BasicExceptionTests(TestFramework):
             routing_key='travis-ci'
         )
 
+    def test_basic_publish_confirms_async_raises_on_max_in_flight(self):
+        connection = FakeConnection()
+        channel = Channel(9, connection, 0.01)
+        channel._confirming_deliveries = True
+        channel._confirms = ConfirmTracker(max_in_flight=1)
+        channel.set_state(Channel.OPEN)
+        basic = Basic(channel)
+
+        basic.publish(body=self.message, routing_key='travis-ci')
+
+        self.assertRaisesRegex(
+            exception.AMQPChannelError,
+            r'publisher confirms took too long \(1 in flight\)',
+            basic.publish, body=self.message,
+            routing_key='travis-ci'
+        )
+        self.assertEqual(channel._confirms.delivery_tag, 1)
+
+    def test_basic_publish_batch_invalid_parameters(self):
+        channel = Channel(0, FakeConnection(), 360)
+        channel.set_state(Channel.OPEN)
+        basic = Basic(channel)
+
+        self.assertRaisesRegex(
+            exception.AMQPInvalidArgument,
+            'messages should be a list or tuple',
+            basic.publish_batch, 'travis-ci'
+        )
+        self.assertRaisesRegex(
+            exception.AMQPInvalidArgument,
+            'messages should only contain tuples or dicts',
+            basic.publish_batch, ['travis-ci']
+        )
+        self.assertRaisesRegex(
+            exception.AMQPInvalidArgument,
+            'routing_key should be a string',
+            basic.publish_batch, [(self.message, None)]
+        )
+
+    def test_basic_publish_batch_confirms_async_rolls_back_on_error(self):
+        connection = FakeConnection(FakeConnection.CLOSED)
+        channel = Channel(9, connection, 0.01)
+        channel._confirming_deliveries = True
+        channel._confirms = ConfirmTracker()
+        channel.set_state(Channel.OPEN)
+        basic = Basic(channel)
+
+        self.assertRaises(
+            exception.AMQPConnectionError,
+            basic.publish_batch, [(self.message, 'travis-ci')] * 2
+        )
+        self.assertEqual(channel._confirms.delivery_tag, 0)
+        self.assertEqual(channel._confirms.in_flight, 0)
+
     def test_basic_publish_confirms_raises_on_invalid_frame(self):
         def on_publish_return_invalid_frame(*_):
             channel.rpc.on_frame(commands.Basic.Cancel())
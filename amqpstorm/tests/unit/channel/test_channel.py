@@ -4,6 +4,7 @@ from pamqp import commands
 
 from amqpstorm import Channel
 from amqpstorm.basic import Basic
+from amqpstorm.confirm import ConfirmTracker
 from amqpstorm.exception import AMQPChannelError
 from amqpstorm.exchange import Exchange
 from amqpstorm.queue import Queue
@@ -164,6 +165,62 @@ class ChannelTests(TestFramework):
         self.assertEqual(channel.confirm_deliveries(), {})
         self.assertTrue(channel.confirming_deliveries)
 
+    def test_channel_confirm_deliveries_async(self):
+        def on_select_ok(*_):
+            channel.rpc.on_frame(commands.Confirm.SelectOk())
+
+        connection = FakeConnection(on_write=on_select_ok)
+        channel = Channel(0, connection, 0.01)
+        channel.set_state(Channel.OPEN)
+
+        self.assertEqual(
+            channel.confirm_deliveries(asynchronous=True, max_in_flight=10),
+            {}
+        )
+        self.assertTrue(channel.confirming_deliveries)
+        self.assertEqual(channel._confirms.max_in_flight, 10)
+
+    def test_channel_wait_for_confirms(self):
+        channel = Channel(0, FakeConnection(), 0.01)
+        channel.set_state(Channel.OPEN)
+        channel._confirms = ConfirmTracker()
+        future = channel._confirms.register()
+
+        channel.on_frame(commands.Basic.Ack(delivery_tag=1))
+        channel.wait_for_confirms()
+
+        self.assertTrue(future.result())
+
+    def test_channel_wait_for_confirms_not_enabled(self):
+        channel = Channel(0, FakeConnection(), 0.01)
+        channel.set_state(Channel.OPEN)
+
+        self.assertIsNone(channel.wait_for_confirms())
+
+    def test_channel_close_fails_pending_confirms(self):
+        channel = Channel(0, FakeConnection(FakeConnection.CLOSED), 360)
+        channel.set_state(Channel.OPEN)
+        channel._confirms = ConfirmTracker()
+        future = channel._confirms.register()
+
+        channel.close()
+
+        self.assertRaisesRegex(AMQPChannelError, 'channel closed',
+                               future.result)
+
+    def test_channel_remote_close_fails_pending_confirms(self):
+        channel = Channel(0, FakeConnection(), 360)
+        channel.set_state(Channel.OPEN)
+        channel._confirms = ConfirmTracker()
+        future = channel._confirms.register()
+
+        close_frame = commands.Channel.Close(reply_code=404,
+                                             reply_text='travis-ci')
+        channel._close_channel(close_frame)
+
+        self.assertRaisesRegex(AMQPChannelError, 'travis-ci',
+                               future.result)
+
     def test_channel_close_channel(self):
         channel = Channel(0, FakeConnection(), 360)
 
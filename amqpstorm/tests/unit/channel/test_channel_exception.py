@@ -27,6 +27,26 @@ class ChannelExceptionTests(TestFramework):
             channel.close, 200, 200
         )
 
+    def test_channel_invalid_confirm_deliveries_parameter(self):
+        channel = Channel(0, mock.Mock(name='Connection'), 360)
+
+        self.assertRaisesRegex(
+            AMQPInvalidArgument,
+            'asynchronous should be a boolean',
+            channel.confirm_deliveries, 'travis-ci'
+        )
+        self.assertRaisesRegex(
+            AMQPInvalidArgument,
+            'max_in_flight should be a positive integer or None',
+            channel.confirm_deliveries, True, 'travis-ci'
+        )
+        self.assertRaisesRegex(
+            AMQPInvalidArgument,
+            'max_in_flight should be a positive integer or None',
+            channel.confirm_deliveries, True, 0
+        )
+        self.assertFalse(channel.confirming_deliveries)
+
     def test_chanel_callback_not_set(self):
         channel = Channel(0, mock.Mock(name='Connection'), 360)
 
@@ -33,6 +33,27 @@ class ChannelFrameTests(TestFramework):
             self.assertIsInstance(msg.body, str)
             self.assertEqual(msg.body.encode('utf-8'), message)
 
+    def test_channel_content_frames_signal_complete_message(self):
+        channel = Channel(0, FakeConnection(), rpc_timeout=1)
+        channel.set_state(channel.OPEN)
+
+        channel.on_frame(commands.Basic.Deliver())
+        self.assertFalse(channel._inbound_ready.is_set())
+        channel.on_frame(ContentHeader(body_size=10))
+        self.assertFalse(channel._inbound_ready.is_set())
+        channel.on_frame(ContentBody(value=b'12345'))
+        self.assertFalse(channel._inbound_ready.is_set())
+        channel.on_frame(ContentBody(value=b'67890'))
+        self.assertTrue(channel._inbound_ready.is_set())
+
+    def test_channel_content_frames_signal_empty_body(self):
+        channel = Channel(0, FakeConnection(), rpc_timeout=1)
+        channel.set_state(channel.OPEN)
+
+        channel.on_frame(commands.Basic.Deliver())
+        channel.on_frame(ContentHeader(body_size=0))
+        self.assertTrue(channel._inbound_ready.is_set())
+
     def test_channel_basic_cancel_frame(self):
         connection = amqpstorm.Connection('localhost', 'guest', 'guest',
                                           lazy=True)
@@ -1,5 +1,6 @@
 import collections
 import threading
+import time
 
 from unittest import mock
 from pamqp.header import ContentHeader
@@ -9,7 +10,9 @@ from pamqp.body import ContentBody
 
 from amqpstorm import AMQPChannelError
 from amqpstorm import AMQPConnectionError
+from amqpstorm import AMQPInvalidArgument
 from amqpstorm import Channel
+from amqpstorm import LazyMessage
 from amqpstorm import Message
 from amqpstorm.tests.utility import FakeConnection
 from amqpstorm.tests.utility import TestFramework
@@ -49,6 +52,25 @@ class ChannelBuildMessageTests(TestFramework):
         self.assertIsInstance(result.body, str)
         self.assertEqual(result.body, message.decode('utf-8'))
 
+    def test_channel_build_lazy_message(self):
+        channel = Channel(0, mock.Mock(name='Connection'), 360)
+
+        message = self.message.encode('utf-8')
+
+        deliver = commands.Basic.Deliver(delivery_tag=2)
+        header = ContentHeader(body_size=len(message))
+        body = ContentBody(value=message)
+
+        channel._inbound = collections.deque([deliver, header, body])
+        result = channel._build_message(auto_decode=True,
+                                        message_impl=LazyMessage)
+
+        self.assertIsInstance(result, LazyMessage)
+        self.assertIs(result._method_frame, deliver)
+        self.assertIs(result._properties_frame, header.properties)
+        self.assertEqual(result.delivery_tag, 2)
+        self.assertEqual(result.body, message.decode('utf-8'))
+
     def test_channel_build_out_of_order_message_deliver(self):
         channel = Channel(0, mock.Mock(name='Connection'), 360)
 
@@ -213,7 +235,7 @@ class ChannelBuildMessageTests(TestFramework):
         monotonic = mock.Mock(side_effect=[0.0, 1.5])
 
         with mock.patch('amqpstorm.channel.time.monotonic', monotonic), \
-                mock.patch('amqpstorm.channel.time.sleep'):
+                mock.patch.object(channel, '_wait_for_inbound'):
             messages = list(
                 channel.build_inbound_messages(break_on_empty=True)
             )
@@ -236,17 +258,17 @@ class ChannelBuildMessageTests(TestFramework):
         header = ContentHeader(body_size=message_len)
         body = ContentBody(value=message)
 
-        state = {'sleeps': 0}
+        state = {'waits': 0}
 
-        def fake_sleep(_):
-            state['sleeps'] += 1
-            if state['sleeps'] == 1:
+        def fake_wait(_):
+            state['waits'] += 1
+            if state['waits'] == 1:
                 channel._inbound.extend([deliver, header, body])
 
         monotonic = mock.Mock(side_effect=[0.0, 0.5, 1.5])
 
         with mock.patch('amqpstorm.channel.time.monotonic', monotonic), \
-                mock.patch('amqpstorm.channel.time.sleep', fake_sleep):
+                mock.patch.object(channel, '_wait_for_inbound', fake_wait):
             messages = list(
                 channel.build_inbound_messages(break_on_empty=True)
             )
@@ -270,7 +292,7 @@ class ChannelBuildMessageTests(TestFramework):
         monotonic = mock.Mock(side_effect=[0.0, 1.5])
 
         with mock.patch('amqpstorm.channel.time.monotonic', monotonic), \
-                mock.patch('amqpstorm.channel.time.sleep'):
+                mock.patch.object(channel, '_wait_for_inbound'):
             messages = list(
                 channel.build_inbound_messages(break_on_empty=True)
             )
@@ -303,6 +325,54 @@ class ChannelBuildMessageTests(TestFramework):
 
         self.assertFalse(channel._inbound)
 
+    def test_channel_build_message_body_wakes_up_on_frame(self):
+        channel = Channel(0, FakeConnection(), 360)
+        channel.set_state(Channel.OPEN)
+        channel.on_frame(commands.Basic.Deliver())
+        channel.on_frame(ContentHeader(body_size=len(self.message)))
+        channel._inbound.clear()
+
+        def add_body():
+            channel.on_frame(ContentBody(value=self.message.encode('utf-8')))
+
+        threading.Timer(function=add_body, interval=0.05).start()
+
+        with mock.patch('amqpstorm.channel.ERROR_CHECK_INTERVAL', 10):
+            result = channel._build_message_body(len(self.message))
+
+        self.assertEqual(result, self.message.encode('utf-8'))
+
+    def test_channel_build_inbound_messages_wakes_up_on_message(self):
+        channel = Channel(0, FakeConnection(), 360)
+        channel.set_state(Channel.OPEN)
+        message = self.message.encode('utf-8')
+
+        def add_message():
+            channel.on_frame(commands.Basic.Deliver())
+            channel.on_frame(ContentHeader(body_size=len(message)))
+            channel.on_frame(ContentBody(value=message))
+
+        threading.Timer(function=add_message, interval=0.05).start()
+
+        with mock.patch('amqpstorm.channel.ERROR_CHECK_INTERVAL', 10):
+            generator = channel.build_inbound_messages()
+            self.assertEqual(next(generator).body, self.message)
+
+    def test_channel_build_inbound_messages_wakes_up_on_cancel(self):
+        channel = Channel(0, FakeConnection(), 360)
+        channel.set_state(Channel.OPEN)
+        channel.add_consumer_tag('travis-ci')
+
+        threading.Timer(function=channel.remove_consumer_tag,
+                        interval=0.05).start()
+
+        with mock.patch('amqpstorm.channel.ERROR_CHECK_INTERVAL', 10):
+            messages = list(channel.build_inbound_messages(
+                break_on_empty=True, empty_timeout=10
+            ))
+
+        self.assertEqual(messages, [])
+
     def test_channel_build_inbound_messages_keeps_in_flight_on_cancel(self):
         channel = Channel(0, FakeConnection(), 360)
         channel.set_state(Channel.OPEN)
@@ -314,19 +384,19 @@ class ChannelBuildMessageTests(TestFramework):
         body = ContentBody(value=message)
         channel._inbound = collections.deque([deliver])
 
-        state = {'sleeps': 0}
+        state = {'waits': 0}
 
-        def fake_sleep(_):
-            state['sleeps'] += 1
-            if state['sleeps'] == 1:
+        def fake_wait(_):
+            state['waits'] += 1
+            if state['waits'] == 1:
                 channel.remove_consumer_tag()
-            elif state['sleeps'] == 2:
+            elif state['waits'] == 2:
                 channel._inbound.append(header)
                 channel._inbound.append(body)
-            elif state['sleeps'] >= 3:
+            elif state['waits'] >= 3:
                 channel.set_state(Channel.CLOSED)
 
-        with mock.patch('amqpstorm.channel.time.sleep', fake_sleep):
+        with mock.patch.object(channel, '_wait_for_inbound', fake_wait):
             messages = list(
                 channel.build_inbound_messages(break_on_empty=True)
             )
@@ -736,3 +806,125 @@ class ChannelStartConsumingTests(TestFramework):
         channel._consumer_callbacks['travis-ci-3'] = callback_three
 
         channel.start_consuming()
+
+    @staticmethod
+    def create_deliveries(consumer_tags):
+        frames = []
+        for index, consumer_tag in enumerate(consumer_tags):
+            body = str(index).encode('utf-8')
+            frames.extend([
+                commands.Basic.Deliver(consumer_tag=consumer_tag,
+                                       delivery_tag=index + 1),
+                ContentHeader(body_size=len(body)),
+                ContentBody(value=body),
+            ])
+        return collections.deque(frames)
+
+    def test_channel_start_consuming_workers(self):
+        channel = Channel(0, FakeConnection(), 360)
+        channel.set_state(channel.OPEN)
+        channel._inbound = self.create_deliveries(['travis-ci'] * 4)
+        barrier = threading.Barrier(4, timeout=1)
+        threads = set()
+        consumed = []
+
+        def callback(msg):
+            threads.add(threading.current_thread())
+            barrier.wait()
+            consumed.append(msg.body)
+            if len(consumed) == 4:
+                channel.remove_consumer_tag('travis-ci')
+
+        channel.add_consumer_tag('travis-ci')
+        channel._consumer_callbacks['travis-ci'] = callback
+        channel.start_consuming(workers=4)
+
+        self.assertEqual(sorted(consumed), ['0', '1', '2', '3'])
+        self.assertEqual(len(threads), 4)
+        self.assertNotIn(threading.current_thread(), threads)
+
+    def test_channel_start_consuming_workers_ordered(self):
+        channel = Channel(0, FakeConnection(), 360)
+        channel.set_state(channel.OPEN)
+        channel._inbound = self.create_deliveries(
+            ['travis-ci-1', 'travis-ci-2'] * 10
+        )
+        consumed = collections.defaultdict(list)
+        running = collections.Counter()
+        lock = threading.Lock()
+
+        def callback(msg):
+            consumer_tag = msg.method['consumer_tag']
+            with lock:
+                running[consumer_tag] += 1
+                self.assertEqual(running[consumer_tag], 1)
+            time.sleep(0.001)
+            with lock:
+                running[consumer_tag] -= 1
+                consumed[consumer_tag].append(msg.delivery_tag)
+                if sum(map(len, consumed.values())) == 20:
+                    channel.remove_consumer_tag()
+
+        for consumer_tag in ('travis-ci-1', 'travis-ci-2'):
+            channel.add_consumer_tag(consumer_tag)
+            channel._consumer_callbacks[consumer_tag] = callback
+        channel.start_consuming(workers=4, ordered=True)
+
+        self.assertEqual(consumed['travis-ci-1'], list(range(1, 21, 2)))
+        self.assertEqual(consumed['travis-ci-2'], list(range(2, 21, 2)))
+
+    def test_channel_start_consuming_workers_to_tuple(self):
+        channel = Channel(0, FakeConnection(), 360)
+        channel.set_state(channel.OPEN)
+        channel._inbound = self.create_deliveries(['travis-ci'])
+        consumed = []
+
+        def callback(body, channel_, method, properties):
+            consumed.append((body, method['consumer_tag']))
+            channel.set_state(channel.CLOSED)
+
+        channel.add_consumer_tag('travis-ci')
+        channel._consumer_callbacks['travis-ci'] = callback
+        channel.start_consuming(to_tuple=True, workers=2)
+
+        self.assertEqual(consumed, [(b'0', 'travis-ci')])
+
+    def test_channel_start_consuming_workers_callback_raises(self):
+        channel = Channel(0, FakeConnection(), 360)
+        channel.set_state(channel.OPEN)
+        channel._inbound = self.create_deliveries(['travis-ci'] * 10)
+        consumed = []
+
+        def callback(msg):
+            consumed.append(msg.body)
+            raise ValueError('travis-ci')
+
+        channel.add_consumer_tag('travis-ci')
+        channel._consumer_callbacks['travis-ci'] = callback
+
+        self.assertRaisesRegex(
+            ValueError, 'travis-ci',
+            channel.start_consuming, workers=1
+        )
+        self.assertEqual(consumed, ['0'])
+        self.assertEqual(channel.consumer_tags, ['travis-ci'])
+
+    def test_channel_start_consuming_invalid_parameters(self):
+        channel = Channel(0, FakeConnection(), 360)
+        channel.set_state(channel.OPEN)
+        channel._consumer_callbacks['travis-ci'] = lambda _: None
+
+        self.assertRaisesRegex(
+            AMQPInvalidArgument,
+            'workers should be a positive integer or None',
+            channel.start_consuming, workers=0
+        )
+        self.assertRaisesRegex(
+            AMQPInvalidArgument,
+            'workers should be a positive integer or None',
+            channel.start_consuming, workers='1'
+        )
+        self.assertRaisesRegex(
+            AMQPInvalidArgument, 'ordered should be a boolean',
+            channel.start_consuming, workers=1, ordered='true'
+        )
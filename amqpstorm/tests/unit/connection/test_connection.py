@@ -17,6 +17,11 @@ from amqpstorm.tests.utility import TestFramework
 
 
 class ConnectionTests(TestFramework):
+    tune_frame = (
+        b'\x01\x00\x00\x00\x00\x00\x0c\x00\n\x00\x1e\x00\x00\x00'
+        b'\x02\x00\x00\x00<\xce'
+    )
+
     def test_connection_with_statement(self):
         with Connection('127.0.0.1', 'guest', 'guest', lazy=True) as con:
             self.assertIsInstance(con, Connection)
@@ -124,6 +129,50 @@ class ConnectionTests(TestFramework):
         data_in = connection._read_buffer(data_in)
         self.assertFalse(data_in)
 
+    def test_connection_read_buffer_keeps_partial_frame(self):
+        connection = Connection('127.0.0.1', 'guest', 'guest', lazy=True)
+        heartbeat_frame = b'\x08\x00\x00\x00\x00\x00\x00\xce'
+        data_in = bytearray(
+            heartbeat_frame + self.tune_frame + self.tune_frame[:10]
+        )
+
+        with mock.patch.object(connection._channel0, 'on_frame') as on_frame:
+            result = connection._read_buffer(data_in)
+
+        self.assertIs(result, data_in)
+        self.assertEqual(result, self.tune_frame[:10])
+        self.assertEqual(on_frame.call_count, 2)
+        self.assertIsInstance(on_frame.call_args[0][0],
+                              commands.Connection.Tune)
+
+        result += self.tune_frame[10:]
+        with mock.patch.object(connection._channel0, 'on_frame') as on_frame:
+            result = connection._read_buffer(result)
+
+        self.assertFalse(result)
+        on_frame.assert_called_once()
+
+    def test_connection_handle_amqp_frame_with_offset(self):
+        connection = Connection('127.0.0.1', 'guest', 'guest', lazy=True)
+        payload = bytearray(b'\x00' * 4 + self.tune_frame)
+
+        byte_count, channel_id, frame_in = (
+            connection._handle_amqp_frame(payload, offset=4)
+        )
+
+        self.assertEqual(byte_count, len(self.tune_frame))
+        self.assertEqual(channel_id, 0)
+        self.assertIsInstance(frame_in, commands.Connection.Tune)
+
+    def test_connection_handle_amqp_frame_incomplete(self):
+        connection = Connection('127.0.0.1', 'guest', 'guest', lazy=True)
+
+        for index in range(len(self.tune_frame)):
+            self.assertEqual(
+                connection._handle_amqp_frame(self.tune_frame[:index]),
+                (0, None, None)
+            )
+
     def test_connection_send_handshake(self):
         connection = Connection('127.0.0.1', 'guest', 'guest', lazy=True)
 
@@ -146,17 +195,19 @@ class ConnectionTests(TestFramework):
             b'\x02\x00\x00\x00<\xce'
         )
 
-        data_in, channel_id, frame_in = connection._handle_amqp_frame(payload)
+        byte_count, channel_id, frame_in = (
+            connection._handle_amqp_frame(payload)
+        )
 
-        self.assertEqual(data_in, b'')
+        self.assertEqual(byte_count, len(payload))
         self.assertEqual(channel_id, 0)
         self.assertIsInstance(frame_in, commands.Connection.Tune)
 
     def test_connection_handle_amqp_frame_none_returns_none(self):
         connection = Connection('127.0.0.1', 'guest', 'guest', lazy=True)
-        result = connection._handle_amqp_frame('')
+        result = connection._handle_amqp_frame(b'')
 
-        self.assertEqual(result[0], '')
+        self.assertEqual(result[0], 0)
         self.assertIsNone(result[1])
         self.assertIsNone(result[2])
 
@@ -170,9 +221,9 @@ class ConnectionTests(TestFramework):
         try:
             pamqp_frame.unmarshal = throw_error
 
-            result = connection._handle_amqp_frame('travis-ci')
+            result = connection._handle_amqp_frame(self.tune_frame)
 
-            self.assertEqual(result[0], 'travis-ci')
+            self.assertEqual(result[0], 0)
             self.assertIsNone(result[1])
             self.assertIsNone(result[2])
         finally:
@@ -205,9 +256,9 @@ class ConnectionTests(TestFramework):
         try:
             pamqp_frame.unmarshal = throw_error
 
-            result = connection._handle_amqp_frame('travis-ci')
+            result = connection._handle_amqp_frame(self.tune_frame)
 
-            self.assertEqual(result[0], 'travis-ci')
+            self.assertEqual(result[0], 0)
             self.assertIsNone(result[1])
             self.assertIsNone(result[2])
         finally:
@@ -239,9 +290,9 @@ class ConnectionTests(TestFramework):
         try:
             pamqp_frame.unmarshal = throw_error
 
-            result = connection._handle_amqp_frame('travis-ci')
+            result = connection._handle_amqp_frame(self.tune_frame)
 
-            self.assertEqual(result[0], 'travis-ci')
+            self.assertEqual(result[0], 0)
             self.assertIsNone(result[1])
             self.assertIsNone(result[2])
         finally:
@@ -459,15 +510,15 @@ class ConnectionTests(TestFramework):
 
     def test_connection_get_first_channel_id(self):
         connection = Connection('127.0.0.1', 'guest', 'guest', lazy=True)
-        self.assertEqual(connection._last_channel_id, None)
+        self.assertEqual(connection._channel_ids._next_channel_id, 1)
         self.assertEqual(
             connection._get_next_available_channel_id(), 1
         )
-        self.assertEqual(connection._last_channel_id, 1)
+        self.assertEqual(connection._channel_ids._next_channel_id, 2)
 
     def test_connection_get_channel_ids(self):
         connection = Connection('127.0.0.1', 'guest', 'guest', lazy=True)
-        self.assertEqual(connection._last_channel_id, None)
+        self.assertEqual(connection._channel_ids._next_channel_id, 1)
         channel = Channel(1, connection, 1)
         channel.set_state(channel.OPEN)
         connection._channels[1] = channel
@@ -480,7 +531,8 @@ class ConnectionTests(TestFramework):
             self.assertEqual(
                 channel_id, index
             )
-            self.assertEqual(connection._last_channel_id, index)
+            self.assertEqual(connection._channel_ids._next_channel_id,
+                             index + 1)
 
     def test_connection_avoid_conflicts_with_channel_ids(self):
         connection = Connection('127.0.0.1', 'guest', 'guest', lazy=True)
@@ -502,7 +554,7 @@ class ConnectionTests(TestFramework):
         self.assertEqual(
             last_channel_id, 301
         )
-        self.assertEqual(connection._last_channel_id, 301)
+        self.assertEqual(connection._channel_ids._next_channel_id, 302)
 
         channel = connection.channel(lazy=True)
         channel.set_state(channel.OPEN)
@@ -511,7 +563,7 @@ class ConnectionTests(TestFramework):
         self.assertEqual(
             last_channel_id, 65535
         )
-        self.assertEqual(connection._last_channel_id, 65535)
+        self.assertEqual(connection._channel_ids._next_channel_id, 65536)
 
     def test_connection_reuse_predictable(self):
         max_channels = 1024
@@ -610,6 +662,21 @@ class ConnectionTests(TestFramework):
         # We should now have three channels.
         self.assertEqual(3, len(connection._channels))
 
+    def test_connection_reuse_lowest_released_channel_id(self):
+        connection = Connection('127.0.0.1', 'guest', 'guest', lazy=True)
+        connection.set_state(connection.OPEN)
+
+        for _ in compatibility.RANGE(10):
+            channel = connection.channel(lazy=True)
+            channel.set_state(channel.OPEN)
+
+        connection._channels[7].set_state(Channel.CLOSED)
+        connection._cleanup_channel(3)
+
+        self.assertEqual(int(connection.channel(lazy=True)), 3)
+        self.assertEqual(int(connection.channel(lazy=True)), 7)
+        self.assertEqual(int(connection.channel(lazy=True)), 11)
+
     def test_connection_open_many_channels(self):
         connection = Connection('127.0.0.1', 'guest', 'guest', lazy=True)
         connection.set_state(connection.OPEN)
@@ -629,7 +696,8 @@ class ConnectionTests(TestFramework):
             channel.set_state(channel.OPEN)
             connection._channels[channel_id] = channel
 
-            self.assertEqual(connection._last_channel_id, index + 1)
+            self.assertEqual(connection._channel_ids._next_channel_id,
+                             index + 2)
 
         self.assertRaisesRegex(
             AMQPConnectionError,
@@ -1,7 +1,10 @@
 import ssl
 
+from amqpstorm import AMQPConnectionError
 from amqpstorm import AMQPInvalidArgument
+from amqpstorm import Channel
 from amqpstorm import Connection
+from amqpstorm.confirm import ConfirmTracker
 from amqpstorm.tests.utility import TestFramework
 
 
@@ -124,6 +127,14 @@ class ConnectionExceptionTests(TestFramework):
             Connection, '127.0.0.1', 'guest', 'guest', timeout=None, lazy=True
         )
 
+    def test_connection_invalid_poll_timeout(self):
+        self.assertRaisesRegex(
+            AMQPInvalidArgument,
+            'poll_timeout should be an integer or float',
+            Connection, '127.0.0.1', 'guest', 'guest', poll_timeout='1',
+            lazy=True
+        )
+
     def test_connection_invalid_timeout_on_channel(self):
         connection = Connection(
             '127.0.0.1', 'guest', 'guest', timeout=0.1,
@@ -135,3 +146,17 @@ class ConnectionExceptionTests(TestFramework):
             'rpc_timeout should be an integer',
             connection.channel, None
         )
+
+    def test_connection_io_error_fails_pending_confirms(self):
+        connection = Connection('127.0.0.1', 'guest', 'guest', lazy=True)
+        channel = Channel(1, connection, 360)
+        channel.set_state(Channel.OPEN)
+        channel._confirms = ConfirmTracker()
+        connection._channels[1] = channel
+        future = channel._confirms.register()
+
+        connection._io._on_error(AMQPConnectionError('travis-ci'))
+
+        self.assertRaisesRegex(AMQPConnectionError, 'travis-ci',
+                               future.result, 1)
+        self.assertEqual(len(connection.exceptions), 1)
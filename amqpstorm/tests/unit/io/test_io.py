@@ -1,11 +1,17 @@
+import select
 import socket
 import ssl
+import time
+import unittest
 
 from unittest import mock
 
 import amqpstorm.io
 from amqpstorm.exception import AMQPConnectionError
+from amqpstorm.io import EpollPoller
 from amqpstorm.io import IO
+from amqpstorm.io import Poller
+from amqpstorm.io import SelectPoller
 from amqpstorm.tests.utility import FakeConnection
 from amqpstorm.tests.utility import TestFramework
 
@@ -80,9 +86,14 @@ class IOTests(TestFramework):
         self.assertFalse(io.use_ssl)
 
         io.socket = mock.Mock(name='socket', spec=socket.socket)
-        io.socket.recv.return_value = '12345'
 
-        self.assertEqual(io._receive(), '12345')
+        def recv_into(buffer, _):
+            buffer[0:5] = b'12345'
+            return 5
+
+        io.socket.recv_into.side_effect = recv_into
+
+        self.assertEqual(io._receive(), b'12345')
 
     def test_io_simple_ssl_receive(self):
         connection = FakeConnection()
@@ -96,9 +107,13 @@ class IOTests(TestFramework):
         elif hasattr(ssl, 'SSLSocket'):
             io.socket = mock.Mock(name='socket', spec=ssl.SSLSocket)
 
-        io.socket.read.return_value = '12345'
+        def read(_, buffer):
+            buffer[0:5] = b'12345'
+            return 5
 
-        self.assertEqual(io._receive(), '12345')
+        io.socket.read.side_effect = read
+
+        self.assertEqual(io._receive(), b'12345')
 
     def test_io_simple_send_zero_bytes_sent(self):
         connection = FakeConnection()
@@ -114,6 +129,20 @@ class IOTests(TestFramework):
             connection.check_for_errors
         )
 
+    def test_io_ssl_send_waits_until_writable(self):
+        connection = FakeConnection()
+        connection.parameters['ssl'] = True
+        io = IO(connection.parameters, exceptions=connection.exceptions)
+        io.socket = mock.Mock(name='socket', spec=ssl.SSLSocket)
+        io.socket.send.side_effect = [ssl.SSLWantWriteError(), 2, 3]
+
+        with mock.patch.object(amqpstorm.io.select, 'select') as wait:
+            io.write_to_socket(b'12345')
+
+        wait.assert_called_once_with([], [io.socket], [], 30)
+        self.assertEqual(io.socket.send.call_count, 3)
+        self.assertEqual(connection.exceptions, [])
+
     def test_io_set_ssl_context(self):
         connection = FakeConnection()
         connection.parameters['ssl_options'] = {
@@ -246,3 +275,149 @@ class IOTests(TestFramework):
         finally:
             amqpstorm.io.socket.getaddrinfo = restore_func
             amqpstorm.io.socket.has_ipv6 = restore_has_ipv6
+
+    def test_io_create_poller(self):
+        connection = FakeConnection()
+        connection.parameters['poll_timeout'] = 0.1
+        io = IO(connection.parameters)
+
+        poller = io._create_poller(0)
+        self.assertIsInstance(poller, SelectPoller)
+        self.assertEqual(poller._timeout, 0.1)
+        self.assertFalse(poller.edge_triggered)
+
+        io.poller_type = 'poll'
+        if hasattr(select, 'poll'):
+            self.assertIsInstance(io._create_poller(0), Poller)
+
+    @unittest.skipIf(not hasattr(select, 'epoll'), 'epoll not available')
+    def test_io_create_epoll_poller(self):
+        connection = FakeConnection()
+        connection.parameters['poller'] = 'epoll'
+        io = IO(connection.parameters)
+        io.socket, sock_wr = socket.socketpair()
+        io.socket.settimeout(1)
+        try:
+            poller = io._create_poller(io.socket.fileno())
+            self.assertIsInstance(poller, EpollPoller)
+            self.assertTrue(poller.edge_triggered)
+            poller.close()
+
+            io.socket.settimeout(None)
+            poller = io._create_poller(io.socket.fileno())
+            self.assertFalse(poller.edge_triggered)
+            poller.close()
+        finally:
+            io._close_socket()
+            sock_wr.close()
+
+    @unittest.skipIf(not hasattr(select, 'epoll'), 'epoll not available')
+    def test_io_epoll_poller_is_ready(self):
+        sock_rd, sock_wr = socket.socketpair()
+        poller = EpollPoller(sock_rd.fileno(), [], timeout=0.01)
+        try:
+            self.assertFalse(poller.is_ready)
+
+            sock_wr.send(b'travis-ci')
+            self.assertTrue(poller.is_ready)
+            self.assertFalse(poller.is_ready)
+        finally:
+            poller.close()
+            sock_rd.close()
+            sock_wr.close()
+
+    @unittest.skipIf(not hasattr(select, 'epoll'), 'epoll not available')
+    def test_io_receive_until_would_block(self):
+        connection = FakeConnection()
+        connection.parameters['poller'] = 'epoll'
+        io = IO(connection.parameters)
+        io.socket, sock_wr = socket.socketpair()
+        io.socket.settimeout(1)
+        io._running.set()
+        try:
+            io.poller = io._create_poller(io.socket.fileno())
+            sock_wr.send(b'travis-ci' * 10)
+
+            io._receive_until_would_block()
+
+            self.assertEqual(io.data_in, b'travis-ci' * 10)
+            self.assertTrue(io._running.is_set())
+            self.assertFalse(io._drain_pending)
+            self.assertEqual(io.socket.gettimeout(), 1)
+        finally:
+            io._close_socket()
+            sock_wr.close()
+
+    @unittest.skipIf(not hasattr(socket, 'MSG_DONTWAIT'),
+                     'MSG_DONTWAIT not available')
+    def test_io_receive_until_would_block_leaves_timeout_alone(self):
+        connection = FakeConnection()
+        io = IO(connection.parameters)
+        io.socket, sock_wr = socket.socketpair()
+        io._running.set()
+        try:
+            for timeout in (5, None):
+                io.socket.settimeout(timeout)
+                sock_wr.send(b'travis-ci')
+                start = time.monotonic()
+
+                with mock.patch.object(socket.socket,
+                                       'settimeout') as settimeout:
+                    io._receive_until_would_block()
+
+                self.assertLess(time.monotonic() - start, 1)
+                settimeout.assert_not_called()
+                self.assertEqual(io.socket.gettimeout(), timeout)
+            self.assertEqual(io.data_in, b'travis-ci' * 2)
+            self.assertTrue(io._running.is_set())
+        finally:
+            io._close_socket()
+            sock_wr.close()
+
+    def test_io_receive_until_would_block_ssl_reads_pending(self):
+        connection = FakeConnection()
+        connection.parameters['ssl'] = True
+        io = IO(connection.parameters)
+        io.socket = mock.Mock(name='socket', spec=ssl.SSLSocket)
+        io.socket.pending.side_effect = [5, 0]
+
+        def read(_, buffer):
+            buffer[0:5] = b'12345'
+            return 5
+
+        io.socket.read.side_effect = read
+        io._running.set()
+
+        io._receive_until_would_block()
+
+        self.assertEqual(io.data_in, b'12345')
+        self.assertEqual(io.socket.read.call_count, 1)
+        io.socket.settimeout.assert_not_called()
+
+    @unittest.skipIf(not hasattr(select, 'epoll'), 'epoll not available')
+    def test_io_receive_until_would_block_when_paused(self):
+        paused = []
+        connection = FakeConnection()
+        connection.parameters['poller'] = 'epoll'
+        io = IO(connection.parameters, is_paused_impl=lambda: bool(paused))
+        io.socket, sock_wr = socket.socketpair()
+        io.socket.settimeout(1)
+        io._running.set()
+        try:
+            io.poller = io._create_poller(io.socket.fileno())
+            sock_wr.send(b'travis-ci')
+            paused.append(True)
+
+            io._receive_until_would_block()
+
+            self.assertEqual(io.data_in, b'')
+            self.assertTrue(io._drain_pending)
+
+            paused.clear()
+            io._receive_until_would_block()
+
+            self.assertEqual(io.data_in, b'travis-ci')
+            self.assertFalse(io._drain_pending)
+        finally:
+            io._close_socket()
+            sock_wr.close()
@@ -47,7 +47,7 @@ class IOExceptionTests(TestFramework):
 
         io = IO(connection.parameters, exceptions=connection.exceptions)
         io.socket = mock.Mock(name='socket', spec=socket.socket)
-        io.socket.recv.side_effect = socket.error('travis-ci')
+        io.socket.recv_into.side_effect = socket.error('travis-ci')
         io._receive()
         self.assertRaisesRegex(
             AMQPConnectionError,
@@ -60,7 +60,7 @@ class IOExceptionTests(TestFramework):
 
         io = IO(connection.parameters, exceptions=connection.exceptions)
         io.socket = mock.Mock(name='socket', spec=socket.socket)
-        io.socket.recv.side_effect = compatibility.SSLWantReadError()
+        io.socket.recv_into.side_effect = compatibility.SSLWantReadError()
         io._receive()
         self.assertIsNone(connection.check_for_errors())
 
@@ -69,7 +69,7 @@ class IOExceptionTests(TestFramework):
 
         io = IO(connection.parameters, exceptions=connection.exceptions)
         io.socket = mock.Mock(name='socket', spec=socket.socket)
-        io.socket.recv.side_effect = OSError(EWOULDBLOCK, 'would block')
+        io.socket.recv_into.side_effect = OSError(EWOULDBLOCK, 'would block')
         io._receive()
         self.assertIsNone(connection.check_for_errors())
 
@@ -77,7 +77,7 @@ class IOExceptionTests(TestFramework):
         connection = FakeConnection()
         io = IO(connection.parameters)
         io.socket = mock.Mock(name='socket', spec=socket.socket)
-        io.socket.recv.side_effect = socket.timeout('timeout')
+        io.socket.recv_into.side_effect = socket.timeout('timeout')
         io._receive()
         self.assertIsNone(connection.check_for_errors())
 
@@ -216,6 +216,30 @@ class IOExceptionTests(TestFramework):
         self.assertFalse(poller.is_ready)
         self.assertTrue(exceptions)
 
+    @unittest.skipIf(not hasattr(select, 'epoll'), 'epoll not available')
+    def test_io_receive_until_would_block_connection_closed(self):
+        self.disable_logging_validation()
+        connection = FakeConnection()
+        connection.parameters['poller'] = 'epoll'
+        io = IO(connection.parameters, exceptions=connection.exceptions)
+        io.socket, sock_wr = socket.socketpair()
+        io.socket.settimeout(1)
+        io._running.set()
+        try:
+            io.poller = io._create_poller(io.socket.fileno())
+            sock_wr.close()
+
+            io._receive_until_would_block()
+
+            self.assertFalse(io._running.is_set())
+            self.assertRaisesRegex(
+                AMQPConnectionError,
+                'connection closed by server',
+                connection.check_for_errors
+            )
+        finally:
+            io._close_socket()
+
     def test_io_simple_receive_when_socket_not_set(self):
         connection = FakeConnection()
         io = IO(connection.parameters, exceptions=connection.exceptions)
@@ -260,8 +284,9 @@ class IOExceptionTests(TestFramework):
         io._running.set()
         io.poller = mock.Mock()
         io.poller.is_ready = True
+        io.poller.edge_triggered = False
         io.socket = mock.Mock(name='socket', spec=socket.socket)
-        io.socket.recv.return_value = b'payload'
+        io.socket.recv_into.return_value = len(b'payload')
 
         io._process_incoming_data()
 
@@ -1,3 +1,5 @@
+from unittest import mock
+
 from amqpstorm.management import ManagementApi
 
 from amqpstorm.tests.utility import FakeHTTPClient
@@ -27,3 +29,31 @@ class ApiTests(TestFramework):
         self.assertIsInstance(top[0], dict)
         self.assertEqual(top[0]['node'], 'node1')
         self.assertIn('processes', top[0])
+
+    def test_api_list_stream(self):
+        api = ManagementApi('url', 'guest', 'guest', max_workers=2)
+        api.http_client.iter_list = mock.Mock(return_value=iter([{}]))
+
+        for handler in (api.channel, api.connection, api.exchange, api.queue):
+            api.http_client.iter_list.reset_mock()
+            self.assertEqual(list(handler.list(stream=True)), [{}])
+            self.assertTrue(api.http_client.iter_list.called)
+            api.http_client.iter_list.return_value = iter([{}])
+        self.assertEqual(api.http_client._max_workers, 2)
+
+    def test_api_list_columns(self):
+        api = ManagementApi('url', 'guest', 'guest')
+        api.http_client.list = mock.Mock(return_value=[])
+        api.http_client.iter_list = mock.Mock(return_value=iter([]))
+        api.http_client.get = mock.Mock(return_value={})
+
+        for handler in (api.channel, api.connection, api.exchange, api.queue):
+            handler.list(columns=['name'])
+            self.assertEqual(api.http_client.list.call_args[1]['columns'],
+                             ['name'])
+        api.nodes(columns='name', stream=True)
+        self.assertEqual(api.http_client.iter_list.call_args[1]['columns'],
+                         'name')
+        api.overview(columns=['rabbitmq_version'])
+        self.assertEqual(api.http_client.get.call_args[1]['columns'],
+                         ['rabbitmq_version'])
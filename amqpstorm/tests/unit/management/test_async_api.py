@@ -0,0 +1,284 @@
+import asyncio
+import base64
+import http.server
+import json
+import socket
+import threading
+import time
+import unittest
+from urllib.parse import parse_qs
+from urllib.parse import urlsplit
+
+from amqpstorm.exception import AMQPInvalidArgument
+from amqpstorm.management import ApiConnectionError
+from amqpstorm.management import ApiError
+from amqpstorm.management import AsyncManagementApi
+from amqpstorm.message import Message
+from amqpstorm.tests.utility import TestFramework
+
+
+class StubServer(http.server.ThreadingHTTPServer):
+    """Local Management Api stub, serving canned JSON responses."""
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), StubHandler)
+        self.routes = {}
+        self.requests = []
+        self.connections = 0
+        self.sockets = []
+        self.active = 0
+        self.max_active = 0
+        self.delay = 0.0
+        self.lock = threading.Lock()
+        self.thread = threading.Thread(target=self.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+
+    @property
+    def url(self):
+        return f'http://127.0.0.1:{self.server_address[1]}/'
+
+    def close_connections(self):
+        with self.lock:
+            for sock in self.sockets:
+                try:
+                    sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+class StubHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+            self.server.sockets.append(self.connection)
+
+    def log_message(self, *_):
+        pass
+
+    def do_GET(self):
+        self.respond()
+
+    def do_PUT(self):
+        self.respond()
+
+    def do_POST(self):
+        self.respond()
+
+    def do_DELETE(self):
+        self.respond()
+
+    def respond(self):
+        server = self.server
+        length = int(self.headers.get('Content-Length') or 0)
+        url = urlsplit(self.path)
+        with server.lock:
+            server.requests.append({
+                'method': self.command,
+                'path': url.path,
+                'params': {key: values[0] for key, values in
+                           parse_qs(url.query).items()},
+                'body': self.rfile.read(length),
+                'authorization': self.headers.get('Authorization'),
+            })
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+        try:
+            time.sleep(server.delay)
+            route = server.routes.get(url.path, (404, {'error': 'Object Not Found'}))
+            if callable(route):
+                route = route(parse_qs(url.query))
+            status, payload = route[:2]
+            chunked = len(route) > 2 and route[2]
+            body = json.dumps(payload).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            if status == 204:
+                self.end_headers()
+            elif chunked:
+                self.send_header('Transfer-Encoding', 'chunked')
+                self.end_headers()
+                for index in range(0, len(body), 5):
+                    chunk = body[index:index + 5]
+                    self.wfile.write(b'%x\r\n%s\r\n' % (len(chunk), chunk))
+                self.wfile.write(b'0\r\n\r\n')
+            else:
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+        finally:
+            with server.lock:
+                server.active -= 1
+
+
+class AsyncManagementApiTests(TestFramework, unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        super().setUp()
+        self.server = StubServer()
+        self.addCleanup(self.server.stop)
+
+    async def asyncSetUp(self):
+        self.api = AsyncManagementApi(self.server.url, 'guest', 'travis-ci',
+                                      timeout=5, max_connections=2)
+
+    async def asyncTearDown(self):
+        await self.api.close()
+
+    async def test_api_get(self):
+        self.server.routes['/api/queues/%2F/travis-ci'] = (
+            200, {'name': 'travis-ci', 'messages': 1}
+        )
+
+        queue = await self.api.queue.get('travis-ci')
+
+        self.assertEqual(queue, {'name': 'travis-ci', 'messages': 1})
+        request = self.server.requests[0]
+        self.assertEqual(request['method'], 'GET')
+        self.assertEqual(
+            request['authorization'],
+            'Basic ' + base64.b64encode(b'guest:travis-ci').decode('ascii')
+        )
+
+    async def test_api_put_payload(self):
+        self.server.routes['/api/queues/%2F/travis-ci'] = (204, None)
+
+        await self.api.queue.declare('travis-ci', durable=True)
+        await self.api.queue.declare('travis-ci', durable=True)
+
+        request = self.server.requests[0]
+        self.assertEqual(request['method'], 'PUT')
+        self.assertTrue(json.loads(request['body'])['durable'])
+        self.assertEqual(self.server.connections, 1)
+
+    async def test_api_chunked_response(self):
+        self.server.routes['/api/overview'] = (
+            200, {'rabbitmq_version': '4.1.0'}, True
+        )
+
+        overview = await self.api.overview(columns=['rabbitmq_version'])
+
+        self.assertEqual(overview, {'rabbitmq_version': '4.1.0'})
+        self.assertEqual(self.server.requests[0]['params'],
+                         {'columns': 'rabbitmq_version'})
+
+    async def test_api_connection_pooling(self):
+        self.server.routes['/api/whoami'] = (200, {'name': 'guest'})
+        self.server.delay = 0.05
+
+        results = await asyncio.gather(*(self.api.whoami()
+                                         for _ in range(8)))
+        await self.api.whoami()
+
+        self.assertEqual(results, [{'name': 'guest'}] * 8)
+        self.assertEqual(self.server.max_active, 2)
+        self.assertEqual(self.server.connections, 2)
+
+    async def test_api_reconnects_stale_connection(self):
+        self.server.routes['/api/whoami'] = (200, {'name': 'guest'})
+        await self.api.whoami()
+
+        self.server.close_connections()
+        self.assertEqual(await self.api.whoami(), {'name': 'guest'})
+
+        self.server.close_connections()
+        await asyncio.sleep(0.05)
+        self.assertEqual(await self.api.whoami(), {'name': 'guest'})
+        self.assertEqual(self.server.connections, 3)
+
+    async def test_api_list_pages(self):
+        def page(params):
+            number = int(params['page'][0])
+            return 200, {'page': number, 'page_count': 5,
+                         'items': [{'name': f'queue-{number}'}]}
+
+        self.server.routes['/api/queues/%2F'] = page
+
+        queues = await self.api.queue.list(page_size=1)
+        streamed = [queue['name'] async for queue in
+                    self.api.queue.list(page_size=1, stream=True)]
+
+        self.assertEqual([queue['name'] for queue in queues],
+                         [f'queue-{number}' for number in range(1, 6)])
+        self.assertEqual(streamed, [queue['name'] for queue in queues])
+
+    async def test_api_basic_get(self):
+        self.server.routes['/api/queues/%2F/travis-ci/get'] = (
+            200, [{'payload': 'hello', 'properties': {}}]
+        )
+
+        messages = await self.api.basic.get('travis-ci')
+        payloads = await self.api.basic.get('travis-ci', to_dict=True)
+
+        self.assertIsInstance(messages[0], Message)
+        self.assertEqual(messages[0].body, 'hello')
+        self.assertEqual(payloads, [{'payload': 'hello', 'properties': {}}])
+
+    async def test_api_top(self):
+        self.server.routes['/api/nodes'] = (200, [{'name': 'rabbit@a'},
+                                                  {'name': 'rabbit@b'}])
+        self.server.routes['/api/top/rabbit@a'] = (200, {'node': 'a'})
+        self.server.routes['/api/top/rabbit@b'] = (200, {'node': 'b'})
+
+        self.assertEqual(await self.api.top(), [{'node': 'a'}, {'node': 'b'}])
+
+    async def test_api_bulk_operations(self):
+        for index in range(6):
+            self.server.routes[f'/api/queues/%2F/queue-{index}'] = (204, None)
+        self.server.routes['/api/definitions/%2F'] = (204, None)
+        self.server.delay = 0.02
+
+        errors = await self.api.queue.declare_many(
+            [f'queue-{index}' for index in range(8)]
+        )
+        imported = await self.api.queue.declare_many(
+            ['travis', 'ci'], use_definitions=True
+        )
+
+        self.assertEqual(sorted(errors), ['queue-6', 'queue-7'])
+        self.assertEqual(errors['queue-6'].error_code, 404)
+        self.assertEqual(imported, {})
+        self.assertEqual(self.server.max_active, 2)
+        self.assertEqual(self.server.requests[-1]['path'],
+                         '/api/definitions/%2F')
+
+    async def test_api_bulk_operations_reject_duplicate_items(self):
+        with self.assertRaisesRegex(AMQPInvalidArgument, 'duplicate item'):
+            await self.api.queue.declare_many(['travis', 'travis'])
+        with self.assertRaisesRegex(AMQPInvalidArgument, 'duplicate item'):
+            await self.api.exchange.declare_many(['travis', 'travis'],
+                                                 use_definitions=True)
+
+        self.assertEqual(self.server.requests, [])
+
+    async def test_api_error(self):
+        with self.assertRaises(ApiError) as error:
+            await self.api.queue.get('travis-ci')
+
+        self.assertEqual(error.exception.error_code, 404)
+
+    async def test_api_connection_error(self):
+        sock = socket.socket()
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+        sock.close()
+        api = AsyncManagementApi(f'http://127.0.0.1:{port}', 'guest', 'guest')
+
+        with self.assertRaises(ApiConnectionError):
+            await api.whoami()
+
+    async def test_api_timeout(self):
+        self.server.routes['/api/whoami'] = (200, {'name': 'guest'})
+        self.server.delay = 0.5
+        api = AsyncManagementApi(self.server.url, 'guest', 'guest',
+                                 timeout=0.05)
+
+        with self.assertRaisesRegex(ApiConnectionError, 'timed out'):
+            await api.whoami()
@@ -0,0 +1,182 @@
+import json
+import threading
+import time
+
+import requests
+
+from amqpstorm.exception import AMQPInvalidArgument
+from amqpstorm.management import ApiConnectionError
+from amqpstorm.management import ApiError
+from amqpstorm.management import ManagementApi
+from amqpstorm.tests.utility import TestFramework
+
+
+class FakeResponse(object):
+    def __init__(self, status_code=204, json=None):
+        self.status_code = status_code
+        self._json = json
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f'{self.status_code} Error')
+
+    def json(self):
+        if self._json is None:
+            raise ValueError('no content')
+        return self._json
+
+
+class BulkOperationsTests(TestFramework):
+    def setUp(self):
+        super().setUp()
+        self.api = ManagementApi('http://localhost:15672', 'guest', 'guest',
+                                 max_workers=3)
+        self.requests = []
+        self.failures = {}
+        self.active = 0
+        self.max_active = 0
+        lock = threading.Lock()
+
+        def request(method, url, data=None, **_):
+            path = url.split('/api/', 1)[1]
+            with lock:
+                self.requests.append((method, path, data))
+                self.active += 1
+                self.max_active = max(self.max_active, self.active)
+            try:
+                time.sleep(0.01)
+                failure = self.failures.get(path)
+                if isinstance(failure, Exception):
+                    raise failure
+                elif failure:
+                    return FakeResponse(failure, {'error': 'travis-ci'})
+                return FakeResponse()
+            finally:
+                with lock:
+                    self.active -= 1
+
+        self.api.http_client.session.request = request
+
+    def test_queue_declare_many(self):
+        self.failures['queues/%2F/queue-3'] = 406
+        self.failures['queues/%2F/queue-5'] = requests.ConnectionError('ci')
+        queues = [f'queue-{index}' for index in range(10)]
+        queues[1] = {'queue': 'queue-1', 'durable': True}
+
+        errors = self.api.queue.declare_many(queues, auto_delete=True)
+
+        self.assertEqual(sorted(errors), ['queue-3', 'queue-5'])
+        self.assertIsInstance(errors['queue-3'], ApiError)
+        self.assertEqual(errors['queue-3'].error_code, 406)
+        self.assertIsInstance(errors['queue-5'], ApiConnectionError)
+        self.assertEqual(len(self.requests), 10)
+        self.assertEqual(self.max_active, 3)
+        payloads = {path: json.loads(data)
+                    for _, path, data in self.requests}
+        self.assertTrue(payloads['queues/%2F/queue-1']['durable'])
+        self.assertFalse(payloads['queues/%2F/queue-2']['durable'])
+        self.assertTrue(payloads['queues/%2F/queue-2']['auto_delete'])
+
+    def test_queue_delete_many(self):
+        errors = self.api.queue.delete_many(['travis', 'ci'],
+                                            virtual_host='travis')
+
+        self.assertEqual(errors, {})
+        self.assertEqual(sorted((method, path)
+                                for method, path, _ in self.requests),
+                         [('delete', 'queues/travis/ci'),
+                          ('delete', 'queues/travis/travis')])
+
+    def test_queue_bind_many(self):
+        self.failures['bindings/%2F/e/amq.topic/q/ci'] = 404
+
+        errors = self.api.queue.bind_many([
+            ('travis', 'amq.direct', 'travis'),
+            {'queue': 'ci', 'exchange': 'amq.topic', 'routing_key': '#'},
+        ])
+
+        self.assertEqual(list(errors), [('ci', 'amq.topic', '#')])
+        self.assertEqual(len(self.requests), 2)
+
+    def test_exchange_bulk_operations(self):
+        self.assertEqual(self.api.exchange.declare_many(
+            ['travis', {'exchange': 'ci', 'exchange_type': 'topic'}]
+        ), {})
+        self.assertEqual(self.api.exchange.bind_many([('travis', 'ci')]), {})
+        self.assertEqual(self.api.exchange.delete_many(['travis']), {})
+
+        payloads = {path: json.loads(data)
+                    for _, path, data in self.requests if data}
+        self.assertEqual(payloads['exchanges/%2F/travis']['type'], 'direct')
+        self.assertEqual(payloads['exchanges/%2F/ci']['type'], 'topic')
+        self.assertEqual(payloads['bindings/%2F/e/ci/e/travis']['routing_key'],
+                         '')
+        self.assertEqual(self.requests[-1][:2],
+                         ('delete', 'exchanges/%2F/travis'))
+
+    def test_bulk_operations_use_definitions(self):
+        self.assertEqual(self.api.queue.declare_many(
+            ['travis', {'queue': 'ci', 'durable': True}],
+            virtual_host='travis', use_definitions=True
+        ), {})
+        self.assertEqual(self.api.exchange.declare_many(
+            ['travis'], exchange_type='topic', use_definitions=True
+        ), {})
+        self.assertEqual(self.api.queue.bind_many(
+            [('travis', 'travis', '#')], use_definitions=True
+        ), {})
+
+        self.assertEqual([path for _, path, _ in self.requests],
+                         ['definitions/travis', 'definitions/%2F',
+                          'definitions/%2F'])
+        queues, exchanges, bindings = [json.loads(data)
+                                       for _, _, data in self.requests]
+        self.assertEqual(queues, {'queues': [
+            {'name': 'travis', 'durable': False, 'auto_delete': False,
+             'arguments': {}},
+            {'name': 'ci', 'durable': True, 'auto_delete': False,
+             'arguments': {}},
+        ]})
+        self.assertEqual(exchanges['exchanges'][0]['type'], 'topic')
+        self.assertEqual(bindings, {'bindings': [
+            {'source': 'travis', 'destination': 'travis',
+             'destination_type': 'queue', 'routing_key': '#',
+             'arguments': {}},
+        ]})
+
+    def test_bulk_operations_use_definitions_error(self):
+        self.failures['definitions/%2F'] = 400
+
+        errors = self.api.queue.declare_many(['travis', 'ci'],
+                                             use_definitions=True)
+
+        self.assertEqual(sorted(errors), ['ci', 'travis'])
+        self.assertIs(errors['ci'], errors['travis'])
+        self.assertEqual(errors['ci'].error_code, 400)
+
+    def test_bulk_operations_reject_duplicate_items(self):
+        self.assertRaisesRegex(
+            AMQPInvalidArgument, "duplicate item: 'travis'",
+            self.api.queue.declare_many,
+            ['travis', {'queue': 'travis', 'durable': True}]
+        )
+        self.assertRaisesRegex(
+            AMQPInvalidArgument, 'duplicate item',
+            self.api.queue.bind_many,
+            [('travis', 'ci', '#'), ('travis', 'ci', '#')],
+            use_definitions=True
+        )
+        self.assertRaisesRegex(
+            AMQPInvalidArgument, 'duplicate item',
+            self.api.exchange.delete_many, ['travis', 'travis']
+        )
+
+        self.assertEqual(self.requests, [])
+
+    def test_import_definitions(self):
+        self.api.import_definitions({'queues': []})
+        self.api.import_definitions({'queues': []}, virtual_host='/')
+
+        self.assertEqual([(method, path) for method, path, _ in self.requests],
+                         [('post', 'definitions'),
+                          ('post', 'definitions/%2F')])
@@ -0,0 +1,166 @@
+import threading
+import time
+
+from amqpstorm.exception import AMQPInvalidArgument
+from amqpstorm.management import ManagementApi
+from amqpstorm.management import ResponseCache
+from amqpstorm.management.http_client import ApiConnectionError
+from amqpstorm.tests.utility import TestFramework
+
+
+class ResponseCacheTests(TestFramework):
+    def setUp(self):
+        super().setUp()
+        self.fetches = 0
+
+    def fetch(self):
+        def fetch():
+            self.fetches += 1
+            return {'fetch': self.fetches}
+        return fetch
+
+    def test_cache_invalid_parameters(self):
+        for kwargs, message in (
+            ({'ttl': -1}, 'ttl should be a non-negative integer or float'),
+            ({'endpoint_ttls': {'overview': 'travis-ci'}},
+             'ttl should be a non-negative integer or float'),
+            ({'max_size': 0}, 'max_size should be a positive integer'),
+        ):
+            self.assertRaisesRegex(AMQPInvalidArgument, message,
+                                   ResponseCache, **kwargs)
+
+    def test_cache_hit(self):
+        cache = ResponseCache()
+
+        first = cache.get('overview', None, self.fetch())
+        first['fetch'] = 'modified'
+
+        self.assertEqual(cache.get('overview', None, self.fetch()),
+                         {'fetch': 1})
+        self.assertEqual(cache.get('overview', {'columns': 'name'},
+                                   self.fetch()),
+                         {'fetch': 2})
+        self.assertEqual(self.fetches, 2)
+
+    def test_cache_endpoint_ttls(self):
+        cache = ResponseCache(ttl=60, endpoint_ttls={'overview': 0.01,
+                                                     'nodes': 0})
+
+        self.assertEqual(cache.ttl('queues/%2F/travis-ci'), 60)
+        cache.get('overview', None, self.fetch())
+        cache.get('nodes', None, self.fetch())
+        cache.get('nodes', None, self.fetch())
+        time.sleep(0.02)
+        cache.get('overview', None, self.fetch())
+
+        self.assertEqual(self.fetches, 4)
+        self.assertEqual(len(cache), 1)
+
+    def test_cache_lru_eviction(self):
+        cache = ResponseCache(max_size=2)
+
+        cache.get('queues/%2F/a', None, self.fetch())
+        cache.get('queues/%2F/b', None, self.fetch())
+        cache.get('queues/%2F/a', None, self.fetch())
+        cache.get('queues/%2F/c', None, self.fetch())
+        self.assertEqual(self.fetches, 3)
+
+        cache.get('queues/%2F/a', None, self.fetch())
+        self.assertEqual(self.fetches, 3)
+        cache.get('queues/%2F/b', None, self.fetch())
+        self.assertEqual(self.fetches, 4)
+
+    def test_cache_invalidate(self):
+        cache = ResponseCache()
+        for path in ('queues', 'queues/%2F', 'queues/%2F/travis',
+                     'queues/%2F/travis/bindings', 'queues/%2F/travis-ci',
+                     'exchanges/%2F/travis'):
+            cache.get(path, None, self.fetch())
+
+        cache.invalidate('queues/%2F/travis')
+
+        self.assertEqual(sorted(key[0] for key in cache._entries),
+                         ['exchanges/%2F/travis', 'queues/%2F/travis-ci'])
+
+    def test_cache_errors_not_cached(self):
+        cache = ResponseCache()
+
+        def fetch():
+            raise ApiConnectionError('travis-ci')
+
+        self.assertRaises(ApiConnectionError, cache.get, 'nodes', None, fetch)
+        self.assertEqual(cache.get('nodes', None, self.fetch()), {'fetch': 1})
+
+    def test_cache_single_flight(self):
+        cache = ResponseCache()
+        started = threading.Event()
+        release = threading.Event()
+        results = []
+
+        def fetch():
+            self.fetches += 1
+            started.set()
+            release.wait(5)
+            return ['travis-ci']
+
+        def get():
+            results.append(cache.get('queues', None, fetch))
+
+        threads = [threading.Thread(target=get) for _ in range(5)]
+        threads[0].start()
+        self.assertTrue(started.wait(5))
+        for thread in threads[1:]:
+            thread.start()
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(self.fetches, 1)
+        self.assertEqual(results, [['travis-ci']] * 5)
+
+    def test_cache_invalidated_while_in_flight(self):
+        cache = ResponseCache()
+
+        def fetch():
+            cache.invalidate('queues/%2F/travis')
+            return {'stale': True}
+
+        self.assertEqual(cache.get('queues/%2F', None, fetch),
+                         {'stale': True})
+        self.assertEqual(len(cache), 0)
+
+
+class ManagementApiCacheTests(TestFramework):
+    def test_api_cache(self):
+        api = ManagementApi('http://localhost:15672', 'guest', 'guest',
+                            cache=ResponseCache())
+        requests = []
+
+        def request(method, url, **_):
+            requests.append((method, url))
+            return FakeResponse({'name': 'travis-ci'})
+
+        api.http_client.session.request = request
+
+        api.queue.get('travis-ci')
+        api.queue.get('travis-ci')
+        api.overview()
+        api.queue.delete('travis-ci')
+        api.queue.get('travis-ci')
+        api.overview()
+
+        self.assertEqual([method for method, _ in requests],
+                         ['get', 'get', 'delete', 'get'])
+
+
+class FakeResponse(object):
+    def __init__(self, json):
+        self.status_code = 200
+        self._json = json
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._json
@@ -1,5 +1,11 @@
+import json
+import random
+import threading
+import time
+
 import requests
 
+from amqpstorm.management.http_client import ApiConnectionError
 from amqpstorm.management.http_client import ApiError
 from amqpstorm.management.http_client import HTTPClient
 from amqpstorm.tests.utility import TestFramework
@@ -8,10 +14,13 @@ from amqpstorm.tests.utility import TestFramework
 class FakeResponse(object):
     """Fake Requests Response for Unit-Testing."""
 
-    def __init__(self, status_code=200, json=None, raises=None):
+    def __init__(self, status_code=200, json=None, raises=None,
+                 content=None):
         self.status_code = status_code
         self._json = json
         self._raises = raises
+        self._content = content
+        self.closed = False
 
     def raise_for_status(self):
         if not self._raises:
@@ -23,6 +32,18 @@ class FakeResponse(object):
             raise self._raises
         return self._json
 
+    def iter_content(self, chunk_size=1):
+        content = self._content
+        if content is None:
+            content = json.dumps(self._json).encode('utf-8')
+        for index in range(0, len(content), 3):
+            if self._raises and index:
+                raise self._raises
+            yield content[index:index + 3]
+
+    def close(self):
+        self.closed = True
+
 
 class ApiHTTPTests(TestFramework):
     def test_api_valid_json(self):
@@ -65,3 +86,186 @@ class ApiHTTPTests(TestFramework):
             FakeResponse(),
             fake_payload
         )
+
+
+class ApiHTTPListTests(TestFramework):
+    def create_client(self, page_count=5, max_workers=3, delay=0.0,
+                      on_page=None):
+        client = HTTPClient('http://localhost:15672/', 'guest', 'guest',
+                            verify=None, cert=None, timeout=1,
+                            max_workers=max_workers)
+        self.requests = []
+        self.active = 0
+        self.max_active = 0
+        lock = threading.Lock()
+
+        def request(method, url, params=None, **_):
+            with lock:
+                self.requests.append(dict(params or {}))
+                self.active += 1
+                self.max_active = max(self.max_active, self.active)
+            try:
+                if delay:
+                    time.sleep(random.uniform(0, delay))
+                if params is None or 'page' not in params:
+                    return FakeResponse(json=['travis', 'ci'])
+                page = params['page']
+                if on_page:
+                    on_page(page)
+                return FakeResponse(json={
+                    'page': page, 'page_count': page_count,
+                    'items': [f'{page}-1', f'{page}-2'],
+                })
+            finally:
+                with lock:
+                    self.active -= 1
+
+        client.session.request = request
+        return client
+
+    def test_api_list_without_pages(self):
+        client = self.create_client()
+
+        self.assertEqual(client.list('queues', name='travis',
+                                     use_regex=True),
+                         ['travis', 'ci'])
+        self.assertEqual(self.requests,
+                         [{'name': 'travis', 'use_regex': 'true'}])
+
+    def test_api_list_pages_in_order(self):
+        client = self.create_client(page_count=20, delay=0.01)
+
+        items = client.list('queues', page_size=2)
+
+        self.assertEqual(items, [f'{page}-{index}' for page in range(1, 21)
+                                 for index in (1, 2)])
+        self.assertEqual(sorted(params['page'] for params in self.requests),
+                         list(range(1, 21)))
+        self.assertTrue(all(params['page_size'] == 2
+                            for params in self.requests))
+        self.assertGreater(self.max_active, 1)
+        self.assertLessEqual(self.max_active, 3)
+
+    def test_api_list_single_page(self):
+        client = self.create_client(page_count=1)
+
+        self.assertEqual(client.list('queues', page_size=2), ['1-1', '1-2'])
+        self.assertEqual(len(self.requests), 1)
+
+    def test_api_list_error(self):
+        def on_page(page):
+            if page == 3:
+                raise requests.ConnectionError('travis-ci')
+
+        client = self.create_client(on_page=on_page)
+
+        self.assertRaisesRegex(ApiConnectionError, 'travis-ci',
+                               client.list, 'queues', page_size=2)
+
+    def test_api_iter_list(self):
+        client = self.create_client(page_count=10, max_workers=2)
+
+        items = client.iter_list('queues', page_size=2)
+        self.assertEqual(self.requests, [])
+
+        self.assertEqual(next(items), '1-1')
+        self.assertLessEqual(len(self.requests), 3)
+        self.assertEqual(list(items)[-1], '10-2')
+        self.assertEqual(len(self.requests), 10)
+
+    def test_api_iter_list_closed_early(self):
+        client = self.create_client(page_count=100, max_workers=2)
+
+        items = client.iter_list('queues', page_size=2)
+        self.assertEqual([next(items) for _ in range(4)],
+                         ['1-1', '1-2', '2-1', '2-2'])
+        items.close()
+
+        self.assertLessEqual(len(self.requests), 5)
+
+    def test_api_iter_list_without_pages(self):
+        client = self.create_client()
+
+        self.assertEqual(list(client.iter_list('queues')), ['travis', 'ci'])
+
+    def test_api_list_columns(self):
+        client = self.create_client()
+
+        client.list('queues', columns=['name', 'messages'])
+        list(client.iter_list('queues', columns='name'))
+        client.list('queues', page_size=2, columns=['name'])
+
+        self.assertEqual(self.requests[0], {'columns': 'name,messages'})
+        self.assertEqual(self.requests[1], {'columns': 'name'})
+        self.assertEqual(self.requests[2]['columns'], 'name')
+
+
+class ApiHTTPStreamTests(TestFramework):
+    def create_client(self, response):
+        client = HTTPClient('http://localhost:15672/', 'guest', 'guest',
+                            verify=None, cert=None, timeout=1)
+        self.calls = []
+
+        def request(method, url, **kwargs):
+            self.calls.append(kwargs)
+            return response
+
+        client.session.request = request
+        return client
+
+    def test_api_stream_parses_incrementally(self):
+        response = FakeResponse(json=[{'name': 'travis'}, {'name': 'ci'}])
+        client = self.create_client(response)
+
+        items = client.iter_list('queues')
+        self.assertEqual(next(items), {'name': 'travis'})
+        self.assertTrue(self.calls[0]['stream'])
+        self.assertFalse(response.closed)
+
+        self.assertEqual(list(items), [{'name': 'ci'}])
+        self.assertTrue(response.closed)
+
+    def test_api_stream_closed_early(self):
+        response = FakeResponse(json=list(range(100)))
+        client = self.create_client(response)
+
+        items = client.iter_list('queues')
+        self.assertEqual(next(items), 0)
+        items.close()
+
+        self.assertTrue(response.closed)
+
+    def test_api_stream_invalid_json(self):
+        client = self.create_client(FakeResponse(content=b'{"travis": 1}'))
+
+        self.assertRaisesRegex(ApiError,
+                               'invalid JSON response: expected a JSON array',
+                               list, client.iter_list('queues'))
+
+    def test_api_stream_http_error(self):
+        response = FakeResponse(status_code=404, json={'error': 'not_found'},
+                                raises=requests.HTTPError('travis-ci'))
+        client = self.create_client(response)
+
+        with self.assertRaises(ApiError) as error:
+            list(client.iter_list('queues'))
+
+        self.assertEqual(error.exception.error_code, 404)
+        self.assertTrue(response.closed)
+
+    def test_api_stream_connection_error(self):
+        response = FakeResponse(json=['travis', 'ci'],
+                                raises=requests.ConnectionError('travis-ci'))
+        response.raise_for_status = lambda: None
+        client = self.create_client(response)
+
+        self.assertRaisesRegex(ApiConnectionError, 'travis-ci',
+                               list, client.iter_list('queues'))
+        self.assertTrue(response.closed)
+
+    def test_api_list_pool_size(self):
+        client = HTTPClient('http://localhost:15672/', 'guest', 'guest',
+                            verify=None, cert=None, timeout=1, max_workers=32)
+
+        adapter = client.session.get_adapter('https://localhost:15671/')
+        self.assertEqual(adapter._pool_maxsize, 32)
@@ -0,0 +1,60 @@
+import json
+import random
+
+from amqpstorm.management.json_stream import iter_array
+from amqpstorm.tests.utility import TestFramework
+
+
+def chunked(data, size):
+    return [data[index:index + size] for index in range(0, len(data), size)]
+
+
+class JsonStreamTests(TestFramework):
+    def test_json_stream_any_chunk_size(self):
+        elements = [
+            {'name': 'travis-ci', 'arguments': {'x-max-length': 10}},
+            -1.5e10, 0, 123456789, True, False, None,
+            'café ☃ "quoted" \\', [], {}, [1, [2, [3]]],
+        ]
+        data = json.dumps(elements, indent=2, ensure_ascii=False)
+        data = data.encode('utf-8')
+
+        for size in (1, 2, 3, 7, 64, len(data)):
+            self.assertEqual(list(iter_array(chunked(data, size))), elements)
+
+    def test_json_stream_random_chunks(self):
+        elements = [{'name': f'queue-{index}', 'messages': index * 1.25}
+                    for index in range(100)]
+        data = json.dumps(elements).encode('utf-8')
+        rnd = random.Random(1)
+        chunks = []
+        position = 0
+        while position < len(data):
+            size = rnd.randint(1, 50)
+            chunks.append(data[position:position + size])
+            position += size
+
+        self.assertEqual(list(iter_array(chunks)), elements)
+
+    def test_json_stream_empty_array(self):
+        self.assertEqual(list(iter_array([b' [ ', b' ] \n'])), [])
+
+    def test_json_stream_is_lazy(self):
+        def chunks():
+            yield b'[{"name": "travis"}, '
+            raise AssertionError('read too far')
+
+        self.assertEqual(next(iter_array(chunks())), {'name': 'travis'})
+
+    def test_json_stream_invalid(self):
+        for data, message in (
+            (b'{"name": "travis"}', 'expected a JSON array'),
+            (b'', 'unexpected end of the JSON array'),
+            (b'[1 2]', 'expected "," or "]"'),
+            (b'[1, 2', 'unexpected end of the JSON array'),
+            (b'[1, 2] 3', 'unexpected data after the JSON array'),
+            (b'[1, ]', 'Expecting value'),
+            (b'[tru]', 'Expecting value'),
+        ):
+            self.assertRaisesRegex(ValueError, message,
+                                   list, iter_array(chunked(data, 2)))
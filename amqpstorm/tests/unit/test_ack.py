@@ -0,0 +1,285 @@
+import collections
+import threading
+
+from pamqp import commands
+from pamqp.body import ContentBody
+from pamqp.header import ContentHeader
+
+from amqpstorm import Channel
+from amqpstorm.ack import AckCoalescer
+from amqpstorm.exception import AMQPChannelError
+from amqpstorm.exception import AMQPInvalidArgument
+from amqpstorm.tests.utility import FakeConnection
+from amqpstorm.tests.utility import TestFramework
+
+
+class AckCoalescerTests(TestFramework):
+    def setUp(self):
+        super(AckCoalescerTests, self).setUp()
+        self.frames_out = []
+        self.acks = AckCoalescer(self.frames_out.append, max_pending=100,
+                                 flush_interval=60)
+
+    def tearDown(self):
+        self.acks.clear()
+        super(AckCoalescerTests, self).tearDown()
+
+    def deliver(self, count):
+        for delivery_tag in range(1, count + 1):
+            self.acks.delivered(delivery_tag)
+
+    def get_acks(self):
+        return [
+            (frame_out.delivery_tag, frame_out.multiple)
+            for frame_out in self.frames_out
+        ]
+
+    def test_ack_coalesce_in_order(self):
+        self.acks = AckCoalescer(self.frames_out.append, max_pending=5,
+                                 flush_interval=60)
+        self.deliver(10)
+
+        for delivery_tag in range(1, 5):
+            self.acks.ack(delivery_tag)
+        self.assertEqual(self.frames_out, [])
+        self.assertEqual(self.acks.pending, 4)
+
+        self.acks.ack(5)
+
+        self.assertEqual(self.get_acks(), [(5, True)])
+        self.assertEqual(self.acks.pending, 0)
+
+    def test_ack_coalesce_out_of_order(self):
+        self.deliver(5)
+        self.acks.ack(2)
+        self.acks.ack(3)
+        self.acks.ack(1)
+        self.acks.ack(5)
+
+        self.acks.flush()
+
+        self.assertEqual(self.get_acks(), [(3, True), (5, False)])
+
+    def test_ack_coalesce_ack_waits_for_lower_delivery_tags(self):
+        self.deliver(3)
+        self.acks.ack(2)
+        self.acks.ack(3)
+
+        self.acks.flush()
+
+        self.assertEqual(self.get_acks(), [(2, False), (3, False)])
+
+    def test_ack_coalesce_single_ack(self):
+        self.deliver(3)
+        self.acks.ack(1)
+
+        self.acks.flush()
+
+        self.assertEqual(self.get_acks(), [(1, False)])
+
+    def test_ack_coalesce_multiple(self):
+        self.deliver(5)
+        self.acks.ack(3, multiple=True)
+        self.acks.ack(5)
+
+        self.acks.flush()
+
+        self.assertEqual(self.get_acks(), [(3, True), (5, False)])
+
+    def test_ack_coalesce_multiple_all(self):
+        self.deliver(5)
+        self.acks.ack(1)
+
+        self.acks.ack(0, multiple=True)
+
+        self.assertEqual(self.get_acks(), [(1, False), (0, True)])
+        self.assertEqual(self.acks.pending, 0)
+
+    def test_ack_coalesce_untracked_delivery_tag(self):
+        self.acks.ack(1)
+        self.acks.ack(2)
+
+        self.acks.flush()
+
+        self.assertEqual(self.get_acks(), [(2, True)])
+
+    def test_ack_coalesce_flush_interval(self):
+        flushed = threading.Event()
+
+        def write_frame(frame_out):
+            self.frames_out.append(frame_out)
+            flushed.set()
+
+        self.acks = AckCoalescer(write_frame, flush_interval=0.01)
+        self.deliver(2)
+        self.acks.ack(1)
+
+        self.assertTrue(flushed.wait(1))
+        self.assertEqual(self.get_acks(), [(1, False)])
+        self.assertIsNone(self.acks._timer)
+
+    def test_ack_coalesce_send_flushes_pending_acks(self):
+        self.deliver(4)
+        self.acks.ack(1)
+        self.acks.ack(2)
+
+        self.acks.send(commands.Basic.Nack(delivery_tag=4, multiple=True))
+
+        self.assertEqual(len(self.frames_out), 2)
+        self.assertIsInstance(self.frames_out[0], commands.Basic.Ack)
+        self.assertEqual(self.frames_out[0].delivery_tag, 2)
+        self.assertTrue(self.frames_out[0].multiple)
+        self.assertIsInstance(self.frames_out[1], commands.Basic.Nack)
+        self.assertIsNone(self.acks._lowest_outstanding())
+
+    def test_ack_coalesce_reject_allows_prefix_to_advance(self):
+        self.deliver(4)
+        self.acks.send(commands.Basic.Reject(delivery_tag=1))
+        self.acks.ack(2)
+        self.acks.ack(3)
+
+        self.acks.flush()
+
+        self.assertIsInstance(self.frames_out[0], commands.Basic.Reject)
+        self.assertEqual(self.frames_out[1].delivery_tag, 3)
+        self.assertTrue(self.frames_out[1].multiple)
+
+    def test_ack_coalesce_clear(self):
+        self.deliver(3)
+        self.acks.ack(1)
+
+        self.acks.clear()
+        self.acks.flush()
+
+        self.assertEqual(self.frames_out, [])
+        self.assertIsNone(self.acks._lowest_outstanding())
+
+    def test_ack_coalesce_timer_error_is_logged(self):
+        self.disable_logging_validation()
+
+        def write_frame(_):
+            raise AMQPChannelError('travis-ci')
+
+        self.acks = AckCoalescer(write_frame, flush_interval=60)
+        self.acks.ack(1)
+
+        self.acks._on_timer()
+
+        self.assertEqual(self.get_last_log(),
+                         'Failed to send acknowledgements: travis-ci')
+
+
+class ChannelCoalesceAcksTests(TestFramework):
+    @staticmethod
+    def create_channel():
+        channel = Channel(1, FakeConnection(), 1)
+        channel.set_state(Channel.OPEN)
+        return channel
+
+    @staticmethod
+    def deliver(channel, consumer_tag, count):
+        frames = []
+        for delivery_tag in range(1, count + 1):
+            frames.extend([
+                commands.Basic.Deliver(consumer_tag=consumer_tag,
+                                       delivery_tag=delivery_tag),
+                ContentHeader(body_size=2),
+                ContentBody(value=b'hi'),
+            ])
+        channel._inbound = collections.deque(frames)
+        return list(channel.build_inbound_messages(break_on_empty=True))
+
+    def test_channel_coalesce_acks(self):
+        channel = self.create_channel()
+        connection = channel._connection
+        channel.coalesce_acks(max_pending=10, flush_interval=60)
+
+        messages = self.deliver(channel, 'travis-ci', 3)
+        for message in reversed(messages):
+            message.ack()
+        self.assertEqual(connection.frames_out, [])
+
+        channel.flush_acks()
+
+        self.assertEqual(len(connection.frames_out), 1)
+        _, frame_out = connection.frames_out[0]
+        self.assertIsInstance(frame_out, commands.Basic.Ack)
+        self.assertEqual(frame_out.delivery_tag, 3)
+        self.assertTrue(frame_out.multiple)
+
+    def test_channel_coalesce_acks_waits_for_unacked_messages(self):
+        channel = self.create_channel()
+        connection = channel._connection
+        channel.coalesce_acks(flush_interval=60)
+
+        messages = self.deliver(channel, 'travis-ci', 2)
+        messages[1].ack()
+        channel.flush_acks()
+
+        _, frame_out = connection.frames_out[0]
+        self.assertEqual(frame_out.delivery_tag, 2)
+        self.assertFalse(frame_out.multiple)
+
+    def test_channel_coalesce_acks_no_ack_consumer(self):
+        channel = self.create_channel()
+        channel.coalesce_acks(flush_interval=60)
+        channel._no_ack_consumer_tags.add('travis-ci')
+
+        self.deliver(channel, 'travis-ci', 2)
+
+        self.assertIsNone(channel._acks._lowest_outstanding())
+
+    def test_channel_coalesce_acks_nack_sent_right_away(self):
+        channel = self.create_channel()
+        connection = channel._connection
+        channel.coalesce_acks(flush_interval=60)
+
+        messages = self.deliver(channel, 'travis-ci', 2)
+        messages[0].ack()
+        messages[1].nack()
+
+        self.assertEqual(len(connection.frames_out), 2)
+        self.assertIsInstance(connection.frames_out[0][1], commands.Basic.Ack)
+        self.assertIsInstance(connection.frames_out[1][1], commands.Basic.Nack)
+
+    def test_channel_coalesce_acks_flushed_on_close(self):
+        channel = self.create_channel()
+        connection = channel._connection
+        channel.coalesce_acks(flush_interval=60)
+        messages = self.deliver(channel, 'travis-ci', 1)
+        messages[0].ack()
+
+        def on_write(channel_id, frame_out):
+            if isinstance(frame_out, commands.Channel.Close):
+                channel.rpc.on_frame(commands.Channel.CloseOk())
+
+        connection.on_write = on_write
+        channel.close()
+
+        self.assertIsInstance(connection.frames_out[0][1], commands.Basic.Ack)
+        self.assertIsInstance(connection.frames_out[-1][1],
+                              commands.Channel.Close)
+        self.assertEqual(channel._acks.pending, 0)
+
+    def test_channel_coalesce_acks_channel_closed(self):
+        channel = self.create_channel()
+        channel.coalesce_acks(flush_interval=60)
+        channel.set_state(Channel.CLOSED)
+
+        self.assertRaisesRegex(
+            AMQPChannelError, 'channel closed',
+            channel.basic.ack, 1
+        )
+
+    def test_channel_coalesce_acks_invalid_parameters(self):
+        channel = self.create_channel()
+
+        self.assertRaisesRegex(
+            AMQPInvalidArgument, 'max_pending should be a positive integer',
+            channel.coalesce_acks, max_pending=0
+        )
+        self.assertRaisesRegex(
+            AMQPInvalidArgument,
+            'flush_interval should be a positive integer or float',
+            channel.coalesce_acks, flush_interval='1'
+        )
@@ -0,0 +1,92 @@
+import json
+import os
+import tempfile
+
+from benchmarks import __main__ as benchmarks_main
+from benchmarks.broker import FakeBroker
+from benchmarks.suite import BENCHMARKS
+from benchmarks.suite import compare
+from benchmarks.suite import run
+
+from amqpstorm.tests.utility import TestFramework
+
+
+class BenchmarkTests(TestFramework):
+    def test_benchmark_fake_broker_round_trip(self):
+        with FakeBroker() as broker:
+            broker.fill('travis-ci', 2, b'travis-ci')
+            with broker.connection() as connection:
+                channel = connection.channel()
+                channel.queue.declare('travis-ci')
+                channel.confirm_deliveries()
+                self.assertTrue(channel.basic.publish(b'hello', 'travis-ci'))
+                self.assertEqual(broker.message_count('travis-ci'), 3)
+
+                message = channel.basic.get('travis-ci', no_ack=True)
+                self.assertEqual(message.body, 'travis-ci')
+
+                channel.queue.purge('travis-ci')
+                self.assertIsNone(channel.basic.get('travis-ci'))
+
+    def test_benchmark_run_all(self):
+        results = run(messages=20)
+
+        names = {result['name'] for result in results['results']}
+        for name in BENCHMARKS:
+            self.assertIn(name, {name.split('.')[0] for name in names})
+        for result in results['results']:
+            self.assertGreater(result['value'], 0)
+            self.assertIn('unit', result)
+
+    def test_benchmark_unknown_name(self):
+        self.assertRaisesRegex(
+            ValueError, 'unknown benchmark: travis-ci',
+            run, 20, ['travis-ci']
+        )
+
+    def test_benchmark_main_writes_json(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'benchmark.json')
+            self.assertEqual(benchmarks_main.main(
+                ['--messages', '10', '--output', path, 'publish']
+            ), 0)
+            with open(path) as file_in:
+                results = json.load(file_in)
+
+        self.assertEqual([result['name'] for result in results['results']],
+                         ['publish'])
+
+    def test_benchmark_compare(self):
+        baseline = {'results': [
+            {'name': 'publish', 'value': 1000, 'unit': 'msg/s'},
+            {'name': 'rpc.p50', 'value': 100, 'unit': 'us'},
+            {'name': 'memory', 'value': 100, 'unit': 'B/msg'},
+        ]}
+        results = {'results': [
+            {'name': 'publish', 'value': 600, 'unit': 'msg/s'},
+            {'name': 'rpc.p50', 'value': 120, 'unit': 'us'},
+            {'name': 'memory', 'value': 50, 'unit': 'B/msg'},
+            {'name': 'consume', 'value': 1, 'unit': 'msg/s'},
+        ]}
+
+        self.assertEqual(compare(results, baseline, 0.3), [
+            'publish: 600 msg/s (baseline 1000 msg/s, 40% worse)'
+        ])
+        self.assertEqual(compare(results, baseline, 0.5), [])
+
+    def test_benchmark_main_baseline_regression(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'baseline.json')
+            with open(path, 'w') as file_out:
+                json.dump({'results': [
+                    {'name': 'publish', 'value': 1e12, 'unit': 'msg/s'}
+                ]}, file_out)
+
+            self.assertEqual(benchmarks_main.main(
+                ['--messages', '10', '--output', os.devnull,
+                 '--baseline', path, 'publish']
+            ), 1)
+            self.assertEqual(benchmarks_main.main(
+                ['--messages', '10', '--output', os.devnull,
+                 '--baseline', path, '--max-regression', '1', 'publish']
+            ), 0)
@@ -0,0 +1,71 @@
+from amqpstorm.channel_ids import ChannelIds
+from amqpstorm.tests.utility import TestFramework
+
+
+class ChannelIdsTests(TestFramework):
+    def test_channel_ids_are_sequential(self):
+        channel_ids = ChannelIds()
+
+        for index in range(1, 11):
+            self.assertEqual(channel_ids.acquire(10, lambda _: True), index)
+
+    def test_channel_ids_reuse_lowest_released_id(self):
+        channel_ids = ChannelIds()
+        for _ in range(10):
+            channel_ids.acquire(10, lambda _: True)
+
+        channel_ids.release(8)
+        channel_ids.release(2)
+        channel_ids.release(2)
+        channel_ids.release(0)
+
+        self.assertEqual(channel_ids.acquire(10, lambda _: True), 2)
+        self.assertEqual(channel_ids.acquire(10, lambda _: True), 8)
+        self.assertIsNone(channel_ids.acquire(10, lambda _: False))
+
+    def test_channel_ids_do_not_scan_used_ids(self):
+        channel_ids = ChannelIds()
+        checked = []
+
+        def is_available(channel_id):
+            checked.append(channel_id)
+            return True
+
+        for _ in range(1000):
+            channel_ids.acquire(65535, is_available)
+        channel_ids.release(500)
+
+        self.assertEqual(channel_ids.acquire(65535, is_available), 500)
+        self.assertEqual(channel_ids.acquire(65535, is_available), 1001)
+        self.assertEqual(len(checked), 1002)
+
+    def test_channel_ids_skip_released_ids_in_use(self):
+        channel_ids = ChannelIds()
+        for _ in range(3):
+            channel_ids.acquire(3, lambda _: True)
+        channel_ids.release(1)
+        channel_ids.release(2)
+
+        self.assertEqual(
+            channel_ids.acquire(3, lambda channel_id: channel_id != 1), 2
+        )
+
+    def test_channel_ids_reclaim_ids_freed_without_release(self):
+        channel_ids = ChannelIds()
+        for _ in range(10):
+            channel_ids.acquire(10, lambda _: True)
+
+        self.assertEqual(
+            channel_ids.acquire(10, lambda channel_id: channel_id in (4, 6)), 4
+        )
+        self.assertEqual(channel_ids.acquire(10, lambda _: True), 6)
+
+    def test_channel_ids_reset(self):
+        channel_ids = ChannelIds()
+        channel_ids.acquire(10, lambda _: True)
+        channel_ids.release(1)
+
+        channel_ids.reset()
+
+        self.assertEqual(channel_ids.acquire(10, lambda _: True), 1)
+        self.assertEqual(channel_ids.acquire(10, lambda _: True), 2)
@@ -0,0 +1,201 @@
+import math
+import socket
+import time
+from unittest import mock
+
+from benchmarks.broker import BrokerConnection
+from benchmarks.broker import FakeBroker
+from pamqp import commands
+
+from amqpstorm import AMQPConnectionError
+from amqpstorm import ClusterConnection
+from amqpstorm import RobustConnection
+from amqpstorm.cluster import parse_nodes
+from amqpstorm.exception import AMQPInvalidArgument
+from amqpstorm.tests.utility import TestFramework
+
+
+def unused_port():
+    sock = socket.socket()
+    sock.bind(('127.0.0.1', 0))
+    port = sock.getsockname()[1]
+    sock.close()
+    return port
+
+
+class ParseNodesTests(TestFramework):
+    def test_parse_nodes(self):
+        self.assertEqual(
+            parse_nodes(['rmq1', 'rmq2:5673', ('rmq3', 5674), '[::1]:5675',
+                         '[::1]', '::1'], port=5671),
+            [('rmq1', 5671), ('rmq2', 5673), ('rmq3', 5674), ('::1', 5675),
+             ('::1', 5671), ('::1', 5671)]
+        )
+
+    def test_parse_nodes_string(self):
+        self.assertEqual(parse_nodes('rmq1:5673, rmq2'),
+                         [('rmq1', 5673), ('rmq2', 5672)])
+
+    def test_parse_nodes_invalid(self):
+        for nodes, message in (
+            (None, 'nodes should be a list or a string'),
+            ([], 'nodes should contain at least one node'),
+            (['rmq1:travis'], "invalid cluster node: 'rmq1:travis'"),
+            ([('rmq1', '5672')], r"invalid cluster node: \('rmq1', '5672'\)"),
+            (['rmq1', ''], "invalid cluster node: ''"),
+        ):
+            self.assertRaisesRegex(AMQPInvalidArgument, message,
+                                   parse_nodes, nodes)
+
+
+class ClusterConnectionTests(TestFramework):
+    def create_connection(self, nodes, **kwargs):
+        return ClusterConnection(nodes, 'guest', 'guest', lazy=True, **kwargs)
+
+    def test_cluster_connection_invalid_parameters(self):
+        self.assertRaisesRegex(
+            AMQPInvalidArgument,
+            'strategy should be one of: shuffle, round_robin, latency',
+            self.create_connection, ['rmq1'], strategy='travis-ci'
+        )
+        self.assertRaisesRegex(
+            AMQPInvalidArgument,
+            'node_cooldown should be a non-negative integer or float',
+            self.create_connection, ['rmq1'], node_cooldown=-1
+        )
+
+    def test_cluster_connection_parameters(self):
+        connection = self.create_connection('rmq1:5673,rmq2',
+                                            virtual_host='travis')
+
+        self.assertEqual(connection.nodes, [('rmq1', 5673), ('rmq2', 5672)])
+        self.assertEqual(connection.node, ('rmq1', 5673))
+        self.assertEqual(connection.parameters['virtual_host'], 'travis')
+
+    def test_cluster_connection_round_robin(self):
+        connection = self.create_connection(['rmq1', 'rmq2', 'rmq3'],
+                                            strategy='round_robin')
+
+        first = connection._candidates()
+        second = connection._candidates()
+
+        self.assertEqual(sorted(first), sorted(second))
+        self.assertEqual(first[1:] + first[:1], second)
+
+    def test_cluster_connection_shuffle(self):
+        connection = self.create_connection(['rmq1', 'rmq2', 'rmq3'])
+
+        with mock.patch('random.shuffle', lambda nodes: nodes.reverse()):
+            self.assertEqual(connection._candidates(),
+                             [('rmq3', 5672), ('rmq2', 5672), ('rmq1', 5672)])
+
+    def test_cluster_connection_latency(self):
+        connection = self.create_connection(['rmq1', 'rmq2', 'rmq3'],
+                                            strategy='latency')
+        latency = {('rmq1', 5672): math.inf, ('rmq2', 5672): 0.2,
+                   ('rmq3', 5672): 0.1}
+        connection._connect_time = latency.__getitem__
+
+        self.assertEqual(connection._candidates(),
+                         [('rmq3', 5672), ('rmq2', 5672), ('rmq1', 5672)])
+        self.assertIn(('rmq1', 5672), connection._unavailable)
+
+    def test_cluster_connection_unavailable_nodes_last(self):
+        connection = self.create_connection(['rmq1', 'rmq2', 'rmq3'],
+                                            strategy='round_robin')
+        connection._set_unavailable(('rmq1', 5672))
+        connection._set_unavailable(('rmq2', 5672))
+        connection._unavailable[('rmq2', 5672)] = 0
+
+        for _ in range(3):
+            self.assertEqual(connection._candidates()[-1], ('rmq1', 5672))
+        self.assertNotIn(('rmq2', 5672), connection._unavailable)
+
+
+class ClusterConnectionFailoverTests(TestFramework):
+    def test_cluster_connection_fails_over(self):
+        dead_node = ('127.0.0.1', unused_port())
+        with FakeBroker() as broker:
+            node = ('127.0.0.1', broker.port)
+            for strategy in ('shuffle', 'round_robin', 'latency'):
+                connection = ClusterConnection([dead_node, node], 'guest',
+                                               'guest', strategy=strategy)
+                try:
+                    self.assertTrue(connection.is_open)
+                    self.assertEqual(connection.node, node)
+                    self.assertTrue(connection.channel().is_open)
+                finally:
+                    connection.close()
+
+    def test_cluster_connection_no_node_available(self):
+        nodes = [('127.0.0.1', unused_port()), ('127.0.0.1', unused_port())]
+
+        self.assertRaisesRegex(
+            AMQPConnectionError, 'no cluster node available: 127.0.0.1:',
+            ClusterConnection, nodes, 'guest', 'guest'
+        )
+
+    def test_cluster_connection_blocked_after_handshake(self):
+        def open_and_block(broker_connection, *_):
+            broker_connection._write(0, commands.Connection.OpenOk())
+            broker_connection._flush()
+            time.sleep(0.05)
+            broker_connection._write(0, commands.Connection.Blocked(
+                reason='low on memory'
+            ))
+
+        with FakeBroker() as first, FakeBroker() as second:
+            nodes = [('127.0.0.1', first.port), ('127.0.0.1', second.port)]
+            connection = ClusterConnection(nodes, 'guest', 'guest',
+                                           strategy='latency', lazy=True)
+            connection._measure_latency = lambda nodes: dict(
+                zip(nodes, range(len(nodes)))
+            )
+            with mock.patch.object(BrokerConnection, '_on_Connection_Open',
+                                   open_and_block):
+                connection.open()
+            try:
+                for _ in range(100):
+                    if connection.is_blocked:
+                        break
+                    time.sleep(0.01)
+
+                self.assertTrue(connection.is_blocked)
+                self.assertTrue(connection.is_open)
+                self.assertEqual(connection.node, nodes[0])
+                self.assertNotIn(nodes[0], connection._unavailable)
+            finally:
+                connection.close()
+
+    def test_robust_cluster_connection(self):
+        class RobustClusterConnection(RobustConnection, ClusterConnection):
+            pass
+
+        with FakeBroker() as first, FakeBroker() as second:
+            nodes = [('127.0.0.1', first.port), ('127.0.0.1', second.port)]
+            connection = RobustClusterConnection(nodes, 'guest', 'guest',
+                                                 strategy='round_robin',
+                                                 retry_delay=0.01)
+            try:
+                channel = connection.channel()
+                channel.queue.declare('travis-ci')
+                node = connection.node
+                broker = first if node == nodes[0] else second
+                broker.stop()
+                self.assertRaises(AMQPConnectionError,
+                                  self._wait_for_error, connection)
+
+                self.assertTrue(connection._wait_for_recovery())
+                self.assertNotEqual(connection.node, node)
+                self.assertTrue(channel.is_open)
+                other = second if broker is first else first
+                self.assertEqual(other.message_count('travis-ci'), 0)
+                self.assertIn('travis-ci', other.queues)
+            finally:
+                connection.close()
+
+    @staticmethod
+    def _wait_for_error(connection, timeout=5):
+        for _ in range(int(timeout / 0.01)):
+            connection.check_for_errors()
+            time.sleep(0.01)
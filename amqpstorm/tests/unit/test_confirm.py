@@ -0,0 +1,132 @@
+import threading
+import time
+
+from pamqp import commands
+
+from amqpstorm.confirm import ConfirmTracker
+from amqpstorm.exception import AMQPChannelError
+from amqpstorm.exception import AMQPConnectionError
+from amqpstorm.tests.utility import TestFramework
+from amqpstorm.tests.utility import fake_function
+
+
+class ConfirmTrackerTests(TestFramework):
+    def test_confirm_register(self):
+        confirms = ConfirmTracker()
+        confirms.register()
+        confirms.register()
+        self.assertEqual(confirms.delivery_tag, 2)
+        self.assertEqual(confirms.in_flight, 2)
+
+    def test_confirm_register_from_delivery_tag(self):
+        confirms = ConfirmTracker(delivery_tag=10)
+        confirms.register()
+        self.assertEqual(confirms.delivery_tag, 11)
+
+        confirms.on_frame(commands.Basic.Ack(delivery_tag=11))
+        self.assertEqual(confirms.in_flight, 0)
+
+    def test_confirm_unregister(self):
+        confirms = ConfirmTracker()
+        confirms.register()
+        future = confirms.register()
+        confirms.unregister(future)
+        self.assertEqual(confirms.delivery_tag, 1)
+        self.assertEqual(confirms.in_flight, 1)
+
+    def test_confirm_unregister_not_last(self):
+        confirms = ConfirmTracker()
+        future = confirms.register()
+        confirms.register()
+        confirms.unregister(future)
+        self.assertEqual(confirms.delivery_tag, 2)
+        self.assertEqual(confirms.in_flight, 2)
+
+    def test_confirm_ack(self):
+        confirms = ConfirmTracker()
+        future_1 = confirms.register()
+        future_2 = confirms.register()
+        confirms.on_frame(commands.Basic.Ack(delivery_tag=2))
+        self.assertFalse(future_1.done())
+        self.assertTrue(future_2.result())
+        self.assertEqual(confirms.in_flight, 1)
+
+    def test_confirm_nack(self):
+        confirms = ConfirmTracker()
+        future = confirms.register()
+        confirms.on_frame(commands.Basic.Nack(delivery_tag=1))
+        self.assertFalse(future.result())
+        self.assertEqual(confirms.in_flight, 0)
+
+    def test_confirm_ack_multiple(self):
+        confirms = ConfirmTracker()
+        futures = [confirms.register() for _ in range(5)]
+        confirms.on_frame(commands.Basic.Ack(delivery_tag=3, multiple=True))
+        self.assertTrue(all(future.result() for future in futures[:3]))
+        self.assertFalse(futures[3].done())
+        self.assertFalse(futures[4].done())
+        confirms.on_frame(commands.Basic.Nack(delivery_tag=5, multiple=True))
+        self.assertFalse(futures[3].result())
+        self.assertFalse(futures[4].result())
+        self.assertEqual(confirms.in_flight, 0)
+
+    def test_confirm_ack_multiple_zero_delivery_tag(self):
+        confirms = ConfirmTracker()
+        futures = [confirms.register() for _ in range(3)]
+        confirms.on_frame(commands.Basic.Ack(delivery_tag=0, multiple=True))
+        self.assertTrue(all(future.result() for future in futures))
+
+    def test_confirm_ack_unknown_delivery_tag(self):
+        confirms = ConfirmTracker()
+        future = confirms.register()
+        confirms.on_frame(commands.Basic.Ack(delivery_tag=10))
+        self.assertFalse(future.done())
+
+    def test_confirm_fail(self):
+        confirms = ConfirmTracker()
+        future = confirms.register()
+        confirms.fail(AMQPConnectionError('travis-ci'))
+        self.assertRaises(AMQPConnectionError, future.result)
+        self.assertEqual(confirms.in_flight, 0)
+
+    def test_confirm_wait(self):
+        confirms = ConfirmTracker()
+        confirms.register()
+        confirms.register()
+
+        def deliver_ack():
+            time.sleep(0.05)
+            confirms.on_frame(commands.Basic.Ack(delivery_tag=2,
+                                                 multiple=True))
+
+        thread = threading.Thread(target=deliver_ack)
+        thread.start()
+        confirms.wait(fake_function, timeout=1)
+        thread.join()
+        self.assertEqual(confirms.in_flight, 0)
+
+    def test_confirm_wait_max_in_flight(self):
+        confirms = ConfirmTracker(max_in_flight=2)
+        confirms.register()
+        confirms.register()
+        confirms.wait(fake_function, max_in_flight=2, timeout=0.01)
+
+    def test_confirm_wait_raises_on_timeout(self):
+        confirms = ConfirmTracker()
+        confirms.register()
+        self.assertRaisesRegex(
+            AMQPChannelError,
+            r'publisher confirms took too long \(1 in flight\)',
+            confirms.wait, fake_function, timeout=0.01
+        )
+
+    def test_confirm_wait_raises_on_error(self):
+        def check_for_errors():
+            raise AMQPConnectionError('travis-ci')
+
+        confirms = ConfirmTracker()
+        confirms.register()
+        self.assertRaises(
+            AMQPConnectionError,
+            confirms.wait, check_for_errors, timeout=1
+        )
@@ -0,0 +1,367 @@
+import socket
+import threading
+import time
+
+from pamqp import commands
+from pamqp.body import ContentBody
+from pamqp.header import ContentHeader
+
+from amqpstorm import Channel
+from amqpstorm import Connection
+from amqpstorm.confirm import ConfirmTracker
+from amqpstorm.exception import AMQPInvalidArgument
+from amqpstorm.flow import InboundCounter
+from amqpstorm.io import IO
+from amqpstorm.reactor import Reactor
+from amqpstorm.tests.utility import FakeConnection
+from amqpstorm.tests.utility import TestFramework
+
+
+class InboundCounterTests(TestFramework):
+    def test_inbound_counter(self):
+        counter = InboundCounter()
+        counter.receive(100, 1)
+        counter.receive(50, 1)
+        counter.consume(100, 1)
+
+        self.assertEqual(counter.bytes, 50)
+        self.assertEqual(counter.messages, 1)
+        self.assertFalse(counter.is_full)
+        self.assertTrue(counter.is_drained)
+
+    def test_inbound_counter_max_bytes(self):
+        counter = InboundCounter(max_bytes=100)
+
+        counter.receive(100, 1)
+        self.assertFalse(counter.is_full)
+        self.assertFalse(counter.is_drained)
+
+        counter.receive(1)
+        self.assertTrue(counter.is_full)
+
+        counter.consume(51)
+        self.assertFalse(counter.is_full)
+        self.assertTrue(counter.is_drained)
+
+    def test_inbound_counter_max_messages(self):
+        counter = InboundCounter(max_messages=2)
+
+        counter.receive(0, 3)
+        self.assertTrue(counter.is_full)
+
+        counter.consume(0, 1)
+        self.assertFalse(counter.is_full)
+        self.assertFalse(counter.is_drained)
+
+        counter.consume(0, 1)
+        self.assertTrue(counter.is_drained)
+
+    def test_inbound_counter_sets_drained_event(self):
+        drained = threading.Event()
+        counter = InboundCounter(max_messages=2, drained=drained)
+        counter.receive(0, 4)
+
+        counter.consume(0, 1)
+        self.assertFalse(drained.is_set())
+
+        counter.consume(0, 2)
+        self.assertTrue(drained.is_set())
+
+
+class InboundFlowControlTests(TestFramework):
+    @staticmethod
+    def deliver(channel, count, body=b'travis-ci'):
+        for delivery_tag in range(1, count + 1):
+            channel.on_frame(commands.Basic.Deliver(
+                consumer_tag='travis-ci', delivery_tag=delivery_tag
+            ))
+            channel.on_frame(ContentHeader(body_size=len(body)))
+            channel.on_frame(ContentBody(value=body))
+
+    @staticmethod
+    def create_channel(connection):
+        channel = Channel(1, connection, 1)
+        channel.set_state(Channel.OPEN)
+        connection._channels[1] = channel
+        return channel
+
+    def test_flow_inbound_accounting(self):
+        connection = FakeConnection()
+        channel = self.create_channel(connection)
+
+        self.deliver(channel, 3)
+
+        self.assertEqual(channel.inbound_messages, 3)
+        self.assertEqual(channel.inbound_bytes, 27)
+        self.assertEqual(connection.inbound_messages, 3)
+        self.assertEqual(connection.inbound_bytes, 27)
+
+        messages = list(channel.build_inbound_messages(break_on_empty=True))
+
+        self.assertEqual(len(messages), 3)
+        self.assertEqual(channel.inbound_messages, 0)
+        self.assertEqual(channel.inbound_bytes, 0)
+        self.assertEqual(connection.inbound_bytes, 0)
+
+    def test_flow_inbound_accounting_cleared_on_close(self):
+        connection = FakeConnection()
+        channel = self.create_channel(connection)
+        self.deliver(channel, 2)
+
+        channel.on_frame(commands.Channel.Close(reply_code=404))
+
+        self.assertEqual(channel.inbound_bytes, 0)
+        self.assertEqual(connection.inbound_messages, 0)
+        self.assertEqual(connection.inbound_bytes, 0)
+
+    def test_flow_connection_limit_pauses_reading(self):
+        connection = FakeConnection()
+        connection._inbound_counter.max_messages = 4
+        channel = self.create_channel(connection)
+
+        self.deliver(channel, 4)
+        self.assertFalse(connection._is_inbound_paused())
+
+        self.deliver(channel, 1)
+        self.assertTrue(connection._is_inbound_paused())
+
+        generator = channel.build_inbound_messages(break_on_empty=True)
+        for _ in range(2):
+            next(generator)
+        self.assertTrue(connection._is_inbound_paused())
+
+        next(generator)
+        self.assertFalse(connection._is_inbound_paused())
+        self.assertFalse(connection._inbound_paused)
+
+    def test_flow_channel_limit_pauses_reading(self):
+        connection = FakeConnection()
+        channel = self.create_channel(connection)
+        channel.set_inbound_limits(max_bytes=20)
+
+        self.deliver(channel, 3)
+
+        self.assertIn(channel, connection._full_channels)
+        self.assertTrue(connection._is_inbound_paused())
+
+        generator = channel.build_inbound_messages(break_on_empty=True)
+        for _ in range(2):
+            next(generator)
+
+        self.assertFalse(connection._is_inbound_paused())
+        self.assertFalse(connection._full_channels)
+
+    def test_flow_closed_channel_resumes_reading(self):
+        connection = FakeConnection()
+        channel = self.create_channel(connection)
+        channel.set_inbound_limits(max_messages=1)
+        self.deliver(channel, 2)
+        self.assertTrue(connection._is_inbound_paused())
+
+        channel.set_state(Channel.CLOSED)
+
+        self.assertFalse(connection._is_inbound_paused())
+
+    def test_flow_paused_connection_keeps_heartbeat_alive(self):
+        connection = FakeConnection()
+        connection._inbound_counter.max_bytes = 1
+        channel = self.create_channel(connection)
+        self.deliver(channel, 1)
+        connection.heartbeat._reads_since_check = 0
+
+        self.assertTrue(connection._is_inbound_paused())
+        self.assertEqual(connection.heartbeat._reads_since_check, 1)
+
+    def test_flow_io_does_not_read_while_paused(self):
+        sock_rd, sock_wr = socket.socketpair()
+        paused = threading.Event()
+        paused.set()
+        received = []
+
+        def on_read(data_in):
+            received.append(bytes(data_in))
+            return bytearray()
+
+        connection = FakeConnection()
+        io = IO(connection.parameters, on_read_impl=on_read,
+                is_paused_impl=paused.is_set)
+        io.socket = sock_rd
+        io.poller = io._create_poller(sock_rd.fileno())
+        io._running.set()
+        try:
+            io.start_inbound()
+            sock_wr.send(b'travis-ci')
+            time.sleep(0.05)
+            self.assertEqual(received, [])
+
+            paused.clear()
+            io.inbound_drained.set()
+            for _ in range(100):
+                if received:
+                    break
+                time.sleep(0.01)
+            self.assertEqual(received, [b'travis-ci'])
+        finally:
+            io.close()
+            sock_wr.close()
+
+    def test_flow_consuming_wakes_paused_io(self):
+        connection = FakeConnection()
+        connection._inbound_counter.max_messages = 1
+        channel = self.create_channel(connection)
+        self.deliver(channel, 2)
+        self.assertTrue(connection._is_inbound_paused())
+        connection._io.inbound_drained.clear()
+
+        list(channel.build_inbound_messages(break_on_empty=True))
+
+        self.assertTrue(connection._io.inbound_drained.is_set())
+        self.assertFalse(connection._is_inbound_paused())
+
+    def test_flow_rpc_request_keeps_reading(self):
+        connection = FakeConnection()
+        connection._inbound_counter.max_messages = 1
+        channel = self.create_channel(connection)
+        self.deliver(channel, 2)
+        self.assertTrue(connection._is_inbound_paused())
+        connection._io.inbound_drained.clear()
+
+        uuid = channel.rpc.register_request(['Queue.DeclareOk'])
+
+        self.assertTrue(connection._io.inbound_drained.is_set())
+        self.assertFalse(connection._is_inbound_paused())
+
+        channel.rpc.remove(uuid)
+
+        self.assertTrue(connection._is_inbound_paused())
+
+    def test_flow_confirm_waiter_keeps_reading(self):
+        connection = FakeConnection()
+        connection._inbound_counter.max_messages = 1
+        channel = self.create_channel(connection)
+        channel._confirms = ConfirmTracker(
+            on_wait=connection._wake_inbound
+        )
+        channel._confirms.register()
+        self.deliver(channel, 2)
+        self.assertTrue(connection._is_inbound_paused())
+        connection._io.inbound_drained.clear()
+
+        waiter = threading.Thread(target=channel.wait_for_confirms)
+        waiter.start()
+        self.assertTrue(connection._io.inbound_drained.wait(1))
+        self.assertFalse(connection._is_inbound_paused())
+
+        channel._confirms.on_frame(commands.Basic.Ack(delivery_tag=1))
+        waiter.join(1)
+
+        self.assertFalse(waiter.is_alive())
+        self.assertTrue(connection._is_inbound_paused())
+
+    def test_flow_callback_rpc_request_while_paused(self):
+        sock_rd, sock_wr = socket.socketpair()
+
+        def on_write(_, frame_out):
+            if frame_out.name == 'Queue.Declare':
+                sock_wr.send(b'travis-ci')
+
+        def on_read(_):
+            channel.on_frame(commands.Queue.DeclareOk(
+                queue='travis-ci', message_count=0, consumer_count=0
+            ))
+            return bytearray()
+
+        connection = FakeConnection(on_write=on_write)
+        connection._inbound_counter.max_messages = 1
+        channel = self.create_channel(connection)
+        self.deliver(channel, 3)
+        io = connection._io
+        io._on_read_impl = on_read
+        io.socket = sock_rd
+        io.poller = io._create_poller(sock_rd.fileno())
+        io._running.set()
+        try:
+            io.start_inbound()
+            time.sleep(0.05)
+            self.assertTrue(connection._inbound_paused)
+
+            for _ in channel.build_inbound_messages(break_on_empty=True):
+                start = time.monotonic()
+                result = channel.queue.declare('travis-ci')
+                self.assertLess(time.monotonic() - start, 0.5)
+                self.assertEqual(result['queue'], 'travis-ci')
+                break
+        finally:
+            io.close()
+            sock_wr.close()
+
+    def test_flow_reactor_unregisters_socket_while_paused(self):
+        reactor = Reactor()
+        sock_rd, sock_wr = socket.socketpair()
+        paused = threading.Event()
+        received = []
+        readable = threading.Event()
+
+        def on_read(data_in):
+            received.append(bytes(data_in))
+            paused.set()
+            readable.set()
+            return bytearray()
+
+        connection = FakeConnection()
+        connection.parameters['reactor'] = reactor
+        io = IO(connection.parameters, on_read_impl=on_read,
+                is_paused_impl=paused.is_set)
+        io.socket = sock_rd
+        io._running.set()
+        try:
+            io.start_inbound()
+            sock_wr.send(b'travis-ci')
+            self.assertTrue(readable.wait(1))
+            for _ in range(100):
+                if not reactor.sockets:
+                    break
+                time.sleep(0.01)
+            self.assertEqual(reactor.sockets, 0)
+
+            readable.clear()
+            sock_wr.send(b'travis-ci')
+            paused.clear()
+            self.assertTrue(readable.wait(1))
+            self.assertEqual(received, [b'travis-ci', b'travis-ci'])
+        finally:
+            io.close()
+            sock_wr.close()
+            reactor.stop()
+
+    def test_flow_invalid_parameters(self):
+        self.assertRaisesRegex(
+            AMQPInvalidArgument,
+            'max_inbound_bytes should be a positive integer or None',
+            Connection, 'localhost', 'guest', 'guest',
+            max_inbound_bytes=0, lazy=True
+        )
+        self.assertRaisesRegex(
+            AMQPInvalidArgument,
+            'max_inbound_messages should be a positive integer or None',
+            Connection, 'localhost', 'guest', 'guest',
+            max_inbound_messages='1', lazy=True
+        )
+
+        channel = self.create_channel(FakeConnection())
+        self.assertRaisesRegex(
+            AMQPInvalidArgument, 'max_bytes should be a positive integer',
+            channel.set_inbound_limits, max_bytes=0
+        )
+        self.assertRaisesRegex(
+            AMQPInvalidArgument, 'max_messages should be a positive integer',
+            channel.set_inbound_limits, max_messages=1.5
+        )
+
+    def test_flow_connection_parameters(self):
+        connection = Connection('localhost', 'guest', 'guest',
+                                max_inbound_bytes=1024,
+                                max_inbound_messages=10, lazy=True)
+
+        self.assertEqual(connection._inbound_counter.max_bytes, 1024)
+        self.assertEqual(connection._inbound_counter.max_messages, 10)
@@ -1,6 +1,10 @@
+import tracemalloc
 import uuid
 from datetime import datetime
 
+from pamqp import commands
+
+from amqpstorm import LazyMessage
 from amqpstorm import Message
 from amqpstorm.exception import AMQPMessageError
 from amqpstorm.tests.utility import FakeChannel
@@ -490,3 +494,99 @@ class MessageTests(TestFramework):
         self.assertIsInstance(method, dict)
         self.assertIsInstance(properties, dict)
         self.assertIsNone(channel)
+
+
+class LazyMessageTests(TestFramework):
+    @staticmethod
+    def create_frames():
+        basic_deliver = commands.Basic.Deliver(
+            consumer_tag='travis-ci', delivery_tag=8, redelivered=True,
+            exchange='amq.direct', routing_key='travis-ci'
+        )
+        properties = commands.Basic.Properties(
+            content_type='text/plain', message_id=str(uuid.uuid4()),
+            headers={b'name': b'eandersson'}
+        )
+        return basic_deliver, properties
+
+    def test_lazy_message_reads_frames(self):
+        basic_deliver, properties = self.create_frames()
+
+        message = LazyMessage.from_frames(FakeChannel(), b'travis-ci',
+                                          basic_deliver, properties,
+                                          auto_decode=True)
+
+        self.assertEqual(message.body, 'travis-ci')
+        self.assertEqual(message.delivery_tag, 8)
+        self.assertTrue(message.redelivered)
+        self.assertEqual(message.content_type, 'text/plain')
+        self.assertEqual(message.message_id, properties.message_id)
+        self.assertIsNone(message.app_id)
+        self.assertIsNotNone(message._properties_frame)
+
+    def test_lazy_message_matches_message(self):
+        basic_deliver, properties = self.create_frames()
+
+        for auto_decode in (True, False):
+            message = Message.from_frames(None, b'travis-ci', basic_deliver,
+                                          properties, auto_decode=auto_decode)
+            lazy_message = LazyMessage.from_frames(None, b'travis-ci',
+                                                   basic_deliver, properties,
+                                                   auto_decode=auto_decode)
+
+            self.assertEqual(lazy_message.method, message.method)
+            self.assertEqual(lazy_message.properties, message.properties)
+            self.assertEqual(lazy_message.to_dict(), message.to_dict())
+            self.assertEqual(lazy_message.to_tuple(), message.to_tuple())
+            self.assertEqual(dict(lazy_message), dict(message))
+
+    def test_lazy_message_update_properties(self):
+        basic_deliver, properties = self.create_frames()
+        message = LazyMessage.from_frames(None, b'travis-ci', basic_deliver,
+                                          properties, auto_decode=True)
+
+        message.content_type = 'application/json'
+
+        self.assertIsNone(message._properties_frame)
+        self.assertEqual(message.content_type, 'application/json')
+        self.assertEqual(message.properties['content_type'],
+                         'application/json')
+        self.assertEqual(properties.content_type, 'text/plain')
+
+    def test_lazy_message_created_directly(self):
+        message = LazyMessage(None, body=self.message,
+                              properties={'app_id': 'travis-ci'})
+
+        self.assertEqual(message.app_id, 'travis-ci')
+        self.assertIsNone(message.delivery_tag)
+        self.assertIsNone(message.redelivered)
+
+    def test_lazy_message_unknown_attribute(self):
+        message = LazyMessage(None, body=self.message)
+
+        self.assertRaises(AttributeError, getattr, message, 'travis_ci')
+
+    def test_lazy_message_allocates_less_than_message(self):
+        basic_deliver, properties = self.create_frames()
+
+        def allocated_blocks(message_impl):
+            messages = []
+            tracemalloc.start()
+            try:
+                before = tracemalloc.take_snapshot()
+                for _ in range(1000):
+                    message = message_impl.from_frames(
+                        None, b'travis-ci', basic_deliver, properties,
+                        auto_decode=True
+                    )
+                    _ = message.delivery_tag
+                    messages.append(message)
+                after = tracemalloc.take_snapshot()
+            finally:
+                tracemalloc.stop()
+            return sum(stat.count_diff for stat in after.compare_to(
+                before, 'filename'
+            ))
+
+        self.assertLess(allocated_blocks(LazyMessage) * 2,
+                        allocated_blocks(Message))
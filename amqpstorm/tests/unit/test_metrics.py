@@ -0,0 +1,278 @@
+import sys
+import types
+from unittest import mock
+
+from pamqp import commands
+from pamqp import frame as pamqp_frame
+from pamqp.body import ContentBody
+from pamqp.header import ContentHeader
+from pamqp.heartbeat import Heartbeat as HeartbeatFrame
+
+from amqpstorm import Channel
+from amqpstorm import Connection
+from amqpstorm import Metrics
+from amqpstorm.confirm import ConfirmTracker
+from amqpstorm.exception import AMQPInvalidArgument
+from amqpstorm.heartbeat import Heartbeat
+from amqpstorm.metrics import OpenTelemetryMetrics
+from amqpstorm.metrics import PrometheusMetrics
+from amqpstorm.rpc import Rpc
+from amqpstorm.tests.utility import FakeChannel
+from amqpstorm.tests.utility import FakeConnection
+from amqpstorm.tests.utility import TestFramework
+
+
+class RecordingMetrics(Metrics):
+    def __init__(self):
+        super(RecordingMetrics, self).__init__()
+        self.calls = []
+
+    def on_frames_sent(self, frames, size):
+        self.calls.append(('sent', frames, size))
+
+    def on_frames_received(self, frames, size):
+        self.calls.append(('received', frames, size))
+
+    def on_message_received(self):
+        self.calls.append(('message',))
+
+    def on_publish(self, messages, duration):
+        self.calls.append(('publish', messages))
+
+    def on_confirm(self, acked, duration):
+        self.calls.append(('confirm', acked))
+
+    def on_rpc(self, method, duration):
+        self.calls.append(('rpc', method))
+
+    def on_heartbeat_missed(self):
+        self.calls.append(('heartbeat',))
+
+
+class ConnectionMetricsTests(TestFramework):
+    def create_connection(self):
+        self.metrics = RecordingMetrics()
+        connection = Connection('localhost', 'guest', 'guest',
+                                metrics=self.metrics, lazy=True)
+        connection._io.write_to_socket = lambda data_out: None
+        return connection
+
+    def test_metrics_invalid_parameter(self):
+        self.assertRaisesRegex(
+            AMQPInvalidArgument,
+            'metrics should be a Metrics or None',
+            Connection, 'localhost', 'guest', 'guest', metrics='travis-ci',
+            lazy=True
+        )
+
+    def test_metrics_frames_sent(self):
+        connection = self.create_connection()
+        frame_size = len(pamqp_frame.marshal(HeartbeatFrame(), 0))
+
+        connection.write_frame(0, HeartbeatFrame())
+        connection.write_frames(0, [HeartbeatFrame(), HeartbeatFrame()])
+        connection.write_marshalled_frames(b''.join([
+            pamqp_frame.marshal(commands.Basic.Publish(), 1),
+            pamqp_frame.marshal(ContentHeader(body_size=2), 1),
+            pamqp_frame.marshal(ContentBody(b'ci'), 1),
+        ]))
+
+        self.assertEqual(self.metrics.calls[:2], [
+            ('sent', 1, frame_size), ('sent', 2, frame_size * 2)
+        ])
+        self.assertEqual(self.metrics.calls[2][:2], ('sent', 3))
+
+    def test_metrics_frames_received(self):
+        connection = self.create_connection()
+        data_in = bytearray(pamqp_frame.marshal(HeartbeatFrame(), 0) * 2)
+        size = len(data_in)
+        data_in += b'\x08'
+
+        self.assertEqual(connection._read_buffer(data_in), b'\x08')
+        self.assertEqual(self.metrics.calls, [('received', 2, size)])
+
+    def test_metrics_no_frames_received(self):
+        connection = self.create_connection()
+
+        connection._read_buffer(bytearray(b'\x08'))
+
+        self.assertEqual(self.metrics.calls, [])
+
+    def test_metrics_inbound_gauges(self):
+        connection = self.create_connection()
+        channel = Channel(1, connection, 1)
+        channel.set_state(Channel.OPEN)
+        connection._channels[1] = channel
+
+        channel.on_frame(commands.Basic.Deliver(delivery_tag=1))
+        channel.on_frame(ContentHeader(body_size=6))
+        channel.on_frame(ContentBody(b'travis'))
+
+        self.assertEqual(self.metrics.calls, [('message',)])
+        self.assertEqual(self.metrics.inbound_messages, 1)
+        self.assertEqual(self.metrics.inbound_bytes, 6)
+
+    def test_metrics_heartbeat_missed(self):
+        metrics = RecordingMetrics()
+        heartbeat = Heartbeat(60, lambda: None, metrics=metrics)
+        heartbeat._running.set()
+        heartbeat._start_new_timer = lambda: True
+
+        heartbeat.register_read()
+        heartbeat._check_for_life_signs()
+        self.assertEqual(metrics.calls, [])
+
+        heartbeat._check_for_life_signs()
+        self.assertEqual(metrics.calls, [('heartbeat',)])
+
+    def test_metrics_rpc(self):
+        metrics = RecordingMetrics()
+        rpc = Rpc(FakeChannel(), timeout=1, metrics=metrics)
+        uuid = rpc.register_request(['Queue.DeclareOk'])
+        rpc.on_frame(commands.Queue.DeclareOk())
+
+        rpc.get_request(uuid)
+
+        self.assertEqual(metrics.calls, [('rpc', 'Queue.DeclareOk')])
+
+
+class PublishMetricsTests(TestFramework):
+    def create_channel(self, on_write=None):
+        self.metrics = RecordingMetrics()
+        connection = FakeConnection(on_write=on_write)
+        connection._metrics = self.metrics
+        channel = Channel(1, connection, 1)
+        channel.set_state(Channel.OPEN)
+        return channel
+
+    def test_metrics_publish(self):
+        channel = self.create_channel()
+
+        channel.basic.publish(b'travis-ci', 'travis-ci')
+        channel.basic.publish_batch([(b'travis', 'ci'), (b'travis', 'ci')])
+
+        self.assertEqual(self.metrics.calls,
+                         [('publish', 1), ('publish', 2)])
+
+    def test_metrics_publish_confirm(self):
+        def on_write(*_):
+            channel.rpc.on_frame(commands.Basic.Nack())
+
+        channel = self.create_channel(on_write=on_write)
+        channel._confirming_deliveries = True
+
+        self.assertFalse(channel.basic.publish(b'travis-ci', 'travis-ci'))
+        self.assertEqual(self.metrics.calls,
+                         [('rpc', 'Basic.Nack'), ('confirm', False),
+                          ('publish', 1)])
+
+    def test_metrics_publish_confirm_async(self):
+        channel = self.create_channel()
+        channel._confirming_deliveries = True
+        channel._confirms = ConfirmTracker()
+
+        futures = channel.basic.publish_batch([(b'travis', 'ci'),
+                                               (b'travis', 'ci')])
+        self.assertEqual(self.metrics.calls, [('publish', 2)])
+
+        channel.on_frame(commands.Basic.Ack(delivery_tag=2, multiple=True))
+
+        self.assertTrue(all(future.result() for future in futures))
+        self.assertEqual(self.metrics.calls,
+                         [('publish', 2), ('confirm', True),
+                          ('confirm', True)])
+
+
+class PrometheusMetricsTests(TestFramework):
+    def test_prometheus_expose(self):
+        metrics = PrometheusMetrics(buckets=(0.1, 0.01))
+        metrics.on_frames_sent(2, 20)
+        metrics.on_frames_received(1, 8)
+        metrics.on_message_received()
+        metrics.on_publish(3, 0.005)
+        metrics.on_confirm(True, 0.05)
+        metrics.on_confirm(False, 1.0)
+        metrics.on_rpc('Queue.DeclareOk', 0.001)
+        metrics.on_heartbeat_missed()
+
+        lines = metrics.expose().splitlines()
+
+        for line in (
+            '# TYPE amqpstorm_frames_sent_total counter',
+            'amqpstorm_frames_sent_total 2',
+            'amqpstorm_bytes_sent_total 20',
+            'amqpstorm_frames_received_total 1',
+            'amqpstorm_bytes_received_total 8',
+            'amqpstorm_messages_received_total 1',
+            'amqpstorm_messages_published_total 3',
+            'amqpstorm_heartbeats_missed_total 1',
+            '# TYPE amqpstorm_publish_duration_seconds histogram',
+            'amqpstorm_publish_duration_seconds_bucket{le="0.01"} 1',
+            'amqpstorm_publish_duration_seconds_bucket{le="+Inf"} 1',
+            'amqpstorm_publish_duration_seconds_count 1',
+            'amqpstorm_confirm_duration_seconds_bucket'
+            '{result="ack",le="0.01"} 0',
+            'amqpstorm_confirm_duration_seconds_bucket'
+            '{result="ack",le="0.1"} 1',
+            'amqpstorm_confirm_duration_seconds_bucket'
+            '{result="nack",le="0.1"} 0',
+            'amqpstorm_confirm_duration_seconds_bucket'
+            '{result="nack",le="+Inf"} 1',
+            'amqpstorm_confirm_duration_seconds_sum{result="nack"} 1.0',
+            'amqpstorm_rpc_duration_seconds_count{method="Queue.DeclareOk"} 1',
+            '# TYPE amqpstorm_inbound_messages gauge',
+            'amqpstorm_inbound_messages 0',
+            'amqpstorm_inbound_bytes 0',
+        ):
+            self.assertIn(line, lines)
+
+    def test_prometheus_prefix(self):
+        metrics = PrometheusMetrics(prefix='travis')
+
+        self.assertIn('travis_frames_sent_total 0',
+                      metrics.expose().splitlines())
+
+
+class OpenTelemetryMetricsTests(TestFramework):
+    def setUp(self):
+        super(OpenTelemetryMetricsTests, self).setUp()
+        module = types.ModuleType('opentelemetry.metrics')
+        module.Observation = lambda value, attributes=None: value
+        patcher = mock.patch.dict(sys.modules, {
+            'opentelemetry': types.ModuleType('opentelemetry'),
+            'opentelemetry.metrics': module,
+        })
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_opentelemetry_instruments(self):
+        meter = mock.Mock()
+        metrics = OpenTelemetryMetrics(meter)
+        metrics.on_frames_sent(2, 20)
+        metrics.on_confirm(False, 0.5)
+        metrics.on_rpc('Queue.DeclareOk', 0.25)
+
+        calls = meter.create_counter.mock_calls
+        calls.extend(meter.create_histogram.mock_calls)
+        instruments = {call.args[0] for call in calls if call.args}
+        self.assertIn('amqpstorm.frames.sent', instruments)
+        self.assertIn('amqpstorm.rpc.duration', instruments)
+        metrics._frames_sent.add.assert_any_call(2)
+        metrics._confirm_duration.record.assert_any_call(
+            0.5, {'result': 'nack'}
+        )
+        metrics._rpc_duration.record.assert_any_call(
+            0.25, {'method': 'Queue.DeclareOk'}
+        )
+
+    def test_opentelemetry_inbound_gauges(self):
+        meter = mock.Mock()
+        OpenTelemetryMetrics(meter)
+
+        gauges = {
+            call.args[0]: call.kwargs['callbacks'][0]
+            for call in meter.create_observable_gauge.mock_calls
+        }
+
+        self.assertEqual(gauges['amqpstorm.inbound.messages'](None), [0])
+        self.assertEqual(gauges['amqpstorm.inbound.bytes'](None), [0])
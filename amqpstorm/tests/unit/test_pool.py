@@ -0,0 +1,332 @@
+import threading
+import time
+
+from unittest import mock
+
+from pamqp import commands
+
+from amqpstorm import Channel
+from amqpstorm.exception import AMQPChannelError
+from amqpstorm.exception import AMQPConnectionError
+from amqpstorm.exception import AMQPInvalidArgument
+from amqpstorm.pool import ConnectionPool
+from amqpstorm.tests.utility import FakeConnection
+from amqpstorm.tests.utility import TestFramework
+
+
+class PoolConnection(FakeConnection):
+    """Fake Connection that opens, and closes, Channels right away."""
+
+    def __init__(self, *_, **__):
+        super(PoolConnection, self).__init__(PoolConnection.CLOSED)
+        self.opened_channels = 0
+
+    def open(self):
+        self.set_state(self.OPEN)
+
+    def channel(self, rpc_timeout=60, lazy=False):
+        self.opened_channels += 1
+        channel = Channel(self.opened_channels, self, rpc_timeout)
+        channel.set_state(Channel.OPEN)
+        self._channels[channel.channel_id] = channel
+        return channel
+
+    def write_frame(self, channel_id, frame_out):
+        super(PoolConnection, self).write_frame(channel_id, frame_out)
+        if isinstance(frame_out, commands.Basic.Cancel):
+            self._channels[channel_id].rpc.on_frame(
+                commands.Basic.CancelOk(consumer_tag=frame_out.consumer_tag)
+            )
+        elif isinstance(frame_out, commands.Channel.Close):
+            self._channels[channel_id].rpc.on_frame(
+                commands.Channel.CloseOk()
+            )
+        elif isinstance(frame_out, commands.Tx.Select):
+            self._channels[channel_id].rpc.on_frame(commands.Tx.SelectOk())
+
+    def close(self):
+        self.set_state(self.CLOSED)
+
+
+@mock.patch('amqpstorm.pool.Connection', PoolConnection)
+class ConnectionPoolTests(TestFramework):
+    @staticmethod
+    def create_pool(**kwargs):
+        return ConnectionPool('localhost', 'guest', 'guest', **kwargs)
+
+    def test_pool_channel_is_reused(self):
+        pool = self.create_pool()
+
+        with pool.channel() as channel:
+            self.assertIsInstance(channel, Channel)
+            self.assertEqual(pool.in_use, 1)
+        with pool.channel() as second_channel:
+            self.assertIs(second_channel, channel)
+
+        self.assertEqual(pool.connections, 1)
+        self.assertEqual(pool.idle, 1)
+        self.assertEqual(pool.in_use, 0)
+        self.assertEqual(channel._connection.opened_channels, 1)
+
+    def test_pool_channels_are_spread_over_connections(self):
+        pool = self.create_pool(max_connections=2, channels_per_connection=2)
+
+        with pool.channel() as channel_1, pool.channel() as channel_2:
+            with pool.channel() as channel_3, pool.channel() as channel_4:
+                self.assertIs(channel_1._connection, channel_2._connection)
+                self.assertIs(channel_3._connection, channel_4._connection)
+                self.assertIsNot(channel_1._connection, channel_3._connection)
+                self.assertEqual(pool.in_use, 4)
+
+                with self.assertRaisesRegex(AMQPChannelError,
+                                            'timed out waiting for an '
+                                            'available channel'):
+                    with pool.channel(timeout=0.01):
+                        pass
+
+        self.assertEqual(pool.connections, 2)
+        self.assertEqual(pool.idle, 4)
+
+    def test_pool_checkout_waits_for_checkin(self):
+        pool = self.create_pool(channels_per_connection=1)
+        checked_out = threading.Event()
+
+        def hold_channel():
+            with pool.channel():
+                checked_out.set()
+                time.sleep(0.05)
+
+        thread = threading.Thread(target=hold_channel)
+        thread.start()
+        checked_out.wait(1)
+        with pool.channel(timeout=1):
+            self.assertEqual(pool.in_use, 1)
+        thread.join()
+
+    def test_pool_channel_error_discards_channel(self):
+        pool = self.create_pool()
+
+        with self.assertRaisesRegex(AMQPChannelError, 'travis-ci'):
+            with pool.channel() as channel:
+                raise AMQPChannelError('travis-ci')
+
+        self.assertTrue(channel.is_closed)
+        self.assertEqual(pool.idle, 0)
+        self.assertEqual(pool.in_use, 0)
+        self.assertEqual(pool.connections, 1)
+
+    def test_pool_other_error_returns_channel(self):
+        pool = self.create_pool()
+
+        with self.assertRaises(ValueError):
+            with pool.channel():
+                raise ValueError()
+
+        self.assertEqual(pool.idle, 1)
+
+    def test_pool_connection_error_replaces_connection(self):
+        pool = self.create_pool()
+
+        with self.assertRaisesRegex(AMQPConnectionError, 'travis-ci'):
+            with pool.channel() as channel:
+                raise AMQPConnectionError('travis-ci')
+
+        self.assertTrue(channel._connection.is_closed)
+        self.assertEqual(pool.connections, 0)
+        self.assertEqual(pool.in_use, 0)
+
+        with pool.channel() as new_channel:
+            self.assertIsNot(new_channel._connection, channel._connection)
+
+    def test_pool_unhealthy_channel_is_replaced(self):
+        pool = self.create_pool()
+
+        with pool.channel() as channel:
+            pass
+        channel._connection.set_state(PoolConnection.CLOSED)
+
+        with pool.channel() as new_channel:
+            self.assertIsNot(new_channel, channel)
+            self.assertIsNot(new_channel._connection, channel._connection)
+        self.assertEqual(pool.connections, 1)
+
+    def test_pool_reconnects_when_opening_channel_fails(self):
+        pool = self.create_pool()
+        with pool.channel() as channel:
+            pass
+        channel._connection.channel = mock.Mock(
+            side_effect=AMQPConnectionError('travis-ci')
+        )
+        channel.set_state(Channel.CLOSED)
+
+        with pool.channel() as new_channel:
+            self.assertIsNot(new_channel._connection, channel._connection)
+        self.assertTrue(channel._connection.is_closed)
+        self.assertEqual(pool.connections, 1)
+        self.assertEqual(pool.idle, 1)
+
+    def test_pool_consuming_channel_is_not_reused(self):
+        pool = self.create_pool()
+
+        with pool.channel() as channel:
+            channel.add_consumer_tag('travis-ci')
+
+        self.assertTrue(channel.is_closed)
+        self.assertEqual(pool.idle, 0)
+
+    def test_pool_evicts_idle_channels(self):
+        pool = self.create_pool(max_idle=0.01)
+
+        with pool.channel() as channel:
+            pass
+        time.sleep(0.02)
+        with pool.channel() as new_channel:
+            self.assertIsNot(new_channel, channel)
+
+        self.assertTrue(channel.is_closed)
+        self.assertTrue(channel._connection.is_closed)
+        self.assertEqual(pool.connections, 1)
+
+    def test_pool_close(self):
+        pool = self.create_pool()
+        with pool.channel() as channel:
+            pass
+
+        pool.close()
+
+        self.assertTrue(channel.is_closed)
+        self.assertTrue(channel._connection.is_closed)
+        self.assertEqual(pool.connections, 0)
+        self.assertEqual(pool.idle, 0)
+        with self.assertRaisesRegex(AMQPConnectionError,
+                                    'connection pool closed'):
+            with pool.channel():
+                pass
+
+    def test_pool_close_while_channel_checked_out(self):
+        with self.create_pool() as pool:
+            with pool.channel() as channel:
+                pool.close()
+
+        self.assertTrue(channel.is_closed)
+        self.assertEqual(pool.in_use, 0)
+
+    def test_pool_does_not_reuse_channels_with_changed_settings(self):
+        pool = self.create_pool()
+
+        with pool.channel() as channel:
+            channel._confirming_deliveries = True
+        with pool.channel() as second_channel:
+            second_channel.coalesce_acks()
+        with pool.channel() as third_channel:
+            third_channel.basic._prefetch = (10, 0)
+
+        self.assertTrue(channel.is_closed)
+        self.assertTrue(second_channel.is_closed)
+        self.assertTrue(third_channel.is_closed)
+        self.assertEqual(pool.idle, 0)
+        self.assertEqual(pool.in_use, 0)
+
+    def test_pool_transactional_channel_is_not_reused(self):
+        pool = self.create_pool()
+
+        with pool.channel() as channel:
+            channel.tx.select()
+        with pool.channel() as new_channel:
+            self.assertIsNot(new_channel, channel)
+            self.assertFalse(new_channel._transactional)
+
+        self.assertTrue(channel.is_closed)
+        self.assertEqual(pool.idle, 1)
+
+    def test_pool_resets_inbound_limits(self):
+        pool = self.create_pool()
+
+        with pool.channel() as channel:
+            channel.set_inbound_limits(max_bytes=1024, max_messages=10)
+
+        self.assertEqual(pool.idle, 1)
+        self.assertIsNone(channel._inbound_counter.max_bytes)
+        self.assertIsNone(channel._inbound_counter.max_messages)
+
+    def test_pool_opens_connections_without_holding_the_lock(self):
+        pool = self.create_pool(max_connections=2, channels_per_connection=1)
+        with pool.channel():
+            pass
+        opening = threading.Event()
+        resume = threading.Event()
+
+        def open_slowly(connection):
+            opening.set()
+            resume.wait(1)
+            connection.set_state(PoolConnection.OPEN)
+
+        with pool.channel() as channel:
+            with mock.patch.object(PoolConnection, 'open', open_slowly):
+                thread = threading.Thread(target=lambda: pool.channel(
+                    timeout=1).__enter__())
+                thread.start()
+                self.assertTrue(opening.wait(1))
+                self.assertEqual(pool.in_use, 2)
+                self.assertEqual(pool.connections, 2)
+        self.assertEqual(pool.idle, 1)
+        resume.set()
+        thread.join()
+        self.assertIs(channel, pool._idle[0][0])
+
+    def test_pool_close_while_opening_connection(self):
+        pool = self.create_pool()
+
+        def open_and_close_pool(connection):
+            pool.close()
+            connection.set_state(PoolConnection.OPEN)
+
+        with mock.patch.object(PoolConnection, 'open', open_and_close_pool):
+            with self.assertRaisesRegex(AMQPConnectionError,
+                                        'connection pool closed'):
+                with pool.channel():
+                    pass
+
+        self.assertEqual(pool.connections, 0)
+        self.assertEqual(pool.in_use, 0)
+
+    def test_pool_retry_respects_the_channel_limit(self):
+        pool = self.create_pool(channels_per_connection=1)
+        with pool.channel() as channel:
+            pass
+        channel.set_state(Channel.CLOSED)
+        channel._connection.channel = mock.Mock(
+            side_effect=AMQPConnectionError('travis-ci')
+        )
+        discard_connection = pool._discard_connection
+
+        def discard_and_checkout(connection):
+            discard_connection(connection)
+            with pool._condition:
+                pool._channel_count += 1
+
+        pool._discard_connection = discard_and_checkout
+
+        with self.assertRaisesRegex(AMQPChannelError,
+                                    'timed out waiting for an '
+                                    'available channel'):
+            with pool.channel(timeout=0.01):
+                pass
+        self.assertEqual(pool.in_use, 1)
+
+    def test_pool_invalid_parameters(self):
+        self.assertRaisesRegex(
+            AMQPInvalidArgument,
+            'max_connections should be a positive integer',
+            self.create_pool, max_connections=0
+        )
+        self.assertRaisesRegex(
+            AMQPInvalidArgument,
+            'channels_per_connection should be a positive integer',
+            self.create_pool, channels_per_connection='1'
+        )
+        self.assertRaisesRegex(
+            AMQPInvalidArgument,
+            'max_idle should be an integer, float or None',
+            self.create_pool, max_idle='1'
+        )
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+from pamqp import commands
+from pamqp import frame as pamqp_frame
+
+from amqpstorm.channel import Basic
+from amqpstorm.channel import Channel
+from amqpstorm.confirm import ConfirmTracker
+from amqpstorm.exception import AMQPChannelError
+from amqpstorm.exception import AMQPInvalidArgument
+from amqpstorm.publisher import PreparedPublisher
+from amqpstorm.tests.utility import FakeConnection
+from amqpstorm.tests.utility import TestFramework
+
+
+class PreparedPublisherTests(TestFramework):
+    @staticmethod
+    def create_basic(on_write=None, max_frame_size=None):
+        connection = FakeConnection(on_write=on_write)
+        channel = Channel(9, connection, 1)
+        channel.set_state(Channel.OPEN)
+        return Basic(channel, max_frame_size)
+
+    @staticmethod
+    def marshal(basic, *args, **kwargs):
+        return b''.join(
+            pamqp_frame.marshal(frame_out, 9)
+            for frame_out in basic._create_publish_frames(*args, **kwargs)
+        )
+
+    def test_publisher_matches_basic_publish(self):
+        basic = self.create_basic(max_frame_size=4)
+        properties = {
+            'content_type': 'text/plain',
+            'delivery_mode': 2,
+            'headers': {'travis': 'ci'},
+        }
+        publisher = basic.prepare_publisher('travis-ci', 'exchange',
+                                            properties, mandatory=True)
+
+        self.assertIsInstance(publisher, PreparedPublisher)
+        for body in ['hello world', b'hello world', '', 'æøå', b'1234']:
+            self.assertEqual(
+                publisher._marshal_message(body),
+                self.marshal(basic, body, 'travis-ci', 'exchange',
+                             dict(properties), mandatory=True)
+            )
+
+    def test_publisher_custom_encoding(self):
+        basic = self.create_basic()
+        publisher = basic.prepare_publisher(
+            'travis-ci', properties={'content_encoding': 'utf-16'}
+        )
+
+        self.assertEqual(
+            publisher._marshal_message('hello world'),
+            self.marshal(basic, 'hello world', 'travis-ci',
+                         properties={'content_encoding': 'utf-16'})
+        )
+
+    def test_publisher_merges_message_properties(self):
+        basic = self.create_basic()
+        publisher = basic.prepare_publisher(
+            'travis-ci', properties={'delivery_mode': 2}
+        )
+
+        self.assertEqual(
+            publisher._marshal_message('hello world',
+                                       {'message_id': 'travis-ci'}),
+            self.marshal(basic, 'hello world', 'travis-ci',
+                         properties={'delivery_mode': 2,
+                                     'message_id': 'travis-ci'})
+        )
+        self.assertEqual(publisher._properties,
+                         {'delivery_mode': 2, 'content_encoding': 'utf-8'})
+
+    def test_publisher_publish(self):
+        basic = self.create_basic()
+        connection = basic._channel._connection
+        publisher = basic.prepare_publisher('travis-ci')
+
+        self.assertIsNone(publisher.publish('hello world'))
+
+        self.assertEqual(len(connection.frames_out), 1)
+        channel_id, frames_out = connection.frames_out[0]
+        self.assertEqual(channel_id, 9)
+        self.assertIsInstance(frames_out[0], commands.Basic.Publish)
+        self.assertEqual(frames_out[0].routing_key, 'travis-ci')
+        self.assertEqual(frames_out[1].body_size, 11)
+        self.assertEqual(frames_out[2].value, b'hello world')
+
+    def test_publisher_publish_batch(self):
+        basic = self.create_basic()
+        connection = basic._channel._connection
+        publisher = basic.prepare_publisher('travis-ci')
+
+        self.assertIsNone(publisher.publish_batch(['hello', 'world']))
+
+        self.assertEqual(len(connection.frames_out), 1)
+        _, frames_out = connection.frames_out[0]
+        self.assertEqual(len(frames_out), 6)
+        self.assertEqual(frames_out[2].value, b'hello')
+        self.assertEqual(frames_out[5].value, b'world')
+
+    def test_publisher_publish_confirms(self):
+        def on_publish(*_):
+            basic._channel.rpc.on_frame(commands.Basic.Ack(delivery_tag=1))
+
+        basic = self.create_basic(on_write=on_publish)
+        basic._channel._confirming_deliveries = True
+        publisher = basic.prepare_publisher('travis-ci')
+
+        self.assertTrue(publisher.publish('hello world'))
+        self.assertEqual(basic._channel._delivery_tag, 1)
+
+    def test_publisher_publish_batch_confirms_async(self):
+        basic = self.create_basic()
+        basic._channel._confirming_deliveries = True
+        basic._channel._confirms = ConfirmTracker()
+        publisher = basic.prepare_publisher('travis-ci')
+
+        futures = publisher.publish_batch(['hello', 'world'])
+        basic._channel.on_frame(commands.Basic.Ack(delivery_tag=2,
+                                                   multiple=True))
+
+        self.assertEqual([future.result() for future in futures],
+                         [True, True])
+
+    def test_publisher_invalid_parameters(self):
+        basic = self.create_basic()
+
+        self.assertRaisesRegex(
+            AMQPInvalidArgument, 'routing_key should be a string',
+            basic.prepare_publisher, None
+        )
+        self.assertRaisesRegex(
+            AMQPInvalidArgument, 'properties should be a dict or None',
+            basic.prepare_publisher, 'travis-ci', properties=[]
+        )
+
+        publisher = basic.prepare_publisher('travis-ci')
+        self.assertRaisesRegex(
+            AMQPInvalidArgument, 'body should be a string',
+            publisher.publish, None
+        )
+        self.assertRaisesRegex(
+            AMQPInvalidArgument, 'properties should be a dict or None',
+            publisher.publish, 'hello world', []
+        )
+        self.assertRaisesRegex(
+            AMQPInvalidArgument, 'bodies should be a list or tuple',
+            publisher.publish_batch, 'hello world'
+        )
+
+    def test_publisher_channel_closed(self):
+        basic = self.create_basic()
+        publisher = basic.prepare_publisher('travis-ci')
+        basic._channel.set_state(Channel.CLOSED)
+
+        self.assertRaisesRegex(
+            AMQPChannelError, 'channel closed',
+            publisher.publish, 'hello world'
+        )
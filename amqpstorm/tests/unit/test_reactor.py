@@ -0,0 +1,237 @@
+import socket
+import ssl
+import threading
+import time
+from unittest import mock
+
+from amqpstorm import Connection
+from amqpstorm.exception import AMQPConnectionError
+from amqpstorm.exception import AMQPInvalidArgument
+from amqpstorm.heartbeat import Heartbeat
+from amqpstorm.io import IO
+from amqpstorm.reactor import Reactor
+from amqpstorm.reactor import ReactorTimer
+from amqpstorm.tests.utility import FakeConnection
+from amqpstorm.tests.utility import TestFramework
+
+
+class ReactorTests(TestFramework):
+    def setUp(self):
+        super(ReactorTests, self).setUp()
+        self.reactor = Reactor()
+
+    def tearDown(self):
+        self.reactor.stop()
+        super(ReactorTests, self).tearDown()
+
+    def test_reactor_is_started_lazily(self):
+        self.assertFalse(self.reactor.is_running)
+
+        self.reactor.timer(60, lambda: None).start()
+
+        self.assertTrue(self.reactor.is_running)
+
+    def test_reactor_stop(self):
+        self.reactor.timer(60, lambda: None).start()
+        thread = self.reactor._thread
+
+        self.reactor.stop()
+
+        self.assertFalse(self.reactor.is_running)
+        self.assertFalse(thread.is_alive())
+        self.assertIsNone(self.reactor._selector)
+
+    def test_reactor_restarted_while_stopping(self):
+        def restart():
+            while self.reactor.is_running:
+                time.sleep(0.01)
+            self.reactor.timer(60, lambda: None).start()
+
+        self.reactor.timer(0, restart).start()
+        thread = self.reactor._thread
+
+        self.reactor.stop()
+
+        self.assertFalse(thread.is_alive())
+        self.assertTrue(self.reactor.is_running)
+        self.assertIsNot(self.reactor._thread, thread)
+
+    def test_reactor_register(self):
+        sock_rd, sock_wr = socket.socketpair()
+        received = []
+        readable = threading.Event()
+
+        def on_readable():
+            received.append(sock_rd.recv(1024))
+            readable.set()
+
+        try:
+            self.reactor.register(sock_rd, on_readable)
+            self.assertEqual(self.reactor.sockets, 1)
+            sock_wr.send(b'travis-ci')
+
+            self.assertTrue(readable.wait(1))
+            self.assertEqual(received, [b'travis-ci'])
+
+            self.reactor.unregister(sock_rd)
+            self.assertEqual(self.reactor.sockets, 0)
+            readable.clear()
+            sock_wr.send(b'travis-ci')
+            self.assertFalse(readable.wait(0.1))
+        finally:
+            sock_rd.close()
+            sock_wr.close()
+
+    def test_reactor_unregister_unknown_socket(self):
+        self.reactor.unregister(None)
+
+        self.assertEqual(self.reactor.sockets, 0)
+
+    def test_reactor_timers_run_in_order(self):
+        called = []
+        done = threading.Event()
+
+        def on_last():
+            called.append(3)
+            done.set()
+
+        self.reactor.timer(0.03, on_last).start()
+        self.reactor.timer(0.01, lambda: called.append(1)).start()
+        self.reactor.timer(0.02, lambda: called.append(2)).start()
+
+        self.assertTrue(done.wait(1))
+        self.assertEqual(called, [1, 2, 3])
+
+    def test_reactor_timer_cancel(self):
+        called = threading.Event()
+        timer = self.reactor.timer(0.01, called.set)
+        timer.start()
+        timer.cancel()
+
+        self.assertIsInstance(timer, ReactorTimer)
+        self.assertTrue(timer.is_cancelled)
+        self.assertFalse(called.wait(0.1))
+
+    def test_reactor_callback_raises(self):
+        self.disable_logging_validation()
+        called = threading.Event()
+
+        def on_timer():
+            raise ValueError('travis-ci')
+
+        self.reactor.timer(0.01, on_timer).start()
+        self.reactor.timer(0.02, called.set).start()
+
+        self.assertTrue(called.wait(1))
+        self.assertTrue(self.reactor.is_running)
+        self.assertEqual(self.get_last_log(),
+                         'Reactor callback failed: travis-ci')
+
+    def test_reactor_heartbeat_timer(self):
+        sent = threading.Event()
+        heartbeat = Heartbeat(1, sent.set, timer=self.reactor.timer)
+        heartbeat._interval = 0.01
+        heartbeat.start([])
+
+        self.assertTrue(sent.wait(1))
+        self.assertIsInstance(heartbeat._timer, ReactorTimer)
+        heartbeat.stop()
+
+    def test_reactor_io_reads_socket(self):
+        sock_rd, sock_wr = socket.socketpair()
+        received = []
+        readable = threading.Event()
+
+        def on_read(data_in):
+            received.append(bytes(data_in))
+            readable.set()
+            return bytearray()
+
+        connection = FakeConnection()
+        connection.parameters['reactor'] = self.reactor
+        io = IO(connection.parameters, on_read_impl=on_read)
+        io.socket = sock_rd
+        io._running.set()
+        try:
+            io.start_inbound()
+            self.assertIsNone(io._inbound_thread)
+            sock_wr.send(b'travis-ci')
+
+            self.assertTrue(readable.wait(1))
+            self.assertEqual(received, [b'travis-ci'])
+        finally:
+            io.close()
+            sock_wr.close()
+        self.assertEqual(self.reactor.sockets, 0)
+
+    def test_reactor_io_connection_closed_by_server(self):
+        self.disable_logging_validation()
+        sock_rd, sock_wr = socket.socketpair()
+        exceptions = []
+
+        connection = FakeConnection()
+        connection.parameters['reactor'] = self.reactor
+        io = IO(connection.parameters, exceptions=exceptions,
+                on_read_impl=lambda data_in: data_in)
+        io.socket = sock_rd
+        io._running.set()
+        try:
+            self.reactor.register(sock_rd, io._on_socket_readable)
+            sock_wr.close()
+            for _ in range(100):
+                if not self.reactor.sockets:
+                    break
+                time.sleep(0.01)
+
+            self.assertEqual(self.reactor.sockets, 0)
+            self.assertFalse(io._running.is_set())
+            self.assertIsInstance(exceptions[0], AMQPConnectionError)
+        finally:
+            sock_rd.close()
+
+    def test_reactor_io_ssl_socket_is_non_blocking(self):
+        sock = mock.Mock(name='socket', spec=ssl.SSLSocket)
+        connection = FakeConnection()
+        connection.parameters['reactor'] = self.reactor
+        connection.parameters['ssl'] = True
+        io = IO(connection.parameters)
+        io._get_socket_addresses = mock.Mock(return_value=[])
+        io._find_address_and_connect = mock.Mock(return_value=sock)
+
+        io.open()
+
+        sock.setblocking.assert_called_once_with(False)
+        io._running.clear()
+
+    def test_reactor_io_ssl_partial_record(self):
+        exceptions = []
+        connection = FakeConnection()
+        connection.parameters['reactor'] = self.reactor
+        connection.parameters['ssl'] = True
+        io = IO(connection.parameters, exceptions=exceptions,
+                on_read_impl=lambda data_in: data_in)
+        io.socket = mock.Mock(name='socket', spec=ssl.SSLSocket)
+        io.socket.read.side_effect = ssl.SSLWantReadError()
+        io.socket.pending.return_value = 0
+        io._running.set()
+
+        io._on_socket_readable()
+
+        self.assertTrue(io._running.is_set())
+        self.assertEqual(io.data_in, b'')
+        self.assertEqual(exceptions, [])
+
+    def test_reactor_connection_heartbeat_timer(self):
+        connection = Connection('localhost', 'guest', 'guest',
+                                reactor=self.reactor, lazy=True)
+
+        self.assertIs(connection.parameters['reactor'], self.reactor)
+        self.assertIs(connection._io.reactor, self.reactor)
+        self.assertEqual(connection.heartbeat.timer_impl, self.reactor.timer)
+
+    def test_reactor_connection_invalid_parameter(self):
+        self.assertRaisesRegex(
+            AMQPInvalidArgument, 'reactor should be a Reactor or None',
+            Connection, 'localhost', 'guest', 'guest', reactor='travis-ci',
+            lazy=True
+        )
@@ -0,0 +1,269 @@
+import threading
+from unittest import mock
+
+from benchmarks.broker import FakeBroker
+from pamqp import commands
+
+from amqpstorm import AMQPConnectionError
+from amqpstorm import RobustConnection
+from amqpstorm.exception import AMQPInvalidArgument
+from amqpstorm.robust import RobustChannel
+from amqpstorm.robust import Topology
+from amqpstorm.tests.utility import TestFramework
+
+
+class TopologyTests(TestFramework):
+    def test_topology_record_declarations(self):
+        topology = Topology()
+        topology.record(commands.Exchange.Declare(exchange='travis'), {})
+        topology.record(commands.Queue.Declare(queue='ci'), {'queue': 'ci'})
+        topology.record(commands.Queue.Declare(queue='passive', passive=True),
+                        {'queue': 'passive'})
+        topology.record(commands.Queue.Declare(), {'queue': 'amq.gen-1'})
+        topology.record(commands.Queue.Bind(queue='ci', exchange='travis',
+                                            routing_key='ci'), {})
+
+        self.assertEqual(list(topology.exchanges), ['travis'])
+        self.assertEqual(list(topology.queues), ['ci', 'amq.gen-1'])
+        self.assertEqual(list(topology.bindings),
+                         [('queue', 'ci', 'travis', 'ci')])
+
+    def test_topology_record_deletions(self):
+        topology = Topology()
+        topology.record(commands.Exchange.Declare(exchange='travis'), {})
+        topology.record(commands.Exchange.Declare(exchange='source'), {})
+        topology.record(commands.Queue.Declare(queue='ci'), {'queue': 'ci'})
+        topology.record(commands.Queue.Bind(queue='ci', exchange='travis'), {})
+        topology.record(commands.Exchange.Bind(destination='travis',
+                                               source='source'), {})
+        topology.record(commands.Exchange.Bind(destination='source',
+                                               source='amq.topic'), {})
+
+        topology.record(commands.Exchange.Delete(exchange='travis'), {})
+        self.assertEqual(list(topology.exchanges), ['source'])
+        self.assertEqual(list(topology.bindings),
+                         [('exchange', 'source', 'amq.topic', '')])
+
+        topology.record(commands.Exchange.Unbind(destination='source',
+                                                 source='amq.topic'), {})
+        topology.record(commands.Queue.Delete(queue='ci'), {})
+        self.assertEqual(topology.queues, {})
+        self.assertEqual(topology.bindings, {})
+
+    def test_topology_restore(self):
+        topology = Topology()
+        topology.record(commands.Exchange.Declare(exchange='travis'), {})
+        topology.record(commands.Queue.Declare(), {'queue': 'amq.gen-1'})
+        topology.record(commands.Queue.Bind(queue='amq.gen-1',
+                                            exchange='travis'), {})
+        channel = mock.Mock()
+        channel.rpc_request.side_effect = [{'queue': 'amq.gen-2'}, {}]
+
+        renamed = topology.restore(channel)
+
+        self.assertEqual(renamed, {'amq.gen-1': 'amq.gen-2'})
+        self.assertEqual(list(topology.queues), ['amq.gen-2'])
+        frames_out = channel.write_frames.call_args[0][0]
+        self.assertEqual([frame.name for frame in frames_out],
+                         ['Exchange.Declare'])
+        self.assertTrue(all(frame.nowait for frame in frames_out))
+        bind = channel.rpc_request.call_args[0][0]
+        self.assertEqual(bind.name, 'Queue.Bind')
+        self.assertEqual(bind.queue, 'amq.gen-2')
+        self.assertFalse(bind.nowait)
+        self.assertFalse(topology.exchanges['travis'].nowait)
+
+    def test_topology_restore_declares_each_queue_once(self):
+        topology = Topology()
+        topology.record(commands.Queue.Declare(queue='travis'),
+                        {'queue': 'travis'})
+        topology.record(commands.Queue.Declare(), {'queue': 'amq.gen-1'})
+        topology.record(commands.Queue.Declare(), {'queue': 'amq.gen-2'})
+        channel = mock.Mock()
+        channel.rpc_request.side_effect = [
+            {'queue': 'amq.gen-3'}, {'queue': 'amq.gen-4'}, {}
+        ]
+
+        topology.restore(channel)
+
+        channel.write_frames.assert_not_called()
+        self.assertEqual([call[0][0].queue
+                          for call in channel.rpc_request.call_args_list],
+                         ['', '', 'travis'])
+        self.assertEqual(sorted(topology.queues),
+                         ['amq.gen-3', 'amq.gen-4', 'travis'])
+
+    def test_topology_restore_nothing(self):
+        channel = mock.Mock()
+
+        self.assertEqual(Topology().restore(channel), {})
+        channel.rpc_request.assert_not_called()
+
+
+class RobustConnectionTests(TestFramework):
+    def test_robust_connection_invalid_parameters(self):
+        for kwargs, message in (
+            ({'retry_delay': -1},
+             'retry_delay should be a non-negative integer or float'),
+            ({'max_retry_delay': 'travis-ci'},
+             'max_retry_delay should be a non-negative integer or float'),
+            ({'max_retries': 0},
+             'max_retries should be a positive integer or None'),
+        ):
+            self.assertRaisesRegex(
+                AMQPInvalidArgument, message,
+                RobustConnection, 'localhost', 'guest', 'guest', lazy=True,
+                **kwargs
+            )
+
+    def test_robust_connection_creates_robust_channels(self):
+        connection = RobustConnection('localhost', 'guest', 'guest',
+                                      lazy=True)
+        connection.set_state(connection.OPEN)
+
+        self.assertIsInstance(connection.channel(lazy=True), RobustChannel)
+        self.assertFalse(connection.is_recovering)
+
+    def test_robust_connection_not_recovered_before_opened(self):
+        connection = RobustConnection('localhost', 'guest', 'guest',
+                                      lazy=True)
+        connection.exceptions.append(AMQPConnectionError('travis-ci'))
+
+        self.assertRaisesRegex(AMQPConnectionError, 'travis-ci',
+                               connection.check_for_errors)
+        self.assertFalse(connection.is_recovering)
+
+    def test_robust_channel_delivery_tag_offset(self):
+        connection = RobustConnection('localhost', 'guest', 'guest',
+                                      lazy=True)
+        connection.set_state(connection.OPEN)
+        connection.write_frame = mock.Mock()
+        connection.write_frames = mock.Mock()
+        channel = connection.channel(lazy=True)
+        channel.set_state(channel.OPEN)
+        channel._delivery_tag_offset = 5
+
+        deliver = commands.Basic.Deliver(delivery_tag=1)
+        channel.on_frame(deliver)
+        self.assertEqual(deliver.delivery_tag, 6)
+
+        channel.write_frame(commands.Basic.Ack(delivery_tag=6))
+        channel.write_frame(commands.Basic.Reject(delivery_tag=3))
+        channel.write_frames([commands.Basic.Nack(delivery_tag=2),
+                              commands.Basic.Nack(delivery_tag=0,
+                                                  multiple=True)])
+
+        frames_out = [call[0][1] for call in
+                      connection.write_frame.call_args_list]
+        frames_out.extend(connection.write_frames.call_args[0][1])
+        self.assertEqual([(frame.name, frame.delivery_tag)
+                          for frame in frames_out],
+                         [('Basic.Ack', 1), ('Basic.Nack', 0)])
+
+
+class RobustConnectionRecoveryTests(TestFramework):
+    def connect(self, broker, **kwargs):
+        connection = RobustConnection('127.0.0.1', 'guest', 'guest',
+                                      port=broker.port, retry_delay=0.01,
+                                      **kwargs)
+        self.addCleanup(connection.close)
+        return connection
+
+    @staticmethod
+    def disconnect(broker):
+        for connection in list(broker._connections):
+            connection.close()
+
+    def test_robust_connection_recovers_consumer(self):
+        received = []
+        done = threading.Event()
+
+        def on_message(message):
+            received.append(message.body)
+            message.ack()
+            if len(received) == 2:
+                channel.stop_consuming()
+                done.set()
+
+        with FakeBroker() as broker:
+            connection = self.connect(broker)
+            channel = connection.channel()
+            channel.queue.declare('travis-ci')
+            channel.basic.qos(10)
+            channel.basic.consume(on_message, 'travis-ci')
+            consumer = threading.Thread(target=channel.start_consuming)
+            consumer.daemon = True
+            consumer.start()
+
+            broker.fill('travis-ci', 1, b'before')
+            self.assertTrue(self.wait_for(lambda: received == ['before']))
+
+            self.disconnect(broker)
+            with broker.lock:
+                broker.queues.clear()
+            self.assertTrue(self.wait_for(
+                lambda: broker.consumers.get('travis-ci')
+            ))
+            broker.fill('travis-ci', 1, b'after')
+
+            self.assertTrue(done.wait(5))
+            consumer.join(5)
+            self.assertFalse(consumer.is_alive())
+            self.assertEqual(received, ['before', 'after'])
+            self.assertTrue(connection.is_open)
+            self.assertTrue(channel.is_open)
+            self.assertEqual(channel._delivery_tag_offset, 1)
+
+    def test_robust_connection_recovers_publisher(self):
+        with FakeBroker() as broker:
+            connection = self.connect(broker)
+            channel = connection.channel()
+            channel.queue.declare('travis-ci')
+            channel.confirm_deliveries()
+
+            self.disconnect(broker)
+            self.assertTrue(self.wait_for(lambda: connection.exceptions))
+            self.assertRaises(AMQPConnectionError, channel.basic.publish,
+                              b'travis-ci', 'travis-ci')
+            self.assertTrue(connection._wait_for_recovery())
+
+            self.assertTrue(channel.basic.publish(b'travis-ci', 'travis-ci'))
+            self.assertEqual(broker.message_count('travis-ci'), 1)
+
+    def test_robust_connection_gives_up(self):
+        with FakeBroker() as broker:
+            connection = self.connect(broker, max_retries=2)
+            channel = connection.channel()
+            broker.stop()
+            self.assertTrue(self.wait_for(lambda: connection.exceptions))
+
+            self.assertRaises(AMQPConnectionError, channel.check_for_errors)
+            self.assertFalse(connection._wait_for_recovery())
+            self.assertRaisesRegex(
+                AMQPConnectionError,
+                'connection could not be recovered after 2 attempts',
+                connection.check_for_errors
+            )
+
+    def test_robust_connection_close_stops_recovery(self):
+        with FakeBroker() as broker:
+            connection = self.connect(broker, max_retry_delay=60)
+            connection._retry_delay = 60
+            broker.stop()
+            self.assertTrue(self.wait_for(lambda: connection.exceptions))
+            self.assertRaises(AMQPConnectionError, connection.check_for_errors)
+            self.assertTrue(connection.is_recovering)
+
+            connection.close()
+
+            self.assertFalse(connection.is_recovering)
+            self.assertTrue(connection.is_closed)
+
+    @staticmethod
+    def wait_for(predicate, timeout=5):
+        event = threading.Event()
+        for _ in range(int(timeout / 0.01)):
+            if predicate():
+                return True
+            event.wait(0.01)
+        return False
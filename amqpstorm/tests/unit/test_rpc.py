@@ -235,3 +235,55 @@ class RpcTests(TestFramework):
             AMQPChannelError,
             rpc._wait_for_request, uuid, adapter
         )
+
+    def test_wait_for_request_wakes_up_on_frame(self):
+        rpc = Rpc(FakeConnection(), timeout=10)
+        uuid = rpc.register_request(['travis-ci'])
+
+        def delivery_payload():
+            time.sleep(0.05)
+            rpc.on_frame(FakePayload(name='travis-ci'))
+
+        thread = threading.Thread(target=delivery_payload)
+
+        with mock.patch('amqpstorm.rpc.ERROR_CHECK_INTERVAL', 5):
+            start_time = time.monotonic()
+            thread.start()
+            rpc._wait_for_request(
+                uuid, connection_adapter=rpc._default_connection_adapter
+            )
+            self.assertLess(time.monotonic() - start_time, 1)
+
+        thread.join()
+        self.assertEqual(len(rpc._response[uuid]), 1)
+
+    def test_wait_for_request_notify_all_checks_for_errors(self):
+        class Adapter(object):
+            def __init__(self):
+                self.error = None
+
+            def check_for_errors(self):
+                if self.error:
+                    raise self.error
+
+        adapter = Adapter()
+        rpc = Rpc(FakeConnection(), timeout=10)
+        uuid = rpc.register_request(['travis-ci'])
+
+        def close_channel():
+            time.sleep(0.05)
+            adapter.error = AMQPChannelError('travis-ci')
+            rpc.notify_all()
+
+        thread = threading.Thread(target=close_channel)
+
+        with mock.patch('amqpstorm.rpc.ERROR_CHECK_INTERVAL', 5):
+            start_time = time.monotonic()
+            thread.start()
+            self.assertRaises(
+                AMQPChannelError,
+                rpc._wait_for_request, uuid, adapter
+            )
+            self.assertLess(time.monotonic() - start_time, 1)
+
+        thread.join()
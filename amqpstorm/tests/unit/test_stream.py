@@ -0,0 +1,267 @@
+import io
+import threading
+
+from pamqp import commands
+from pamqp.body import ContentBody
+from pamqp.header import ContentHeader
+
+from amqpstorm import Channel
+from amqpstorm.basic import Basic
+from amqpstorm.exception import AMQPChannelError
+from amqpstorm.exception import AMQPInvalidArgument
+from amqpstorm.stream import BodyStream
+from amqpstorm.tests.utility import FakeConnection
+from amqpstorm.tests.utility import TestFramework
+
+
+class BodyStreamTests(TestFramework):
+    @staticmethod
+    def create_stream(chunks):
+        chunks = list(chunks)
+        size = sum(len(chunk) for chunk in chunks)
+        return BodyStream(lambda: chunks.pop(0) if chunks else None, size)
+
+    def test_stream_read(self):
+        stream = self.create_stream([b'travis', b'-ci', b'!'])
+
+        self.assertEqual(stream.size, 10)
+        self.assertEqual(stream.read(4), b'trav')
+        self.assertEqual(stream.remaining, 4)
+        self.assertEqual(stream.read(), b'is-ci!')
+        self.assertEqual(stream.remaining, 0)
+        self.assertEqual(stream.read(), b'')
+
+    def test_stream_chunks(self):
+        stream = self.create_stream([b'travis', b'-ci'])
+
+        self.assertEqual(stream.read(2), b'tr')
+        self.assertEqual(list(stream.chunks()), [b'avis', b'-ci'])
+
+    def test_stream_close_discards_remaining_body(self):
+        chunks = [b'travis', b'-ci']
+        stream = BodyStream(lambda: chunks.pop(0) if chunks else None, 9)
+
+        stream.close()
+
+        self.assertTrue(stream.closed)
+        self.assertEqual(chunks, [])
+        self.assertRaises(ValueError, stream.read)
+
+    def test_stream_body_ended_early(self):
+        stream = BodyStream(lambda: None, 10)
+
+        self.assertEqual(stream.read(), b'')
+        self.assertEqual(stream.remaining, 0)
+
+
+class StreamConsumeTests(TestFramework):
+    @staticmethod
+    def create_channel(connection):
+        channel = Channel(1, connection, 1)
+        channel.set_state(Channel.OPEN)
+        connection._channels[1] = channel
+        return channel
+
+    @staticmethod
+    def deliver(channel, delivery_tag, body_size):
+        channel.on_frame(commands.Basic.Deliver(
+            consumer_tag='travis-ci', delivery_tag=delivery_tag
+        ))
+        channel.on_frame(ContentHeader(body_size=body_size))
+
+    def test_stream_message_delivered_before_body(self):
+        channel = self.create_channel(FakeConnection())
+        channel.add_consumer_tag('travis-ci')
+        self.deliver(channel, 1, 6)
+        channel.on_frame(ContentBody(value=b'tra'))
+
+        messages = channel.build_inbound_messages(stream_body=True,
+                                                  auto_decode=False)
+        message = next(messages)
+
+        self.assertIsInstance(message.body, BodyStream)
+        self.assertEqual(message.body.read(3), b'tra')
+
+        thread = threading.Timer(
+            0.05, channel.on_frame, args=(ContentBody(value=b'vis'),)
+        )
+        thread.start()
+        self.assertEqual(message.body.read(), b'vis')
+        thread.join()
+        self.assertEqual(channel.inbound_bytes, 0)
+
+    def test_stream_unread_body_is_discarded(self):
+        channel = self.create_channel(FakeConnection())
+        self.deliver(channel, 1, 6)
+        channel.on_frame(ContentBody(value=b'travis'))
+        self.deliver(channel, 2, 3)
+        channel.on_frame(ContentBody(value=b'-ci'))
+
+        messages = []
+        for message in channel.build_inbound_messages(break_on_empty=True,
+                                                      stream_body=True):
+            if messages:
+                self.assertTrue(messages[0].body.closed)
+                self.assertEqual(message.body.read(), b'-ci')
+            messages.append(message)
+
+        self.assertEqual(len(messages), 2)
+        self.assertEqual(channel.inbound_bytes, 0)
+        self.assertFalse(channel._stream_body)
+
+    def test_stream_start_consuming(self):
+        channel = self.create_channel(FakeConnection())
+        received = []
+
+        def on_message(message):
+            received.append(message.body.read())
+            channel.remove_consumer_tag('travis-ci')
+
+        channel._consumer_callbacks['travis-ci'] = on_message
+        channel.add_consumer_tag('travis-ci')
+        self.deliver(channel, 1, 6)
+        channel.on_frame(ContentBody(value=b'travis'))
+
+        channel.start_consuming(stream_body=True)
+
+        self.assertEqual(received, [b'travis'])
+
+    def test_stream_start_consuming_with_workers(self):
+        channel = self.create_channel(FakeConnection())
+        channel._consumer_callbacks['travis-ci'] = lambda message: None
+
+        self.assertRaisesRegex(
+            AMQPInvalidArgument,
+            'stream_body cannot be used together with workers',
+            channel.start_consuming, stream_body=True, workers=2
+        )
+
+    def test_stream_large_message_does_not_pause_reading(self):
+        connection = FakeConnection()
+        connection._inbound_counter.max_bytes = 4
+        channel = self.create_channel(connection)
+        self.deliver(channel, 1, 12)
+        channel.on_frame(ContentBody(value=b'travis'))
+
+        self.assertFalse(connection._is_inbound_paused())
+
+        channel.on_frame(ContentBody(value=b'travis'))
+
+        self.assertTrue(connection._is_inbound_paused())
+
+    def test_stream_large_streamed_message_pauses_reading(self):
+        connection = FakeConnection()
+        connection._inbound_counter.max_bytes = 4
+        channel = self.create_channel(connection)
+        channel._stream_body = True
+        self.deliver(channel, 1, 12)
+        channel.on_frame(ContentBody(value=b'travis'))
+
+        self.assertTrue(connection._is_inbound_paused())
+
+
+class StreamPublishTests(TestFramework):
+    def create_basic(self, max_frame_size=4, on_write=None):
+        self.connection = FakeConnection(on_write=on_write)
+        self.channel = Channel(9, self.connection, 1)
+        self.channel.set_state(Channel.OPEN)
+        return Basic(self.channel, max_frame_size=max_frame_size)
+
+    def frames_written(self):
+        return [frame for _, frame in self.connection.frames_out]
+
+    def test_stream_publish_file(self):
+        basic = self.create_basic()
+
+        basic.publish(io.BytesIO(b'travis-ci'), 'travis-ci', body_size=9)
+
+        frames = self.frames_written()
+        self.assertIsInstance(frames[0], commands.Basic.Publish)
+        self.assertIsInstance(frames[1], ContentHeader)
+        self.assertEqual(frames[1].body_size, 9)
+        self.assertEqual([frame.value for frame in frames[2:]],
+                         [b'trav', b'is-c', b'i'])
+
+    def test_stream_publish_iterable(self):
+        basic = self.create_basic()
+
+        basic.publish(iter([b'tr', b'', 'avis', b'-ci']), 'travis-ci',
+                      body_size=9)
+
+        frames = self.frames_written()
+        self.assertEqual([frame.value for frame in frames[2:]],
+                         [b'trav', b'is-c', b'i'])
+
+    def test_stream_publish_empty_body(self):
+        basic = self.create_basic()
+
+        basic.publish(io.BytesIO(), 'travis-ci', body_size=0)
+
+        frames = self.frames_written()
+        self.assertEqual(len(frames), 2)
+        self.assertEqual(frames[1].body_size, 0)
+
+    def test_stream_publish_confirms(self):
+        def on_write(*_):
+            basic._channel.rpc.on_frame(commands.Basic.Ack())
+
+        basic = self.create_basic(on_write=on_write)
+        self.channel._confirming_deliveries = True
+
+        self.assertTrue(basic.publish(io.BytesIO(b'travis-ci'), 'travis-ci',
+                                      body_size=9))
+
+    def test_stream_publish_holds_write_lock(self):
+        basic = self.create_basic()
+        lock_held = []
+
+        def body():
+            for chunk in (b'travis', b'-ci'):
+                lock_held.append(self.channel._write_lock._is_owned())
+                yield chunk
+
+        basic.publish(body(), 'travis-ci', body_size=9)
+
+        self.assertEqual(lock_held, [True, True])
+
+    def test_stream_publish_body_size_mismatch(self):
+        basic = self.create_basic()
+
+        self.assertRaisesRegex(
+            AMQPChannelError,
+            'body does not match body_size, expected 10 bytes',
+            basic.publish, io.BytesIO(b'travis-ci'), 'travis-ci',
+            body_size=10
+        )
+        self.assertRaises(AMQPChannelError, self.channel.check_for_errors)
+
+    def test_stream_publish_body_larger_than_body_size(self):
+        basic = self.create_basic()
+
+        self.assertRaises(
+            AMQPChannelError,
+            basic.publish, iter([b'travis', b'-ci']), 'travis-ci',
+            body_size=8
+        )
+        frames = self.frames_written()
+        self.assertEqual([frame.value for frame in frames[2:]], [b'trav'])
+
+    def test_stream_publish_invalid_parameters(self):
+        basic = self.create_basic()
+
+        self.assertRaisesRegex(
+            AMQPInvalidArgument,
+            'body_size should be a non-negative integer',
+            basic.publish, io.BytesIO(), 'travis-ci', body_size=-1
+        )
+        self.assertRaisesRegex(
+            AMQPInvalidArgument,
+            'body should be a file or an iterable when body_size is set',
+            basic.publish, b'travis-ci', 'travis-ci', body_size=9
+        )
+        self.assertRaisesRegex(
+            AMQPInvalidArgument,
+            'routing_key should be a string',
+            basic.publish, io.BytesIO(), None, body_size=0
+        )
+        self.assertFalse(self.connection.frames_out)
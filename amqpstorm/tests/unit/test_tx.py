@@ -16,8 +16,10 @@ class TxTests(TestFramework):
         channel.set_state(Channel.OPEN)
         tx = Tx(channel)
 
+        self.assertFalse(channel._transactional)
         self.assertIsInstance(tx.select(), dict)
         self.assertTrue(tx._tx_active)
+        self.assertTrue(channel._transactional)
 
     def test_tx_commit(self):
         def on_tx_commit(*_):
@@ -1,6 +1,8 @@
 import logging
 import uuid
 
+from pamqp import frame as pamqp_frame
+
 from amqpstorm.connection import Channel
 from amqpstorm.connection import Connection
 
@@ -65,6 +67,15 @@ class FakeConnection(Connection):
             self.on_write(channel_id, frames_out)
         self.frames_out.append((channel_id, frames_out))
 
+    def write_marshalled_frames(self, data_out):
+        channel_id = None
+        frames_out = []
+        while data_out:
+            byte_count, channel_id, frame_out = pamqp_frame.unmarshal(data_out)
+            frames_out.append(frame_out)
+            data_out = data_out[byte_count:]
+        self.write_frames(channel_id, frames_out)
+
 
 class FakeChannel(Channel):
     """Fake Channel for Unit-Testing."""
@@ -119,6 +130,37 @@ class FakeFrame(object):
             yield attribute[1::], getattr(self, attribute)
 
 
+class FakeTransport(object):
+    """Fake asyncio Transport for Unit-Testing."""
+
+    def __init__(self):
+        self.data_out = bytearray()
+        self.closed = False
+
+    def get_frames(self):
+        """Unmarshal and clear all frames written."""
+        frames = []
+        while self.data_out:
+            byte_count, channel_id, frame_out = pamqp_frame.unmarshal(
+                bytes(self.data_out)
+            )
+            del self.data_out[:byte_count]
+            frames.append((channel_id, frame_out))
+        return frames
+
+    def write(self, data):
+        self.data_out += data
+
+    def is_closing(self):
+        return self.closed
+
+    def close(self):
+        self.closed = True
+
+    def abort(self):
+        self.closed = True
+
+
 class FakeSession(object):
     def close(self):
         pass
@@ -138,7 +180,7 @@ class FakeHTTPClient(object):
     def __exit__(self, *_):
         pass
 
-    def get(self, path):
+    def get(self, path, columns=None):
         return self.on_get(path)
 
     def post(self, path, payload):
@@ -60,6 +60,7 @@ class Tx(Handler):
         :return:
         """
         self._tx_active = True
+        self._channel._transactional = True
         return self._channel.rpc_request(commands.Tx.Select())
 
     def commit(self) -> dict[str, Any] | None:
@@ -0,0 +1 @@
+"""AMQPStorm Benchmarks."""
@@ -0,0 +1,61 @@
+"""Run the AMQPStorm benchmarks.
+
+    e.g.
+    ::
+
+        python -m benchmarks --messages 10000 --output benchmark.json
+
+    Exits with 1 if a result regressed more than --max-regression compared
+    to the --baseline results.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+
+from benchmarks.suite import BENCHMARKS
+from benchmarks.suite import compare
+from benchmarks.suite import run
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks',
+        description='Benchmark the AMQPStorm hot paths against an '
+                    'in-process fake broker.'
+    )
+    parser.add_argument('names', nargs='*', metavar='name',
+                        help='benchmarks to run: ' + ', '.join(BENCHMARKS))
+    parser.add_argument('--messages', type=int, default=10000,
+                        help='number of messages per benchmark')
+    parser.add_argument('--output', default='-',
+                        help='write the json results to this file')
+    parser.add_argument('--baseline',
+                        help='compare the results against this json file')
+    parser.add_argument('--max-regression', type=float, default=0.3,
+                        help='allowed regression compared to the baseline, '
+                             'as a fraction (default: 0.3)')
+    args = parser.parse_args(argv)
+    try:
+        results = run(args.messages, args.names)
+    except ValueError as why:
+        parser.error(str(why))
+    data_out = json.dumps(results, indent=2)
+    if args.output == '-':
+        print(data_out)
+    else:
+        with open(args.output, 'w') as file_out:
+            file_out.write(data_out + '\n')
+    if not args.baseline:
+        return 0
+    with open(args.baseline) as file_in:
+        baseline = json.load(file_in)
+    regressions = compare(results, baseline, args.max_regression)
+    for regression in regressions:
+        print(f'Regression: {regression}', file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,590 @@
+"""In-process stand-in for RabbitMQ used by the benchmarks."""
+from __future__ import annotations
+
+import collections
+import itertools
+import logging
+import socket
+import threading
+from typing import Any
+
+from pamqp import body as pamqp_body
+from pamqp import commands
+from pamqp import frame as pamqp_frame
+from pamqp import header as pamqp_header
+
+import amqpstorm
+
+LOGGER = logging.getLogger(__name__)
+
+FRAME_HEADER_SIZE = 7
+FRAME_END_SIZE = 1
+MAX_FRAME_SIZE = 131072
+PROTOCOL_HEADER = b'AMQP'
+RECV_SIZE = 262144
+
+
+class StoredMessage:
+    """A message waiting in a queue of the FakeBroker.
+
+        The content frames are only marshalled once per channel id, so
+        that queues filled with the same message are cheap to deliver.
+
+    :param bytes body: Message body.
+    :param commands.Basic.Properties properties: Message properties.
+    :param str exchange: Exchange the message was published to.
+    :param str routing_key: Routing key the message was published with.
+    """
+    __slots__ = ['body', 'properties', 'exchange', 'routing_key',
+                 '_content']
+
+    def __init__(
+        self, body: bytes, properties: commands.Basic.Properties,
+        exchange: str, routing_key: str,
+    ) -> None:
+        self.body = body
+        self.properties = properties
+        self.exchange = exchange
+        self.routing_key = routing_key
+        self._content: dict[int, bytes] = {}
+
+    def content(self, channel_id: int, frame_max: int) -> bytes:
+        """Returns the marshalled ContentHeader and ContentBody frames.
+
+        :param int channel_id: Channel the message is sent on.
+        :param int frame_max: Maximum frame size of the connection.
+
+        :rtype: bytes
+        """
+        content = self._content.get(channel_id)
+        if content is not None:
+            return content
+        frames_out: list[Any] = [pamqp_header.ContentHeader(
+            body_size=len(self.body), properties=self.properties
+        )]
+        max_payload = frame_max - FRAME_HEADER_SIZE - FRAME_END_SIZE
+        for start in range(0, len(self.body), max_payload):
+            frames_out.append(
+                pamqp_body.ContentBody(self.body[start:start + max_payload])
+            )
+        content = b''.join(pamqp_frame.marshal(frame_out, channel_id)
+                           for frame_out in frames_out)
+        self._content[channel_id] = content
+        return content
+
+
+class FakeBroker:
+    """In-process stand-in for RabbitMQ, speaking just enough AMQP 0-9-1
+    over loopback for the benchmarks.
+
+        Supports connection negotiation, channels, publisher confirms,
+        queue.declare, queue.delete, queue.purge, basic.qos, basic.get,
+        basic.consume, basic.cancel and basic.publish to the default
+        exchange. Acknowledgements are accepted, and ignored.
+
+        e.g.
+        ::
+
+            with FakeBroker() as broker:
+                broker.fill('benchmark', 1000, b'Hello World!')
+                with broker.connection() as connection:
+                    channel = connection.channel()
+                    message = channel.basic.get('benchmark')
+
+    :param int frame_max: Maximum frame size offered to the clients.
+    """
+
+    def __init__(self, frame_max: int = MAX_FRAME_SIZE) -> None:
+        self.frame_max = frame_max
+        self.lock = threading.RLock()
+        self.queues: dict[str, collections.deque[StoredMessage]] = {}
+        self.consumers: dict[str, collections.deque[Any]] = {}
+        self._connections: list[BrokerConnection] = []
+        self._server: socket.socket | None = None
+        self._thread: threading.Thread | None = None
+        self._running = threading.Event()
+
+    def __enter__(self) -> FakeBroker:
+        self.start()
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.stop()
+
+    @property
+    def port(self) -> int:
+        """Port the broker is listening on.
+
+        :raises RuntimeError: Raises if the broker is not started.
+
+        :rtype: int
+        """
+        if not self._server:
+            raise RuntimeError('broker not started')
+        return self._server.getsockname()[1]
+
+    def start(self) -> None:
+        """Start listening on a free loopback port.
+
+        :return:
+        """
+        self._server = socket.create_server(('127.0.0.1', 0))
+        self._running.set()
+        self._thread = threading.Thread(target=self._accept,
+                                        name='amqpstorm-fake-broker')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop listening, and close all client connections.
+
+        :return:
+        """
+        self._running.clear()
+        if self._server:
+            try:
+                self._server.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            self._server.close()
+        for connection in list(self._connections):
+            connection.close()
+        if self._thread:
+            self._thread.join()
+
+    def connection(self, **kwargs: Any) -> amqpstorm.Connection:
+        """Open an amqpstorm Connection to the broker.
+
+        :param kwargs: Extra Connection parameters.
+
+        :rtype: amqpstorm.Connection
+        """
+        return amqpstorm.Connection('127.0.0.1', 'guest', 'guest',
+                                    port=self.port, **kwargs)
+
+    def fill(
+        self, queue: str, count: int, body: bytes,
+        properties: dict[str, Any] | None = None,
+    ) -> None:
+        """Add messages to a queue without publishing them.
+
+        :param str queue: Queue name.
+        :param int count: Number of messages.
+        :param bytes body: Message body.
+        :param dict properties: Message properties.
+
+        :return:
+        """
+        message = StoredMessage(body,
+                                commands.Basic.Properties(**properties or {}),
+                                '', queue)
+        with self.lock:
+            self.queues.setdefault(queue, collections.deque()).extend(
+                itertools.repeat(message, count)
+            )
+            self._dispatch(queue)
+
+    def message_count(self, queue: str) -> int:
+        """Number of messages waiting in a queue.
+
+        :param str queue: Queue name.
+
+        :rtype: int
+        """
+        with self.lock:
+            return len(self.queues.get(queue, ()))
+
+    def route(self, message: StoredMessage) -> None:
+        """Route a published message to the queue named by its routing key.
+
+            Messages published to any other exchange are dropped.
+
+        :param StoredMessage message: Published message.
+
+        :return:
+        """
+        if message.exchange:
+            return
+        with self.lock:
+            queue = self.queues.get(message.routing_key)
+            if queue is None:
+                return
+            queue.append(message)
+            self._dispatch(message.routing_key)
+
+    def _dispatch(self, queue_name: str) -> None:
+        """Deliver the messages of a queue to its consumers, round-robin.
+
+            Must be called while holding the lock.
+
+        :param str queue_name: Queue name.
+
+        :return:
+        """
+        consumers = self.consumers.get(queue_name)
+        queue = self.queues.get(queue_name)
+        if not consumers or not queue:
+            return
+        deliveries: dict[Any, list[StoredMessage]] = {}
+        while queue:
+            consumer = consumers[0]
+            consumers.rotate(-1)
+            deliveries.setdefault(consumer, []).append(queue.popleft())
+        for consumer, messages in deliveries.items():
+            connection, channel_id, consumer_tag = consumer
+            connection.deliver(channel_id, consumer_tag, messages)
+
+    def _accept(self) -> None:
+        """Accept client connections until the broker is stopped.
+
+        :return:
+        """
+        server = self._server
+        while self._running.is_set() and server:
+            try:
+                sock, _ = server.accept()
+            except OSError:
+                return
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            connection = BrokerConnection(self, sock)
+            self._connections.append(connection)
+            connection.start()
+
+
+class BrokerConnection(threading.Thread):
+    """A single client connection to the FakeBroker.
+
+    :param FakeBroker broker: Broker the client connected to.
+    :param socket.socket sock: Client socket.
+    """
+
+    def __init__(self, broker: FakeBroker, sock: socket.socket) -> None:
+        super().__init__(name='amqpstorm-fake-broker-connection')
+        self.daemon = True
+        self.broker = broker
+        self.frame_max = broker.frame_max
+        self._socket = sock
+        self._write_lock = threading.Lock()
+        self._frames_out: list[bytes] = []
+        self._channels: dict[int, dict[str, Any]] = {}
+        self._consumer_tags = itertools.count(1)
+        self._closed = False
+
+    def close(self) -> None:
+        """Close the client socket, and remove its consumers.
+
+        :return:
+        """
+        self._closed = True
+        with self.broker.lock:
+            for consumers in self.broker.consumers.values():
+                for consumer in list(consumers):
+                    if consumer[0] is self:
+                        consumers.remove(consumer)
+            if self in self.broker._connections:
+                self.broker._connections.remove(self)
+        try:
+            self._socket.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._socket.close()
+
+    def run(self) -> None:
+        """Read, and handle, frames until the client disconnects.
+
+        :return:
+        """
+        data_in = bytearray()
+        try:
+            while not self._closed:
+                data = self._socket.recv(RECV_SIZE)
+                if not data:
+                    break
+                data_in += data
+                offset = self._read_frames(data_in)
+                if offset:
+                    del data_in[:offset]
+                self._flush()
+        except OSError:
+            pass
+        finally:
+            if not self._closed:
+                self.close()
+
+    def deliver(
+        self, channel_id: int, consumer_tag: str,
+        messages: list[StoredMessage],
+    ) -> None:
+        """Deliver messages to a consumer on this connection.
+
+        :param int channel_id: Channel of the consumer.
+        :param str consumer_tag: Consumer tag.
+        :param list messages: Messages to deliver.
+
+        :return:
+        """
+        channel = self._channels.get(channel_id)
+        if channel is None:
+            return
+        data_out = []
+        for message in messages:
+            channel['delivery_tag'] += 1
+            data_out.append(pamqp_frame.marshal(commands.Basic.Deliver(
+                consumer_tag=consumer_tag,
+                delivery_tag=channel['delivery_tag'],
+                exchange=message.exchange,
+                routing_key=message.routing_key,
+            ), channel_id))
+            data_out.append(message.content(channel_id, self.frame_max))
+        self._send(b''.join(data_out))
+
+    def _read_frames(self, data_in: bytearray) -> int:
+        """Handle all complete frames in the buffer.
+
+        :param bytearray data_in: Received data.
+
+        :return: Number of bytes handled.
+        """
+        offset = 0
+        while True:
+            remaining = len(data_in) - offset
+            if data_in.startswith(PROTOCOL_HEADER, offset):
+                if remaining < 8:
+                    return offset
+                frame_size = 8
+            elif remaining < FRAME_HEADER_SIZE:
+                return offset
+            else:
+                frame_size = FRAME_HEADER_SIZE + FRAME_END_SIZE + int.from_bytes(
+                    data_in[offset + 3:offset + 7], 'big'
+                )
+                if remaining < frame_size:
+                    return offset
+            byte_count, channel_id, frame_in = pamqp_frame.unmarshal(
+                bytes(data_in[offset:offset + frame_size])
+            )
+            offset += byte_count
+            self._on_frame(channel_id, frame_in)
+
+    def _on_frame(self, channel_id: int, frame_in: Any) -> None:
+        """Handle a frame received from the client.
+
+        :param int channel_id: Channel id.
+        :param pamqp.Frame frame_in: Amqp frame.
+
+        :return:
+        """
+        handler = getattr(self, '_on_' + frame_in.name.replace('.', '_'),
+                          None)
+        if handler is None:
+            LOGGER.debug('Ignoring frame: %s', frame_in.name)
+            return
+        handler(channel_id, frame_in)
+
+    def _write(self, channel_id: int, frame_out: Any) -> None:
+        """Queue a frame, written once the received data has been handled.
+
+        :param int channel_id: Channel id.
+        :param pamqp.Frame frame_out: Amqp frame.
+
+        :return:
+        """
+        self._frames_out.append(pamqp_frame.marshal(frame_out, channel_id))
+
+    def _flush(self) -> None:
+        """Write all queued frames.
+
+        :return:
+        """
+        if not self._frames_out:
+            return
+        data_out = b''.join(self._frames_out)
+        self._frames_out = []
+        self._send(data_out)
+
+    def _send(self, data_out: bytes) -> None:
+        """Write data to the client.
+
+        :param bytes data_out: Marshalled frames.
+
+        :return:
+        """
+        with self._write_lock:
+            try:
+                self._socket.sendall(data_out)
+            except OSError:
+                pass
+
+    def _on_ProtocolHeader(self, *_: Any) -> None:
+        self._write(0, commands.Connection.Start(
+            server_properties={
+                'product': 'amqpstorm-fake-broker',
+                'version': amqpstorm.__version__,
+                'capabilities': {
+                    'basic.nack': True,
+                    'consumer_cancel_notify': True,
+                    'publisher_confirms': True,
+                },
+            },
+            mechanisms='PLAIN', locales='en_US'
+        ))
+
+    def _on_Connection_StartOk(self, *_: Any) -> None:
+        self._write(0, commands.Connection.Tune(
+            channel_max=2047, frame_max=self.frame_max, heartbeat=0
+        ))
+
+    def _on_Connection_Open(self, *_: Any) -> None:
+        self._write(0, commands.Connection.OpenOk())
+
+    def _on_Connection_Close(self, *_: Any) -> None:
+        self._write(0, commands.Connection.CloseOk())
+        self._flush()
+        self.close()
+
+    def _on_Channel_Open(self, channel_id: int, _: Any) -> None:
+        self._channels[channel_id] = {
+            'confirm': False, 'delivery_tag': 0, 'publish': None,
+            'published': 0,
+        }
+        self._write(channel_id, commands.Channel.OpenOk())
+
+    def _on_Channel_Close(self, channel_id: int, _: Any) -> None:
+        self._remove_consumers(channel_id)
+        self._channels.pop(channel_id, None)
+        self._write(channel_id, commands.Channel.CloseOk())
+
+    def _on_Confirm_Select(self, channel_id: int, frame_in: Any) -> None:
+        self._channels[channel_id]['confirm'] = True
+        if not frame_in.nowait:
+            self._write(channel_id, commands.Confirm.SelectOk())
+
+    def _on_Queue_Declare(self, channel_id: int, frame_in: Any) -> None:
+        queue = frame_in.queue or f'amq.gen-{id(frame_in)}'
+        with self.broker.lock:
+            messages = self.broker.queues.setdefault(queue,
+                                                     collections.deque())
+            consumers = self.broker.consumers.get(queue, ())
+            frame_out = commands.Queue.DeclareOk(
+                queue=queue, message_count=len(messages),
+                consumer_count=len(consumers)
+            )
+        if not frame_in.nowait:
+            self._write(channel_id, frame_out)
+
+    def _on_Queue_Delete(self, channel_id: int, frame_in: Any) -> None:
+        with self.broker.lock:
+            messages = self.broker.queues.pop(frame_in.queue, ())
+            self.broker.consumers.pop(frame_in.queue, None)
+        if not frame_in.nowait:
+            self._write(channel_id, commands.Queue.DeleteOk(
+                message_count=len(messages)
+            ))
+
+    def _on_Queue_Purge(self, channel_id: int, frame_in: Any) -> None:
+        with self.broker.lock:
+            messages = self.broker.queues.get(frame_in.queue)
+            message_count = len(messages) if messages else 0
+            if messages:
+                messages.clear()
+        if not frame_in.nowait:
+            self._write(channel_id, commands.Queue.PurgeOk(
+                message_count=message_count
+            ))
+
+    def _on_Basic_Qos(self, channel_id: int, _: Any) -> None:
+        self._write(channel_id, commands.Basic.QosOk())
+
+    def _on_Basic_Get(self, channel_id: int, frame_in: Any) -> None:
+        with self.broker.lock:
+            messages = self.broker.queues.get(frame_in.queue)
+            message = messages.popleft() if messages else None
+            message_count = len(messages) if messages else 0
+        if message is None:
+            self._write(channel_id, commands.Basic.GetEmpty())
+            return
+        channel = self._channels[channel_id]
+        channel['delivery_tag'] += 1
+        self._write(channel_id, commands.Basic.GetOk(
+            delivery_tag=channel['delivery_tag'],
+            exchange=message.exchange, routing_key=message.routing_key,
+            message_count=message_count
+        ))
+        self._frames_out.append(message.content(channel_id, self.frame_max))
+
+    def _on_Basic_Consume(self, channel_id: int, frame_in: Any) -> None:
+        consumer_tag = frame_in.consumer_tag or (
+            f'amq.ctag-{next(self._consumer_tags)}'
+        )
+        if not frame_in.nowait:
+            self._write(channel_id, commands.Basic.ConsumeOk(
+                consumer_tag=consumer_tag
+            ))
+            self._flush()
+        with self.broker.lock:
+            self.broker.consumers.setdefault(
+                frame_in.queue, collections.deque()
+            ).append((self, channel_id, consumer_tag))
+            self.broker._dispatch(frame_in.queue)
+
+    def _on_Basic_Cancel(self, channel_id: int, frame_in: Any) -> None:
+        self._remove_consumers(channel_id, frame_in.consumer_tag)
+        if not frame_in.nowait:
+            self._write(channel_id, commands.Basic.CancelOk(
+                consumer_tag=frame_in.consumer_tag
+            ))
+
+    def _on_Basic_Publish(self, channel_id: int, frame_in: Any) -> None:
+        self._channels[channel_id]['publish'] = [frame_in, None, [], 0]
+
+    def _on_ContentHeader(self, channel_id: int, frame_in: Any) -> None:
+        publish = self._channels[channel_id]['publish']
+        publish[1] = frame_in
+        if not frame_in.body_size:
+            self._published(channel_id)
+
+    def _on_ContentBody(self, channel_id: int, frame_in: Any) -> None:
+        publish = self._channels[channel_id]['publish']
+        publish[2].append(frame_in.value)
+        publish[3] += len(frame_in.value)
+        if publish[3] >= publish[1].body_size:
+            self._published(channel_id)
+
+    def _published(self, channel_id: int) -> None:
+        """Route a message once all its content frames have arrived, and
+        confirm it when the channel is in confirm mode.
+
+        :param int channel_id: Channel id.
+
+        :return:
+        """
+        channel = self._channels[channel_id]
+        method_frame, header_frame, body_parts, _ = channel['publish']
+        channel['publish'] = None
+        self.broker.route(StoredMessage(
+            b''.join(body_parts), header_frame.properties,
+            method_frame.exchange, method_frame.routing_key
+        ))
+        if channel['confirm']:
+            channel['published'] += 1
+            self._write(channel_id, commands.Basic.Ack(
+                delivery_tag=channel['published']
+            ))
+
+    def _remove_consumers(
+        self, channel_id: int, consumer_tag: str | None = None,
+    ) -> None:
+        """Remove the consumers of a channel.
+
+        :param int channel_id: Channel id.
+        :param str consumer_tag: Only remove this consumer.
+
+        :return:
+        """
+        with self.broker.lock:
+            for consumers in self.broker.consumers.values():
+                for consumer in list(consumers):
+                    if consumer[0] is not self or consumer[1] != channel_id:
+                        continue
+                    elif consumer_tag is None or consumer[2] == consumer_tag:
+                        consumers.remove(consumer)
@@ -0,0 +1,310 @@
+"""Benchmarks of the client hot paths."""
+from __future__ import annotations
+
+import gc
+import platform
+import statistics
+import threading
+import time
+import tracemalloc
+from typing import Any
+from typing import Callable
+
+import amqpstorm
+from amqpstorm import LazyMessage
+from amqpstorm import Message
+from benchmarks.broker import FakeBroker
+
+BENCHMARKS: dict[str, Callable[..., list[dict[str, Any]]]] = {}
+QUEUE = 'amqpstorm.benchmark'
+SMALL_BODY = b'x' * 128
+LARGE_BODY = b'x' * (4 * 1024 * 1024)
+HIGHER_IS_BETTER = {'msg/s', 'MiB/s'}
+
+
+def benchmark(name: str) -> Callable:
+    """Register a benchmark.
+
+        A benchmark is called with the broker and the number of messages,
+        and returns a list of results.
+
+    :param str name: Benchmark name.
+
+    :rtype: typing.Callable
+    """
+
+    def register(func: Callable) -> Callable:
+        BENCHMARKS[name] = func
+        return func
+
+    return register
+
+
+def result(name: str, value: float, unit: str, **extra: Any) -> dict[str, Any]:
+    """Returns a single benchmark result.
+
+    :param str name: Result name.
+    :param float value: Measured value.
+    :param str unit: Unit of the value.
+
+    :rtype: dict
+    """
+    return dict(name=name, value=round(value, 3), unit=unit, **extra)
+
+
+def latency(name: str, samples: list[float]) -> list[dict[str, Any]]:
+    """Returns the median, and 99th percentile, of latency samples.
+
+    :param str name: Result name.
+    :param list samples: Latencies in seconds.
+
+    :rtype: list
+    """
+    samples = sorted(samples)
+    p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+    return [
+        result(name + '.p50', statistics.median(samples) * 1e6, 'us',
+               samples=len(samples)),
+        result(name + '.p99', p99 * 1e6, 'us', samples=len(samples)),
+    ]
+
+
+def throughput(name: str, count: int, elapsed: float, size: int = 0) -> list[dict[str, Any]]:
+    """Returns the throughput of count messages handled in elapsed seconds.
+
+    :param str name: Result name.
+    :param int count: Number of messages.
+    :param float elapsed: Time taken in seconds.
+    :param int size: Body size in bytes.
+
+    :rtype: list
+    """
+    results = [result(name, count / elapsed, 'msg/s', messages=count)]
+    if size:
+        results.append(result(name + '.bandwidth',
+                              count * size / elapsed / 1024 / 1024, 'MiB/s'))
+    return results
+
+
+def _publish(broker: FakeBroker, messages: int, confirm: bool,
+             name: str) -> list[dict[str, Any]]:
+    with broker.connection() as connection:
+        channel = connection.channel()
+        channel.queue.declare(QUEUE)
+        if confirm:
+            channel.confirm_deliveries()
+        start = time.perf_counter()
+        for _ in range(messages):
+            channel.basic.publish(SMALL_BODY, QUEUE)
+        elapsed = time.perf_counter() - start
+        channel.queue.delete(QUEUE)
+    return throughput(name, messages, elapsed)
+
+
+@benchmark('publish')
+def publish(broker: FakeBroker, messages: int) -> list[dict[str, Any]]:
+    return _publish(broker, messages, False, 'publish')
+
+
+@benchmark('publish_confirms')
+def publish_confirms(broker: FakeBroker, messages: int) -> list[dict[str, Any]]:
+    return _publish(broker, messages, True, 'publish_confirms')
+
+
+@benchmark('consume')
+def consume(broker: FakeBroker, messages: int) -> list[dict[str, Any]]:
+    results = []
+    for name, message_impl in (('consume', Message),
+                               ('consume.lazy', LazyMessage)):
+        with broker.connection() as connection:
+            channel = connection.channel()
+            channel.queue.declare(QUEUE)
+            received = 0
+            start = time.perf_counter()
+            channel.basic.consume(queue=QUEUE, no_ack=True)
+            broker.fill(QUEUE, messages, SMALL_BODY)
+            for _ in channel.build_inbound_messages(
+                    message_impl=message_impl):
+                received += 1
+                if received == messages:
+                    break
+            elapsed = time.perf_counter() - start
+            channel.queue.delete(QUEUE)
+        results.extend(throughput(name, messages, elapsed))
+    return results
+
+
+@benchmark('basic_get')
+def basic_get(broker: FakeBroker, messages: int) -> list[dict[str, Any]]:
+    with broker.connection() as connection:
+        channel = connection.channel()
+        channel.queue.declare(QUEUE)
+        broker.fill(QUEUE, messages, SMALL_BODY)
+        samples = []
+        for _ in range(messages):
+            start = time.perf_counter()
+            channel.basic.get(QUEUE, no_ack=True)
+            samples.append(time.perf_counter() - start)
+        channel.queue.delete(QUEUE)
+    return latency('basic_get', samples)
+
+
+@benchmark('rpc')
+def rpc(broker: FakeBroker, messages: int) -> list[dict[str, Any]]:
+    """Round-trip of a request published to a server consuming on a
+    second connection, and its reply consumed by the client.
+    """
+    reply_queue = QUEUE + '.reply'
+    with broker.connection() as server, broker.connection() as client:
+        server_channel = server.channel()
+        server_channel.queue.declare(QUEUE)
+
+        def on_request(message: Message) -> None:
+            server_channel.basic.publish(message.body or b'',
+                                         message.properties['reply_to'])
+
+        server_channel.basic.consume(on_request, QUEUE, no_ack=True)
+        server_thread = threading.Thread(target=server_channel.start_consuming)
+        server_thread.daemon = True
+        server_thread.start()
+
+        channel = client.channel()
+        channel.queue.declare(reply_queue)
+        channel.basic.consume(queue=reply_queue, no_ack=True)
+        replies = channel.build_inbound_messages()
+        properties = {'reply_to': reply_queue}
+        samples = []
+        for _ in range(messages):
+            start = time.perf_counter()
+            channel.basic.publish(SMALL_BODY, QUEUE, properties=properties)
+            next(replies)
+            samples.append(time.perf_counter() - start)
+        server_channel.stop_consuming()
+        server_thread.join()
+        channel.queue.delete(reply_queue)
+        channel.queue.delete(QUEUE)
+    return latency('rpc', samples)
+
+
+@benchmark('large_body')
+def large_body(broker: FakeBroker, messages: int) -> list[dict[str, Any]]:
+    count = max(1, messages // 1000)
+    results = []
+    with broker.connection() as connection:
+        channel = connection.channel()
+        channel.queue.declare(QUEUE)
+        channel.basic.consume(queue=QUEUE, no_ack=True)
+
+        start = time.perf_counter()
+        for _ in range(count):
+            channel.basic.publish(LARGE_BODY, QUEUE)
+        for _ in zip(range(count), channel.build_inbound_messages()):
+            pass
+        results.extend(throughput('large_body', count,
+                                  time.perf_counter() - start,
+                                  len(LARGE_BODY)))
+
+        start = time.perf_counter()
+        broker.fill(QUEUE, count, LARGE_BODY)
+        for _, message in zip(range(count), channel.build_inbound_messages(
+                stream_body=True)):
+            for _ in message.body.chunks():
+                pass
+        results.extend(throughput('large_body.stream', count,
+                                  time.perf_counter() - start,
+                                  len(LARGE_BODY)))
+        channel.queue.delete(QUEUE)
+    return results
+
+
+@benchmark('memory')
+def memory(broker: FakeBroker, messages: int) -> list[dict[str, Any]]:
+    """Memory held per message by messages consumed, but not yet handled."""
+    results = []
+    for name, message_impl in (('memory', Message),
+                               ('memory.lazy', LazyMessage)):
+        with broker.connection() as connection:
+            channel = connection.channel()
+            channel.queue.declare(QUEUE)
+            channel.basic.consume(queue=QUEUE, no_ack=True)
+            gc.collect()
+            tracemalloc.start()
+            try:
+                broker.fill(QUEUE, messages, SMALL_BODY)
+                held = [message for _, message in zip(
+                    range(messages),
+                    channel.build_inbound_messages(message_impl=message_impl)
+                )]
+                current, _ = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            results.append(result(name, current / len(held), 'B/msg',
+                                  body_size=len(SMALL_BODY)))
+            del held
+            channel.queue.delete(QUEUE)
+    return results
+
+
+def compare(
+    results: dict[str, Any],
+    baseline: dict[str, Any],
+    max_regression: float,
+) -> list[str]:
+    """Compare results against a baseline run.
+
+        Throughput is expected to be higher, and latency and memory lower.
+        Results missing from either run are ignored.
+
+    :param dict results: Results returned by run.
+    :param dict baseline: Results of the baseline run.
+    :param float max_regression: Allowed regression, as a fraction of the
+                                 baseline value (e.g. 0.3).
+
+    :return: Description of each result that regressed too much.
+    :rtype: list
+    """
+    baseline_values = {
+        result['name']: result['value'] for result in baseline['results']
+    }
+    regressions = []
+    for result in results['results']:
+        expected = baseline_values.get(result['name'])
+        if not expected:
+            continue
+        change = (result['value'] - expected) / expected
+        if result['unit'] not in HIGHER_IS_BETTER:
+            change = -change
+        if change < -max_regression:
+            regressions.append(
+                f"{result['name']}: {result['value']} {result['unit']} "
+                f"(baseline {expected} {result['unit']}, "
+                f"{abs(change):.0%} worse)"
+            )
+    return regressions
+
+
+def run(messages: int = 10000, names: list[str] | None = None) -> dict[str, Any]:
+    """Run the benchmarks against a FakeBroker.
+
+    :param int messages: Number of messages per benchmark.
+    :param list names: Only run these benchmarks.
+
+    :raises ValueError: Raises if a benchmark does not exist.
+
+    :rtype: dict
+    """
+    names = names or list(BENCHMARKS)
+    for name in names:
+        if name not in BENCHMARKS:
+            raise ValueError(f'unknown benchmark: {name}')
+    results = []
+    with FakeBroker() as broker:
+        for name in names:
+            results.extend(BENCHMARKS[name](broker, messages))
+    return {
+        'amqpstorm': amqpstorm.__version__,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'messages': messages,
+        'results': results,
+    }
@@ -0,0 +1,40 @@
+"""
+A simple example publishing and consuming messages using asyncio.
+"""
+import asyncio
+import logging
+
+from amqpstorm.aio import AsyncConnection
+
+logging.basicConfig(level=logging.INFO)
+
+
+async def main():
+    async with AsyncConnection('localhost', 'guest', 'guest') as connection:
+        async with await connection.channel() as channel:
+            # Declare the Queue, 'example_queue'.
+            await channel.queue.declare('example_queue')
+
+            # Wait for each message to be confirmed by RabbitMQ. Messages
+            # published concurrently are confirmed concurrently.
+            await channel.confirm_deliveries()
+            results = await asyncio.gather(*[
+                channel.basic.publish(f'Hello World {index}!',
+                                      'example_queue')
+                for index in range(10)
+            ])
+            print('Confirmed:', all(results))
+
+            # Set QoS to 100.
+            await channel.basic.qos(100)
+
+            # Start consuming the queue 'example_queue'.
+            await channel.basic.consume(queue='example_queue', no_ack=False)
+            async for message in channel.build_inbound_messages():
+                print('Message:', message.body)
+
+                # Acknowledge that we handled the message without any issues.
+                message.ack()
+
+
+asyncio.run(main())
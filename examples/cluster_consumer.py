@@ -7,12 +7,11 @@ to multiple A records. The DNS name is re-resolved on every connection attempt,
 so it picks up the resolver's rotation and any change to the node set.
 """
 import logging
-import random
 import socket
 import time
 
 import amqpstorm
-from amqpstorm import Connection
+from amqpstorm import ClusterConnection
 
 logging.basicConfig(level=logging.INFO)
 LOGGER = logging.getLogger()
@@ -28,7 +27,7 @@ CLUSTER_NODES = [
 class ClusteredConsumer:
     def __init__(self, nodes=None, hostname=None, port=5672, username='guest',
                  password='guest', queue='example_queue', timeout=5,
-                 max_retries=None, **connection_kwargs):
+                 strategy='shuffle', max_retries=None, **connection_kwargs):
         """
         :param list nodes: List of (hostname, port) cluster nodes.
         :param str hostname: Round-robin DNS name, re-resolved to its A records
@@ -40,11 +39,14 @@ class ClusteredConsumer:
         :param int,float timeout: Per-node socket timeout. A lower value fails
                                   over to the next node faster when one is
                                   unreachable.
+        :param str strategy: Order the nodes are tried in; "shuffle",
+                             "round_robin" or "latency".
         :param int max_retries: Give up after this many full passes over the
                                 node list (None retries forever).
         :param connection_kwargs: Extra keyword arguments forwarded to
-                                  amqpstorm.Connection, e.g. ssl=True with
-                                  ssl_options={...}, virtual_host or heartbeat.
+                                  amqpstorm.ClusterConnection, e.g. ssl=True
+                                  with ssl_options={...}, virtual_host or
+                                  heartbeat.
         """
         self.nodes = list(nodes) if nodes else []
         self.hostname = hostname
@@ -53,6 +55,7 @@ class ClusteredConsumer:
         self.password = password
         self.queue = queue
         self.timeout = timeout
+        self.strategy = strategy
         self.max_retries = max_retries
         self.connection_kwargs = connection_kwargs
         self.connection = None
@@ -76,11 +79,12 @@ class ClusteredConsumer:
         return [(address, self.port) for address in addresses]
 
     def create_connection(self):
-        """Connect to the first reachable node, failing over between nodes.
+        """Connect to the first available node.
 
-            Each pass tries every node once, in a random order to spread load
-            across the cluster. If no node is reachable we back off (capped at
-            30 seconds) and try the whole list again.
+            ClusterConnection tries every node once, in the order picked by
+            the strategy, and nodes that just failed are tried last. If no
+            node is available we back off (capped at 30 seconds) and try the
+            whole list again.
 
         :raises amqpstorm.AMQPConnectionError: If max_retries is set and no
                                                node could be reached.
@@ -90,23 +94,18 @@ class ClusteredConsumer:
         while True:
             attempts += 1
             try:
-                nodes = self.resolve_nodes()
+                self.connection = ClusterConnection(
+                    self.resolve_nodes(), self.username, self.password,
+                    strategy=self.strategy, timeout=self.timeout,
+                    **self.connection_kwargs
+                )
+                LOGGER.info('Connected to cluster node %s:%d',
+                            *self.connection.node)
+                return
             except socket.gaierror as why:
                 LOGGER.warning('Could not resolve %s - %s', self.hostname, why)
-                nodes = []
-            for hostname, port in random.sample(nodes, len(nodes)):
-                try:
-                    self.connection = Connection(
-                        hostname, self.username, self.password,
-                        port=port, timeout=self.timeout,
-                        **self.connection_kwargs
-                    )
-                    LOGGER.info('Connected to cluster node %s:%d',
-                                hostname, port)
-                    return
-                except amqpstorm.AMQPError as why:
-                    LOGGER.warning('Node %s:%d unavailable - %s',
-                                   hostname, port, why)
+            except amqpstorm.AMQPError as why:
+                LOGGER.warning(why)
             if self.max_retries and attempts >= self.max_retries:
                 raise amqpstorm.AMQPConnectionError(
                     f'no cluster node reachable after {attempts} attempts'
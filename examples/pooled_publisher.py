@@ -0,0 +1,36 @@
+"""
+Publish messages from many threads using a pool of connections.
+"""
+import logging
+import threading
+
+from amqpstorm.pool import ConnectionPool
+
+logging.basicConfig(level=logging.INFO)
+
+# Up to 2 connections, with up to 4 open channels each.
+pool = ConnectionPool('localhost', 'guest', 'guest',
+                      max_connections=2, channels_per_connection=4,
+                      max_idle=300)
+
+
+def publish_messages(worker_id):
+    for index in range(100):
+        # Check out an open channel, and return it once done.
+        with pool.channel() as channel:
+            channel.basic.publish(f'Hello World! {worker_id}-{index}',
+                                  'example_queue')
+
+
+with pool:
+    with pool.channel() as channel:
+        channel.queue.declare('example_queue')
+
+    workers = [
+        threading.Thread(target=publish_messages, args=(worker_id,))
+        for worker_id in range(8)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
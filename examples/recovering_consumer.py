@@ -0,0 +1,38 @@
+"""
+A consumer that recovers its queue, QoS and consumer after the
+connection to RabbitMQ was lost.
+"""
+import logging
+
+from amqpstorm import RobustConnection
+
+logging.basicConfig(level=logging.INFO)
+
+
+def on_message(message):
+    """This function is called on message received.
+
+    :param message:
+    :return:
+    """
+    print("Message:", message.body)
+
+    # Acknowledge that we handled the message without any issues.
+    message.ack()
+
+
+# Wait up to 1s before reconnecting, doubling up to 30s between attempts.
+with RobustConnection('localhost', 'guest', 'guest',
+                      retry_delay=1, max_retry_delay=30) as connection:
+    with connection.channel() as channel:
+        # The queue, QoS and consumer are declared once, and declared
+        # again by the connection after it has been recovered.
+        channel.queue.declare('example_queue')
+        channel.basic.qos(100)
+        channel.basic.consume(on_message, 'example_queue', no_ack=False)
+
+        try:
+            # Keeps consuming after the connection has been recovered.
+            channel.start_consuming()
+        except KeyboardInterrupt:
+            channel.close()